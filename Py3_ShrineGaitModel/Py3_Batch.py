@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Batch reprocessing of session folders of C3D files, without Vicon Nexus
+
+    python Py3_Batch.py D:/Archive/2023 D:/Archive/2024 --workers 32 --manifest Reprocess.json
+    python Py3_Batch.py D:/Archive/2024 --all-cycles      (also <Trial>.AllCycles.GCD, see Py3_CreateGCD)
+
+A session is a folder with static calibration files Static_<Condition>_<Subject>.py. Every C3D file of the folder with
+Foot Strike events is a dynamic trial and is processed (Dynamic_Main then CreateGCD) with the testing condition of the
+static calibration file of its subject. The outputs and GCD file of a trial do not depend on the condition, so a subject
+with several static calibrations needs --condition. Trials run in parallel in worker processes, the console output of
+each trial goes to <Trial>.log and the manifest lists the status of every trial.
+With --cache, trials whose inputs did not change since an earlier run reuse the cached results (see Py3_ResultCache).
+Static calibration is the interactive calibration review and is not run by the batch: sessions need their
+Static_<Condition>_<Subject>.py files (e.g. from Nexus).
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+
+# One thread per worker process, the trials are the unit of parallelism
+for ThreadVariable in ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS']:
+    os.environ.setdefault(ThreadVariable, '1')
+
+import sys
+import glob
+import json
+import time
+import argparse
+import traceback
+import contextlib
+import concurrent.futures
+
+import Py3_TrialSource
+import Py3_Headless
+import Py3_ResultCache
+
+def FindSessions(Folders):
+    # [Folder, {Subject: [Conditions]}] of the folders (searched recursively) with static calibration files
+    Sessions = []
+    for Folder in Folders:
+        for [Path, Directories, FileNames] in os.walk(Folder):
+            Calibrations = {}
+            for FileName in sorted(FileNames):
+                if FileName.startswith('Static_') and FileName.endswith('.py'):
+                    [Condition, Subject] = FileName[len('Static_'):-len('.py')].split('_', 1)
+                    Calibrations.setdefault(Subject, []).append(Condition)
+            if len(Calibrations) > 0:
+                Sessions.append([Path, Calibrations])
+    return Sessions
+
+def FindTrials(Sessions, Conditions=None):
+    # [C3D file, Conditions] of the dynamic trials of the sessions, Conditions are the testing conditions with a
+    # static calibration file for the subject of the trial (in the order of the Conditions argument when given)
+    Trials = []
+    for [Path, Calibrations] in Sessions:
+        for FileName in sorted(glob.glob(os.path.join(Path, '*.c3d'))):
+            try:
+                Source = Py3_TrialSource.C3DTrialSource(FileName)
+            except Exception:
+                continue # Not a readable trial, reported by Nexus pipelines in the same way
+            if len(Source.GetEvents(Source.SubjectName, 'Left', 'Foot Strike')[0]) + len(Source.GetEvents(Source.SubjectName, 'Right', 'Foot Strike')[0]) == 0:
+                continue # Static and other trials without gait events
+            TrialConditions = Calibrations.get(Source.SubjectName, [])
+            if Conditions is not None:
+                TrialConditions = [Condition for Condition in Conditions if Condition in TrialConditions][0:1]
+            Trials.append([FileName, TrialConditions])
+    return Trials
+
+def ProcessTrial(FileName, Condition, Mode, CacheDirectory=None, CacheSize=Py3_ResultCache.DefaultCacheSize, AllCycles=False):
+    # Run Dynamic_Main and CreateGCD on a trial in a worker process, returns its manifest entry
+    StartTime = time.time()
+    Entry = {'Trial': FileName, 'Condition': Condition, 'Status': 'Success', 'Error': ''}
+    LogFileName = os.path.splitext(FileName)[0] + '.log'
+    Arguments = argparse.Namespace(condition=Condition, mode=Mode, preferences=None, output=None, all_cycles=AllCycles)
+    Cache = None
+    with open(LogFileName, 'w') as LogFile, contextlib.redirect_stdout(LogFile), contextlib.redirect_stderr(LogFile):
+        try:
+            if CacheDirectory is not None:
+                Cache = Py3_ResultCache.ResultCache(CacheDirectory, CacheSize)
+            Source = Py3_TrialSource.C3DTrialSource(FileName)
+            Py3_TrialSource.SetTrialSource(Source)
+            for Step in Py3_Headless.Steps['process']:
+                Entry['Step'] = Step
+                Py3_Headless.RunStep(Source, Step, Arguments, Cache)
+        except (Exception, SystemExit) as Error:
+            traceback.print_exc()
+            Entry['Status'] = 'Failure'
+            Entry['Error'] = type(Error).__name__ + ': ' + str(Error)
+        finally:
+            Py3_TrialSource.SetTrialSource(None)
+    Entry['Seconds'] = round(time.time() - StartTime, 3)
+    if Cache is not None:
+        [Entry['CacheHits'], Entry['CacheMisses']] = [Cache.Hits, Cache.Misses]
+    Entry['Log'] = LogFileName
+    return Entry
+
+def main():
+    Parser = argparse.ArgumentParser(description='Reprocess session folders of C3D files with the Shrine Gait Model')
+    Parser.add_argument('folders', nargs='+', help='session folders, searched recursively')
+    Parser.add_argument('--condition', action='append', default=None, help='testing condition of the static calibration, may be repeated (first found is used)')
+    Parser.add_argument('--mode', default='Vectorized', choices=['FrameByFrame', 'Vectorized'], help='Dynamic_Main processing mode')
+    Parser.add_argument('--all-cycles', action='store_true', help='also write every complete gait cycle with mean and SD to <Trial>.AllCycles.GCD')
+    Parser.add_argument('--workers', type=int, default=os.cpu_count(), help='number of worker processes (default number of cores)')
+    Parser.add_argument('--cache', default=None, help='result cache folder, unchanged trials are not processed again')
+    Parser.add_argument('--cache-size', type=float, default=Py3_ResultCache.DefaultCacheSize, help='maximum size of the result cache in MB')
+    Parser.add_argument('--manifest', default='Py3_BatchManifest.json', help='manifest of the processed trials (JSON)')
+    Arguments = Parser.parse_args()
+
+    Sessions = FindSessions(Arguments.folders)
+    Trials = FindTrials(Sessions, Arguments.condition)
+    print('Sessions:', len(Sessions), ' Trials:', len(Trials), ' Workers:', Arguments.workers)
+
+    Manifest = []
+    StartTime = time.time()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(Arguments.workers, 1)) as Executor:
+        Futures = []
+        for [FileName, Conditions] in Trials:
+            if len(Conditions) == 1:
+                Futures.append(Executor.submit(ProcessTrial, FileName, Conditions[0], Arguments.mode, Arguments.cache, Arguments.cache_size, Arguments.all_cycles))
+            else:
+                Error = 'no static calibration file' if len(Conditions) == 0 else 'several static calibrations, select one with --condition'
+                Manifest.append({'Trial': FileName, 'Condition': ','.join(Conditions), 'Status': 'Failure', 'Error': Error})
+        for Future in concurrent.futures.as_completed(Futures):
+            Entry = Future.result()
+            Manifest.append(Entry)
+            print(Entry['Status'].ljust(8), Entry['Condition'], Entry['Trial'], Entry['Error'])
+
+    Manifest.sort(key=lambda Entry: [Entry['Trial'], Entry['Condition']])
+    Failures = len([Entry for Entry in Manifest if not Entry['Status'] == 'Success'])
+    Summary = {'VersionNumber': VersionNumber, 'Seconds': round(time.time() - StartTime, 3), 'Trials': len(Manifest), 'Failures': Failures}
+    if Arguments.cache:
+        Summary['CacheHits'] = sum([Entry.get('CacheHits', 0) for Entry in Manifest])
+        Summary['CacheMisses'] = sum([Entry.get('CacheMisses', 0) for Entry in Manifest])
+        print(Py3_ResultCache.HitRateReport(Summary['CacheHits'], Summary['CacheMisses']))
+    Summary['Manifest'] = Manifest
+    with open(Arguments.manifest, 'w') as ManifestFile:
+        json.dump(Summary, ManifestFile, indent=1)
+    print('Processed', len(Manifest), 'trials,', Failures, 'failed, manifest', Arguments.manifest)
+    return 1 if Failures > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
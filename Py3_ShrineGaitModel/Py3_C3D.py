@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# C3D file reader for running the Shrine Gait Model without Vicon Nexus
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import struct
+import numpy as np
+
+BlockSize = 512 # C3D files are organized in 512 byte blocks
+
+# Processor type byte of the parameter section
+ProcessorIntel = 84
+ProcessorDEC = 85
+ProcessorMIPS = 86
+
+def DECToIEEE(Words):
+    # Convert DEC (VAX F) floats read as little endian uint16 pairs to IEEE float32
+    Words = np.asarray(Words, dtype='<u2').reshape(-1,2)
+    Bits = (Words[:,0].astype(np.uint32) << 16) | Words[:,1].astype(np.uint32)
+    return Bits.view(np.float32) / 4.
+
+def IEEEToDEC(Values):
+    # Convert IEEE floats to DEC (VAX F) floats as little endian uint16 pairs, the inverse of DECToIEEE
+    Bits = (np.asarray(Values, dtype=np.float32).ravel() * np.float32(4.)).view(np.uint32)
+    return np.column_stack((Bits >> 16, Bits & 0xFFFF)).astype('<u2')
+
+def ProcessorEndian(Processor):
+    # Byte order of the integers (and IEEE floats) of the processor type
+    return '>' if Processor == ProcessorMIPS else '<'
+
+def PackFloats(Values, Processor):
+    if Processor == ProcessorDEC:
+        return IEEEToDEC(Values).tobytes()
+    return np.asarray(Values, dtype=np.float32).astype(ProcessorEndian(Processor) + 'f4').tobytes()
+
+class C3DForcePlate():
+    # Force plate of the FORCE_PLATFORM group: C3D type, corners (4, 3) and centre in lab, Origin (vector from the
+    # sensor origin to the centre of the plate surface, plate coordinates), 0 based analog Channels, CalMatrix
+    # (type 4 only) and the plate to lab rotation R. Corner 1 is in the +X+Y quadrant of the plate and the corners
+    # go around the plate.
+    def __init__(self, Type, Corners, Origin, Channels, CalMatrix=None):
+        self.Type = Type
+        self.Corners = Corners
+        self.Origin = Origin
+        self.Channels = Channels
+        self.CalMatrix = CalMatrix
+        self.Center = np.mean(Corners, axis=0)
+        AxisX = (Corners[0] + Corners[3] - Corners[1] - Corners[2]) / 2.
+        AxisY = (Corners[0] + Corners[1] - Corners[2] - Corners[3]) / 2.
+        AxisX = AxisX / np.linalg.norm(AxisX)
+        AxisZ = np.cross(AxisX, AxisY)
+        AxisZ = AxisZ / np.linalg.norm(AxisZ)
+        AxisY = np.cross(AxisZ, AxisX)
+        self.R = np.column_stack((AxisX, AxisY, AxisZ))
+
+class C3DFile():
+    # Marker, analog and parameter data of a C3D file
+    # The file is memory mapped: PointData (Frames, Points, 4) and AnalogData (Frames, AnalogRatio, Channels) are views
+    # of the stored values and only the parts that are used are read. Points (Frames, Points, 3) is a view of the file
+    # for float files and is scaled once on first use for integer files. GetPoint and GetAnalog return one marker or a
+    # set of analog channels in float64 physical units.
+    # Numeric parameters are arrays with the C3D dimensions reversed (e.g. FORCE_PLATFORM:CORNERS (3,4,N) -> (N,4,3))
+    def __init__(self, FileName):
+        self.FileName = FileName
+        Data = np.memmap(FileName, dtype=np.uint8, mode='r')
+
+        Header = bytes(Data[0:BlockSize])
+        ParameterBlock = Header[0]
+        if Header[1] != 0x50:
+            raise ValueError(FileName + ' is not a C3D file')
+        ParameterStart = (ParameterBlock - 1) * BlockSize
+        self.ProcessorType = int(Data[ParameterStart + 3])
+        self.Endian = ProcessorEndian(self.ProcessorType)
+
+        # Header
+        [NumPoints, AnalogPerFrame, FirstFrame, LastFrame, MaxGap] = struct.unpack(self.Endian + 'HHHHH', Header[2:12])
+        [DataStartBlock, AnalogRatio] = struct.unpack(self.Endian + 'HH', Header[16:20])
+        HeaderScale = self.UnpackFloat(Header[12:16])
+        HeaderFrameRate = self.UnpackFloat(Header[20:24])
+
+        # Parameter section, up to the data section
+        self.Parameters = self.ReadParameters(bytes(Data[ParameterStart:max((DataStartBlock - 1) * BlockSize, ParameterStart + BlockSize)]), 0)
+
+        # Parameters take precedence over the header, which is limited to 16 bit values
+        NumPoints = self.GetCount('POINT', 'USED', NumPoints)
+        self.PointScale = float(self.GetParameter('POINT', 'SCALE', HeaderScale))
+        self.PointRate = float(self.GetParameter('POINT', 'RATE', HeaderFrameRate))
+        DataStartBlock = self.GetCount('POINT', 'DATA_START', DataStartBlock)
+        self.FirstFrame = FirstFrame
+        self.LastFrame = LastFrame
+        ActualStartField = self.GetParameter('TRIAL', 'ACTUAL_START_FIELD')
+        ActualEndField = self.GetParameter('TRIAL', 'ACTUAL_END_FIELD')
+        if ActualStartField is not None and ActualEndField is not None:
+            # Two 16 bit words, low word first
+            ActualStartField = np.asarray(ActualStartField).astype(np.uint16).astype(int)
+            ActualEndField = np.asarray(ActualEndField).astype(np.uint16).astype(int)
+            self.FirstFrame = int(ActualStartField[0] + 65536 * ActualStartField[1])
+            self.LastFrame = int(ActualEndField[0] + 65536 * ActualEndField[1])
+        self.NumFrames = self.LastFrame - self.FirstFrame + 1
+
+        if AnalogRatio == 0:
+            AnalogChannels = 0
+        else:
+            AnalogChannels = self.GetCount('ANALOG', 'USED', AnalogPerFrame // AnalogRatio)
+        self.AnalogRatio = AnalogRatio
+        self.AnalogRate = float(self.GetParameter('ANALOG', 'RATE', self.PointRate * AnalogRatio))
+
+        # Data section, one record per frame: points (x, y, z, residual) followed by the analog samples
+        self.IsFloat = self.PointScale < 0
+        if self.IsFloat and self.ProcessorType == ProcessorDEC:
+            Type = '<u2' # Converted below
+            Width = 2
+        elif self.IsFloat:
+            Type = self.Endian + 'f4'
+            Width = 1
+        else:
+            Type = self.Endian + 'i2'
+            Width = 1
+        Record = np.dtype([('Points', Type, (NumPoints, 4 * Width)), ('Analog', Type, (AnalogRatio, AnalogChannels * Width))])
+        Frames = np.ndarray((self.NumFrames,), dtype=Record, buffer=Data, offset=(DataStartBlock - 1) * BlockSize)
+        self.PointData = Frames['Points']
+        self.AnalogData = Frames['Analog']
+        if Width == 2:
+            # DEC floats have no numpy type, the data is converted once
+            self.PointData = DECToIEEE(self.PointData).reshape(self.NumFrames, NumPoints, 4)
+            self.AnalogData = DECToIEEE(self.AnalogData).reshape(self.NumFrames, AnalogRatio, AnalogChannels)
+        self.ScaledPoints = None
+
+        self.PointLabels = self.GetLabels('POINT', 'LABELS', NumPoints)
+        self.AnalogLabels = self.GetLabels('ANALOG', 'LABELS', AnalogChannels)
+        self.AnalogDescriptions = self.GetLabels('ANALOG', 'DESCRIPTIONS', AnalogChannels)
+        self.AnalogUnits = self.GetLabels('ANALOG', 'UNITS', AnalogChannels)
+
+        # Analog scaling, value = (stored - OFFSET) * GEN_SCALE * SCALE
+        self.AnalogOffsets = np.asarray(self.GetParameter('ANALOG', 'OFFSET', np.zeros(AnalogChannels)), dtype=float).ravel()[0:AnalogChannels]
+        self.AnalogUnsigned = not self.IsFloat and str(self.GetParameter('ANALOG', 'FORMAT', 'SIGNED')).upper() == 'UNSIGNED'
+        if self.AnalogUnsigned:
+            self.AnalogOffsets = self.AnalogOffsets.astype(np.int16).astype(np.uint16).astype(float)
+        self.AnalogScales = (float(self.GetParameter('ANALOG', 'GEN_SCALE', 1.)) *
+                             np.asarray(self.GetParameter('ANALOG', 'SCALE', np.ones(AnalogChannels)), dtype=float).ravel()[0:AnalogChannels])
+
+        self.ForcePlates = self.ReadForcePlates()
+
+    @property
+    def Points(self):
+        # (Frames, Points, 3) marker coordinates, missing markers are flagged in PointExists
+        if self.IsFloat:
+            return self.PointData[:,:,0:3]
+        if self.ScaledPoints is None:
+            self.ScaledPoints = self.PointData[:,:,0:3] * np.float32(self.PointScale)
+        return self.ScaledPoints
+
+    @property
+    def PointExists(self):
+        # A negative residual flags a missing marker
+        return self.PointData[:,:,3] >= 0
+
+    def GetPoint(self, Index):
+        # (Frames, 3) float64 coordinates and (Frames) exists of one marker, missing frames are zero
+        Values = np.asarray(self.PointData[:,Index,:], dtype=float)
+        Exists = Values[:,3] >= 0
+        Points = Values[:,0:3]
+        if not self.IsFloat:
+            Points = Points * self.PointScale
+        Points[~Exists] = 0.
+        return [Points, Exists]
+
+    def GetAnalog(self, Channels):
+        # (Samples, len(Channels)) float64 analog channels in physical units
+        Values = self.AnalogData[:,:,Channels].reshape(self.NumFrames * self.AnalogRatio, len(Channels))
+        if self.AnalogUnsigned:
+            Values = Values.view(self.Endian + 'u2')
+        return (Values - self.AnalogOffsets[Channels]) * self.AnalogScales[Channels]
+
+    def ReadForcePlates(self):
+        ForcePlates = []
+        NumPlates = self.GetCount('FORCE_PLATFORM', 'USED', 0)
+        if NumPlates == 0:
+            return ForcePlates
+        Types = np.asarray(self.GetParameter('FORCE_PLATFORM', 'TYPE')).ravel()
+        Corners = np.asarray(self.GetParameter('FORCE_PLATFORM', 'CORNERS'), dtype=float).reshape(-1,4,3)
+        Origins = np.asarray(self.GetParameter('FORCE_PLATFORM', 'ORIGIN'), dtype=float).reshape(-1,3)
+        ChannelTable = np.asarray(self.GetParameter('FORCE_PLATFORM', 'CHANNEL'))
+        ChannelTable = ChannelTable.reshape(-1, ChannelTable.shape[-1]).astype(int) - 1
+        CalMatrices = self.GetParameter('FORCE_PLATFORM', 'CAL_MATRIX')
+        for Plate in range(NumPlates):
+            CalMatrix = None
+            if int(Types[Plate]) == 4:
+                CalMatrix = np.asarray(CalMatrices, dtype=float).reshape(-1,6,6)[Plate]
+            ForcePlates.append(C3DForcePlate(int(Types[Plate]), Corners[Plate], Origins[Plate], ChannelTable[Plate].tolist(), CalMatrix))
+        return ForcePlates
+
+    def UnpackFloat(self, Bytes):
+        if self.ProcessorType == ProcessorDEC:
+            return float(DECToIEEE(np.frombuffer(Bytes, dtype='<u2'))[0])
+        return struct.unpack(self.Endian + 'f', Bytes)[0]
+
+    def ReadParameters(self, Data, ParameterStart):
+        # Parameter section: linked records of groups (negative id) and parameters (positive id of their group)
+        GroupNames = {}
+        GroupParameters = []
+        Offset = ParameterStart + 4
+        while Offset + 2 <= len(Data):
+            [NameLength, ID] = struct.unpack('bb', Data[Offset:Offset+2])
+            if NameLength == 0 or ID == 0:
+                break
+            NameLength = abs(NameLength) # Negative length flags a locked parameter
+            Name = Data[Offset+2:Offset+2+NameLength].decode('latin-1').upper()
+            Pointer = Offset + 2 + NameLength
+            NextRecord = struct.unpack(self.Endian + 'h', Data[Pointer:Pointer+2])[0]
+            if ID < 0:
+                GroupNames[-ID] = Name
+            else:
+                GroupParameters.append([ID, Name, self.ReadParameterValue(Data, Pointer + 2)])
+            if NextRecord == 0:
+                break
+            Offset = Pointer + NextRecord
+
+        Parameters = {}
+        for Name in GroupNames.values():
+            Parameters[Name] = {}
+        for [ID, Name, Value] in GroupParameters:
+            Parameters.setdefault(GroupNames.get(ID, str(ID)), {})[Name] = Value
+        return Parameters
+
+    def ReadParameterValue(self, Data, Offset):
+        [DataType, NumDims] = struct.unpack('bB', Data[Offset:Offset+2])
+        Dims = list(Data[Offset+2:Offset+2+NumDims])
+        Offset = Offset + 2 + NumDims
+        Count = int(np.prod(Dims)) if NumDims > 0 else 1
+        if DataType == -1:
+            Text = Data[Offset:Offset+Count].decode('latin-1')
+            if NumDims <= 1:
+                return Text.strip()
+            # Fixed width strings, first dimension is the string length
+            return [Text[i:i+Dims[0]].strip() for i in range(0, Count, Dims[0])]
+        if DataType == 1:
+            Value = np.frombuffer(Data, dtype=np.uint8, count=Count, offset=Offset)
+        elif DataType == 2:
+            Value = np.frombuffer(Data, dtype=self.Endian + 'i2', count=Count, offset=Offset)
+        elif self.ProcessorType == ProcessorDEC:
+            Value = DECToIEEE(np.frombuffer(Data, dtype='<u2', count=2*Count, offset=Offset))
+        else:
+            Value = np.frombuffer(Data, dtype=self.Endian + 'f4', count=Count, offset=Offset)
+        if NumDims == 0:
+            return Value[0]
+        return Value.reshape(Dims[::-1])
+
+    def GetParameter(self, Group, Name, Default=None):
+        return self.Parameters.get(Group, {}).get(Name, Default)
+
+    def GetCount(self, Group, Name, Default):
+        # Counts are stored as int16 but are unsigned
+        Value = self.GetParameter(Group, Name)
+        if Value is None:
+            return Default
+        return int(np.asarray(Value).ravel()[0]) & 0xFFFF
+
+    def GetLabels(self, Group, Name, Count):
+        # Labels continue in LABELS2, LABELS3, ... when there are more than 255
+        Labels = []
+        Index = 1
+        while len(Labels) < Count:
+            Value = self.GetParameter(Group, Name if Index == 1 else Name + str(Index))
+            if Value is None:
+                break
+            if isinstance(Value, str):
+                Value = [Value]
+            Labels.extend(Value)
+            Index = Index + 1
+        Labels = Labels[0:Count]
+        return Labels + ['' for m in range(Count - len(Labels))]
+
+def SetLabels(Parameters, Group, Name, Labels):
+    # Set a label parameter, labels continue in NAME2, NAME3, ... when there are more than 255
+    GroupParameters = Parameters.setdefault(Group, {})
+    Index = 2
+    while Name + str(Index) in GroupParameters:
+        del GroupParameters[Name + str(Index)]
+        Index = Index + 1
+    GroupParameters[Name] = list(Labels[0:255])
+    for Index in range(1, (len(Labels) + 254) // 255):
+        GroupParameters[Name + str(Index+1)] = list(Labels[255*Index:255*(Index+1)])
+
+def PackParameterValue(Value, Processor=ProcessorIntel):
+    # Type, dimensions and data of a parameter value: str, list of str or numeric (dimensions reversed, as read)
+    if isinstance(Value, str):
+        Data = Value.encode('latin-1')
+        [Type, Dims] = [-1, [len(Data)]]
+    elif isinstance(Value, list) and all(isinstance(Text, str) for Text in Value):
+        Length = max([len(Text) for Text in Value] + [1])
+        Data = ''.join([Text.ljust(Length) for Text in Value]).encode('latin-1')
+        [Type, Dims] = [-1, [Length, len(Value)]]
+    else:
+        Value = np.asarray(Value)
+        if Value.dtype == np.uint8:
+            [Type, Data] = [1, Value.tobytes()]
+        elif Value.dtype.kind in 'iub':
+            [Type, Data] = [2, Value.astype(ProcessorEndian(Processor) + 'i2').tobytes()]
+        else:
+            [Type, Data] = [4, PackFloats(Value, Processor)]
+        Dims = list(Value.shape[::-1])
+    if len(Dims) > 7 or max(Dims + [0]) > 255:
+        raise ValueError('Parameter dimensions ' + str(Dims) + ' can not be written to a C3D file')
+    return struct.pack('bB', Type, len(Dims)) + bytes(Dims) + Data
+
+def PackParameters(Parameters, Processor=ProcessorIntel):
+    # Parameter section of {Group: {Name: Value}}, without descriptions
+    Records = []
+    for [GroupID, Group] in enumerate(Parameters, 1):
+        Records.append([Group, -GroupID, b'\x00'])
+        for Name in Parameters[Group]:
+            Records.append([Name, GroupID, PackParameterValue(Parameters[Group][Name], Processor) + b'\x00'])
+    Section = [struct.pack('BBBB', 1, 0x50, 0, Processor)]
+    for [RecordIndex, [Name, ID, Body]] in enumerate(Records):
+        Name = Name.encode('latin-1')
+        NextRecord = 0 if RecordIndex == len(Records) - 1 else 2 + len(Body)
+        Section.append(struct.pack('bb', len(Name), ID) + Name + struct.pack(ProcessorEndian(Processor) + 'h', NextRecord) + Body)
+    Section = b''.join(Section)
+    NumBlocks = (len(Section) + BlockSize - 1) // BlockSize
+    return bytes([1, 0x50, NumBlocks, Processor]) + Section[4:].ljust(NumBlocks * BlockSize - 4, b'\x00')
+
+def WriteC3D(FileName, Parameters, Points, Analog, FirstFrame=1, Processor=ProcessorIntel):
+    # Write a float C3D file in one pass, Intel unless another Processor is given. Points (Frames, Points, 4) holds x, y,
+    # z and residual (-1 for a missing point), Analog (Frames, AnalogRatio, Channels) the stored analog values; labels,
+    # rates and scales are taken from Parameters, the counts, frames and data start are set from the arrays
+    [NumFrames, NumPoints] = Points.shape[0:2]
+    [AnalogRatio, AnalogChannels] = Analog.shape[1:3]
+    Parameters.setdefault('POINT', {})
+    Parameters.setdefault('ANALOG', {})
+    Parameters['POINT']['USED'] = np.array(NumPoints, dtype=np.int16)
+    Parameters['POINT']['SCALE'] = np.array(-1. * abs(float(Parameters['POINT'].get('SCALE', 1.))), dtype=np.float32)
+    Parameters['POINT']['FRAMES'] = np.array(NumFrames, dtype=np.int16 if NumFrames <= 32767 else np.float32)
+    Parameters['ANALOG']['USED'] = np.array(AnalogChannels, dtype=np.int16)
+    # The header frames are 16 bit, the frames are also written as two 16 bit words, low word first
+    LastFrame = FirstFrame + NumFrames - 1
+    Parameters.setdefault('TRIAL', {})
+    Parameters['TRIAL']['ACTUAL_START_FIELD'] = np.array([FirstFrame & 0xFFFF, FirstFrame >> 16], dtype=np.uint16).astype(np.int16)
+    Parameters['TRIAL']['ACTUAL_END_FIELD'] = np.array([LastFrame & 0xFFFF, LastFrame >> 16], dtype=np.uint16).astype(np.int16)
+    PointRate = float(Parameters['POINT'].get('RATE', 100.))
+    Parameters['POINT']['DATA_START'] = np.array(0, dtype=np.int16)
+    ParameterSection = PackParameters(Parameters, Processor)
+    DataStart = 2 + ParameterSection[2]
+    # DATA_START has a fixed size, the section is packed again with its value
+    Parameters['POINT']['DATA_START'] = np.array(DataStart, dtype=np.int16)
+    ParameterSection = PackParameters(Parameters, Processor)
+
+    Endian = ProcessorEndian(Processor)
+    Header = bytearray(BlockSize)
+    Header[0:2] = bytes([2, 0x50])
+    Header[2:12] = struct.pack(Endian + 'HHHHH', NumPoints, AnalogRatio * AnalogChannels, min(FirstFrame, 65535), min(LastFrame, 65535), 0)
+    Header[12:16] = PackFloats(Parameters['POINT']['SCALE'], Processor)
+    Header[16:20] = struct.pack(Endian + 'HH', DataStart, AnalogRatio)
+    Header[20:24] = PackFloats(PointRate, Processor)
+
+    if Processor == ProcessorDEC:
+        # DEC floats have no numpy type, each value is stored as a pair of words
+        Record = np.dtype([('Points', '<u2', (NumPoints, 8)), ('Analog', '<u2', (AnalogRatio, 2 * AnalogChannels))])
+        Frames = np.empty(NumFrames, dtype=Record)
+        Frames['Points'] = IEEEToDEC(Points).reshape(NumFrames, NumPoints, 8)
+        Frames['Analog'] = IEEEToDEC(Analog).reshape(NumFrames, AnalogRatio, 2 * AnalogChannels)
+    else:
+        Record = np.dtype([('Points', Endian + 'f4', (NumPoints, 4)), ('Analog', Endian + 'f4', (AnalogRatio, AnalogChannels))])
+        Frames = np.empty(NumFrames, dtype=Record)
+        Frames['Points'] = Points
+        Frames['Analog'] = Analog
+    with open(FileName, 'wb') as File:
+        File.write(Header)
+        File.write(ParameterSection)
+        Frames.tofile(File)
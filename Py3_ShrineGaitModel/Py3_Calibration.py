@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Structured store of the static calibration, loaded without executing the Static_<Condition>_<Subject>.py file
+
+Static_Main writes the static calibration as Python lines (self.valueEPelvisAnatRelTech = np.array([[...]])). The
+calibration is also stored next to it as Static_<Condition>_<Subject>.json (format version, subject data, marker names
+and options) and Static_<Condition>_<Subject>.npz (AnatRelTech matrices, joint centres and marker offsets, packed into
+one array, their offsets and shapes are in the .json file).
+LoadCalibration reads the store, or converts the .py file when the store is missing or older than the .py file
+(Static_Main still edits the .py file). The .py file is parsed, not executed: only literals, np.array, int, float,
+round and arithmetic are accepted. Loaded calibrations are kept in memory, keyed by the file modification time.
+
+    python Py3_Calibration.py D:/Archive/2024          (convert every Static_*.py file of the folders)
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import ast
+import json
+import zipfile
+import numpy as np
+
+CalibrationFormat = 'Py3_ShrineGaitModel Static Calibration'
+CalibrationFormatVersion = 1
+
+# Functions and operators allowed in the static calibration file
+Functions = {'int': int, 'float': float, 'round': round, 'str': str, 'abs': abs, 'np.array': np.array, 'numpy.array': np.array}
+Operators = {ast.Add: lambda a, b: a + b, ast.Sub: lambda a, b: a - b, ast.Mult: lambda a, b: a * b, ast.Div: lambda a, b: a / b}
+
+LoadedCalibrations = {} # {Static file name: [Key, Values]}
+
+def EvaluateNode(Node):
+    # Value of an expression of the static calibration file
+    if isinstance(Node, ast.Constant):
+        return Node.value
+    if isinstance(Node, (ast.List, ast.Tuple)):
+        return [EvaluateNode(Element) for Element in Node.elts]
+    if isinstance(Node, ast.UnaryOp) and isinstance(Node.op, (ast.USub, ast.UAdd)):
+        Value = EvaluateNode(Node.operand)
+        return -Value if isinstance(Node.op, ast.USub) else +Value
+    if isinstance(Node, ast.BinOp) and type(Node.op) in Operators:
+        return Operators[type(Node.op)](EvaluateNode(Node.left), EvaluateNode(Node.right))
+    if isinstance(Node, ast.Call) and len(Node.keywords) == 0:
+        FunctionName = ast.unparse(Node.func)
+        if FunctionName in Functions:
+            return Functions[FunctionName](*[EvaluateNode(Argument) for Argument in Node.args])
+    raise ValueError('Unsupported expression in static calibration file: ' + ast.unparse(Node))
+
+def ParseStaticFile(StaticDataFileName):
+    # {Name: Value} of the self.Name = Value lines of a static calibration (or user preferences) file
+    with open(StaticDataFileName) as StaticDataFile:
+        Tree = ast.parse(StaticDataFile.read(), StaticDataFileName)
+    Values = {}
+    for Statement in Tree.body:
+        if (not isinstance(Statement, ast.Assign) or not len(Statement.targets) == 1 or not isinstance(Statement.targets[0], ast.Attribute)
+            or not isinstance(Statement.targets[0].value, ast.Name) or not Statement.targets[0].value.id == 'self'):
+            raise ValueError('Unsupported statement in ' + StaticDataFileName + ' line ' + str(Statement.lineno))
+        Values[Statement.targets[0].attr] = EvaluateNode(Statement.value)
+    return Values
+
+def StoreFileNames(StaticDataFileName):
+    Base = os.path.splitext(StaticDataFileName)[0]
+    return [Base + '.json', Base + '.npz']
+
+def SourceKey(StaticDataFileName):
+    # Modification time and size of the .py file, None when there is no .py file
+    if not os.path.exists(StaticDataFileName):
+        return None
+    Stat = os.stat(StaticDataFileName)
+    return [Stat.st_mtime_ns, Stat.st_size]
+
+def WriteCalibration(StaticDataFileName, Values):
+    # Scalars and strings to the .json file, arrays to the .npz file
+    [JsonFileName, NpzFileName] = StoreFileNames(StaticDataFileName)
+    Scalars = {}
+    Arrays = {} # {Name: [Offset, Shape, Type]}
+    Packed = []
+    Offset = 0
+    for Name in Values:
+        if isinstance(Values[Name], np.ndarray):
+            Arrays[Name] = [Offset, list(Values[Name].shape), Values[Name].dtype.str]
+            Packed.append(np.ravel(Values[Name]).astype(float))
+            Offset = Offset + Values[Name].size
+        else:
+            Scalars[Name] = Values[Name]
+    # Written to temporary files and renamed, the .npz file first and the .json file last: workers of Py3_Batch on the
+    # same session may convert the same file at once, and a reader only uses the .npz file the .json file describes
+    Temporary = '.' + str(os.getpid()) + '.tmp'
+    try:
+        with open(NpzFileName + Temporary, 'wb') as NpzFile:
+            np.savez(NpzFile, Arrays=np.concatenate(Packed + [np.zeros(0)]))
+        with open(JsonFileName + Temporary, 'w') as JsonFile:
+            json.dump({'Format': CalibrationFormat, 'FormatVersion': CalibrationFormatVersion, 'VersionNumber': VersionNumber,
+                       'Source': os.path.basename(StaticDataFileName), 'SourceKey': SourceKey(StaticDataFileName),
+                       'Order': list(Values), 'Values': Scalars, 'Arrays': Arrays, 'ArraysSize': Offset}, JsonFile, indent=1)
+        os.replace(NpzFileName + Temporary, NpzFileName)
+        os.replace(JsonFileName + Temporary, JsonFileName)
+    finally:
+        for FileName in [NpzFileName + Temporary, JsonFileName + Temporary]:
+            if os.path.exists(FileName):
+                os.remove(FileName)
+
+def ReadCalibration(StaticDataFileName):
+    # {Name: Value} of the store, None when it is missing, unreadable (e.g. being replaced), of another format version,
+    # older than the .py file or when the .npz file is not the one of the .json file
+    [JsonFileName, NpzFileName] = StoreFileNames(StaticDataFileName)
+    if not os.path.exists(JsonFileName) or not os.path.exists(NpzFileName):
+        return None
+    try:
+        with open(JsonFileName) as JsonFile:
+            Store = json.load(JsonFile)
+        with np.load(NpzFileName, allow_pickle=False) as Arrays:
+            Packed = Arrays['Arrays']
+    except (ValueError, OSError, KeyError, zipfile.BadZipFile):
+        return None
+    if not Store.get('FormatVersion') == CalibrationFormatVersion:
+        return None
+    Key = SourceKey(StaticDataFileName)
+    if Key is not None and not Store.get('SourceKey') == Key:
+        return None
+    if not Store.get('ArraysSize', len(Packed)) == len(Packed):
+        return None
+    Values = {}
+    for Name in Store['Order']:
+        if Name in Store['Arrays']:
+            [Offset, Shape, Type] = Store['Arrays'][Name]
+            Values[Name] = Packed[Offset:Offset+int(np.prod(Shape))].reshape(Shape).astype(Type)
+        else:
+            Values[Name] = Store['Values'][Name]
+    return Values
+
+def ConvertStaticFile(StaticDataFileName):
+    # Write the store of a Static_*.py file, returns its values
+    Values = ParseStaticFile(StaticDataFileName)
+    WriteCalibration(StaticDataFileName, Values)
+    return Values
+
+def LoadCalibration(StaticDataFileName):
+    # {Name: Value} of the static calibration, from memory, the store or the converted .py file
+    Key = SourceKey(StaticDataFileName) or SourceKey(StoreFileNames(StaticDataFileName)[0])
+    if StaticDataFileName in LoadedCalibrations and LoadedCalibrations[StaticDataFileName][0] == Key:
+        return LoadedCalibrations[StaticDataFileName][1]
+    Values = ReadCalibration(StaticDataFileName)
+    if Values is None:
+        Values = ParseStaticFile(StaticDataFileName)
+        try:
+            WriteCalibration(StaticDataFileName, Values)
+        except OSError:
+            pass # Read only session folder, the .py file is parsed each time
+    LoadedCalibrations[StaticDataFileName] = [Key, Values]
+    return Values
+
+def ApplyCalibration(Object, StaticDataFileName):
+    # Set the calibration values as attributes of the program, as executing the static file did
+    Values = LoadCalibration(StaticDataFileName)
+    for Name in Values:
+        Value = Values[Name]
+        if isinstance(Value, np.ndarray):
+            Value = Value.copy()
+        setattr(Object, Name, Value)
+
+def main():
+    if len(sys.argv) < 2:
+        print('Usage: python Py3_Calibration.py <Static_*.py files or folders>')
+        return 1
+    Failures = 0
+    for Argument in sys.argv[1:]:
+        FileNames = [Argument]
+        if os.path.isdir(Argument):
+            FileNames = [os.path.join(Path, FileName) for [Path, Directories, Names] in os.walk(Argument)
+                         for FileName in sorted(Names) if FileName.startswith('Static_') and FileName.endswith('.py')]
+        for FileName in FileNames:
+            try:
+                ConvertStaticFile(FileName)
+                print('Converted', FileName)
+            except (OSError, SyntaxError, ValueError) as Error:
+                print('Failed', FileName, Error)
+                Failures = Failures + 1
+    return 1 if Failures > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
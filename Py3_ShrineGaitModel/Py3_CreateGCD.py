@@ -26,18 +26,29 @@ Last Update: Aug 26, 2024
 @author: psaraswat
 ---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 """
-VersionNumber = 'Py3_v1.3'
+VersionNumber = 'Py3_v1.4'
 
 import sys
 import numpy as np
-import scipy.signal as signal
 from datetime import datetime
 
-import tkinter as tk     ## Python 3.x
+try:
+    import tkinter as tk     ## Python 3.x
+except ImportError:
+    tk = None # Headless servers without Tk, cycles are then selected without the popup
     
-#import Vicon Nexus Subroutines
-import ViconNexus
-vicon = ViconNexus.ViconNexus()
+#import Trial Data Source (Vicon Nexus, or a C3D file when run from Py3_Headless)
+import Py3_TrialSource
+vicon = Py3_TrialSource.OpenTrialSource()
+
+#import Static Calibration Store
+import Py3_Calibration as calibration
+
+#import Math Modules
+import Py3_MathModules as math
+
+#import GCD File Writer
+import Py3_GCDFile as gcdfile
 
 Small_Font= ("Calibri", 12)
 Smaller_Font= ("Calibri", 10)
@@ -58,12 +69,46 @@ if len(sys.argv) > 1:
     TestingCondition = sys.argv[1]
 StaticDataFileName = FilePath + 'Static_' + TestingCondition + '_' + SubjectName + '.py'
 
+# Third argument is the GCD export: 'SelectedCycle' (default) or 'AllCycles'. AllCycles also writes every complete gait
+# cycle of each side with their mean and standard deviation to <Trial>.AllCycles.GCD, and uses the first complete cycle
+# for the GCD file without the cycle selection window, so it can run unattended
+GCDExports = ['SelectedCycle', 'AllCycles']
+GCDExport = GCDExports[0]
+if len(sys.argv) > 2:
+    GCDExport = sys.argv[2]
+if GCDExport not in GCDExports:
+    raise ValueError('Unknown GCD export ' + GCDExport + ' (' + ', '.join(GCDExports) + ')')
+
+# GCD variables of the all cycles export: [GCD variable name after the side, model output (L/R prefix added), component].
+# Muscle outputs have no side prefix and hold the left side in X and the right side in Y. Joint kinetics are only valid
+# for cycles with a force plate contact and stay in the GCD file of the selected cycle
+AllCyclesGCDVariables = [['TrunkObliquity', 'TrunkAngles', 1], ['TrunkTilt', 'TrunkAngles', 0], ['TrunkRotation', 'TrunkAngles', 2],
+                         ['PelvicObliquity', 'PelvisAngles', 1], ['PelvicTilt', 'PelvisAngles', 0], ['PelvicRotation', 'PelvisAngles', 2],
+                         ['HipAbAdduct', 'HipAngles', 1], ['HipFlexExt', 'HipAngles', 0], ['HipRotation', 'HipAngles', 2],
+                         ['KneeValgVar', 'KneeAngles', 1], ['KneeFlexExt', 'KneeAngles', 0], ['KneeRotation', 'KneeAngles', 2],
+                         ['KneeRotation_Proximal', 'KneeAnglesProximal', 2],
+                         ['DorsiPlanFlex', 'AnkleAngles', 0], ['FootRotation', 'AnkleAngles', 2], ['FootProgression', 'FootProgressAngles', 2],
+                         ['FemurRotation', 'ThighAngles', 2], ['TibiaRotation', 'ShankAngles', 2],
+                         ['FemurSagittalInclination', 'ThighAngles', 0], ['TibiaSagittalInclination', 'ShankAngles', 0],
+                         ['FootSagittalInclination', 'FootProgressAngles', 0]]
+AllCyclesMuscleGCDVariables = [[Muscle.replace('VastusLat', 'VastLat') + Quantity, Muscle + Quantity] for Quantity in ['Length', 'Velocity']
+                               for Muscle in ['GluteusMax','IlioPsoas','RectFem','MedHamstring','LatHamstring','Gastroc','Soleus','TibPost','Peroneal','VastusLat']]
+AllCyclesFootModelGCDVariables = [['HindFootTilt', 'HFGA', 0], ['HindFootObliquity', 'HFGA', 1], ['HindFootRotation', 'HFGA', 2],
+                                  ['ForeFootTilt', 'FFGA', 0], ['ForeFootRotation', 'FFGA', 2],
+                                  ['AnkleComplexDorsiPlanFlex', 'ANKA', 0], ['AnkleComplexValgVar', 'ANKA', 1], ['AnkleComplexRotation', 'ANKA', 2],
+                                  ['MidFootDorsiPlanFlex', 'MDFA', 0], ['MidFootSupPron', 'MDFA', 1], ['MidFootAbAdduct', 'MDFA', 2],
+                                  ['HalDorsiPlanFlex', 'HLXA', 0], ['HalValgVar', 'HLXA', 2]]
+
   
 class CreateGCD_Main():
     def __init__(self):
-        exec(open(StaticDataFileName).read()) 
+        calibration.ApplyCalibration(self, StaticDataFileName)
+        # Time normalization of the model outputs, 'Linear' for static calibrations without the preference
+        GCDInterpolation = getattr(self, 'GCDInterpolation', 'Linear')
+        # Binary companion <Trial>.GCD.bin of the GCD files (see Py3_GCDFile)
+        GCDBinary = getattr(self, 'GCDBinary', False)
         GCDFileName = FilePath + FileName + '.GCD'
-        GCDFile = open(GCDFileName,'w+')
+        GCDFile = gcdfile.GCDWriter(GCDFileName, GCDBinary)
         # Report Generator Requires this line to read GCD file
         GCDFile.write('#!DST-Python3_ShrineGaitModel' + '\n')
         # Write File Creattion Date Time
@@ -100,6 +145,31 @@ class CreateGCD_Main():
         [RightFootStrikeEventFrames, RightFootStrikeEventOffsets] = vicon.GetEvents(SubjectName,'Right','Foot Strike')
         [RightFootOffEventFrames, RightFootOffEventOffsets] = vicon.GetEvents(SubjectName,'Right','Foot Off')
         
+        # Gait cycles with all gait events [numCycle, Strike1, Strike2, ToeOff], in the order of the foot strikes
+        def FindCompleteCycles(FootStrikeEventFrames, FootOffEventFrames, OppositeFootStrikeEventFrames, OppositeFootOffEventFrames):
+            CompleteCycles = []
+            FootStrikeEventFrames = sorted(FootStrikeEventFrames)
+            for numCycle in range(len(FootStrikeEventFrames)-1):
+                Strike1 = FootStrikeEventFrames[numCycle]
+                Strike2 = FootStrikeEventFrames[numCycle + 1]
+                ToeOff = 0
+                for i in range(len(FootOffEventFrames)):
+                    if FootOffEventFrames[i] > Strike1 and FootOffEventFrames[i] < Strike2:
+                        ToeOff = FootOffEventFrames[i]
+                OppositeToeOff = [Frame for Frame in OppositeFootOffEventFrames if Frame > Strike1 and Frame < ToeOff]
+                OppositeFootStrike = [Frame for Frame in OppositeFootStrikeEventFrames if Frame > Strike1 and Frame < ToeOff]
+                if not ToeOff == 0 and len(OppositeToeOff) > 0 and len(OppositeFootStrike) > 0:
+                    CompleteCycles.append([numCycle, Strike1, Strike2, ToeOff])
+            return CompleteCycles
+        
+        # Select the first gait cycle with all gait events, used when there is no operator to select the cycle
+        def SelectFirstCompleteCycle(FootStrikeEventFrames, FootOffEventFrames, OppositeFootStrikeEventFrames, OppositeFootOffEventFrames):
+            global SelectedCycleIndex 
+            SelectedCycleIndex = 0
+            CompleteCycles = FindCompleteCycles(FootStrikeEventFrames, FootOffEventFrames, OppositeFootStrikeEventFrames, OppositeFootOffEventFrames)
+            if len(CompleteCycles) > 0:
+                SelectedCycleIndex = CompleteCycles[0][0]
+        
         # Event frame rounding, round up if offset is more than 1/2 video frame
         Off_Thresh = 1/(2*vicon.GetFrameRate())
         
@@ -116,24 +186,42 @@ class CreateGCD_Main():
             if RightFootOffEventOffsets[i] >= Off_Thresh:
                 RightFootOffEventFrames[i] = RightFootOffEventFrames[i] + 1
         
-        # Function to interpolate data to gait cycles
-        def ComputeGCDVariable(C3DVariableName,NumPointsPerGraph,Strike1,Strike2):
-            C3DVariableX = [0 for m in range(Strike2-Strike1+1)]
-            C3DVariableY = [0 for m in range(Strike2-Strike1+1)]
-            C3DVariableZ = [0 for m in range(Strike2-Strike1+1)]
-            try:
-                C3DVariable = np.array([vicon.GetModelOutput(SubjectName, C3DVariableName)][0][0])
-                C3DVariableX = C3DVariable[0][Strike1-1:Strike2]
-                C3DVariableY = C3DVariable[1][Strike1-1:Strike2]
-                C3DVariableZ = C3DVariable[2][Strike1-1:Strike2]
-            except:
-                pass
-            GCD_Time = np.linspace(0, NumPointsPerGraph-1 , NumPointsPerGraph)
-            C3D_Time = np.linspace(0, NumPointsPerGraph-1, (Strike2-Strike1+1))
-            GCDVariableX = np.interp(GCD_Time, C3D_Time, C3DVariableX)
-            GCDVariableY = np.interp(GCD_Time, C3D_Time, C3DVariableY)
-            GCDVariableZ = np.interp(GCD_Time, C3D_Time, C3DVariableZ)
-            return [GCDVariableX,GCDVariableY,GCDVariableZ]
+        # Model outputs (3, frames) and their exists flags, fetched once for both sides. Zeros when the trial has no such output
+        ModelOutputArrays = {}
+        ModelOutputExists = {}
+        def GetModelOutputArray(C3DVariableName):
+            if C3DVariableName not in ModelOutputArrays:
+                try:
+                    [Components, Exists] = vicon.GetModelOutput(SubjectName, C3DVariableName)
+                    ModelOutputArrays[C3DVariableName] = np.array(Components, dtype=float)
+                    ModelOutputExists[C3DVariableName] = np.array(Exists, dtype=bool)
+                except:
+                    ModelOutputArrays[C3DVariableName] = np.zeros((3, vicon.GetFrameCount()))
+                    ModelOutputExists[C3DVariableName] = np.zeros(vicon.GetFrameCount(), dtype=bool)
+            return ModelOutputArrays[C3DVariableName]
+        
+        # Kinetics are written when Dynamic_Main wrote the joint moments (Kinetics output group), and the muscle lengths and
+        # velocities when it wrote the muscle lengths (MuscleLengths output group). Outputs of output groups left out by the
+        # output profile are still in the trial when an earlier run created them, without existing frames
+        def ModelOutputWritten(C3DVariableName):
+            if C3DVariableName not in ModelOutputs:
+                return False
+            GetModelOutputArray(C3DVariableName)
+            return bool(ModelOutputExists[C3DVariableName].any())
+        LeftKineticsWritten = ModelOutputWritten('LAnkleMoment')
+        RightKineticsWritten = ModelOutputWritten('RAnkleMoment')
+        MuscleLengthsWritten = ModelOutputWritten('GluteusMaxLength')
+        
+        # Function to interpolate data to gait cycles: the model outputs are stacked (variables, 3, frames) and every
+        # cycle [Strike1, Strike2] is resampled in one pass. Returns (cycles, variables, 3, NumPointsPerGraph)
+        def NormalizeModelOutputs(C3DVariableNames,NumPointsPerGraph,Cycles):
+            C3DVariables = np.stack([GetModelOutputArray(C3DVariableName) for C3DVariableName in C3DVariableNames])
+            return math.TimeNormalize_Batch(C3DVariables, Cycles, NumPointsPerGraph, GCDInterpolation)
+        
+        # GCD Variables {C3DVariableName: [GCDVariableX,GCDVariableY,GCDVariableZ]} of the model outputs for one cycle
+        def ComputeGCDVariables(C3DVariableNames,NumPointsPerGraph,Strike1,Strike2):
+            GCDVariables = NormalizeModelOutputs(C3DVariableNames, NumPointsPerGraph, [[Strike1, Strike2]])[0]
+            return {C3DVariableName: list(GCDVariables[Index]) for [Index, C3DVariableName] in enumerate(C3DVariableNames)}
         
         def ComputeGCDVariableEMG(EMG_Digital,EMG_Analog,EMG_DigitalDeviceID,EMG_AnalogDeviceID,EMG_DigitalDeviceOutputIDs,EMG_AnalogDeviceOutputIDs,C3DVariableName,NumPointsPerGraph,Strike1,Strike2):
             try:
@@ -236,24 +324,13 @@ class CreateGCD_Main():
             return [GCDVariable_GRFx,GCDVariable_GRFy,GCDVariable_GRFz,GCDVariable_GRTz,GCDVariable_COPx,GCDVariable_COPy]
             
         def WriteArrayToGCD(GCDFile, GCDVariableName, GCDVariable):
-            GCDFile.write('!' + GCDVariableName + '\n')
-            for i in range(len(GCDVariable)):
-                GCDFile.write(str(np.format_float_positional(float(GCDVariable[i]),precision=6))  + '\n')
+            # Values are formatted when the GCD file is closed (see Py3_GCDFile)
+            GCDFile.WriteArray(GCDVariableName, GCDVariable)
                 
         def WriteSingleValueToGCD(GCDFile, GCDVariableName, GCDVariable):
-            GCDFile.write('!' + GCDVariableName + '\n')
-            GCDFile.write(str(np.format_float_positional(float(GCDVariable),precision=6))  + '\n')   
+            GCDFile.WriteSingleValue(GCDVariableName, GCDVariable)
         
-        def WriteArrayToGCD_ComputeEMGenvelope(GCDFile, GCDVariableName, GCDVariable,
-                                               AveragingWindowSizeInMiliseconds):
-            GCDFile.write('!' + GCDVariableName + '\n')
-            for i in range(len(GCDVariable)):
-                GCDFile.write(str(round(float(GCDVariable[i]), 6)) + '\n')
-
-            # Envelope
-            GCD_Time = np.linspace(0, NumPointsPerGraph - 1, NumPointsPerGraph)
-            EMG_Time = np.linspace(0, NumPointsPerGraph - 1, len(GCDVariable))
-
+        def EMGSignalFrequency():
             # Find Signal Frequency
             EMG_DeviceID = 0
             DeviceIDs = vicon.GetDeviceIDs()
@@ -297,38 +374,25 @@ class CreateGCD_Main():
             # Set Signal Frequency to non-zero
             if SignalFrequency == 0:
                 SignalFrequency = 10 * MarkerFrameRate
-            ###########################################
+            return SignalFrequency
 
-            # Design the Buterworth filter
-            FilterOrder  = 5    
-            CutOffFrequency = 10 
-            B, A = signal.butter(FilterOrder,CutOffFrequency/(SignalFrequency/2.0),btype='high',output='ba')
-            
-            # Apply the filter
-            GCDVariable_Filtered = signal.filtfilt(B,A, GCDVariable)
-            
-            # Rectify the signal
-            GCDVariable_Rectified = abs(GCDVariable_Filtered)
-            
-            # Compute window average
-            WindowSizeTime = AveragingWindowSizeInMiliseconds # ms
-            WindowSize = int(WindowSizeTime*(1000/SignalFrequency))
-            GCDVariable_WindowAveraged = GCDVariable_Rectified
-            for i in range(len(GCDVariable_Rectified)):
-                if i < WindowSize/2:       
-                    GCDVariable_WindowAveraged[i] =  sum(GCDVariable_WindowAveraged[i:WindowSize-i])/len(GCDVariable[i:WindowSize-i])
-                else:
-                    GCDVariable_WindowAveraged[i] =  sum(GCDVariable_WindowAveraged[i-int(WindowSize/2):i+int(WindowSize/2)])/len(GCDVariable[i-int(WindowSize/2):i+int(WindowSize/2)])
-                    if i > len(GCDVariable_Rectified) - (WindowSize/2):
-                        GCDVariable_WindowAveraged[i] =  sum(GCDVariable_WindowAveraged[i-(WindowSize-(len(GCDVariable_Rectified)-i)):len(GCDVariable_Rectified)])/len(GCDVariable[i-(WindowSize-(len(GCDVariable_Rectified)-i)):len(GCDVariable_Rectified)])
+        def WriteArrayToGCD_ComputeEMGenvelope(GCDFile, EMGChannels, AveragingWindowSizeInMiliseconds):
+            # Raw EMG of the channels [GCDVariableName, GCDVariable] and their envelopes. Channels of the same length
+            # are filtered and averaged together (see Py3_MathModules.EMGEnvelope_Batch)
+            SignalFrequency = EMGSignalFrequency()
+            GCD_Time = np.linspace(0, NumPointsPerGraph - 1, NumPointsPerGraph)
+            Lengths = [len(GCDVariable) for [GCDVariableName, GCDVariable] in EMGChannels]
+            Envelopes = [None for m in range(len(EMGChannels))]
+            for Length in set(Lengths):
+                Channels = [Index for Index in range(len(EMGChannels)) if Lengths[Index] == Length]
+                GCDVariables_WindowAveraged = math.EMGEnvelope_Batch([EMGChannels[Index][1] for Index in Channels], SignalFrequency, AveragingWindowSizeInMiliseconds)
+                EMG_Time = np.linspace(0, NumPointsPerGraph - 1, Length)
+                for [Row, Index] in enumerate(Channels):
+                    Envelopes[Index] = np.interp(GCD_Time, EMG_Time, GCDVariables_WindowAveraged[Row])
 
-            # Compute Envelope
-            GCDVariable_Envelope = np.interp(GCD_Time, EMG_Time, GCDVariable_WindowAveraged)
-
-            GCDFile.write('!' + GCDVariableName + 'Envelope' + '\n')
-            for i in range(len(GCDVariable_Envelope)):
-                GCDFile.write(str(round(float(GCDVariable_Envelope[i]), 6)) + '\n')
-                    
+            for [[GCDVariableName, GCDVariable], GCDVariable_Envelope] in zip(EMGChannels, Envelopes):
+                GCDFile.WriteRoundedArray(GCDVariableName, GCDVariable)
+                GCDFile.WriteRoundedArray(GCDVariableName + 'Envelope', GCDVariable_Envelope)
 
         
         # Left
@@ -342,107 +406,111 @@ class CreateGCD_Main():
             if len(LeftFootStrikeEventFrames) > 2:
                 # More than one Left Gait Cycle Found
                 
-                # Open a window to display page selection
-                popup = self.popup = tk.Tk()
-                #popup.resizable(0,0)
-                #popup.geometry('%dx%d+%d+%d' % (600, 200, 0, 0))
-                #Centers the App on Monitor
-                AppWidth = 600
-                AppHeight= 200
-                ScreenWidth = 1600#self.winfo_screenwidth()
-                ScreenHeight = 1000#self.winfo_screenheight()
-                x=(ScreenWidth/2) - (AppWidth/2)
-                y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
-                #y=100
-                popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
-                popup.title('Gait Cycle Selection')
+                if vicon.Headless or GCDExport == 'AllCycles':
+                    # No operator to select the cycle, use the first cycle with all gait events
+                    SelectFirstCompleteCycle(LeftFootStrikeEventFrames, LeftFootOffEventFrames, RightFootStrikeEventFrames, RightFootOffEventFrames)
+                else:
+                    # Open a window to display page selection
+                    popup = self.popup = tk.Tk()
+                    #popup.resizable(0,0)
+                    #popup.geometry('%dx%d+%d+%d' % (600, 200, 0, 0))
+                    #Centers the App on Monitor
+                    AppWidth = 600
+                    AppHeight= 200
+                    ScreenWidth = 1600#self.winfo_screenwidth()
+                    ScreenHeight = 1000#self.winfo_screenheight()
+                    x=(ScreenWidth/2) - (AppWidth/2)
+                    y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
+                    #y=100
+                    popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
+                    popup.title('Gait Cycle Selection')
                 
                 
-                # Add Save PDF Button
-                ProceedButton = tk.Button(popup, text="Proceed", command= lambda: [ReadCycleSelectionLeft(), self.popup.destroy()], font=Small_Font, justify = 'center')#anchor = 'se')
-                ProceedButton.place(x=10,y=200-60,width=600-100,height=50) 
-                # Exit Button
-                CancelButton = tk.Button(popup, text="Cancel", command=lambda: cancelLeft(), font=Small_Font, justify = 'center')
-                CancelButton.place(x=600-80,y=200-60,width = 70, height = 50)
+                    # Add Save PDF Button
+                    ProceedButton = tk.Button(popup, text="Proceed", command= lambda: [ReadCycleSelectionLeft(), self.popup.destroy()], font=Small_Font, justify = 'center')#anchor = 'se')
+                    ProceedButton.place(x=10,y=200-60,width=600-100,height=50) 
+                    # Exit Button
+                    CancelButton = tk.Button(popup, text="Cancel", command=lambda: cancelLeft(), font=Small_Font, justify = 'center')
+                    CancelButton.place(x=600-80,y=200-60,width = 70, height = 50)
                 
-                #print 'IC   OTO     OIC     TO  IC'
-                TitleLabelText = 'Side' + ' \t' + 'IC' + ' \t' + 'OTO' + ' \t' + 'OIC' + ' \t' + 'TO' + ' \t' + 'IC'
-                TitleLabel = tk.Label(popup, text=TitleLabelText,font=Small_Font, justify = 'left')
-                TitleLabel.place(x=45,y=10)
+                    #print 'IC   OTO     OIC     TO  IC'
+                    TitleLabelText = 'Side' + ' \t' + 'IC' + ' \t' + 'OTO' + ' \t' + 'OIC' + ' \t' + 'TO' + ' \t' + 'IC'
+                    TitleLabel = tk.Label(popup, text=TitleLabelText,font=Small_Font, justify = 'left')
+                    TitleLabel.place(x=45,y=10)
                 
-                numCycleIndex = tk.IntVar()
-                for numCycle in range(len(LeftFootStrikeEventFrames)-1):
-                    LeftStrike1 = 0.
-                    LeftStrike2 = 0.
-                    LeftToeOff = 0.
-                    LeftOppositeToeOff = 0.
-                    LeftOppositeFootStrike = 0.
-                    LeftStrike1 = sorted(LeftFootStrikeEventFrames)[numCycle]
-                    LeftStrike2 = sorted(LeftFootStrikeEventFrames)[numCycle + 1]
-                    for i in range(len(LeftFootOffEventFrames)):
-                        if LeftFootOffEventFrames[i] > LeftStrike1 and LeftFootOffEventFrames[i] < LeftStrike2:
-                            LeftToeOff = LeftFootOffEventFrames[i]
-                    for i in range(len(RightFootOffEventFrames)):
-                         if RightFootOffEventFrames[i] > LeftStrike1 and RightFootOffEventFrames[i] < LeftToeOff:
-                            LeftOppositeToeOff = RightFootOffEventFrames[i]
-                    for i in range(len(RightFootStrikeEventFrames)):
-                         if RightFootStrikeEventFrames[i] > LeftStrike1 and RightFootStrikeEventFrames[i] < LeftToeOff:
-                            LeftOppositeFootStrike = RightFootStrikeEventFrames[i] 
-                    # Change to blank if value not found
-                    if LeftToeOff == 0:
-                        StringLeftToeOff = '   '
-                    else:
-                        StringLeftToeOff = str(LeftToeOff)
-                    if LeftOppositeToeOff == 0:
-                        StringLeftOppositeToeOff = '   '
-                    else:
-                        StringLeftOppositeToeOff = str(LeftOppositeToeOff)
-                    if LeftOppositeFootStrike == 0:
-                        StringLeftOppositeFootStrike = '   '
-                    else:
-                        StringLeftOppositeFootStrike = str(LeftOppositeFootStrike)
+                    numCycleIndex = tk.IntVar()
+                    for numCycle in range(len(LeftFootStrikeEventFrames)-1):
+                        LeftStrike1 = 0.
+                        LeftStrike2 = 0.
+                        LeftToeOff = 0.
+                        LeftOppositeToeOff = 0.
+                        LeftOppositeFootStrike = 0.
+                        LeftStrike1 = sorted(LeftFootStrikeEventFrames)[numCycle]
+                        LeftStrike2 = sorted(LeftFootStrikeEventFrames)[numCycle + 1]
+                        for i in range(len(LeftFootOffEventFrames)):
+                            if LeftFootOffEventFrames[i] > LeftStrike1 and LeftFootOffEventFrames[i] < LeftStrike2:
+                                LeftToeOff = LeftFootOffEventFrames[i]
+                        for i in range(len(RightFootOffEventFrames)):
+                             if RightFootOffEventFrames[i] > LeftStrike1 and RightFootOffEventFrames[i] < LeftToeOff:
+                                LeftOppositeToeOff = RightFootOffEventFrames[i]
+                        for i in range(len(RightFootStrikeEventFrames)):
+                             if RightFootStrikeEventFrames[i] > LeftStrike1 and RightFootStrikeEventFrames[i] < LeftToeOff:
+                                LeftOppositeFootStrike = RightFootStrikeEventFrames[i] 
+                        # Change to blank if value not found
+                        if LeftToeOff == 0:
+                            StringLeftToeOff = '   '
+                        else:
+                            StringLeftToeOff = str(LeftToeOff)
+                        if LeftOppositeToeOff == 0:
+                            StringLeftOppositeToeOff = '   '
+                        else:
+                            StringLeftOppositeToeOff = str(LeftOppositeToeOff)
+                        if LeftOppositeFootStrike == 0:
+                            StringLeftOppositeFootStrike = '   '
+                        else:
+                            StringLeftOppositeFootStrike = str(LeftOppositeFootStrike)
                         
-                    numCycleButtonText = 'Left' + ' \t' + str(LeftStrike1) + ' \t' + StringLeftOppositeToeOff + ' \t' + StringLeftOppositeFootStrike + ' \t' + StringLeftToeOff + ' \t' + str(LeftStrike2) + '\n'
+                        numCycleButtonText = 'Left' + ' \t' + str(LeftStrike1) + ' \t' + StringLeftOppositeToeOff + ' \t' + StringLeftOppositeFootStrike + ' \t' + StringLeftToeOff + ' \t' + str(LeftStrike2) + '\n'
                     
-                    numCycleButton = tk.Radiobutton(popup, text=numCycleButtonText, variable = numCycleIndex, value=numCycle, font=Small_Font, command= lambda: ReadCycleSelectionLeft(), anchor = 'center',background='white') 
-                    numCycleButton.place(x=10, y = 10 + (numCycle + 1)*35, height = 30, width = 400)                    
+                        numCycleButton = tk.Radiobutton(popup, text=numCycleButtonText, variable = numCycleIndex, value=numCycle, font=Small_Font, command= lambda: ReadCycleSelectionLeft(), anchor = 'center',background='white') 
+                        numCycleButton.place(x=10, y = 10 + (numCycle + 1)*35, height = 30, width = 400)                    
                     
-                    if LeftStrike1 == 0 or LeftStrike2 == 0 or LeftToeOff == 0 or LeftOppositeToeOff == 0 or LeftOppositeFootStrike == 0:
-                        WarningLabel = tk.Label(popup,text="Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
-                        WarningLabel.place(x=420,y=10 + (numCycle + 1)*35, height = 30,)
+                        if LeftStrike1 == 0 or LeftStrike2 == 0 or LeftToeOff == 0 or LeftOppositeToeOff == 0 or LeftOppositeFootStrike == 0:
+                            WarningLabel = tk.Label(popup,text="Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
+                            WarningLabel.place(x=420,y=10 + (numCycle + 1)*35, height = 30,)
                         
 
                 
-                def cancelLeft():
-                    popup.destroy
-                    sys.exit()
+                    def cancelLeft():
+                        popup.destroy
+                        sys.exit()
                     
-                def ReadCycleSelectionLeft():
-                    global SelectedCycleIndex 
-                    SelectedCycleIndex = numCycleIndex.get()
-                    LeftStrike1 = 0.
-                    LeftStrike2 = 0.
-                    LeftToeOff = 0.
-                    LeftOppositeToeOff = 0.
-                    LeftOppositeFootStrike = 0.
-                    LeftStrike1 = sorted(LeftFootStrikeEventFrames)[SelectedCycleIndex ]
-                    LeftStrike2 = sorted(LeftFootStrikeEventFrames)[SelectedCycleIndex  + 1]
-                    for i in range(len(LeftFootOffEventFrames)):
-                        if LeftFootOffEventFrames[i] > LeftStrike1 and LeftFootOffEventFrames[i] < LeftStrike2:
-                            LeftToeOff = LeftFootOffEventFrames[i]
-                    for i in range(len(RightFootOffEventFrames)):
-                         if RightFootOffEventFrames[i] > LeftStrike1 and RightFootOffEventFrames[i] < LeftToeOff:
-                            LeftOppositeToeOff = RightFootOffEventFrames[i]
-                    for i in range(len(RightFootStrikeEventFrames)):
-                         if RightFootStrikeEventFrames[i] > LeftStrike1 and RightFootStrikeEventFrames[i] < LeftToeOff:
-                            LeftOppositeFootStrike = RightFootStrikeEventFrames[i] 
-                    if LeftStrike1 == 0 or LeftStrike2 == 0 or LeftToeOff == 0 or LeftOppositeToeOff == 0 or LeftOppositeFootStrike == 0:
-                        ProceedButton.place_forget()
-                    else:
-                        ProceedButton.place(x=10,y=200-60,width=600-100,height=50)
+                    def ReadCycleSelectionLeft():
+                        global SelectedCycleIndex 
+                        SelectedCycleIndex = numCycleIndex.get()
+                        LeftStrike1 = 0.
+                        LeftStrike2 = 0.
+                        LeftToeOff = 0.
+                        LeftOppositeToeOff = 0.
+                        LeftOppositeFootStrike = 0.
+                        LeftStrike1 = sorted(LeftFootStrikeEventFrames)[SelectedCycleIndex ]
+                        LeftStrike2 = sorted(LeftFootStrikeEventFrames)[SelectedCycleIndex  + 1]
+                        for i in range(len(LeftFootOffEventFrames)):
+                            if LeftFootOffEventFrames[i] > LeftStrike1 and LeftFootOffEventFrames[i] < LeftStrike2:
+                                LeftToeOff = LeftFootOffEventFrames[i]
+                        for i in range(len(RightFootOffEventFrames)):
+                             if RightFootOffEventFrames[i] > LeftStrike1 and RightFootOffEventFrames[i] < LeftToeOff:
+                                LeftOppositeToeOff = RightFootOffEventFrames[i]
+                        for i in range(len(RightFootStrikeEventFrames)):
+                             if RightFootStrikeEventFrames[i] > LeftStrike1 and RightFootStrikeEventFrames[i] < LeftToeOff:
+                                LeftOppositeFootStrike = RightFootStrikeEventFrames[i] 
+                        if LeftStrike1 == 0 or LeftStrike2 == 0 or LeftToeOff == 0 or LeftOppositeToeOff == 0 or LeftOppositeFootStrike == 0:
+                            ProceedButton.place_forget()
+                        else:
+                            ProceedButton.place(x=10,y=200-60,width=600-100,height=50)
                         
-                ReadCycleSelectionLeft()
-                popup.mainloop()
+                    ReadCycleSelectionLeft()
+                    popup.mainloop()
                 
                 
                 LeftStrike1 = sorted(LeftFootStrikeEventFrames)[SelectedCycleIndex ]
@@ -474,19 +542,22 @@ class CreateGCD_Main():
                         LeftOppositeFootStrike = RightFootStrikeEventFrames[i]
                 
                 if LeftOppositeFootStrike == 0 or LeftOppositeToeOff == 0:
-                    popup = tk.Tk()
-                    popup.resizable(0,0)
-                    AppWidth = 400
-                    AppHeight= 50
-                    ScreenWidth = 1600#self.winfo_screenwidth()
-                    ScreenHeight = 1000#self.winfo_screenheight()
-                    x=(ScreenWidth/2) - (AppWidth/2)
-                    y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
-                    popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
-                    popup.title('Warning')
-                    WarningMessage = tk.Label(popup,text="Left Side: Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
-                    WarningMessage.pack()
-                    popup.mainloop()
+                    if vicon.Headless or GCDExport == 'AllCycles':
+                        print('Left Side: Missing Gait Events!!!')
+                    else:
+                        popup = tk.Tk()
+                        popup.resizable(0,0)
+                        AppWidth = 400
+                        AppHeight= 50
+                        ScreenWidth = 1600#self.winfo_screenwidth()
+                        ScreenHeight = 1000#self.winfo_screenheight()
+                        x=(ScreenWidth/2) - (AppWidth/2)
+                        y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
+                        popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
+                        popup.title('Warning')
+                        WarningMessage = tk.Label(popup,text="Left Side: Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
+                        WarningMessage.pack()
+                        popup.mainloop()
                     
             #print str(LeftStrike1) + ' \t' + str(LeftOppositeToeOff) + ' \t' + str(LeftOppositeFootStrike) + ' \t' + str(LeftToeOff) + ' \t' + str(LeftStrike2) + '\n'
             # Compute Stride Temporal Parameters
@@ -517,55 +588,61 @@ class CreateGCD_Main():
             LeftDoubleSupport  = LeftDoubleSupport1 + LeftDoubleSupport2
                         
             # Compute GCD Variables
-            [LeftTrunkTilt,LeftTrunkObliquity,LeftTrunkRotation]    = ComputeGCDVariable('LTrunkAngles' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftPelvicTilt,LeftPelvicObliquity,LeftPelvicRotation] = ComputeGCDVariable('LPelvisAngles', NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftHipFlexExt,LeftHipAbAdduct,LeftHipRotation]        = ComputeGCDVariable('LHipAngles'   , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftKneeFlexExt,LeftKneeValgVar,LeftKneeRotation]      = ComputeGCDVariable('LKneeAngles'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [DummyX,DummyY,LeftKneeRotation_Proximal]      = ComputeGCDVariable('LKneeAnglesProximal'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftDorsiPlanFlex,DummyY,LeftFootRotation]             = ComputeGCDVariable('LAnkleAngles' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftFootSagittalInclination,DummyY,LeftFootProgression]        = ComputeGCDVariable('LFootProgressAngles'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            LeftGCDVariables = ComputeGCDVariables(['LTrunkAngles','LPelvisAngles','LHipAngles','LKneeAngles','LKneeAnglesProximal','LAnkleAngles','LFootProgressAngles','LThighAngles','LShankAngles',
+                                                    'GluteusMaxLength','IlioPsoasLength','RectFemLength','MedHamstringLength','LatHamstringLength','GastrocLength','SoleusLength','TibPostLength','PeronealLength','VastusLatLength',
+                                                    'GluteusMaxVelocity','IlioPsoasVelocity','RectFemVelocity','MedHamstringVelocity','LatHamstringVelocity','GastrocVelocity','SoleusVelocity','TibPostVelocity','PeronealVelocity','VastusLatVelocity'], NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            [LeftTrunkTilt,LeftTrunkObliquity,LeftTrunkRotation]    = LeftGCDVariables['LTrunkAngles']
+            [LeftPelvicTilt,LeftPelvicObliquity,LeftPelvicRotation] = LeftGCDVariables['LPelvisAngles']
+            [LeftHipFlexExt,LeftHipAbAdduct,LeftHipRotation]        = LeftGCDVariables['LHipAngles']
+            [LeftKneeFlexExt,LeftKneeValgVar,LeftKneeRotation]      = LeftGCDVariables['LKneeAngles']
+            [DummyX,DummyY,LeftKneeRotation_Proximal]      = LeftGCDVariables['LKneeAnglesProximal']
+            [LeftDorsiPlanFlex,DummyY,LeftFootRotation]             = LeftGCDVariables['LAnkleAngles']
+            [LeftFootSagittalInclination,DummyY,LeftFootProgression]        = LeftGCDVariables['LFootProgressAngles']
             # Compute Pelvis, Knee and Ankle Progression GCD Variables
-            [LeftFemurSagittalInclination,DummyY,LeftFemurProgression]      = ComputeGCDVariable('LThighAngles'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftTibiaSagittalInclination,DummyY,LeftTibiaProgression]      = ComputeGCDVariable('LShankAngles'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            [LeftFemurSagittalInclination,DummyY,LeftFemurProgression]      = LeftGCDVariables['LThighAngles']
+            [LeftTibiaSagittalInclination,DummyY,LeftTibiaProgression]      = LeftGCDVariables['LShankAngles']
             
             # Muscle Length 
-            [LeftGluteusMaxLength,DummyY,DummyZ]    = ComputeGCDVariable('GluteusMaxLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftIlioPsoasLength,DummyY,DummyZ]    = ComputeGCDVariable('IlioPsoasLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftRectFemLength,DummyY,DummyZ]    = ComputeGCDVariable('RectFemLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftMedHamstringLength,DummyY,DummyZ]    = ComputeGCDVariable('MedHamstringLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftLatHamstringLength,DummyY,DummyZ]    = ComputeGCDVariable('LatHamstringLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftGastrocLength,DummyY,DummyZ]    = ComputeGCDVariable('GastrocLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftSoleusLength,DummyY,DummyZ]    = ComputeGCDVariable('SoleusLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftTibPostLength,DummyY,DummyZ]    = ComputeGCDVariable('TibPostLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftPeronealLength,DummyY,DummyZ]    = ComputeGCDVariable('PeronealLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftVastusLatLength,DummyY,DummyZ]    = ComputeGCDVariable('VastusLatLength' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            [LeftGluteusMaxLength,DummyY,DummyZ]    = LeftGCDVariables['GluteusMaxLength']
+            [LeftIlioPsoasLength,DummyY,DummyZ]    = LeftGCDVariables['IlioPsoasLength']
+            [LeftRectFemLength,DummyY,DummyZ]    = LeftGCDVariables['RectFemLength']
+            [LeftMedHamstringLength,DummyY,DummyZ]    = LeftGCDVariables['MedHamstringLength']
+            [LeftLatHamstringLength,DummyY,DummyZ]    = LeftGCDVariables['LatHamstringLength']
+            [LeftGastrocLength,DummyY,DummyZ]    = LeftGCDVariables['GastrocLength']
+            [LeftSoleusLength,DummyY,DummyZ]    = LeftGCDVariables['SoleusLength']
+            [LeftTibPostLength,DummyY,DummyZ]    = LeftGCDVariables['TibPostLength']
+            [LeftPeronealLength,DummyY,DummyZ]    = LeftGCDVariables['PeronealLength']
+            [LeftVastusLatLength,DummyY,DummyZ]    = LeftGCDVariables['VastusLatLength']
             # Muscle Velocity 
-            [LeftGluteusMaxVelocity,DummyY,DummyZ]    = ComputeGCDVariable('GluteusMaxVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftIlioPsoasVelocity,DummyY,DummyZ]    = ComputeGCDVariable('IlioPsoasVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftRectFemVelocity,DummyY,DummyZ]    = ComputeGCDVariable('RectFemVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftMedHamstringVelocity,DummyY,DummyZ]    = ComputeGCDVariable('MedHamstringVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftLatHamstringVelocity,DummyY,DummyZ]    = ComputeGCDVariable('LatHamstringVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftGastrocVelocity,DummyY,DummyZ]    = ComputeGCDVariable('GastrocVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftSoleusVelocity,DummyY,DummyZ]    = ComputeGCDVariable('SoleusVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftTibPostVelocity,DummyY,DummyZ]    = ComputeGCDVariable('TibPostVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftPeronealVelocity,DummyY,DummyZ]    = ComputeGCDVariable('PeronealVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-            [LeftVastusLatVelocity,DummyY,DummyZ]    = ComputeGCDVariable('VastusLatVelocity' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            [LeftGluteusMaxVelocity,DummyY,DummyZ]    = LeftGCDVariables['GluteusMaxVelocity']
+            [LeftIlioPsoasVelocity,DummyY,DummyZ]    = LeftGCDVariables['IlioPsoasVelocity']
+            [LeftRectFemVelocity,DummyY,DummyZ]    = LeftGCDVariables['RectFemVelocity']
+            [LeftMedHamstringVelocity,DummyY,DummyZ]    = LeftGCDVariables['MedHamstringVelocity']
+            [LeftLatHamstringVelocity,DummyY,DummyZ]    = LeftGCDVariables['LatHamstringVelocity']
+            [LeftGastrocVelocity,DummyY,DummyZ]    = LeftGCDVariables['GastrocVelocity']
+            [LeftSoleusVelocity,DummyY,DummyZ]    = LeftGCDVariables['SoleusVelocity']
+            [LeftTibPostVelocity,DummyY,DummyZ]    = LeftGCDVariables['TibPostVelocity']
+            [LeftPeronealVelocity,DummyY,DummyZ]    = LeftGCDVariables['PeronealVelocity']
+            [LeftVastusLatVelocity,DummyY,DummyZ]    = LeftGCDVariables['VastusLatVelocity']
             
             
             
             # Check if Kinetics Data exist
-            if 'LAnklePowerComponents' in ModelOutputs:
-                [LeftHipFlexExtMoment,LeftHipAbAdductMoment,LeftHipRotationMoment]      = ComputeGCDVariable('LHipMoment'   , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftKneeFlexExtMoment,LeftKneeValgVarMoment,LeftKneeRotationMoment]    = ComputeGCDVariable('LKneeMoment'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftDorsiPlanFlexMoment,LeftFootAbAdductMoment,LeftFootRotationMoment] = ComputeGCDVariable('LAnkleMoment' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+            if LeftKineticsWritten:
+                LeftGCDVariables = ComputeGCDVariables(['LHipMoment','LKneeMoment','LAnkleMoment',
+                                                        'LHipPowerComponents','LKneePowerComponents','LAnklePowerComponents',
+                                                        'LHipPower','LKneePower','LAnklePower'], NumPointsPerGraph, LeftStrike1, LeftStrike2)
+                [LeftHipFlexExtMoment,LeftHipAbAdductMoment,LeftHipRotationMoment]      = LeftGCDVariables['LHipMoment']
+                [LeftKneeFlexExtMoment,LeftKneeValgVarMoment,LeftKneeRotationMoment]    = LeftGCDVariables['LKneeMoment']
+                [LeftDorsiPlanFlexMoment,LeftFootAbAdductMoment,LeftFootRotationMoment] = LeftGCDVariables['LAnkleMoment']
                 
-                [LeftHipFlexExtPower,LeftHipAbAdductPower,LeftHipRotationPower]         = ComputeGCDVariable('LHipPowerComponents'    , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftKneeFlexExtPower,LeftKneeValgVarPower,LeftKneeRotationPower]       = ComputeGCDVariable('LKneePowerComponents'   , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftDorsiPlanFlexPower,LeftFootAbAdductPower,LeftFootRotationPower]    = ComputeGCDVariable('LAnklePowerComponents'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+                [LeftHipFlexExtPower,LeftHipAbAdductPower,LeftHipRotationPower]         = LeftGCDVariables['LHipPowerComponents']
+                [LeftKneeFlexExtPower,LeftKneeValgVarPower,LeftKneeRotationPower]       = LeftGCDVariables['LKneePowerComponents']
+                [LeftDorsiPlanFlexPower,LeftFootAbAdductPower,LeftFootRotationPower]    = LeftGCDVariables['LAnklePowerComponents']
                 
-                [DummyX,DummyY,LeftHipPowerTotal]         = ComputeGCDVariable('LHipPower'    , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [DummyX,DummyY,LeftKneePowerTotal]       = ComputeGCDVariable('LKneePower'   , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [DummyX,DummyY,LeftAnklePowerTotal]    = ComputeGCDVariable('LAnklePower'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+                [DummyX,DummyY,LeftHipPowerTotal]         = LeftGCDVariables['LHipPower']
+                [DummyX,DummyY,LeftKneePowerTotal]       = LeftGCDVariables['LKneePower']
+                [DummyX,DummyY,LeftAnklePowerTotal]    = LeftGCDVariables['LAnklePower']
                 
                 # Check for Force Plate Hits
                 LeftForcePlate_DeviceID = 0 #Default Value if Force Plate Hit is not Found
@@ -673,13 +750,14 @@ class CreateGCD_Main():
                 
             # Check if Foot Model data exists
             if self.valueLeftFootModelCheck == '1':
-                [LeftHindFootTilt,LeftHindFootObliquity,LeftHindFootRotation]                    = ComputeGCDVariable('LHFGA' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftForeFootTilt,LeftForeFootObliquity,LeftForeFootRotation]                    = ComputeGCDVariable('LFFGA' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftAnkleComplexDorsiPlanFlex,LeftAnkleComplexValgVar,LeftAnkleComplexRotation] = ComputeGCDVariable('LANKA' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftMidFootDorsiPlanFlex,LeftMidFootSupPron,LeftMidFootAbAdduct]                = ComputeGCDVariable('LMDFA' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftToeFlexExt,DummyY,LeftToeValgVar]                                           = ComputeGCDVariable('LHLXA' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftSupination,DummyY,DummyZ]                                                   = ComputeGCDVariable('Supination' , NumPointsPerGraph, LeftStrike1, LeftStrike2)
-                [LeftSkew,DummyY,DummyZ]                                                         = ComputeGCDVariable('Skew'  , NumPointsPerGraph, LeftStrike1, LeftStrike2)
+                LeftGCDVariables = ComputeGCDVariables(['LHFGA','LFFGA','LANKA','LMDFA','LHLXA','Supination','Skew'], NumPointsPerGraph, LeftStrike1, LeftStrike2)
+                [LeftHindFootTilt,LeftHindFootObliquity,LeftHindFootRotation]                    = LeftGCDVariables['LHFGA']
+                [LeftForeFootTilt,LeftForeFootObliquity,LeftForeFootRotation]                    = LeftGCDVariables['LFFGA']
+                [LeftAnkleComplexDorsiPlanFlex,LeftAnkleComplexValgVar,LeftAnkleComplexRotation] = LeftGCDVariables['LANKA']
+                [LeftMidFootDorsiPlanFlex,LeftMidFootSupPron,LeftMidFootAbAdduct]                = LeftGCDVariables['LMDFA']
+                [LeftToeFlexExt,DummyY,LeftToeValgVar]                                           = LeftGCDVariables['LHLXA']
+                [LeftSupination,DummyY,DummyZ]                                                   = LeftGCDVariables['Supination']
+                [LeftSkew,DummyY,DummyZ]                                                         = LeftGCDVariables['Skew']
                 
             
             
@@ -694,104 +772,108 @@ class CreateGCD_Main():
             if len(RightFootStrikeEventFrames) > 2:
                 # More than one Right Gait Cycle Found
                 
-                # Open a window to display page selection
-                popup = self.popup = tk.Tk()
-                #popup.resizable(0,0)
-                #popup.geometry('%dx%d+%d+%d' % (600, 200, 0, 0))
-                #Centers the App on Monitor
-                AppWidth = 600
-                AppHeight= 200
-                ScreenWidth = 1600#self.winfo_screenwidth()
-                ScreenHeight = 1000#self.winfo_screenheight()
-                x=(ScreenWidth/2) - (AppWidth/2)
-                y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
-                #y=100
-                popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
-                popup.title('Gait Cycle Selection')
+                if vicon.Headless or GCDExport == 'AllCycles':
+                    # No operator to select the cycle, use the first cycle with all gait events
+                    SelectFirstCompleteCycle(RightFootStrikeEventFrames, RightFootOffEventFrames, LeftFootStrikeEventFrames, LeftFootOffEventFrames)
+                else:
+                    # Open a window to display page selection
+                    popup = self.popup = tk.Tk()
+                    #popup.resizable(0,0)
+                    #popup.geometry('%dx%d+%d+%d' % (600, 200, 0, 0))
+                    #Centers the App on Monitor
+                    AppWidth = 600
+                    AppHeight= 200
+                    ScreenWidth = 1600#self.winfo_screenwidth()
+                    ScreenHeight = 1000#self.winfo_screenheight()
+                    x=(ScreenWidth/2) - (AppWidth/2)
+                    y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
+                    #y=100
+                    popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
+                    popup.title('Gait Cycle Selection')
                 
-                #print 'IC   OTO     OIC     TO  IC'
-                TitleLabelText = 'Side' + ' \t' + 'IC' + ' \t' + 'OTO' + ' \t' + 'OIC' + ' \t' + 'TO' + ' \t' + 'IC'
-                TitleLabel = tk.Label(popup, text=TitleLabelText,font=Small_Font, justify = 'left')
-                TitleLabel.place(x=45,y=10)
+                    #print 'IC   OTO     OIC     TO  IC'
+                    TitleLabelText = 'Side' + ' \t' + 'IC' + ' \t' + 'OTO' + ' \t' + 'OIC' + ' \t' + 'TO' + ' \t' + 'IC'
+                    TitleLabel = tk.Label(popup, text=TitleLabelText,font=Small_Font, justify = 'left')
+                    TitleLabel.place(x=45,y=10)
 
-                numCycleIndex = tk.IntVar()
-                for numCycle in range(len(RightFootStrikeEventFrames)-1):
-                    RightStrike1 = 0.
-                    RightStrike2 = 0.
-                    RightToeOff = 0.
-                    RightOppositeToeOff = 0.
-                    RightOppositeFootStrike = 0.
-                    RightStrike1 = sorted(RightFootStrikeEventFrames)[numCycle]
-                    RightStrike2 = sorted(RightFootStrikeEventFrames)[numCycle + 1]
-                    for i in range(len(RightFootOffEventFrames)):
-                        if RightFootOffEventFrames[i] > RightStrike1 and RightFootOffEventFrames[i] < RightStrike2:
-                            RightToeOff = RightFootOffEventFrames[i]
-                    for i in range(len(LeftFootOffEventFrames)):
-                         if LeftFootOffEventFrames[i] > RightStrike1 and LeftFootOffEventFrames[i] < RightToeOff:
-                            RightOppositeToeOff = LeftFootOffEventFrames[i]
-                    for i in range(len(LeftFootStrikeEventFrames)):
-                         if LeftFootStrikeEventFrames[i] > RightStrike1 and LeftFootStrikeEventFrames[i] < RightToeOff:
-                            RightOppositeFootStrike = LeftFootStrikeEventFrames[i] 
-                    # Change to blank if value not found
-                    if RightToeOff == 0:
-                        StringRightToeOff = '   '
-                    else:
-                        StringRightToeOff = str(RightToeOff)
-                    if RightOppositeToeOff == 0:
-                        StringRightOppositeToeOff = '   '
-                    else:
-                        StringRightOppositeToeOff = str(RightOppositeToeOff)
-                    if RightOppositeFootStrike == 0:
-                        StringRightOppositeFootStrike = '   '
-                    else:
-                        StringRightOppositeFootStrike = str(RightOppositeFootStrike)
+                    numCycleIndex = tk.IntVar()
+                    for numCycle in range(len(RightFootStrikeEventFrames)-1):
+                        RightStrike1 = 0.
+                        RightStrike2 = 0.
+                        RightToeOff = 0.
+                        RightOppositeToeOff = 0.
+                        RightOppositeFootStrike = 0.
+                        RightStrike1 = sorted(RightFootStrikeEventFrames)[numCycle]
+                        RightStrike2 = sorted(RightFootStrikeEventFrames)[numCycle + 1]
+                        for i in range(len(RightFootOffEventFrames)):
+                            if RightFootOffEventFrames[i] > RightStrike1 and RightFootOffEventFrames[i] < RightStrike2:
+                                RightToeOff = RightFootOffEventFrames[i]
+                        for i in range(len(LeftFootOffEventFrames)):
+                             if LeftFootOffEventFrames[i] > RightStrike1 and LeftFootOffEventFrames[i] < RightToeOff:
+                                RightOppositeToeOff = LeftFootOffEventFrames[i]
+                        for i in range(len(LeftFootStrikeEventFrames)):
+                             if LeftFootStrikeEventFrames[i] > RightStrike1 and LeftFootStrikeEventFrames[i] < RightToeOff:
+                                RightOppositeFootStrike = LeftFootStrikeEventFrames[i] 
+                        # Change to blank if value not found
+                        if RightToeOff == 0:
+                            StringRightToeOff = '   '
+                        else:
+                            StringRightToeOff = str(RightToeOff)
+                        if RightOppositeToeOff == 0:
+                            StringRightOppositeToeOff = '   '
+                        else:
+                            StringRightOppositeToeOff = str(RightOppositeToeOff)
+                        if RightOppositeFootStrike == 0:
+                            StringRightOppositeFootStrike = '   '
+                        else:
+                            StringRightOppositeFootStrike = str(RightOppositeFootStrike)
                         
-                    numCycleButtonText = 'Right' + ' \t' + str(RightStrike1) + ' \t' + StringRightOppositeToeOff + ' \t' + StringRightOppositeFootStrike + ' \t' + StringRightToeOff + ' \t' + str(RightStrike2) + '\n'
+                        numCycleButtonText = 'Right' + ' \t' + str(RightStrike1) + ' \t' + StringRightOppositeToeOff + ' \t' + StringRightOppositeFootStrike + ' \t' + StringRightToeOff + ' \t' + str(RightStrike2) + '\n'
                     
-                    numCycleButton = tk.Radiobutton(popup, text=numCycleButtonText, variable = numCycleIndex, value=numCycle, font=Small_Font, command= lambda: ReadCycleSelectionRight(), anchor = 'center',background='white') 
-                    numCycleButton.place(x=10, y = 10 + (numCycle + 1)*35, height = 30, width = 400)                    
+                        numCycleButton = tk.Radiobutton(popup, text=numCycleButtonText, variable = numCycleIndex, value=numCycle, font=Small_Font, command= lambda: ReadCycleSelectionRight(), anchor = 'center',background='white') 
+                        numCycleButton.place(x=10, y = 10 + (numCycle + 1)*35, height = 30, width = 400)                    
                     
-                    if RightStrike1 == 0 or RightStrike2 == 0 or RightToeOff == 0 or RightOppositeToeOff == 0 or RightOppositeFootStrike == 0:
-                        WarningLabel = tk.Label(popup,text="Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
-                        WarningLabel.place(x=420,y=10 + (numCycle + 1)*35, height = 30,)
+                        if RightStrike1 == 0 or RightStrike2 == 0 or RightToeOff == 0 or RightOppositeToeOff == 0 or RightOppositeFootStrike == 0:
+                            WarningLabel = tk.Label(popup,text="Missing Gait Events!!!", font=Small_Font,justify= 'center',foreground='red')
+                            WarningLabel.place(x=420,y=10 + (numCycle + 1)*35, height = 30,)
                 
-                # Add Save PDF Button
-                ProceedButton = tk.Button(popup, text="Proceed", command= lambda: [ReadCycleSelectionRight(), self.popup.destroy()], font=Small_Font, justify = 'center')#anchor = 'se')
-                ProceedButton.place(x=10,y=200-60,width=600-100,height=50) 
-                # Exit Button
-                CancelButton = tk.Button(popup, text="Cancel", command=lambda: cancelRight(), font=Small_Font, justify = 'center')
-                CancelButton.place(x=600-80,y=200-60,width = 70, height = 50)
+                    # Add Save PDF Button
+                    ProceedButton = tk.Button(popup, text="Proceed", command= lambda: [ReadCycleSelectionRight(), self.popup.destroy()], font=Small_Font, justify = 'center')#anchor = 'se')
+                    ProceedButton.place(x=10,y=200-60,width=600-100,height=50) 
+                    # Exit Button
+                    CancelButton = tk.Button(popup, text="Cancel", command=lambda: cancelRight(), font=Small_Font, justify = 'center')
+                    CancelButton.place(x=600-80,y=200-60,width = 70, height = 50)
                 
-                def cancelRight():
-                    popup.destroy
-                    sys.exit()
+                    def cancelRight():
+                        popup.destroy
+                        sys.exit()
                     
-                def ReadCycleSelectionRight():
-                    global SelectedCycleIndex 
-                    SelectedCycleIndex = numCycleIndex.get()
-                    RightStrike1 = 0.
-                    RightStrike2 = 0.
-                    RightToeOff = 0.
-                    RightOppositeToeOff = 0.
-                    RightOppositeFootStrike = 0.
-                    RightStrike1 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex ]
-                    RightStrike2 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex  + 1]
-                    for i in range(len(RightFootOffEventFrames)):
-                        if RightFootOffEventFrames[i] > RightStrike1 and RightFootOffEventFrames[i] < RightStrike2:
-                            RightToeOff = RightFootOffEventFrames[i]
-                    for i in range(len(LeftFootOffEventFrames)):
-                         if LeftFootOffEventFrames[i] > RightStrike1 and LeftFootOffEventFrames[i] < RightToeOff:
-                            RightOppositeToeOff = LeftFootOffEventFrames[i]
-                    for i in range(len(LeftFootStrikeEventFrames)):
-                         if LeftFootStrikeEventFrames[i] > RightStrike1 and LeftFootStrikeEventFrames[i] < RightToeOff:
-                            RightOppositeFootStrike = LeftFootStrikeEventFrames[i] 
-                    if RightStrike1 == 0 or RightStrike2 == 0 or RightToeOff == 0 or RightOppositeToeOff == 0 or RightOppositeFootStrike == 0:
-                        ProceedButton.place_forget()
-                    else:
-                        ProceedButton.place(x=10,y=200-60,width=600-100,height=50)
+                    def ReadCycleSelectionRight():
+                        global SelectedCycleIndex 
+                        SelectedCycleIndex = numCycleIndex.get()
+                        RightStrike1 = 0.
+                        RightStrike2 = 0.
+                        RightToeOff = 0.
+                        RightOppositeToeOff = 0.
+                        RightOppositeFootStrike = 0.
+                        RightStrike1 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex ]
+                        RightStrike2 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex  + 1]
+                        for i in range(len(RightFootOffEventFrames)):
+                            if RightFootOffEventFrames[i] > RightStrike1 and RightFootOffEventFrames[i] < RightStrike2:
+                                RightToeOff = RightFootOffEventFrames[i]
+                        for i in range(len(LeftFootOffEventFrames)):
+                             if LeftFootOffEventFrames[i] > RightStrike1 and LeftFootOffEventFrames[i] < RightToeOff:
+                                RightOppositeToeOff = LeftFootOffEventFrames[i]
+                        for i in range(len(LeftFootStrikeEventFrames)):
+                             if LeftFootStrikeEventFrames[i] > RightStrike1 and LeftFootStrikeEventFrames[i] < RightToeOff:
+                                RightOppositeFootStrike = LeftFootStrikeEventFrames[i] 
+                        if RightStrike1 == 0 or RightStrike2 == 0 or RightToeOff == 0 or RightOppositeToeOff == 0 or RightOppositeFootStrike == 0:
+                            ProceedButton.place_forget()
+                        else:
+                            ProceedButton.place(x=10,y=200-60,width=600-100,height=50)
                         
-                ReadCycleSelectionRight()
-                popup.mainloop()
+                    ReadCycleSelectionRight()
+                    popup.mainloop()
                 
                 RightStrike1 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex ]
                 RightStrike2 = sorted(RightFootStrikeEventFrames)[SelectedCycleIndex  + 1]
@@ -820,19 +902,22 @@ class CreateGCD_Main():
                      if LeftFootStrikeEventFrames[i] > RightStrike1 and LeftFootStrikeEventFrames[i] < RightToeOff:
                         RightOppositeFootStrike = LeftFootStrikeEventFrames[i]
                 if RightOppositeFootStrike == 0 or RightOppositeToeOff == 0:
-                    popup = tk.Tk()
-                    popup.resizable(0,0)
-                    AppWidth = 400
-                    AppHeight= 50
-                    ScreenWidth = 1600#self.winfo_screenwidth()
-                    ScreenHeight = 1000#self.winfo_screenheight()
-                    x=(ScreenWidth/2) - (AppWidth/2)
-                    y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
-                    popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
-                    popup.title('Warning')
-                    WarningMessage = tk.Label(popup,text="Right Side: Missing Gait Events!!! \n Add events and Rerun CreateGCD pipeline", font=Small_Font,justify= 'center',foreground='red')
-                    WarningMessage.pack()
-                    popup.mainloop()
+                    if vicon.Headless or GCDExport == 'AllCycles':
+                        print('Right Side: Missing Gait Events!!! Add events and Rerun CreateGCD pipeline')
+                    else:
+                        popup = tk.Tk()
+                        popup.resizable(0,0)
+                        AppWidth = 400
+                        AppHeight= 50
+                        ScreenWidth = 1600#self.winfo_screenwidth()
+                        ScreenHeight = 1000#self.winfo_screenheight()
+                        x=(ScreenWidth/2) - (AppWidth/2)
+                        y=(ScreenHeight/2)- (AppHeight/2) #Put the App at center of Monitor
+                        popup.geometry('%dx%d+%d+%d' % (AppWidth, AppHeight, x, y))
+                        popup.title('Warning')
+                        WarningMessage = tk.Label(popup,text="Right Side: Missing Gait Events!!! \n Add events and Rerun CreateGCD pipeline", font=Small_Font,justify= 'center',foreground='red')
+                        WarningMessage.pack()
+                        popup.mainloop()
             
             #print str(RightStrike1) + ' \t' + str(RightOppositeToeOff) + ' \t' + str(RightOppositeFootStrike) + ' \t' + str(RightToeOff) + ' \t' + str(RightStrike2) + '\n'
             # Compute Stride Temporal Parameters
@@ -862,53 +947,59 @@ class CreateGCD_Main():
             RightDoubleSupport  = RightDoubleSupport1 + RightDoubleSupport2
             
             # Compute GCD Variables
-            [RightTrunkTilt,RightTrunkObliquity,RightTrunkRotation]     = ComputeGCDVariable('RTrunkAngles' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightPelvicTilt,RightPelvicObliquity,RightPelvicRotation]  = ComputeGCDVariable('RPelvisAngles', NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightHipFlexExt,RightHipAbAdduct,RightHipRotation]         = ComputeGCDVariable('RHipAngles'   , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightKneeFlexExt,RightKneeValgVar,RightKneeRotation]       = ComputeGCDVariable('RKneeAngles'  , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,DummyY,RightKneeRotation_Proximal]      = ComputeGCDVariable('RKneeAnglesProximal'  , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightDorsiPlanFlex,DummyY,RightFootRotation]               = ComputeGCDVariable('RAnkleAngles' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightFootSagittalInclination,DummyY,RightFootProgression]          = ComputeGCDVariable('RFootProgressAngles'  , NumPointsPerGraph, RightStrike1, RightStrike2)
+            RightGCDVariables = ComputeGCDVariables(['RTrunkAngles','RPelvisAngles','RHipAngles','RKneeAngles','RKneeAnglesProximal','RAnkleAngles','RFootProgressAngles','RThighAngles','RShankAngles',
+                                                     'GluteusMaxLength','IlioPsoasLength','RectFemLength','MedHamstringLength','LatHamstringLength','GastrocLength','SoleusLength','TibPostLength','PeronealLength','VastusLatLength',
+                                                     'GluteusMaxVelocity','IlioPsoasVelocity','RectFemVelocity','MedHamstringVelocity','LatHamstringVelocity','GastrocVelocity','SoleusVelocity','TibPostVelocity','PeronealVelocity','VastusLatVelocity'], NumPointsPerGraph, RightStrike1, RightStrike2)
+            [RightTrunkTilt,RightTrunkObliquity,RightTrunkRotation]     = RightGCDVariables['RTrunkAngles']
+            [RightPelvicTilt,RightPelvicObliquity,RightPelvicRotation]  = RightGCDVariables['RPelvisAngles']
+            [RightHipFlexExt,RightHipAbAdduct,RightHipRotation]         = RightGCDVariables['RHipAngles']
+            [RightKneeFlexExt,RightKneeValgVar,RightKneeRotation]       = RightGCDVariables['RKneeAngles']
+            [DummyX,DummyY,RightKneeRotation_Proximal]      = RightGCDVariables['RKneeAnglesProximal']
+            [RightDorsiPlanFlex,DummyY,RightFootRotation]               = RightGCDVariables['RAnkleAngles']
+            [RightFootSagittalInclination,DummyY,RightFootProgression]          = RightGCDVariables['RFootProgressAngles']
             # Compute Pelvis, Knee and Ankle Progression GCD Variables
-            [RightFemurSagittalInclination,DummyY,RightFemurProgression]        = ComputeGCDVariable('RThighAngles'  , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [RightTibiaSagittalInclination,DummyY,RightTibiaProgression]        = ComputeGCDVariable('RShankAngles'  , NumPointsPerGraph, RightStrike1, RightStrike2)
+            [RightFemurSagittalInclination,DummyY,RightFemurProgression]        = RightGCDVariables['RThighAngles']
+            [RightTibiaSagittalInclination,DummyY,RightTibiaProgression]        = RightGCDVariables['RShankAngles']
             
             # Muscle Length 
-            [DummyX,RightGluteusMaxLength,DummyZ]    = ComputeGCDVariable('GluteusMaxLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightIlioPsoasLength,DummyZ]    = ComputeGCDVariable('IlioPsoasLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightRectFemLength,DummyZ]    = ComputeGCDVariable('RectFemLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightMedHamstringLength,DummyZ]    = ComputeGCDVariable('MedHamstringLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightLatHamstringLength,DummyZ]    = ComputeGCDVariable('LatHamstringLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightGastrocLength,DummyZ]    = ComputeGCDVariable('GastrocLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightSoleusLength,DummyZ]    = ComputeGCDVariable('SoleusLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightTibPostLength,DummyZ]    = ComputeGCDVariable('TibPostLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightPeronealLength,DummyZ]    = ComputeGCDVariable('PeronealLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightVastusLatLength,DummyZ]    = ComputeGCDVariable('VastusLatLength' , NumPointsPerGraph, RightStrike1, RightStrike2)
+            [DummyX,RightGluteusMaxLength,DummyZ]    = RightGCDVariables['GluteusMaxLength']
+            [DummyX,RightIlioPsoasLength,DummyZ]    = RightGCDVariables['IlioPsoasLength']
+            [DummyX,RightRectFemLength,DummyZ]    = RightGCDVariables['RectFemLength']
+            [DummyX,RightMedHamstringLength,DummyZ]    = RightGCDVariables['MedHamstringLength']
+            [DummyX,RightLatHamstringLength,DummyZ]    = RightGCDVariables['LatHamstringLength']
+            [DummyX,RightGastrocLength,DummyZ]    = RightGCDVariables['GastrocLength']
+            [DummyX,RightSoleusLength,DummyZ]    = RightGCDVariables['SoleusLength']
+            [DummyX,RightTibPostLength,DummyZ]    = RightGCDVariables['TibPostLength']
+            [DummyX,RightPeronealLength,DummyZ]    = RightGCDVariables['PeronealLength']
+            [DummyX,RightVastusLatLength,DummyZ]    = RightGCDVariables['VastusLatLength']
             # Muscle Velocity 
-            [DummyX,RightGluteusMaxVelocity,DummyZ]    = ComputeGCDVariable('GluteusMaxVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightIlioPsoasVelocity,DummyZ]    = ComputeGCDVariable('IlioPsoasVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightRectFemVelocity,DummyZ]    = ComputeGCDVariable('RectFemVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightMedHamstringVelocity,DummyZ]    = ComputeGCDVariable('MedHamstringVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightLatHamstringVelocity,DummyZ]    = ComputeGCDVariable('LatHamstringVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightGastrocVelocity,DummyZ]    = ComputeGCDVariable('GastrocVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightSoleusVelocity,DummyZ]    = ComputeGCDVariable('SoleusVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightTibPostVelocity,DummyZ]    = ComputeGCDVariable('TibPostVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightPeronealVelocity,DummyZ]    = ComputeGCDVariable('PeronealVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
-            [DummyX,RightVastusLatVelocity,DummyZ]    = ComputeGCDVariable('VastusLatVelocity' , NumPointsPerGraph, RightStrike1, RightStrike2)
+            [DummyX,RightGluteusMaxVelocity,DummyZ]    = RightGCDVariables['GluteusMaxVelocity']
+            [DummyX,RightIlioPsoasVelocity,DummyZ]    = RightGCDVariables['IlioPsoasVelocity']
+            [DummyX,RightRectFemVelocity,DummyZ]    = RightGCDVariables['RectFemVelocity']
+            [DummyX,RightMedHamstringVelocity,DummyZ]    = RightGCDVariables['MedHamstringVelocity']
+            [DummyX,RightLatHamstringVelocity,DummyZ]    = RightGCDVariables['LatHamstringVelocity']
+            [DummyX,RightGastrocVelocity,DummyZ]    = RightGCDVariables['GastrocVelocity']
+            [DummyX,RightSoleusVelocity,DummyZ]    = RightGCDVariables['SoleusVelocity']
+            [DummyX,RightTibPostVelocity,DummyZ]    = RightGCDVariables['TibPostVelocity']
+            [DummyX,RightPeronealVelocity,DummyZ]    = RightGCDVariables['PeronealVelocity']
+            [DummyX,RightVastusLatVelocity,DummyZ]    = RightGCDVariables['VastusLatVelocity']
             
             # Check if Kinetics Data exist
-            if 'RAnklePowerComponents' in ModelOutputs:
-                [RightHipFlexExtMoment,RightHipAbAdductMoment,RightHipRotationMoment]      = ComputeGCDVariable('RHipMoment'   , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightKneeFlexExtMoment,RightKneeValgVarMoment,RightKneeRotationMoment]    = ComputeGCDVariable('RKneeMoment'  , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightDorsiPlanFlexMoment,RightFootAbAdductMoment,RightFootRotationMoment] = ComputeGCDVariable('RAnkleMoment' , NumPointsPerGraph, RightStrike1, RightStrike2)
+            if RightKineticsWritten:
+                RightGCDVariables = ComputeGCDVariables(['RHipMoment','RKneeMoment','RAnkleMoment',
+                                                         'RHipPowerComponents','RKneePowerComponents','RAnklePowerComponents',
+                                                         'RHipPower','RKneePower','RAnklePower'], NumPointsPerGraph, RightStrike1, RightStrike2)
+                [RightHipFlexExtMoment,RightHipAbAdductMoment,RightHipRotationMoment]      = RightGCDVariables['RHipMoment']
+                [RightKneeFlexExtMoment,RightKneeValgVarMoment,RightKneeRotationMoment]    = RightGCDVariables['RKneeMoment']
+                [RightDorsiPlanFlexMoment,RightFootAbAdductMoment,RightFootRotationMoment] = RightGCDVariables['RAnkleMoment']
                 
-                [RightHipFlexExtPower,RightHipAbAdductPower,RightHipRotationPower]         = ComputeGCDVariable('RHipPowerComponents'    , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightKneeFlexExtPower,RightKneeValgVarPower,RightKneeRotationPower]       = ComputeGCDVariable('RKneePowerComponents'   , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightDorsiPlanFlexPower,RightFootAbAdductPower,RightFootRotationPower]    = ComputeGCDVariable('RAnklePowerComponents'  , NumPointsPerGraph, RightStrike1, RightStrike2)
+                [RightHipFlexExtPower,RightHipAbAdductPower,RightHipRotationPower]         = RightGCDVariables['RHipPowerComponents']
+                [RightKneeFlexExtPower,RightKneeValgVarPower,RightKneeRotationPower]       = RightGCDVariables['RKneePowerComponents']
+                [RightDorsiPlanFlexPower,RightFootAbAdductPower,RightFootRotationPower]    = RightGCDVariables['RAnklePowerComponents']
              
-                [DummyX,DummyY,RightHipPowerTotal]         = ComputeGCDVariable('RHipPower'    , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [DummyX,DummyY,RightKneePowerTotal]       = ComputeGCDVariable('RKneePower'   , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [DummyX,DummyY,RightAnklePowerTotal]    = ComputeGCDVariable('RAnklePower'  , NumPointsPerGraph, RightStrike1, RightStrike2)
+                [DummyX,DummyY,RightHipPowerTotal]         = RightGCDVariables['RHipPower']
+                [DummyX,DummyY,RightKneePowerTotal]       = RightGCDVariables['RKneePower']
+                [DummyX,DummyY,RightAnklePowerTotal]    = RightGCDVariables['RAnklePower']
                 
                 # Check for Force Plate Hits
                 RightForcePlate_DeviceID = 0 #Default Value if Force Plate Hit is not Found
@@ -1015,13 +1106,14 @@ class CreateGCD_Main():
             
             # Check if Foot Model data exists
             if self.valueRightFootModelCheck == '1':
-                [RightHindFootTilt,RightHindFootObliquity,RightHindFootRotation]                    = ComputeGCDVariable('RHFGA' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightForeFootTilt,RightForeFootObliquity,RightForeFootRotation]                    = ComputeGCDVariable('RFFGA' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightAnkleComplexDorsiPlanFlex,RightAnkleComplexValgVar,RightAnkleComplexRotation] = ComputeGCDVariable('RANKA' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightMidFootDorsiPlanFlex,RightMidFootSupPron,RightMidFootAbAdduct]                = ComputeGCDVariable('RMDFA' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [RightToeFlexExt,DummyY,RightToeValgVar]                                            = ComputeGCDVariable('RHLXA' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [DummyX,RightSupination,DummyZ]                                                     = ComputeGCDVariable('Supination' , NumPointsPerGraph, RightStrike1, RightStrike2)
-                [DummyX,RightSkew,DummyZ]                                                           = ComputeGCDVariable('Skew'  , NumPointsPerGraph, RightStrike1, RightStrike2)
+                RightGCDVariables = ComputeGCDVariables(['RHFGA','RFFGA','RANKA','RMDFA','RHLXA','Supination','Skew'], NumPointsPerGraph, RightStrike1, RightStrike2)
+                [RightHindFootTilt,RightHindFootObliquity,RightHindFootRotation]                    = RightGCDVariables['RHFGA']
+                [RightForeFootTilt,RightForeFootObliquity,RightForeFootRotation]                    = RightGCDVariables['RFFGA']
+                [RightAnkleComplexDorsiPlanFlex,RightAnkleComplexValgVar,RightAnkleComplexRotation] = RightGCDVariables['RANKA']
+                [RightMidFootDorsiPlanFlex,RightMidFootSupPron,RightMidFootAbAdduct]                = RightGCDVariables['RMDFA']
+                [RightToeFlexExt,DummyY,RightToeValgVar]                                            = RightGCDVariables['RHLXA']
+                [DummyX,RightSupination,DummyZ]                                                     = RightGCDVariables['Supination']
+                [DummyX,RightSkew,DummyZ]                                                           = RightGCDVariables['Skew']
                 
         
         # Write Temporal Variables in GCD File
@@ -1101,33 +1193,34 @@ class CreateGCD_Main():
             WriteArrayToGCD(GCDFile,'LeftFootSagittalInclination',LeftFootSagittalInclination)
             
             
-            # Muscle Length
-            WriteArrayToGCD(GCDFile,'LeftGluteusMaxLength',LeftGluteusMaxLength)
-            WriteArrayToGCD(GCDFile,'LeftIlioPsoasLength',LeftIlioPsoasLength)
-            WriteArrayToGCD(GCDFile,'LeftRectFemLength',LeftRectFemLength)
-            WriteArrayToGCD(GCDFile,'LeftMedHamstringLength',LeftMedHamstringLength)
-            WriteArrayToGCD(GCDFile,'LeftLatHamstringLength',LeftLatHamstringLength)
-            WriteArrayToGCD(GCDFile,'LeftGastrocLength',LeftGastrocLength)
-            WriteArrayToGCD(GCDFile,'LeftSoleusLength',LeftSoleusLength)
-            WriteArrayToGCD(GCDFile,'LeftTibPostLength',LeftTibPostLength)
-            WriteArrayToGCD(GCDFile,'LeftPeronealLength',LeftPeronealLength)
-            WriteArrayToGCD(GCDFile,'LeftVastLatLength',LeftVastusLatLength)
-            # Muscle Velocity
-            WriteArrayToGCD(GCDFile,'LeftGluteusMaxVelocity',LeftGluteusMaxVelocity)
-            WriteArrayToGCD(GCDFile,'LeftIlioPsoasVelocity',LeftIlioPsoasVelocity)
-            WriteArrayToGCD(GCDFile,'LeftRectFemVelocity',LeftRectFemVelocity)
-            WriteArrayToGCD(GCDFile,'LeftMedHamstringVelocity',LeftMedHamstringVelocity)
-            WriteArrayToGCD(GCDFile,'LeftLatHamstringVelocity',LeftLatHamstringVelocity)
-            WriteArrayToGCD(GCDFile,'LeftGastrocVelocity',LeftGastrocVelocity)
-            WriteArrayToGCD(GCDFile,'LeftSoleusVelocity',LeftSoleusVelocity)
-            WriteArrayToGCD(GCDFile,'LeftTibPostVelocity',LeftTibPostVelocity)
-            WriteArrayToGCD(GCDFile,'LeftPeronealVelocity',LeftPeronealVelocity)
-            WriteArrayToGCD(GCDFile,'LeftVastLatVelocity',LeftVastusLatVelocity)
+            if MuscleLengthsWritten:
+                # Muscle Length
+                WriteArrayToGCD(GCDFile,'LeftGluteusMaxLength',LeftGluteusMaxLength)
+                WriteArrayToGCD(GCDFile,'LeftIlioPsoasLength',LeftIlioPsoasLength)
+                WriteArrayToGCD(GCDFile,'LeftRectFemLength',LeftRectFemLength)
+                WriteArrayToGCD(GCDFile,'LeftMedHamstringLength',LeftMedHamstringLength)
+                WriteArrayToGCD(GCDFile,'LeftLatHamstringLength',LeftLatHamstringLength)
+                WriteArrayToGCD(GCDFile,'LeftGastrocLength',LeftGastrocLength)
+                WriteArrayToGCD(GCDFile,'LeftSoleusLength',LeftSoleusLength)
+                WriteArrayToGCD(GCDFile,'LeftTibPostLength',LeftTibPostLength)
+                WriteArrayToGCD(GCDFile,'LeftPeronealLength',LeftPeronealLength)
+                WriteArrayToGCD(GCDFile,'LeftVastLatLength',LeftVastusLatLength)
+                # Muscle Velocity
+                WriteArrayToGCD(GCDFile,'LeftGluteusMaxVelocity',LeftGluteusMaxVelocity)
+                WriteArrayToGCD(GCDFile,'LeftIlioPsoasVelocity',LeftIlioPsoasVelocity)
+                WriteArrayToGCD(GCDFile,'LeftRectFemVelocity',LeftRectFemVelocity)
+                WriteArrayToGCD(GCDFile,'LeftMedHamstringVelocity',LeftMedHamstringVelocity)
+                WriteArrayToGCD(GCDFile,'LeftLatHamstringVelocity',LeftLatHamstringVelocity)
+                WriteArrayToGCD(GCDFile,'LeftGastrocVelocity',LeftGastrocVelocity)
+                WriteArrayToGCD(GCDFile,'LeftSoleusVelocity',LeftSoleusVelocity)
+                WriteArrayToGCD(GCDFile,'LeftTibPostVelocity',LeftTibPostVelocity)
+                WriteArrayToGCD(GCDFile,'LeftPeronealVelocity',LeftPeronealVelocity)
+                WriteArrayToGCD(GCDFile,'LeftVastLatVelocity',LeftVastusLatVelocity)
             
             
             
             # Check if Kinetics Data exist
-            if 'LAnklePowerComponents' in ModelOutputs:
+            if LeftKineticsWritten:
                 WriteArrayToGCD(GCDFile,'LeftHipFlexExtMoment',LeftHipFlexExtMoment)
                 WriteArrayToGCD(GCDFile,'LeftHipAbAdductMoment',LeftHipAbAdductMoment)
                 WriteArrayToGCD(GCDFile,'LeftHipRotationMoment',LeftHipRotationMoment)
@@ -1162,37 +1255,38 @@ class CreateGCD_Main():
             
             # Check if EMG Data Exists
             if EMG_DigitalDeviceID != 0 or EMG_AnalogDeviceID != 0:         
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLRectFem',LeftRectusFemorisEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLVastLat',LeftVasltusLateralisEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLMedHams',LeftMedialHamstringsEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLGasTroc',LeftGastrocnemiusEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLTibAnte',LeftTibialisAnteriorEMG, 80)
+                LeftEMGChannels = [['LeftRawLRectFem', LeftRectusFemorisEMG],
+                                   ['LeftRawLVastLat', LeftVasltusLateralisEMG],
+                                   ['LeftRawLMedHams', LeftMedialHamstringsEMG],
+                                   ['LeftRawLGasTroc', LeftGastrocnemiusEMG],
+                                   ['LeftRawLTibAnte', LeftTibialisAnteriorEMG]]
                 # Lexington
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLGlutMax',LeftGluteusMaximusEMG, 80)
+                    LeftEMGChannels.append(['LeftRawLGlutMax', LeftGluteusMaximusEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLGlutMed',LeftGluteusMediusEMG, 80)
+                    LeftEMGChannels.append(['LeftRawLGlutMed', LeftGluteusMediusEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLAdducto',LeftAdductorsEMG, 80)
+                    LeftEMGChannels.append(['LeftRawLAdducto', LeftAdductorsEMG])
                 except:
                     pass
                 # Montreal
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLVastMed',LeftVasltusMedialisEMG, 80)
+                    LeftEMGChannels.append(['LeftRawLVastMed', LeftVasltusMedialisEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLLatHams',LeftLateralHamstringsEMG, 80)
+                    LeftEMGChannels.append(['LeftRawLLatHams', LeftLateralHamstringsEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'LeftRawLPerLong',LeftPeroneusLongusEMG, 80)  
+                    LeftEMGChannels.append(['LeftRawLPerLong', LeftPeroneusLongusEMG])
                 except:
                     pass
+                WriteArrayToGCD_ComputeEMGenvelope(GCDFile, LeftEMGChannels, 80)
                 
             # Check if Foot Model data exists
             if self.valueLeftFootModelCheck == '1':
@@ -1244,31 +1338,32 @@ class CreateGCD_Main():
             WriteArrayToGCD(GCDFile,'RightFootSagittalInclination',RightFootSagittalInclination)
             
             
-            # Muscle Length
-            WriteArrayToGCD(GCDFile,'RightGluteusMaxLength',RightGluteusMaxLength)
-            WriteArrayToGCD(GCDFile,'RightIlioPsoasLength',RightIlioPsoasLength)
-            WriteArrayToGCD(GCDFile,'RightRectFemLength',RightRectFemLength)
-            WriteArrayToGCD(GCDFile,'RightMedHamstringLength',RightMedHamstringLength)
-            WriteArrayToGCD(GCDFile,'RightLatHamstringLength',RightLatHamstringLength)
-            WriteArrayToGCD(GCDFile,'RightGastrocLength',RightGastrocLength)
-            WriteArrayToGCD(GCDFile,'RightSoleusLength',RightSoleusLength)
-            WriteArrayToGCD(GCDFile,'RightTibPostLength',RightTibPostLength)
-            WriteArrayToGCD(GCDFile,'RightPeronealLength',RightPeronealLength)
-            WriteArrayToGCD(GCDFile,'RightVastLatLength',RightVastusLatLength)
-            # Muscle Velocity
-            WriteArrayToGCD(GCDFile,'RightGluteusMaxVelocity',RightGluteusMaxVelocity)
-            WriteArrayToGCD(GCDFile,'RightIlioPsoasVelocity',RightIlioPsoasVelocity)
-            WriteArrayToGCD(GCDFile,'RightRectFemVelocity',RightRectFemVelocity)
-            WriteArrayToGCD(GCDFile,'RightMedHamstringVelocity',RightMedHamstringVelocity)
-            WriteArrayToGCD(GCDFile,'RightLatHamstringVelocity',RightLatHamstringVelocity)
-            WriteArrayToGCD(GCDFile,'RightGastrocVelocity',RightGastrocVelocity)
-            WriteArrayToGCD(GCDFile,'RightSoleusVelocity',RightSoleusVelocity)
-            WriteArrayToGCD(GCDFile,'RightTibPostVelocity',RightTibPostVelocity)
-            WriteArrayToGCD(GCDFile,'RightPeronealVelocity',RightPeronealVelocity)
-            WriteArrayToGCD(GCDFile,'RightVastLatVelocity',RightVastusLatVelocity)
+            if MuscleLengthsWritten:
+                # Muscle Length
+                WriteArrayToGCD(GCDFile,'RightGluteusMaxLength',RightGluteusMaxLength)
+                WriteArrayToGCD(GCDFile,'RightIlioPsoasLength',RightIlioPsoasLength)
+                WriteArrayToGCD(GCDFile,'RightRectFemLength',RightRectFemLength)
+                WriteArrayToGCD(GCDFile,'RightMedHamstringLength',RightMedHamstringLength)
+                WriteArrayToGCD(GCDFile,'RightLatHamstringLength',RightLatHamstringLength)
+                WriteArrayToGCD(GCDFile,'RightGastrocLength',RightGastrocLength)
+                WriteArrayToGCD(GCDFile,'RightSoleusLength',RightSoleusLength)
+                WriteArrayToGCD(GCDFile,'RightTibPostLength',RightTibPostLength)
+                WriteArrayToGCD(GCDFile,'RightPeronealLength',RightPeronealLength)
+                WriteArrayToGCD(GCDFile,'RightVastLatLength',RightVastusLatLength)
+                # Muscle Velocity
+                WriteArrayToGCD(GCDFile,'RightGluteusMaxVelocity',RightGluteusMaxVelocity)
+                WriteArrayToGCD(GCDFile,'RightIlioPsoasVelocity',RightIlioPsoasVelocity)
+                WriteArrayToGCD(GCDFile,'RightRectFemVelocity',RightRectFemVelocity)
+                WriteArrayToGCD(GCDFile,'RightMedHamstringVelocity',RightMedHamstringVelocity)
+                WriteArrayToGCD(GCDFile,'RightLatHamstringVelocity',RightLatHamstringVelocity)
+                WriteArrayToGCD(GCDFile,'RightGastrocVelocity',RightGastrocVelocity)
+                WriteArrayToGCD(GCDFile,'RightSoleusVelocity',RightSoleusVelocity)
+                WriteArrayToGCD(GCDFile,'RightTibPostVelocity',RightTibPostVelocity)
+                WriteArrayToGCD(GCDFile,'RightPeronealVelocity',RightPeronealVelocity)
+                WriteArrayToGCD(GCDFile,'RightVastLatVelocity',RightVastusLatVelocity)
             
             # Check if Kinetics Data exist
-            if 'RAnklePowerComponents' in ModelOutputs:
+            if RightKineticsWritten:
                 WriteArrayToGCD(GCDFile,'RightHipFlexExtMoment',RightHipFlexExtMoment)
                 WriteArrayToGCD(GCDFile,'RightHipAbAdductMoment',RightHipAbAdductMoment)
                 WriteArrayToGCD(GCDFile,'RightHipRotationMoment',RightHipRotationMoment)
@@ -1303,37 +1398,38 @@ class CreateGCD_Main():
 
             # Check if EMG Data Exists                  
             if EMG_DigitalDeviceID != 0 or EMG_AnalogDeviceID != 0:   
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRRectFem',RightRectusFemorisEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRVastLat',RightVasltusLateralisEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRMedHams',RightMedialHamstringsEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRGasTroc',RightGastrocnemiusEMG, 80)
-                WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRTibAnte',RightTibialisAnteriorEMG, 80)
+                RightEMGChannels = [['RightRawRRectFem', RightRectusFemorisEMG],
+                                    ['RightRawRVastLat', RightVasltusLateralisEMG],
+                                    ['RightRawRMedHams', RightMedialHamstringsEMG],
+                                    ['RightRawRGasTroc', RightGastrocnemiusEMG],
+                                    ['RightRawRTibAnte', RightTibialisAnteriorEMG]]
                 # Lexington
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRGlutMax',RightGluteusMaximusEMG, 80)
+                    RightEMGChannels.append(['RightRawRGlutMax', RightGluteusMaximusEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRGlutMed',RightGluteusMediusEMG, 80)
+                    RightEMGChannels.append(['RightRawRGlutMed', RightGluteusMediusEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRAdducto',RightAdductorsEMG, 80)  
+                    RightEMGChannels.append(['RightRawRAdducto', RightAdductorsEMG])
                 except:
                     pass
                 # Montreal
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRVastMed',RightVasltusMedialisEMG, 80)
+                    RightEMGChannels.append(['RightRawRVastMed', RightVasltusMedialisEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRLatHams',RightLateralHamstringsEMG, 80)
+                    RightEMGChannels.append(['RightRawRLatHams', RightLateralHamstringsEMG])
                 except:
                     pass
                 try:
-                    WriteArrayToGCD_ComputeEMGenvelope(GCDFile,'RightRawRPerLong',RightPeroneusLongusEMG, 80)  
+                    RightEMGChannels.append(['RightRawRPerLong', RightPeroneusLongusEMG])
                 except:
                     pass
+                WriteArrayToGCD_ComputeEMGenvelope(GCDFile, RightEMGChannels, 80)
             
             # Check if Foot Model data exists
             if self.valueRightFootModelCheck == '1':
@@ -1357,5 +1453,67 @@ class CreateGCD_Main():
         
         GCDFile.close()
         
+        # All cycles export, every complete cycle of each side and the mean and standard deviation over the cycles
+        def WriteAllCyclesGCD(AllCyclesFileName):
+            AllCyclesFile = gcdfile.GCDWriter(AllCyclesFileName, GCDBinary)
+            AllCyclesFile.write('#!DST-Python3_ShrineGaitModel' + '\n')
+            AllCyclesFile.write('$FileCreationDateTime' + '\n')
+            AllCyclesFile.write(str(datetime.now().date()) + '-' + str(datetime.now().time().hour) + 'h-' + str(datetime.now().time().minute) + 'm-' + str(datetime.now().time().second) + 's' + '\n')
+            AllCyclesFile.write('$ProgramVersion' + '\n')
+            AllCyclesFile.write(VersionNumber + '\n')
+            AllCyclesFile.write('$C3DFileName' + '\n')
+            AllCyclesFile.write(str(FilePath) + str(FileName) + '.c3d' + '\n')
+            AllCyclesFile.write('$StaticFileName' + '\n')
+            AllCyclesFile.write(StaticDataFileName + '\n')
+            AllCyclesFile.write('!VideoRate' + '\n')
+            AllCyclesFile.write(str(MarkerFrameRate) + '\n')
+            
+            for [Side, FootStrikeEventFrames, FootOffEventFrames, OppositeFootStrikeEventFrames, OppositeFootOffEventFrames, FootModelCheck] in [
+                    ['Left', LeftFootStrikeEventFrames, LeftFootOffEventFrames, RightFootStrikeEventFrames, RightFootOffEventFrames, self.valueLeftFootModelCheck],
+                    ['Right', RightFootStrikeEventFrames, RightFootOffEventFrames, LeftFootStrikeEventFrames, LeftFootOffEventFrames, self.valueRightFootModelCheck]]:
+                CompleteCycles = FindCompleteCycles(FootStrikeEventFrames, FootOffEventFrames, OppositeFootStrikeEventFrames, OppositeFootOffEventFrames)
+                WriteSingleValueToGCD(AllCyclesFile, Side + 'NumberOfCycles', len(CompleteCycles))
+                if len(CompleteCycles) == 0:
+                    continue
+                Strikes1 = np.array([Cycle[1] for Cycle in CompleteCycles], dtype=float)
+                Strikes2 = np.array([Cycle[2] for Cycle in CompleteCycles], dtype=float)
+                ToeOffs = np.array([Cycle[3] for Cycle in CompleteCycles], dtype=float)
+                WriteArrayToGCD(AllCyclesFile, Side + 'CycleFootStrike1', Strikes1)
+                WriteArrayToGCD(AllCyclesFile, Side + 'CycleFootStrike2', Strikes2)
+                
+                # [GCD variable, model output, component] of the side
+                Variables = [[Side + GCDVariableName, Side[0] + C3DVariableName, Component] for [GCDVariableName, C3DVariableName, Component] in AllCyclesGCDVariables]
+                if MuscleLengthsWritten:
+                    Variables = Variables + [[Side + GCDVariableName, C3DVariableName, ['Left','Right'].index(Side)] for [GCDVariableName, C3DVariableName] in AllCyclesMuscleGCDVariables]
+                if FootModelCheck == '1':
+                    Variables = Variables + [[Side + GCDVariableName, Side[0] + C3DVariableName, Component] for [GCDVariableName, C3DVariableName, Component] in AllCyclesFootModelGCDVariables]
+                    Variables = Variables + [[Side + 'Supination', 'Supination', ['Left','Right'].index(Side)], [Side + 'Skew', 'Skew', ['Left','Right'].index(Side)]]
+                C3DVariableNames = list(dict.fromkeys([C3DVariableName for [GCDVariableName, C3DVariableName, Component] in Variables]))
+                Normalized = NormalizeModelOutputs(C3DVariableNames, NumPointsPerGraph, [[int(Cycle[1]), int(Cycle[2])] for Cycle in CompleteCycles])
+                # (cycles, variables, points), then mean and standard deviation of all variables at once
+                Curves = Normalized[:, [C3DVariableNames.index(C3DVariableName) for [GCDVariableName, C3DVariableName, Component] in Variables],
+                                    [Component for [GCDVariableName, C3DVariableName, Component] in Variables]]
+                StrideTimes = (Strikes2 - Strikes1) / MarkerFrameRate
+                FootOffs = 100*(ToeOffs - Strikes1)/(Strikes2 - Strikes1)
+                Degrees = 1 if len(CompleteCycles) > 1 else 0
+                
+                WriteArrayToGCD(AllCyclesFile, Side + 'StrideTime', StrideTimes)
+                WriteSingleValueToGCD(AllCyclesFile, Side + 'StrideTime_Mean', np.mean(StrideTimes))
+                WriteSingleValueToGCD(AllCyclesFile, Side + 'StrideTime_SD', np.std(StrideTimes, ddof=Degrees))
+                WriteArrayToGCD(AllCyclesFile, Side + 'FootOff', FootOffs)
+                WriteSingleValueToGCD(AllCyclesFile, Side + 'FootOff_Mean', np.mean(FootOffs))
+                WriteSingleValueToGCD(AllCyclesFile, Side + 'FootOff_SD', np.std(FootOffs, ddof=Degrees))
+                Means = np.mean(Curves, axis=0)
+                StandardDeviations = np.std(Curves, axis=0, ddof=Degrees)
+                for [Index, [GCDVariableName, C3DVariableName, Component]] in enumerate(Variables):
+                    for numCycle in range(len(CompleteCycles)):
+                        WriteArrayToGCD(AllCyclesFile, GCDVariableName + '_Cycle' + str(numCycle + 1), Curves[numCycle, Index])
+                    WriteArrayToGCD(AllCyclesFile, GCDVariableName + '_Mean', Means[Index])
+                    WriteArrayToGCD(AllCyclesFile, GCDVariableName + '_SD', StandardDeviations[Index])
+            AllCyclesFile.close()
+        
+        if GCDExport == 'AllCycles':
+            WriteAllCyclesGCD(FilePath + FileName + '.AllCycles.GCD')
+        
 #Calls the main Function
 CreateGCD_Main()
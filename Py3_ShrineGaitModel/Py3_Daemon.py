@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Optional processing daemon, so that Nexus pipeline steps do not start and import a new Python each time
+
+Start the daemon once (e.g. at login) on the Nexus computer:
+
+    python Py3_Daemon.py serve
+
+and set the Python pipeline entries to this script, with the program before the usual script arguments:
+
+    Script: Py3_Daemon.py    ScriptArgs: dynamic BF        (Dynamic_Main)
+    Script: Py3_Daemon.py    ScriptArgs: gcd BF            (CreateGCD)
+    Script: Py3_Daemon.py    ScriptArgs: process BF        (both, fused, see Py3_ProcessTrial)
+
+The client only forwards the program step, its arguments and the working folder to the daemon on localhost and prints
+the program output. The daemon keeps numpy/scipy, the model modules, the connection to Nexus, the compiled programs and
+the loaded static calibrations between trials and runs one program at a time. When no daemon is running, the client runs
+the program itself, as the pipeline did before, and also when the daemon does not answer within a few seconds.
+
+The daemon only runs the model programs of its own folder, by step. When it starts, it writes a new secret to
+~/.Py3_ShrineGaitModel/Daemon-<port>.token, readable by the user only, and each request must answer a challenge of the
+daemon with an HMAC of that secret, so other users and processes of the computer cannot run programs through it.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+# Only the standard library is imported here, the client must start fast
+import os
+import sys
+import hmac
+import json
+import socket
+import hashlib
+import secrets
+import traceback
+
+ProgramDirectory = os.path.dirname(os.path.abspath(__file__))
+Programs = {'static': 'Py3_StaticMain.py', 'dynamic': 'Py3_DynamicMain.py', 'gcd': 'Py3_CreateGCD.py', 'process': 'Py3_ProcessTrial.py'}
+DaemonHost = '127.0.0.1'
+DaemonPort = int(os.environ.get('PY3_SHRINEGAITMODEL_PORT', '50707'))
+TokenDirectory = os.path.join(os.path.expanduser('~'), '.Py3_ShrineGaitModel')
+HandshakeTimeout = 5. # s, for the challenge and the request, so that a connection that does not answer cannot block the daemon
+
+def TokenFileName(Port=DaemonPort):
+    return os.path.join(TokenDirectory, 'Daemon-' + str(Port) + '.token')
+
+def WriteToken(Port=DaemonPort):
+    # New secret of the daemon, in a file only the user can read
+    Token = secrets.token_hex(32)
+    os.makedirs(TokenDirectory, exist_ok=True)
+    FileName = TokenFileName(Port)
+    if os.path.exists(FileName):
+        os.remove(FileName)
+    with os.fdopen(os.open(FileName, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'w') as TokenFile:
+        TokenFile.write(Token)
+    return Token
+
+def ReadToken(Port=DaemonPort):
+    # Secret of the running daemon, None when there is no token file
+    try:
+        with open(TokenFileName(Port)) as TokenFile:
+            return TokenFile.read().strip()
+    except OSError:
+        return None
+
+def Signature(Token, Challenge):
+    # Answer to the challenge of the daemon, the token itself is never sent
+    return hmac.new(Token.encode('utf-8'), Challenge.encode('utf-8'), hashlib.sha256).hexdigest()
+
+def RunProgram(ProgramFileName, Arguments, CompiledPrograms=None):
+    # Run a program as its own __main__ script; compiled programs are reused while the file is unchanged
+    Modified = os.path.getmtime(ProgramFileName)
+    if CompiledPrograms is None or not CompiledPrograms.get(ProgramFileName, [None])[0] == Modified:
+        with open(ProgramFileName) as ProgramFile:
+            Code = compile(ProgramFile.read(), ProgramFileName, 'exec')
+        if CompiledPrograms is not None:
+            CompiledPrograms[ProgramFileName] = [Modified, Code]
+    else:
+        Code = CompiledPrograms[ProgramFileName][1]
+    sys.argv = [ProgramFileName] + list(Arguments)
+    exec(Code, {'__name__': '__main__', '__file__': ProgramFileName, '__builtins__': __builtins__})
+
+# ============================== Daemon ==============================
+class ClientWriter():
+    # stdout/stderr of a program, sent to the client line by line
+    def __init__(self, Connection):
+        self.Connection = Connection
+        self.Buffer = ''
+
+    def write(self, Text):
+        self.Buffer = self.Buffer + Text
+        if '\n' in self.Buffer:
+            [Lines, self.Buffer] = self.Buffer.rsplit('\n', 1)
+            self.Send({'Output': Lines + '\n'})
+        return len(Text)
+
+    def flush(self):
+        if not self.Buffer == '':
+            self.Send({'Output': self.Buffer})
+            self.Buffer = ''
+
+    def Send(self, Message):
+        try:
+            self.Connection.sendall((json.dumps(Message) + '\n').encode('utf-8'))
+        except OSError:
+            pass # Client gone, the program still completes
+
+def Serve(Host=DaemonHost, Port=DaemonPort):
+    # Warm up: modules of the programs and the trial source stay imported between requests
+    import numpy
+    import scipy.signal
+    import Py3_TrialSource
+    import Py3_MathModules
+    import Py3_GaitModules
+    import Py3_Calibration
+    import Py3_GCDFile
+    CompiledPrograms = {}
+
+    Server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    Server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    Server.bind((Host, Port))
+    Server.listen(8)
+    Token = WriteToken(Port)
+    print('Py3_ShrineGaitModel daemon', VersionNumber, 'listening on', Host + ':' + str(Port))
+    try:
+        while True:
+            [Connection, Address] = Server.accept()
+            with Connection:
+                if not HandleRequest(Connection, CompiledPrograms, Token) == 0:
+                    # The Nexus connection (kept by Py3_TrialSource) is opened again by the next program, e.g. after Nexus was restarted
+                    Py3_TrialSource.SetTrialSource(None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Server.close()
+        try:
+            os.remove(TokenFileName(Port))
+        except OSError:
+            pass
+
+def HandleRequest(Connection, CompiledPrograms, Token):
+    # Sends {Challenge}, request {Signature, Step, Arguments, WorkingDirectory}, replies {Output} lines then {Status, Error}.
+    # Returns the status
+    Writer = ClientWriter(Connection)
+    Status = 0
+    Error = ''
+    [StandardOutput, StandardError, WorkingDirectory] = [sys.stdout, sys.stderr, os.getcwd()]
+    try:
+        Connection.settimeout(HandshakeTimeout)
+        Challenge = secrets.token_hex(32)
+        Writer.Send({'Challenge': Challenge})
+        Request = json.loads(Connection.makefile('r', encoding='utf-8').readline())
+        Connection.settimeout(None)
+        if not hmac.compare_digest(str(Request.get('Signature', '')), Signature(Token, Challenge)):
+            raise PermissionError('Request without the token of the Py3_ShrineGaitModel daemon')
+        if Request.get('Step') not in Programs:
+            raise ValueError(str(Request.get('Step')) + ' is not a Shrine Gait Model program')
+        ProgramFileName = os.path.join(ProgramDirectory, Programs[Request['Step']])
+        os.chdir(Request.get('WorkingDirectory', WorkingDirectory))
+        [sys.stdout, sys.stderr] = [Writer, Writer]
+        RunProgram(ProgramFileName, Request.get('Arguments', []), CompiledPrograms)
+    except SystemExit as Exit:
+        Status = Exit.code if isinstance(Exit.code, int) else (0 if Exit.code is None else 1)
+    except Exception as Exception_:
+        traceback.print_exc()
+        Status = 1
+        Error = type(Exception_).__name__ + ': ' + str(Exception_)
+    finally:
+        Writer.flush()
+        [sys.stdout, sys.stderr] = [StandardOutput, StandardError]
+        os.chdir(WorkingDirectory)
+    Writer.Send({'Status': Status, 'Error': Error})
+    return Status
+
+# ============================== Client ==============================
+def RunClient(Step, Arguments):
+    # Forward the program to the daemon, or run it here when no daemon is running. Returns the exit status
+    ProgramFileName = os.path.join(ProgramDirectory, Programs[Step])
+    Token = ReadToken()
+    try:
+        if Token is None:
+            raise OSError('No daemon token')
+        Connection = socket.create_connection((DaemonHost, DaemonPort), timeout=1.)
+    except OSError:
+        sys.path.insert(0, ProgramDirectory)
+        RunProgram(ProgramFileName, Arguments)
+        return 0
+    with Connection:
+        # A daemon that does not send its challenge in time (busy, or the port is held by another process) is not used
+        Lines = Connection.makefile('r', encoding='utf-8')
+        try:
+            Connection.settimeout(HandshakeTimeout)
+            Challenge = json.loads(Lines.readline())['Challenge']
+        except (OSError, ValueError, KeyError, TypeError):
+            Connection.close()
+            sys.path.insert(0, ProgramDirectory)
+            RunProgram(ProgramFileName, Arguments)
+            return 0
+        Connection.settimeout(None)
+        Connection.sendall((json.dumps({'Signature': Signature(Token, Challenge), 'Step': Step, 'Arguments': Arguments, 'WorkingDirectory': os.getcwd()}) + '\n').encode('utf-8'))
+        for Line in Lines:
+            Message = json.loads(Line)
+            if 'Output' in Message:
+                sys.stdout.write(Message['Output'])
+                sys.stdout.flush()
+            if 'Status' in Message:
+                if not Message['Error'] == '':
+                    print(Message['Error'], file=sys.stderr)
+                return Message['Status']
+    print('Connection to the Py3_ShrineGaitModel daemon lost', file=sys.stderr)
+    return 1
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        sys.path.insert(0, ProgramDirectory)
+        Serve()
+        return 0
+    if len(sys.argv) < 2 or sys.argv[1] not in Programs:
+        print('Usage: python Py3_Daemon.py serve | ' + ' | '.join(Programs) + ' <script arguments>')
+        return 2
+    return RunClient(sys.argv[1], sys.argv[2:])
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -26,19 +26,25 @@ Last Update: 26 Aug, 2024
 @author: psaraswat
 ---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 """
-VersionNumber = 'Py3_v1.3'
+VersionNumber = 'Py3_v1.4'
 
 import numpy as np
 import sys
     
-#import Vicon Nexus Subroutines
-from viconnexusapi import ViconNexus
-vicon = ViconNexus.ViconNexus()
+#import Trial Data Source (Vicon Nexus, or a C3D file when run from Py3_Headless)
+import Py3_TrialSource
+vicon = Py3_TrialSource.OpenTrialSource()
+
+#import Static Calibration Store
+import Py3_Calibration as calibration
 
 #import Common Vector/Matrix Operations Modules
 import Py3_MathModules as math
 import Py3_GaitModules as gait
 
+#import Model Output Store
+import Py3_OutputStore as store
+
 
 SubjectName = vicon.GetSubjectNames()[0]
 FilePath, FileName = vicon.GetTrialName()
@@ -52,6 +58,18 @@ TestingCondition = DefaultTestingCondition
 if len(sys.argv) > 1:
     TestingCondition = sys.argv[1]
 
+# Third argument selects the kinematics processing: 'FrameByFrame' (default) or 'Vectorized' (whole trial as array operations)
+DefaultProcessingMode = 'FrameByFrame'
+ProcessingMode = DefaultProcessingMode
+if len(sys.argv) > 2:
+    ProcessingMode = sys.argv[2]
+
+# Fourth argument selects the model outputs: an output profile or output groups joined by '+' (see Py3_OutputStore),
+# by default the OutputProfile of the user preferences
+OutputProfile = None
+if len(sys.argv) > 3:
+    OutputProfile = sys.argv[3]
+
 #StaticDataFileName = FilePath + 'Static_BF_' + SubjectName + '.py'
 # Condition- Barefoot (BF) string read as Script Argument
 StaticDataFileName = FilePath + 'Static_' + TestingCondition + '_' + SubjectName + '.py'
@@ -65,20 +83,37 @@ class Dynamic_Main():
         # =============================================================================
                 
         # Function to extract markerdata into an array and check if data exists
-        def MarkerArrayCheck(Subject, MarkerName):
-            # Check if marker exists at all
-            if vicon.HasTrajectory(Subject,MarkerName) is True:
-                MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists = vicon.GetTrajectory(Subject, MarkerName)   
-            else:
-                framecount = vicon.GetFrameCount()
-                MarkerDataX= [0 for m in range(framecount)] 
-                MarkerDataY= [0 for m in range(framecount)] 
-                MarkerDataZ= [0 for m in range(framecount)] 
-                MarkerDataExists = [False]*framecount
-            return MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists
+        MarkerArrayCheck = vicon.MarkerArrayCheck
+        
+        # Function to stack marker data of the processed frames into an (N,3) array, x and y set by walking direction
+        def MarkerArrayBatch(MarkerDataX, MarkerDataY, MarkerDataZ, Direction=1):
+            MarkerArray = np.column_stack((MarkerDataX[StartFrame-1:EndFrame], MarkerDataY[StartFrame-1:EndFrame], MarkerDataZ[StartFrame-1:EndFrame])).astype(float)
+            MarkerArray[:,0:2] = Direction * MarkerArray[:,0:2]
+            return MarkerArray
+        
+        # Function to store an (N,3) array of the processed frames into an output array, x and y set by walking direction
+        def StoreArrayBatch(OutputArray, Data, Direction=1):
+            OutputArray[0][StartFrame-1:EndFrame] = Direction * Data[:,0]
+            OutputArray[1][StartFrame-1:EndFrame] = Direction * Data[:,1]
+            OutputArray[2][StartFrame-1:EndFrame] = Data[:,2]
+        
+        calibration.ApplyCalibration(self, StaticDataFileName)
+        
+        # Model output groups to compute and write, outputs of the other groups are skipped
+        OutputGroups = store.SelectOutputGroups(OutputProfile if OutputProfile else getattr(self, 'OutputProfile', store.DefaultOutputProfile))
+        PrunedOutputs = store.PrunedOutputs(OutputGroups)
+        
+        # Functions to create and write model outputs of the output profile
+        def CreateModelOutput(Subject, Name, *Arguments):
+            if not Name in PrunedOutputs:
+                vicon.CreateModelOutput(Subject, Name, *Arguments)
+        
+        def SetModelOutput(Subject, Name, Components, Exists):
+            if not Name in PrunedOutputs:
+                vicon.SetModelOutput(Subject, Name, Components, Exists)
         
-        exec(open(StaticDataFileName).read())
-        #execfile(UserPreferencesFileName)
+        # Read all markers of the user preferences at once
+        vicon.FetchMarkers(SubjectName, [getattr(self, Name) for Name in dir(self) if Name.endswith('MarkerName')])
         
         # Compute ASIS Markers if Pelfix Option is Used
         if not self.valuePelvicFixCheck == '0': # Pelfix Option is Used
@@ -241,10 +276,11 @@ class Dynamic_Main():
             SacralMarkerX= [0 for m in range(framecount)] 
             SacralMarkerY= [0 for m in range(framecount)] 
             SacralMarkerZ= [0 for m in range(framecount)] 
-            for FrameNumber in range(StartFrame-1,EndFrame): 
-                SacralMarkerX[FrameNumber] = (LeftPSISMarkerX[FrameNumber] + RightPSISMarkerX[FrameNumber]) / 2
-                SacralMarkerY[FrameNumber] = (LeftPSISMarkerY[FrameNumber] + RightPSISMarkerY[FrameNumber]) / 2
-                SacralMarkerZ[FrameNumber] = (LeftPSISMarkerZ[FrameNumber] + RightPSISMarkerZ[FrameNumber]) / 2
+            SacralMarkerX[StartFrame-1:EndFrame] = ((np.asarray(LeftPSISMarkerX[StartFrame-1:EndFrame]) + np.asarray(RightPSISMarkerX[StartFrame-1:EndFrame])) / 2).tolist()
+            SacralMarkerY[StartFrame-1:EndFrame] = ((np.asarray(LeftPSISMarkerY[StartFrame-1:EndFrame]) + np.asarray(RightPSISMarkerY[StartFrame-1:EndFrame])) / 2).tolist()
+            SacralMarkerZ[StartFrame-1:EndFrame] = ((np.asarray(LeftPSISMarkerZ[StartFrame-1:EndFrame]) + np.asarray(RightPSISMarkerZ[StartFrame-1:EndFrame])) / 2).tolist()
+            # The sacrum exists where both PSIS markers do
+            SacralMarkerExists = (np.asarray(LeftPSISMarkerExists, dtype=bool) & np.asarray(RightPSISMarkerExists, dtype=bool)).tolist()
         LeftASISMarkerX, LeftASISMarkerY, LeftASISMarkerZ, LeftASISMarkerExists = MarkerArrayCheck(SubjectName, self.LeftASISMarkerName)
         LeftThighMarkerX, LeftThighMarkerY, LeftThighMarkerZ, LeftThighMarkerExists = MarkerArrayCheck(SubjectName, self.LeftThighMarkerName)
         LeftLateralKneeMarkerX, LeftLateralKneeMarkerY, LeftLateralKneeMarkerZ, LeftLateralKneeMarkerExists = MarkerArrayCheck(SubjectName, self.LeftLateralKneeMarkerName)
@@ -309,13 +345,8 @@ class Dynamic_Main():
         #      Check for Medial Ankle marker drop-off
         # =============================================================================
         framecount = vicon.GetFrameCount()
-        LeftMedialAnkleMarkerDropOff = 0
-        RightMedialAnkleMarkerDropOff = 0
-        for FrameNumber in range(StartFrame-1,EndFrame):
-            if LeftMedialAnkleMarkerZ[FrameNumber] == 0:
-                LeftMedialAnkleMarkerDropOff = 1
-            if RightMedialAnkleMarkerZ[FrameNumber] == 0:
-                RightMedialAnkleMarkerDropOff = 1
+        LeftMedialAnkleMarkerDropOff = int(np.any(np.asarray(LeftMedialAnkleMarkerZ[StartFrame-1:EndFrame]) == 0))
+        RightMedialAnkleMarkerDropOff = int(np.any(np.asarray(RightMedialAnkleMarkerZ[StartFrame-1:EndFrame]) == 0))
                 
         # =============================================================================
         #      Determine Walking Direction and lab coordinate system
@@ -366,188 +397,221 @@ class Dynamic_Main():
         # Initialize arrays to write to C3D File
         framecount = vicon.GetFrameCount()
         exists = [True]*framecount
+        # Exists flags of the outputs whose segments have missing markers (Vectorized mode), other outputs use exists
+        OutputExists = {}
+        
+        # Model outputs, (3, frames) views of one array (see Py3_OutputStore)
+        OutputNames = ['LeftHipCenter', 'RightHipCenter', 'LeftKneeCenter', 'RightKneeCenter', 'LeftAnkleCenter', 'RightAnkleCenter', 'LeftASIS', 'RightASIS',
+                       'LeftKNE', 'RightKNE', 'LeftANK', 'RightANK', 'PelvisOrigin', 'LeftTrunkAngles', 'LeftTrunkAnglesTOR', 'LeftTrunkAnglesROT',
+                       'LeftPelvisAngles', 'LeftPelvisAnglesTOR', 'LeftPelvisAnglesROT', 'LeftThighAngles', 'LeftShankAngles', 'LeftFootAngles',
+                       'RightTrunkAngles', 'RightTrunkAnglesTOR', 'RightTrunkAnglesROT', 'RightPelvisAngles', 'RightPelvisAnglesTOR', 'RightPelvisAnglesROT',
+                       'RightThighAngles', 'RightShankAngles', 'RightFootAngles', 'LeftHipAngles', 'LeftKneeAngles', 'LeftKneeAnglesProximal',
+                       'LeftKneeAnglesDistal', 'LeftAnkleAngles', 'RightHipAngles', 'RightKneeAngles', 'RightKneeAnglesProximal', 'RightKneeAnglesDistal',
+                       'RightAnkleAngles', 'LeftTrunkAnglesRad', 'LeftPelvisAnglesRad', 'LeftThighAnglesRad', 'LeftShankAnglesRad', 'LeftFootAnglesRad',
+                       'RightTrunkAnglesRad', 'RightPelvisAnglesRad', 'RightThighAnglesRad', 'RightShankAnglesRad', 'RightFootAnglesRad', 'LeftHipAnglesRad',
+                       'LeftKneeAnglesRad', 'LeftAnkleAnglesRad', 'RightHipAnglesRad', 'RightKneeAnglesRad', 'RightAnkleAnglesRad', 'HATCenterOfMass',
+                       'LeftThighCenterOfMass', 'LeftShankCenterOfMass', 'LeftFootCenterOfMass', 'RightThighCenterOfMass', 'RightShankCenterOfMass',
+                       'RightFootCenterOfMass', 'LeftHipMoment', 'LeftHipPower', 'LeftHipPowerTotal', 'LeftKneeMoment', 'LeftKneePower', 'LeftKneePowerTotal',
+                       'LeftAnkleMoment', 'LeftAnklePower', 'LeftAnklePowerTotal', 'RightHipMoment', 'RightHipPower', 'RightHipPowerTotal', 'RightKneeMoment',
+                       'RightKneePower', 'RightKneePowerTotal', 'RightAnkleMoment', 'RightAnklePower', 'RightAnklePowerTotal', 'LeftAnkleJRF', 'LeftKneeJRF',
+                       'LeftHipJRF', 'RightAnkleJRF', 'RightKneeJRF', 'RightHipJRF', 'LeftGRF', 'LeftGRM', 'RightGRF', 'RightGRM', 'LeftMPSum', 'RightMPSum',
+                       'LeftFootCoP', 'RightFootCoP', 'GluteusMaxLength', 'IlioPsoasLength', 'RectFemLength', 'MedHamstringLength', 'LatHamstringLength',
+                       'GastrocLength', 'SoleusLength', 'TibPostLength', 'PeronealLength', 'VastusLatLength', 'GluteusMaxVelocity', 'IlioPsoasVelocity',
+                       'RectFemVelocity', 'MedHamstringVelocity', 'LatHamstringVelocity', 'GastrocVelocity', 'SoleusVelocity', 'TibPostVelocity',
+                       'PeronealVelocity', 'VastusLatVelocity']
+        if self.valueLeftFootModelCheck == '1':
+            OutputNames = OutputNames + ['LeftUpperPCAL', 'LeftHindfootAngles', 'LeftForefootAngles', 'LeftHalluxAngles', 'LeftAnkleComplexAngles', 'LeftMidfootAngles',
+                                          'LeftToesAngles', 'LeftHindfootAnglesRad', 'LeftForefootAnglesRad', 'LeftHalluxAnglesRad', 'LeftAnkleComplexAnglesRad',
+                                          'LeftMidfootAnglesRad', 'LeftToesAnglesRad']
+        if self.valueRightFootModelCheck == '1':
+            OutputNames = OutputNames + ['RightUpperPCAL', 'RightHindfootAngles', 'RightForefootAngles', 'RightHalluxAngles', 'RightAnkleComplexAngles', 'RightMidfootAngles',
+                                          'RightToesAngles', 'RightHindfootAnglesRad', 'RightForefootAnglesRad', 'RightHalluxAnglesRad', 'RightAnkleComplexAnglesRad',
+                                          'RightMidfootAnglesRad', 'RightToesAnglesRad']
+        if self.valueLeftFootModelCheck == '1' or self.valueRightFootModelCheck == '1':
+            OutputNames = OutputNames + ['Supination', 'Skew']
+        Outputs = store.OutputStore(OutputNames, framecount, store.OutputDataType(getattr(self, 'OutputDataType', store.DefaultOutputDataType)))
         
-        arrayLeftHipCenter = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightHipCenter = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeCenter = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeCenter = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnkleCenter = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnkleCenter = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftHipCenter = Outputs['LeftHipCenter']
+        arrayRightHipCenter = Outputs['RightHipCenter']
+        arrayLeftKneeCenter = Outputs['LeftKneeCenter']
+        arrayRightKneeCenter = Outputs['RightKneeCenter']
+        arrayLeftAnkleCenter = Outputs['LeftAnkleCenter']
+        arrayRightAnkleCenter = Outputs['RightAnkleCenter']
         
         # ASI, KNE, ANK for MAPS
-        arrayLeftASIS = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightASIS = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKNE = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKNE = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftANK = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightANK = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftASIS = Outputs['LeftASIS']
+        arrayRightASIS = Outputs['RightASIS']
+        arrayLeftKNE = Outputs['LeftKNE']
+        arrayRightKNE = Outputs['RightKNE']
+        arrayLeftANK = Outputs['LeftANK']
+        arrayRightANK = Outputs['RightANK']
         
         # Initialize array for Pelvic Origin, UpperPCAL for SLC
-        arrayPelvisOrigin = [[0. for m in range(framecount)] for n in range(3)]
+        arrayPelvisOrigin = Outputs['PelvisOrigin']
         if self.valueLeftFootModelCheck == '1':
-            arrayLeftUpperPCAL = [[0. for m in range(framecount)] for n in range(3)]
+            arrayLeftUpperPCAL = Outputs['LeftUpperPCAL']
         if self.valueRightFootModelCheck == '1':
-            arrayRightUpperPCAL = [[0. for m in range(framecount)] for n in range(3)]
-            
-        arrayLeftTrunkAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftTrunkAnglesTOR = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftTrunkAnglesROT = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftPelvisAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftPelvisAnglesTOR = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftPelvisAnglesROT = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftThighAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftShankAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftFootAngles = [[0. for m in range(framecount)] for n in range(3)]
+            arrayRightUpperPCAL = Outputs['RightUpperPCAL']
+            
+        arrayLeftTrunkAngles = Outputs['LeftTrunkAngles']
+        arrayLeftTrunkAnglesTOR = Outputs['LeftTrunkAnglesTOR']
+        arrayLeftTrunkAnglesROT = Outputs['LeftTrunkAnglesROT']
+        arrayLeftPelvisAngles = Outputs['LeftPelvisAngles']
+        arrayLeftPelvisAnglesTOR = Outputs['LeftPelvisAnglesTOR']
+        arrayLeftPelvisAnglesROT = Outputs['LeftPelvisAnglesROT']
+        arrayLeftThighAngles = Outputs['LeftThighAngles']
+        arrayLeftShankAngles = Outputs['LeftShankAngles']
+        arrayLeftFootAngles = Outputs['LeftFootAngles']
         if self.valueLeftFootModelCheck == '1':
-            arrayLeftHindfootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftForefootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftHalluxAngles = [[0. for m in range(framecount)] for n in range(3)]
-        
-        arrayRightTrunkAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightTrunkAnglesTOR = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightTrunkAnglesROT = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightPelvisAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightPelvisAnglesTOR = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightPelvisAnglesROT = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightThighAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightShankAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightFootAngles = [[0. for m in range(framecount)] for n in range(3)]
+            arrayLeftHindfootAngles = Outputs['LeftHindfootAngles']
+            arrayLeftForefootAngles = Outputs['LeftForefootAngles']
+            arrayLeftHalluxAngles = Outputs['LeftHalluxAngles']
+        
+        arrayRightTrunkAngles = Outputs['RightTrunkAngles']
+        arrayRightTrunkAnglesTOR = Outputs['RightTrunkAnglesTOR']
+        arrayRightTrunkAnglesROT = Outputs['RightTrunkAnglesROT']
+        arrayRightPelvisAngles = Outputs['RightPelvisAngles']
+        arrayRightPelvisAnglesTOR = Outputs['RightPelvisAnglesTOR']
+        arrayRightPelvisAnglesROT = Outputs['RightPelvisAnglesROT']
+        arrayRightThighAngles = Outputs['RightThighAngles']
+        arrayRightShankAngles = Outputs['RightShankAngles']
+        arrayRightFootAngles = Outputs['RightFootAngles']
         if self.valueRightFootModelCheck == '1':
-            arrayRightHindfootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightForefootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightHalluxAngles = [[0. for m in range(framecount)] for n in range(3)]
-        
-        arrayLeftHipAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeAnglesProximal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeAnglesDistal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnkleAngles = [[0. for m in range(framecount)] for n in range(3)]
+            arrayRightHindfootAngles = Outputs['RightHindfootAngles']
+            arrayRightForefootAngles = Outputs['RightForefootAngles']
+            arrayRightHalluxAngles = Outputs['RightHalluxAngles']
+        
+        arrayLeftHipAngles = Outputs['LeftHipAngles']
+        arrayLeftKneeAngles = Outputs['LeftKneeAngles']
+        arrayLeftKneeAnglesProximal = Outputs['LeftKneeAnglesProximal']
+        arrayLeftKneeAnglesDistal = Outputs['LeftKneeAnglesDistal']
+        arrayLeftAnkleAngles = Outputs['LeftAnkleAngles']
         if self.valueLeftFootModelCheck == '1':
-            arrayLeftAnkleComplexAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftMidfootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftToesAngles = [[0. for m in range(framecount)] for n in range(3)]
-        
-        arrayRightHipAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeAngles = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeAnglesProximal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeAnglesDistal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnkleAngles = [[0. for m in range(framecount)] for n in range(3)]
+            arrayLeftAnkleComplexAngles = Outputs['LeftAnkleComplexAngles']
+            arrayLeftMidfootAngles = Outputs['LeftMidfootAngles']
+            arrayLeftToesAngles = Outputs['LeftToesAngles']
+        
+        arrayRightHipAngles = Outputs['RightHipAngles']
+        arrayRightKneeAngles = Outputs['RightKneeAngles']
+        arrayRightKneeAnglesProximal = Outputs['RightKneeAnglesProximal']
+        arrayRightKneeAnglesDistal = Outputs['RightKneeAnglesDistal']
+        arrayRightAnkleAngles = Outputs['RightAnkleAngles']
         if self.valueRightFootModelCheck == '1':
-            arrayRightAnkleComplexAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightMidfootAngles = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightToesAngles = [[0. for m in range(framecount)] for n in range(3)]
+            arrayRightAnkleComplexAngles = Outputs['RightAnkleComplexAngles']
+            arrayRightMidfootAngles = Outputs['RightMidfootAngles']
+            arrayRightToesAngles = Outputs['RightToesAngles']
         
         
-        arrayLeftTrunkAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftPelvisAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftThighAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftShankAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftFootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftTrunkAnglesRad = Outputs['LeftTrunkAnglesRad']
+        arrayLeftPelvisAnglesRad = Outputs['LeftPelvisAnglesRad']
+        arrayLeftThighAnglesRad = Outputs['LeftThighAnglesRad']
+        arrayLeftShankAnglesRad = Outputs['LeftShankAnglesRad']
+        arrayLeftFootAnglesRad = Outputs['LeftFootAnglesRad']
         if self.valueLeftFootModelCheck == '1':
-            arrayLeftHindfootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftForefootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftHalluxAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightTrunkAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightPelvisAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightThighAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightShankAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightFootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+            arrayLeftHindfootAnglesRad = Outputs['LeftHindfootAnglesRad']
+            arrayLeftForefootAnglesRad = Outputs['LeftForefootAnglesRad']
+            arrayLeftHalluxAnglesRad = Outputs['LeftHalluxAnglesRad']
+        arrayRightTrunkAnglesRad = Outputs['RightTrunkAnglesRad']
+        arrayRightPelvisAnglesRad = Outputs['RightPelvisAnglesRad']
+        arrayRightThighAnglesRad = Outputs['RightThighAnglesRad']
+        arrayRightShankAnglesRad = Outputs['RightShankAnglesRad']
+        arrayRightFootAnglesRad = Outputs['RightFootAnglesRad']
         if self.valueRightFootModelCheck == '1':
-            arrayRightHindfootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightForefootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightHalluxAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+            arrayRightHindfootAnglesRad = Outputs['RightHindfootAnglesRad']
+            arrayRightForefootAnglesRad = Outputs['RightForefootAnglesRad']
+            arrayRightHalluxAnglesRad = Outputs['RightHalluxAnglesRad']
             
-        arrayLeftHipAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnkleAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftHipAnglesRad = Outputs['LeftHipAnglesRad']
+        arrayLeftKneeAnglesRad = Outputs['LeftKneeAnglesRad']
+        arrayLeftAnkleAnglesRad = Outputs['LeftAnkleAnglesRad']
         if self.valueLeftFootModelCheck == '1':
-            arrayLeftAnkleComplexAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftMidfootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayLeftToesAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+            arrayLeftAnkleComplexAnglesRad = Outputs['LeftAnkleComplexAnglesRad']
+            arrayLeftMidfootAnglesRad = Outputs['LeftMidfootAnglesRad']
+            arrayLeftToesAnglesRad = Outputs['LeftToesAnglesRad']
             
-        arrayRightHipAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnkleAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+        arrayRightHipAnglesRad = Outputs['RightHipAnglesRad']
+        arrayRightKneeAnglesRad = Outputs['RightKneeAnglesRad']
+        arrayRightAnkleAnglesRad = Outputs['RightAnkleAnglesRad']
         if self.valueRightFootModelCheck == '1':
-            arrayRightAnkleComplexAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightMidfootAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
-            arrayRightToesAnglesRad = [[0. for m in range(framecount)] for n in range(3)]
+            arrayRightAnkleComplexAnglesRad = Outputs['RightAnkleComplexAnglesRad']
+            arrayRightMidfootAnglesRad = Outputs['RightMidfootAnglesRad']
+            arrayRightToesAnglesRad = Outputs['RightToesAnglesRad']
         
         if self.valueLeftFootModelCheck == '1' or self.valueRightFootModelCheck == '1':
-            arraySupination = [[0. for m in range(framecount)] for n in range(3)]
-            arraySkew = [[0. for m in range(framecount)] for n in range(3)]
-            
-        arrayHATCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftThighCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftShankCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftFootCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightThighCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightShankCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightFootCenterOfMass = [[0. for m in range(framecount)] for n in range(3)]
-        
-        
-        arrayLeftHipMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftHipPower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftHipPowerTotal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneePower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneePowerTotal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnkleMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnklePower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftAnklePowerTotal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightHipMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightHipPower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightHipPowerTotal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneePower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneePowerTotal = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnkleMoment = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnklePower = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnklePowerTotal = [[0. for m in range(framecount)] for n in range(3)]
+            arraySupination = Outputs['Supination']
+            arraySkew = Outputs['Skew']
+            
+        arrayHATCenterOfMass = Outputs['HATCenterOfMass']
+        arrayLeftThighCenterOfMass = Outputs['LeftThighCenterOfMass']
+        arrayLeftShankCenterOfMass = Outputs['LeftShankCenterOfMass']
+        arrayLeftFootCenterOfMass = Outputs['LeftFootCenterOfMass']
+        arrayRightThighCenterOfMass = Outputs['RightThighCenterOfMass']
+        arrayRightShankCenterOfMass = Outputs['RightShankCenterOfMass']
+        arrayRightFootCenterOfMass = Outputs['RightFootCenterOfMass']
+        
+        
+        arrayLeftHipMoment = Outputs['LeftHipMoment']
+        arrayLeftHipPower = Outputs['LeftHipPower']
+        arrayLeftHipPowerTotal = Outputs['LeftHipPowerTotal']
+        arrayLeftKneeMoment = Outputs['LeftKneeMoment']
+        arrayLeftKneePower = Outputs['LeftKneePower']
+        arrayLeftKneePowerTotal = Outputs['LeftKneePowerTotal']
+        arrayLeftAnkleMoment = Outputs['LeftAnkleMoment']
+        arrayLeftAnklePower = Outputs['LeftAnklePower']
+        arrayLeftAnklePowerTotal = Outputs['LeftAnklePowerTotal']
+        arrayRightHipMoment = Outputs['RightHipMoment']
+        arrayRightHipPower = Outputs['RightHipPower']
+        arrayRightHipPowerTotal = Outputs['RightHipPowerTotal']
+        arrayRightKneeMoment = Outputs['RightKneeMoment']
+        arrayRightKneePower = Outputs['RightKneePower']
+        arrayRightKneePowerTotal = Outputs['RightKneePowerTotal']
+        arrayRightAnkleMoment = Outputs['RightAnkleMoment']
+        arrayRightAnklePower = Outputs['RightAnklePower']
+        arrayRightAnklePowerTotal = Outputs['RightAnklePowerTotal']
         
         # Add JRF, GRF, Moment/Power Sums
         # Joint Reaction Forces
-        arrayLeftAnkleJRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftKneeJRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftHipJRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightAnkleJRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightKneeJRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightHipJRF = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftAnkleJRF = Outputs['LeftAnkleJRF']
+        arrayLeftKneeJRF = Outputs['LeftKneeJRF']
+        arrayLeftHipJRF = Outputs['LeftHipJRF']
+        arrayRightAnkleJRF = Outputs['RightAnkleJRF']
+        arrayRightKneeJRF = Outputs['RightKneeJRF']
+        arrayRightHipJRF = Outputs['RightHipJRF']
         # Ground Reaction Forces and Moments
-        arrayLeftGRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLeftGRM = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightGRF = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightGRM = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftGRF = Outputs['LeftGRF']
+        arrayLeftGRM = Outputs['LeftGRM']
+        arrayRightGRF = Outputs['RightGRF']
+        arrayRightGRM = Outputs['RightGRM']
         # Moment and Power (MP) Sums (SagittalMomentSum, SagittalPowerSum, TotalPowerSum)
-        arrayLeftMPSum = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightMPSum = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftMPSum = Outputs['LeftMPSum']
+        arrayRightMPSum = Outputs['RightMPSum']
         # CoP relative to the foot CS
-        arrayLeftFootCoP = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRightFootCoP = [[0. for m in range(framecount)] for n in range(3)]
+        arrayLeftFootCoP = Outputs['LeftFootCoP']
+        arrayRightFootCoP = Outputs['RightFootCoP']
 
         
         # Muscle Length and Velocities
-        arrayGluteusMaxLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayIlioPsoasLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRectFemLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayMedHamstringLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLatHamstringLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayGastrocLength = [[0. for m in range(framecount)] for n in range(3)]
-        arraySoleusLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayTibPostLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayPeronealLength = [[0. for m in range(framecount)] for n in range(3)]
-        arrayVastusLatLength = [[0. for m in range(framecount)] for n in range(3)]
-        
-        arrayGluteusMaxVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayIlioPsoasVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayRectFemVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayMedHamstringVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayLatHamstringVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayGastrocVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arraySoleusVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayTibPostVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayPeronealVelocity = [[0. for m in range(framecount)] for n in range(3)]
-        arrayVastusLatVelocity = [[0. for m in range(framecount)] for n in range(3)]
+        arrayGluteusMaxLength = Outputs['GluteusMaxLength']
+        arrayIlioPsoasLength = Outputs['IlioPsoasLength']
+        arrayRectFemLength = Outputs['RectFemLength']
+        arrayMedHamstringLength = Outputs['MedHamstringLength']
+        arrayLatHamstringLength = Outputs['LatHamstringLength']
+        arrayGastrocLength = Outputs['GastrocLength']
+        arraySoleusLength = Outputs['SoleusLength']
+        arrayTibPostLength = Outputs['TibPostLength']
+        arrayPeronealLength = Outputs['PeronealLength']
+        arrayVastusLatLength = Outputs['VastusLatLength']
+        
+        arrayGluteusMaxVelocity = Outputs['GluteusMaxVelocity']
+        arrayIlioPsoasVelocity = Outputs['IlioPsoasVelocity']
+        arrayRectFemVelocity = Outputs['RectFemVelocity']
+        arrayMedHamstringVelocity = Outputs['MedHamstringVelocity']
+        arrayLatHamstringVelocity = Outputs['LatHamstringVelocity']
+        arrayGastrocVelocity = Outputs['GastrocVelocity']
+        arraySoleusVelocity = Outputs['SoleusVelocity']
+        arrayTibPostVelocity = Outputs['TibPostVelocity']
+        arrayPeronealVelocity = Outputs['PeronealVelocity']
+        arrayVastusLatVelocity = Outputs['VastusLatVelocity']
         
 #        arrayLeftMusclePoint1 = [[0. for m in range(framecount)] for n in range(3)]
 #        arrayLeftMusclePoint2 = [[0. for m in range(framecount)] for n in range(3)]
@@ -663,6 +727,7 @@ class Dynamic_Main():
         VaLa.append([  25.3,  18.4,-424.3])     #{*Fem: -172<KneeAng<-110deg*}
         VaLa.append([  10.3,  14.1,  42.3])		#{*Pat*}
         VaLa_Seg = ['Thigh','Thigh','Thigh','Thigh','Patella']
+        VaLa_KneeFlexion = [None,None,[69.,np.inf],[110.,np.inf],None]
         
         
         #{* Semimembranosus, 2 points *}
@@ -697,6 +762,7 @@ class Dynamic_Main():
         ReFe.append([  33.4,   1.9,-403.0])     #{*Fem: 83<KneeFlex<171 deg *}
         ReFe.append([  12.1,  -1.0,  43.7])		#{*Pat*}
         ReFe_Seg = ['Pelvis','Thigh','Patella']
+        ReFe_KneeFlexion = [None,[83.,np.inf],None]
         
         #{* Gastrocnemius, Medial [GaMe] and Lateral [GaLa] heads, 3/4 points *}
         GaMe = []
@@ -706,6 +772,7 @@ class Dynamic_Main():
         GaMe.append([ -21.7, -29.5, -48.7])		#{*Tib*}
         GaMe.append([   4.4,  -5.3,  31.0])		#{*Cal*}
         GaMe_Seg = ['Thigh','Thigh','Shank','Calcaneus']
+        GaMe_KneeFlexion = [None,[-np.inf,44.],None,None]
         
         GaLa = []
         GaLa.append([ -15.5,  27.2,-394.6])		#{*Fem*}
@@ -714,6 +781,7 @@ class Dynamic_Main():
         GaLa.append([ -24.2,  23.5, -48.1])		#{*Tib*}
         GaLa.append([   4.4,  -5.3,  31.0])		#{*Cal*}
         GaLa_Seg = ['Thigh','Thigh','Shank','Calcaneus']
+        GaLa_KneeFlexion = [None,[-np.inf,44.],None,None]
         
         #{* Soleus [Sole], 2 Points *}
         Sole = []
@@ -748,9 +816,599 @@ class Dynamic_Main():
         PeLn.append([ 120.3, -18.4,   8.5])		#{*Cal*}
         PeLn_Seg = ['Shank','Shank','Shank','Calcaneus','Calcaneus','Calcaneus','Calcaneus']
         
+        #{* Muscle model compiled once into point offsets and segment indices *}
+        DelpSegmentNames = ['Pelvis','Thigh','Shank','Patella','Calcaneus']
+        DelpMuscleNames = ['GMaS','GMaM','GMaI','Ilia','Psoa','SeMe','SeTe','BiFL','BiFS','ReFe','VaLa','GaMe','GaLa','Sole','TiPo','PeBr','PeLn']
+        DelpMuscleModel = math.CompileMuscleModel([[GMaS,GMaS_Seg,None], [GMaM,GMaM_Seg,None], [GMaI,GMaI_Seg,None],
+                                                   [Ilia,Ilia_Seg,None], [Psoa,Psoa_Seg,None],
+                                                   [SeMe,SeMe_Seg,None], [SeTe,SeTe_Seg,None], [BiFL,BiFL_Seg,None], [BiFS,BiFS_Seg,None],
+                                                   [ReFe,ReFe_Seg,ReFe_KneeFlexion], [VaLa,VaLa_Seg,VaLa_KneeFlexion],
+                                                   [GaMe,GaMe_Seg,GaMe_KneeFlexion], [GaLa,GaLa_Seg,GaLa_KneeFlexion],
+                                                   [Sole,Sole_Seg,None], [TiPo,TiPo_Seg,None], [PeBr,PeBr_Seg,None], [PeLn,PeLn_Seg,None]],
+                                                  DelpSegmentNames)
+        
+        # Zero Positions to compute Normalizing Muscle Length, side index 0 = Left and 1 = Right
+        # The zero position only moves with the pelvis, so the lengths are computed once with the pelvis at the lab origin
+        ELabDelp = np.eye(3)
+        # Flex patellae by constant at zero knee flexion
+        EPatellaAnatDelp0 = math.RotateCSaroundYaxis(ELabDelp,PatR0)
+        # Rotate Calcaneus to account for normal tibial torsion
+        LeftECalcaneusAnatDelp0 = math.RotateCSaroundZaxis(ELabDelp,15.0)
+        RightECalcaneusAnatDelp0 = math.RotateCSaroundZaxis(ELabDelp,-15.0)
+        LeftShankOriginDelp0 = np.add(DelpLeftHJC, DelpKJC0)
+        RightShankOriginDelp0 = np.add(DelpRightHJC, DelpKJC0)
+        DelpMuscleLengths0 = [math.ComputeMuscleLengths_Batch(DelpMuscleModel, 'Left', [ELabDelp, ELabDelp, ELabDelp, EPatellaAnatDelp0, LeftECalcaneusAnatDelp0],
+                                                              [np.zeros(3), DelpLeftHJC, LeftShankOriginDelp0, LeftShankOriginDelp0 + DelpLPat0, LeftShankOriginDelp0 + DelpAJC + LCalC], 0.),
+                              math.ComputeMuscleLengths_Batch(DelpMuscleModel, 'Right', [ELabDelp, ELabDelp, ELabDelp, EPatellaAnatDelp0, RightECalcaneusAnatDelp0],
+                                                              [np.zeros(3), DelpRightHJC, RightShankOriginDelp0, RightShankOriginDelp0 + DelpRPat0, RightShankOriginDelp0 + DelpAJC + RCalC], 0.)]
+        
+        # Delp muscle model segment poses of every frame, side index 0 = Left and 1 = Right
+        # Muscle lengths of all frames are computed in one pass after the kinematics
+        DelpSegmentCS = np.zeros((2, framecount, len(DelpSegmentNames), 3, 3))
+        DelpSegmentOrigins = np.zeros((2, framecount, len(DelpSegmentNames), 3))
+        DelpKneeFlexion = np.zeros((2, framecount))
         
+        
+        # =============================================================================
+        #      Vectorized Kinematics: all frames of the trial computed as array operations
+        # =============================================================================
+        if ProcessingMode == 'Vectorized':
+            NumberOfFrames = EndFrame - StartFrame + 1
+
+            #Transform marker data if necessary based on direction that the patient is walking
+            C7Marker = MarkerArrayBatch(C7MarkerX, C7MarkerY, C7MarkerZ, Direction)
+            LeftClavicleMarker = MarkerArrayBatch(LeftClavicleMarkerX, LeftClavicleMarkerY, LeftClavicleMarkerZ, Direction)
+            RightClavicleMarker = MarkerArrayBatch(RightClavicleMarkerX, RightClavicleMarkerY, RightClavicleMarkerZ, Direction)
+            SacralMarker = MarkerArrayBatch(SacralMarkerX, SacralMarkerY, SacralMarkerZ, Direction)
+            LeftASISMarker = MarkerArrayBatch(LeftASISMarkerX, LeftASISMarkerY, LeftASISMarkerZ, Direction)
+            LeftThighMarker = MarkerArrayBatch(LeftThighMarkerX, LeftThighMarkerY, LeftThighMarkerZ, Direction)
+            LeftLateralKneeMarker = MarkerArrayBatch(LeftLateralKneeMarkerX, LeftLateralKneeMarkerY, LeftLateralKneeMarkerZ, Direction)
+            LeftTibialMarker = MarkerArrayBatch(LeftTibialMarkerX, LeftTibialMarkerY, LeftTibialMarkerZ, Direction)
+            if LeftTibialTriadCheck is True:
+                LeftTibialUpperMarker = MarkerArrayBatch(LeftTibialUpperMarkerX, LeftTibialUpperMarkerY, LeftTibialUpperMarkerZ, Direction)
+                LeftTibialLowerMarker = MarkerArrayBatch(LeftTibialLowerMarkerX, LeftTibialLowerMarkerY, LeftTibialLowerMarkerZ, Direction)
+            LeftLateralAnkleMarker = MarkerArrayBatch(LeftLateralAnkleMarkerX, LeftLateralAnkleMarkerY, LeftLateralAnkleMarkerZ, Direction)
+            LeftToeMarker = MarkerArrayBatch(LeftToeMarkerX, LeftToeMarkerY, LeftToeMarkerZ, Direction)
+            LeftMedialAnkleMarker = MarkerArrayBatch(LeftMedialAnkleMarkerX, LeftMedialAnkleMarkerY, LeftMedialAnkleMarkerZ, Direction)
+            if self.valueLeftFootModelCheck == '1':
+                LeftLateralCalcaneusMarker = MarkerArrayBatch(LeftLateralCalcaneusMarkerX, LeftLateralCalcaneusMarkerY, LeftLateralCalcaneusMarkerZ, Direction)
+                LeftMedialCalcaneusMarker = MarkerArrayBatch(LeftMedialCalcaneusMarkerX, LeftMedialCalcaneusMarkerY, LeftMedialCalcaneusMarkerZ, Direction)
+                LeftPosteriorCalcaneusMarker = MarkerArrayBatch(LeftPosteriorCalcaneusMarkerX, LeftPosteriorCalcaneusMarkerY, LeftPosteriorCalcaneusMarkerZ, Direction)
+
+                # Computer MTP1 Marker
+                LeftFirstMetarsalBaseMarker = MarkerArrayBatch(LeftFirstMetarsalBaseMarkerX, LeftFirstMetarsalBaseMarkerY, LeftFirstMetarsalBaseMarkerZ)
+                LeftFirstMetarsalHeadMarker = MarkerArrayBatch(LeftFirstMetarsalHeadMarkerX, LeftFirstMetarsalHeadMarkerY, LeftFirstMetarsalHeadMarkerZ)
+                LeftFifthMetarsalHeadMarker = MarkerArrayBatch(LeftFifthMetarsalHeadMarkerX, LeftFifthMetarsalHeadMarkerY, LeftFifthMetarsalHeadMarkerZ)
+                LeftEForefootTech = gait.TechCS_Forefoot_mSHCG_Batch('Left', LeftFirstMetarsalBaseMarker, LeftFirstMetarsalHeadMarker, LeftFifthMetarsalHeadMarker)
+                LeftMTP1MarkerLab = math.TransformPointIntoLabCoors_Batch(self.valueLeftFirstMetatarsoPhalangealJointMarkerForefoot, LeftEForefootTech, LeftFirstMetarsalBaseMarker)
+                LeftFirstMetatarsoPhalangealJointMarker = LeftMTP1MarkerLab * np.array([Direction, Direction, 1])
+
+                LeftFirstMetarsalBaseMarker = MarkerArrayBatch(LeftFirstMetarsalBaseMarkerX, LeftFirstMetarsalBaseMarkerY, LeftFirstMetarsalBaseMarkerZ, Direction)
+                LeftFirstMetarsalHeadMarker = MarkerArrayBatch(LeftFirstMetarsalHeadMarkerX, LeftFirstMetarsalHeadMarkerY, LeftFirstMetarsalHeadMarkerZ, Direction)
+                LeftFifthMetarsalHeadMarker = MarkerArrayBatch(LeftFifthMetarsalHeadMarkerX, LeftFifthMetarsalHeadMarkerY, LeftFifthMetarsalHeadMarkerZ, Direction)
+                LeftHalluxMarker = MarkerArrayBatch(LeftHalluxMarkerX, LeftHalluxMarkerY, LeftHalluxMarkerZ, Direction)
+            RightASISMarker = MarkerArrayBatch(RightASISMarkerX, RightASISMarkerY, RightASISMarkerZ, Direction)
+            RightThighMarker = MarkerArrayBatch(RightThighMarkerX, RightThighMarkerY, RightThighMarkerZ, Direction)
+            RightLateralKneeMarker = MarkerArrayBatch(RightLateralKneeMarkerX, RightLateralKneeMarkerY, RightLateralKneeMarkerZ, Direction)
+            RightTibialMarker = MarkerArrayBatch(RightTibialMarkerX, RightTibialMarkerY, RightTibialMarkerZ, Direction)
+            if RightTibialTriadCheck is True:
+                RightTibialUpperMarker = MarkerArrayBatch(RightTibialUpperMarkerX, RightTibialUpperMarkerY, RightTibialUpperMarkerZ, Direction)
+                RightTibialLowerMarker = MarkerArrayBatch(RightTibialLowerMarkerX, RightTibialLowerMarkerY, RightTibialLowerMarkerZ, Direction)
+            RightLateralAnkleMarker = MarkerArrayBatch(RightLateralAnkleMarkerX, RightLateralAnkleMarkerY, RightLateralAnkleMarkerZ, Direction)
+            RightToeMarker = MarkerArrayBatch(RightToeMarkerX, RightToeMarkerY, RightToeMarkerZ, Direction)
+            RightMedialAnkleMarker = MarkerArrayBatch(RightMedialAnkleMarkerX, RightMedialAnkleMarkerY, RightMedialAnkleMarkerZ, Direction)
+            if self.valueRightFootModelCheck == '1':
+                RightLateralCalcaneusMarker = MarkerArrayBatch(RightLateralCalcaneusMarkerX, RightLateralCalcaneusMarkerY, RightLateralCalcaneusMarkerZ, Direction)
+                RightMedialCalcaneusMarker = MarkerArrayBatch(RightMedialCalcaneusMarkerX, RightMedialCalcaneusMarkerY, RightMedialCalcaneusMarkerZ, Direction)
+                RightPosteriorCalcaneusMarker = MarkerArrayBatch(RightPosteriorCalcaneusMarkerX, RightPosteriorCalcaneusMarkerY, RightPosteriorCalcaneusMarkerZ, Direction)
+
+                # Computer MTP1 Marker
+                RightFirstMetarsalBaseMarker = MarkerArrayBatch(RightFirstMetarsalBaseMarkerX, RightFirstMetarsalBaseMarkerY, RightFirstMetarsalBaseMarkerZ)
+                RightFirstMetarsalHeadMarker = MarkerArrayBatch(RightFirstMetarsalHeadMarkerX, RightFirstMetarsalHeadMarkerY, RightFirstMetarsalHeadMarkerZ)
+                RightFifthMetarsalHeadMarker = MarkerArrayBatch(RightFifthMetarsalHeadMarkerX, RightFifthMetarsalHeadMarkerY, RightFifthMetarsalHeadMarkerZ)
+                RightEForefootTech = gait.TechCS_Forefoot_mSHCG_Batch('Right', RightFirstMetarsalBaseMarker, RightFirstMetarsalHeadMarker, RightFifthMetarsalHeadMarker)
+                RightMTP1MarkerLab = math.TransformPointIntoLabCoors_Batch(self.valueRightFirstMetatarsoPhalangealJointMarkerForefoot, RightEForefootTech, RightFirstMetarsalBaseMarker)
+                RightFirstMetatarsoPhalangealJointMarker = RightMTP1MarkerLab * np.array([Direction, Direction, 1])
+
+                RightFirstMetarsalBaseMarker = MarkerArrayBatch(RightFirstMetarsalBaseMarkerX, RightFirstMetarsalBaseMarkerY, RightFirstMetarsalBaseMarkerZ, Direction)
+                RightFirstMetarsalHeadMarker = MarkerArrayBatch(RightFirstMetarsalHeadMarkerX, RightFirstMetarsalHeadMarkerY, RightFirstMetarsalHeadMarkerZ, Direction)
+                RightFifthMetarsalHeadMarker = MarkerArrayBatch(RightFifthMetarsalHeadMarkerX, RightFifthMetarsalHeadMarkerY, RightFifthMetarsalHeadMarkerZ, Direction)
+                RightHalluxMarker = MarkerArrayBatch(RightHalluxMarkerX, RightHalluxMarkerY, RightHalluxMarkerZ, Direction)
+
+            # Compute Technical Coordinate System: Trunk
+            if TrunkFlag == 1:
+                [ETrunkTech,PelvisCenterLab,ShouldersCenterLab] = gait.TechCS_Trunk_Newington_Batch(C7Marker, LeftClavicleMarker, RightClavicleMarker, LeftASISMarker, RightASISMarker, SacralMarker)
+                # Trunk transformation may be zeros in Static File
+                ETrunkAnat = ETrunkTech
+
+            # Compute Technical Coordinate System: Pelvis
+            [EPelvisTech, MidASISLab] = gait.TechCS_Pelvis_Newington_Batch(LeftASISMarker, RightASISMarker, SacralMarker)
+            # Compute Anatomical Coordinate System: Pelvis
+            EPelvisAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueEPelvisAnatRelTech, EPelvisTech)
+
+            # Compute Hip Center Location, relative to midASIS point and expressed relative to pelvic coor system
+            if self.HipModelName == 'Newington':
+                [LeftHipCenterPelvis, LeftHipCenterLab] = gait.JointCenterModel_Hip_Newington_Batch('Left', self.MarkerDiameter, self.valueASISdist, self.valueLeftASIStoGTdist, self.valueLeftLegLength, self.valueRightLegLength,  RightASISMarker, LeftASISMarker, EPelvisTech, MidASISLab)
+                [RightHipCenterPelvis, RightHipCenterLab] = gait.JointCenterModel_Hip_Newington_Batch('Right', self.MarkerDiameter, self.valueASISdist, self.valueRightASIStoGTdist, self.valueLeftLegLength, self.valueRightLegLength, RightASISMarker, LeftASISMarker, EPelvisTech, MidASISLab)
+            if self.HipModelName == 'Harrington':
+                [LeftHipCenterPelvis, LeftHipCenterLab] = gait.JointCenterModel_Hip_Harrington_Batch('Left', self.valueASISdist, RightASISMarker, LeftASISMarker, SacralMarker, EPelvisTech, MidASISLab)
+                [RightHipCenterPelvis, RightHipCenterLab] = gait.JointCenterModel_Hip_Harrington_Batch('Right', self.valueASISdist, RightASISMarker, LeftASISMarker, SacralMarker, EPelvisTech, MidASISLab)
+            if self.HipModelName == 'Harrington2':
+                [LeftHipCenterPelvis, LeftHipCenterLab] = gait.JointCenterModel_Hip_Harrington2_Batch('Left', self.valueASISdist, self.valueLeftLegLength, self.valueRightLegLength, RightASISMarker, LeftASISMarker, SacralMarker, EPelvisTech, MidASISLab)
+                [RightHipCenterPelvis, RightHipCenterLab] = gait.JointCenterModel_Hip_Harrington2_Batch('Right', self.valueASISdist, self.valueLeftLegLength, self.valueRightLegLength, RightASISMarker, LeftASISMarker, SacralMarker, EPelvisTech, MidASISLab)
+
+            # Compute Technical and Anatomical Coordinate System: Thigh
+            LeftEThighTech = gait.TechCS_Thigh_Newington_Batch('Left', LeftHipCenterLab, LeftThighMarker, LeftLateralKneeMarker)
+            RightEThighTech = gait.TechCS_Thigh_Newington_Batch('Right', RightHipCenterLab, RightThighMarker, RightLateralKneeMarker)
+            LeftEThighAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEThighAnatRelTech, LeftEThighTech)
+            RightEThighAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEThighAnatRelTech, RightEThighTech)
+
+            # Compute Location of Knee Center (in lab space, based on thigh anatomical frame)
+            LeftKneeCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueLeftKneeCenterThigh, LeftEThighTech, LeftLateralKneeMarker)
+            RightKneeCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueRightKneeCenterThigh, RightEThighTech, RightLateralKneeMarker)
+
+            # Compute Technical Coordinate System: Shank and ankle joint centers
+            if LeftTibialTriadCheck is True:
+                LeftEShankTech = gait.TechCS_Shank_Newington_Batch('Left', LeftTibialUpperMarker, LeftTibialLowerMarker, LeftTibialMarker)
+                LeftAnkleCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueLeftAnkleCenterShank, LeftEShankTech, LeftTibialMarker)
+            else:
+                LeftEShankTech = gait.TechCS_Shank_Newington_Batch('Left', LeftKneeCenterLab, LeftTibialMarker, LeftLateralAnkleMarker)
+                LeftAnkleCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueLeftAnkleCenterShank, LeftEShankTech, LeftLateralAnkleMarker)
+            if RightTibialTriadCheck is True:
+                RightEShankTech = gait.TechCS_Shank_Newington_Batch('Right', RightTibialUpperMarker, RightTibialLowerMarker, RightTibialMarker)
+                RightAnkleCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueRightAnkleCenterShank, RightEShankTech, RightTibialMarker)
+            else:
+                RightEShankTech = gait.TechCS_Shank_Newington_Batch('Right', RightKneeCenterLab, RightTibialMarker, RightLateralAnkleMarker)
+                RightAnkleCenterLab = math.TransformPointIntoLabCoors_Batch(self.valueRightAnkleCenterShank, RightEShankTech, RightLateralAnkleMarker)
+
+            # If Medial ankle is available,then recompute ankle joint center
+            if LeftMedialAnkleMarkerDropOff == 0:
+                LeftAnkleCenterLab = gait.JointCenterModel_Ankle_Newington_Batch('Left', self.MarkerDiameter, self.valueLeftAnkleWidth, LeftLateralAnkleMarker, LeftMedialAnkleMarker)
+            if RightMedialAnkleMarkerDropOff == 0:
+                RightAnkleCenterLab = gait.JointCenterModel_Ankle_Newington_Batch('Right', self.MarkerDiameter, self.valueRightAnkleWidth, RightLateralAnkleMarker, RightMedialAnkleMarker)
+
+            # Compute Technical Coordinate System: Foot
+            LeftEFootTech = gait.TechCS_Foot_Newington_Batch('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftToeMarker)
+            RightEFootTech = gait.TechCS_Foot_Newington_Batch('Right', RightKneeCenterLab, RightAnkleCenterLab, RightToeMarker)
+
+            # Compute Anatomical Coordinate Systems: Shank
+            LeftEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEShankProximalAnatRelTech, LeftEShankTech)
+            RightEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEShankProximalAnatRelTech, RightEShankTech)
+            LeftEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEShankDistalAnatRelTech, LeftEShankTech)
+            RightEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEShankDistalAnatRelTech, RightEShankTech)
+
+            # If Medial ankle is available,then recompute Shank Proximal/Distal Anatomical Coordinate System
+            if LeftMedialAnkleMarkerDropOff == 0:
+                LeftEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington_Batch('Left', LeftKneeCenterLab, LeftLateralKneeMarker, LeftAnkleCenterLab)
+                LeftEShankDistalAnat= gait.AnatCS_Shank_Distal_VCM_Batch('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftLateralAnkleMarker)
+            if RightMedialAnkleMarkerDropOff == 0:
+                RightEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington_Batch('Right', RightKneeCenterLab, RightLateralKneeMarker, RightAnkleCenterLab)
+                RightEShankDistalAnat= gait.AnatCS_Shank_Distal_VCM_Batch('Right', RightKneeCenterLab, RightAnkleCenterLab, RightLateralAnkleMarker)
+
+            # Compute Anatomical Coordinate Systems: Foot
+            LeftEFootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEFootAnatRelTech, LeftEFootTech)
+            RightEFootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEFootAnatRelTech, RightEFootTech)
+
+            # Compute Technical and Anatomical Coordinate System: Left Foot Segments
+            if self.valueLeftFootModelCheck == '1':
+                LeftEHindfootTech = gait.TechCS_Hindfoot_mSHCG_Batch('Left', LeftLateralCalcaneusMarker, LeftMedialCalcaneusMarker, LeftPosteriorCalcaneusMarker)
+                LeftEForefootTech = gait.TechCS_Forefoot_mSHCG_Batch('Left', LeftFirstMetarsalBaseMarker, LeftFirstMetarsalHeadMarker, LeftFifthMetarsalHeadMarker)
+                LeftEHalluxTech = gait.TechCS_Hallux_mSHCG_Batch('Left', LeftHalluxMarker, LeftFirstMetatarsoPhalangealJointMarker, LeftToeMarker)
+                LeftEHindfootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEHindfootAnatRelTech, LeftEHindfootTech)
+                LeftEForefootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEForefootAnatRelTech, LeftEForefootTech)
+                LeftEHalluxAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEHalluxAnatRelTech, LeftEHalluxTech)
+                # Local vector in hindfoot to the upper cal point, transformed into Lab CS
+                LeftUpperPosteriorCalcaneusHindfoot = MarkerArrayBatch(arrayLPCALUX, arrayLPCALUY, arrayLPCALUZ)
+                LeftUpperPosteriorCalcaneusMarker = math.TransformPointIntoLabCoors_Batch(LeftUpperPosteriorCalcaneusHindfoot, LeftEHindfootAnat, LeftPosteriorCalcaneusMarker)
+
+            # Compute Technical and Anatomical Coordinate System: Right Foot Segments
+            if self.valueRightFootModelCheck == '1':
+                RightEHindfootTech = gait.TechCS_Hindfoot_mSHCG_Batch('Right', RightLateralCalcaneusMarker, RightMedialCalcaneusMarker, RightPosteriorCalcaneusMarker)
+                RightEForefootTech = gait.TechCS_Forefoot_mSHCG_Batch('Right', RightFirstMetarsalBaseMarker, RightFirstMetarsalHeadMarker, RightFifthMetarsalHeadMarker)
+                RightEHalluxTech = gait.TechCS_Hallux_mSHCG_Batch('Right', RightHalluxMarker, RightFirstMetatarsoPhalangealJointMarker, RightToeMarker)
+                RightEHindfootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEHindfootAnatRelTech, RightEHindfootTech)
+                RightEForefootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEForefootAnatRelTech, RightEForefootTech)
+                RightEHalluxAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEHalluxAnatRelTech, RightEHalluxTech)
+                # Local vector in hindfoot to the upper cal point, transformed into Lab CS
+                RightUpperPosteriorCalcaneusHindfoot = MarkerArrayBatch(arrayRPCALUX, arrayRPCALUY, arrayRPCALUZ)
+                RightUpperPosteriorCalcaneusMarker = math.TransformPointIntoLabCoors_Batch(RightUpperPosteriorCalcaneusHindfoot, RightEHindfootAnat, RightPosteriorCalcaneusMarker)
+
+            # Compute Kinematics
+
+            #Compute trunk kinematics
+            if TrunkFlag == 1:
+                TrunkAnglesTORRad = math.EulerAngles_YXZ_Batch(ETrunkAnat, ELab)
+                TrunkAnglesROTRad = math.EulerAngles_ZXY_Batch(ETrunkAnat, ELab)
+                if self.TrunkRotationSequence == 'TOR':
+                    TrunkAnglesRad = TrunkAnglesTORRad
+                if self.TrunkRotationSequence == 'ROT':
+                    TrunkAnglesRad = TrunkAnglesROTRad
+            else:
+                TrunkAnglesTORRad = np.zeros((NumberOfFrames,3))
+                TrunkAnglesROTRad = np.zeros((NumberOfFrames,3))
+                TrunkAnglesRad = np.zeros((NumberOfFrames,3))
+            #Compute pelvic kinematics
+            PelvisAnglesTORRad = math.EulerAngles_YXZ_Batch(EPelvisAnat, ELab)
+            PelvisAnglesROTRad = math.EulerAngles_ZXY_Batch(EPelvisAnat, ELab)
+            if self.PelvisRotationSequence == 'TOR':
+                PelvisAnglesRad = PelvisAnglesTORRad
+            if self.PelvisRotationSequence == 'ROT':
+                PelvisAnglesRad = PelvisAnglesROTRad
+            #Compute thigh, shank and foot kinematics
+            LeftThighAnglesRad = math.EulerAngles_YXZ_Batch(LeftEThighAnat, ELab)
+            RightThighAnglesRad = math.EulerAngles_YXZ_Batch(RightEThighAnat, ELab)
+            LeftShankAnglesRad = math.EulerAngles_YXZ_Batch(LeftEShankDistalAnat, ELab)
+            RightShankAnglesRad = math.EulerAngles_YXZ_Batch(RightEShankDistalAnat, ELab)
+            LeftFootAnglesRad = math.EulerAngles_YXZ_Batch(LeftEFootAnat, ELab)
+            RightFootAnglesRad = math.EulerAngles_YXZ_Batch(RightEFootAnat, ELab)
+            #Compute foot segment kinematics
+            if self.valueLeftFootModelCheck == '1':
+                LeftHindfootAnglesRad = math.EulerAngles_YXZ_Batch(LeftEHindfootAnat, ELab)
+                LeftForefootAnglesRad = math.EulerAngles_YXZ_Batch(LeftEForefootAnat, ELab)
+                LeftHalluxAnglesRad = math.EulerAngles_YXZ_Batch(LeftEHalluxAnat, ELab)
+                # Create a Coordinate System with y axis aligned with HF progression axis
+                ey = np.zeros((NumberOfFrames,3))
+                ey[:,0:2] = LeftEHindfootAnat[:,0:2,1]
+                ey = math.NormalizeVectors_Batch(ey)
+                ex = np.cross(ey,np.array([0.,0.,1.]))
+                ez = np.cross(ex,ey)
+                LeftEHFProgression = np.stack((ex,ey,ez), axis=-1)
+                # Segment Inclinatiosn are measured w.r.t. Lab axis aligned with HF Progression
+                LeftHindfootAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(LeftEHindfootAnat, LeftEHFProgression)
+                LeftForefootAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(LeftEForefootAnat, LeftEHFProgression)
+                LeftHalluxAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(LeftEHalluxAnat, LeftEHFProgression)
+            if self.valueRightFootModelCheck == '1':
+                RightHindfootAnglesRad = math.EulerAngles_YXZ_Batch(RightEHindfootAnat, ELab)
+                RightForefootAnglesRad = math.EulerAngles_YXZ_Batch(RightEForefootAnat, ELab)
+                RightHalluxAnglesRad = math.EulerAngles_YXZ_Batch(RightEHalluxAnat, ELab)
+                # Create a Coordinate System with y axis aligned with HF progression axis
+                ey = np.zeros((NumberOfFrames,3))
+                ey[:,0:2] = RightEHindfootAnat[:,0:2,1]
+                ey = math.NormalizeVectors_Batch(ey)
+                ex = np.cross(ey,np.array([0.,0.,1.]))
+                ez = np.cross(ex,ey)
+                RightEHFProgression = np.stack((ex,ey,ez), axis=-1)
+                # Segment Inclinatiosn are measured w.r.t. Lab axis aligned with HF Progression
+                RightHindfootAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(RightEHindfootAnat, RightEHFProgression)
+                RightForefootAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(RightEForefootAnat, RightEHFProgression)
+                RightHalluxAnglesRelHFProgressionRad = math.EulerAngles_YXZ_Batch(RightEHalluxAnat, RightEHFProgression)
+            #Compute hip kinematics
+            LeftHipAnglesRad = math.EulerAngles_YXZ_Batch(LeftEThighAnat, EPelvisAnat)
+            RightHipAnglesRad = math.EulerAngles_YXZ_Batch(RightEThighAnat, EPelvisAnat)
+            #Compute knee kinematics
+            LeftKneeAnglesProximalRad = math.EulerAngles_YXZ_Batch(LeftEShankProximalAnat, LeftEThighAnat)
+            RightKneeAnglesProximalRad = math.EulerAngles_YXZ_Batch(RightEShankProximalAnat, RightEThighAnat)
+            LeftKneeAnglesDistalRad = math.EulerAngles_YXZ_Batch(LeftEShankDistalAnat, LeftEThighAnat)
+            RightKneeAnglesDistalRad = math.EulerAngles_YXZ_Batch(RightEShankDistalAnat, RightEThighAnat)
+            if self.ShankCoordinateSystem == 'Distal':
+                LeftKneeAnglesRad = LeftKneeAnglesDistalRad
+                RightKneeAnglesRad = RightKneeAnglesDistalRad
+            if self.ShankCoordinateSystem == 'Proximal':
+                LeftKneeAnglesRad = LeftKneeAnglesProximalRad
+                RightKneeAnglesRad = RightKneeAnglesProximalRad
+            #Compute ankle kinematics
+            LeftAnkleAnglesRad = math.EulerAngles_YXZ_Batch(LeftEFootAnat, LeftEShankDistalAnat)
+            RightAnkleAnglesRad = math.EulerAngles_YXZ_Batch(RightEFootAnat, RightEShankDistalAnat)
+            #Compute foot joint kinematics, ToeAngles are zero where the Hallux marker is missing
+            if self.valueLeftFootModelCheck == '1':
+                LeftAnkleComplexAnglesRad = math.EulerAngles_YXZ_Batch(LeftEHindfootAnat, LeftEShankDistalAnat)
+                LeftMidfootAnglesRad = math.EulerAngles_YXZ_Batch(LeftEForefootAnat, LeftEHindfootAnat)
+                LeftToesAnglesRad = np.where(LeftHalluxMarker[:,2:3] != 0, math.EulerAngles_YXZ_Batch(LeftEHalluxAnat, LeftEForefootAnat), 0.)
+            if self.valueRightFootModelCheck == '1':
+                RightAnkleComplexAnglesRad = math.EulerAngles_YXZ_Batch(RightEHindfootAnat, RightEShankDistalAnat)
+                RightMidfootAnglesRad = math.EulerAngles_YXZ_Batch(RightEForefootAnat, RightEHindfootAnat)
+                RightToesAnglesRad = np.where(RightHalluxMarker[:,2:3] != 0, math.EulerAngles_YXZ_Batch(RightEHalluxAnat, RightEForefootAnat), 0.)
+
+            #Convert units of angles from radians to degrees & set sign based on side and plotting convention
+            [T1, T2, T3] = math.AngleConventionMatrices(-1) # For Left Side
+            LeftTrunkAnglesDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesRad, T1)
+            LeftTrunkAnglesTORDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesTORRad, T1)
+            LeftTrunkAnglesROTDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesROTRad, T1)
+            LeftPelvisAnglesDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesRad, T1)
+            LeftPelvisAnglesTORDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesTORRad, T1)
+            LeftPelvisAnglesROTDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesROTRad, T1)
+            LeftThighAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftThighAnglesRad, T1)
+            LeftShankAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftShankAnglesRad, T1)
+            LeftFootAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftFootAnglesRad, T1)
+            LeftHipAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftHipAnglesRad, T2)
+            LeftKneeAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftKneeAnglesRad, T3)
+            LeftKneeAnglesProximalDeg = math.ConvertAnglesToDegrees_Batch(LeftKneeAnglesProximalRad, T3)
+            LeftKneeAnglesDistalDeg = math.ConvertAnglesToDegrees_Batch(LeftKneeAnglesDistalRad, T3)
+            LeftAnkleAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftAnkleAnglesRad, T2)
+            if self.valueLeftFootModelCheck == '1':
+                LeftHindfootAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftHindfootAnglesRad, T1)
+                LeftForefootAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftForefootAnglesRad, T1)
+                LeftHalluxAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftHalluxAnglesRad, T1)
+                LeftHindfootAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(LeftHindfootAnglesRelHFProgressionRad, T2)
+                LeftForefootAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(LeftForefootAnglesRelHFProgressionRad, T2)
+                LeftHalluxAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(LeftHalluxAnglesRelHFProgressionRad, T2)
+                LeftAnkleComplexAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftAnkleComplexAnglesRad, T2)
+                LeftMidfootAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftMidfootAnglesRad, T2)
+                LeftToesAnglesDeg = math.ConvertAnglesToDegrees_Batch(LeftToesAnglesRad, T2)
+
+            [T1, T2, T3] = math.AngleConventionMatrices(1) # For Right Side
+            RightTrunkAnglesDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesRad, T1)
+            RightTrunkAnglesTORDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesTORRad, T1)
+            RightTrunkAnglesROTDeg = math.ConvertAnglesToDegrees_Batch(TrunkAnglesROTRad, T1)
+            RightPelvisAnglesDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesRad, T1)
+            RightPelvisAnglesTORDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesTORRad, T1)
+            RightPelvisAnglesROTDeg = math.ConvertAnglesToDegrees_Batch(PelvisAnglesROTRad, T1)
+            RightThighAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightThighAnglesRad, T1)
+            RightShankAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightShankAnglesRad, T1)
+            RightFootAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightFootAnglesRad, T1)
+            RightHipAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightHipAnglesRad, T2)
+            RightKneeAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightKneeAnglesRad, T3)
+            RightKneeAnglesProximalDeg = math.ConvertAnglesToDegrees_Batch(RightKneeAnglesProximalRad, T3)
+            RightKneeAnglesDistalDeg = math.ConvertAnglesToDegrees_Batch(RightKneeAnglesDistalRad, T3)
+            RightAnkleAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightAnkleAnglesRad, T2)
+            if self.valueRightFootModelCheck == '1':
+                RightHindfootAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightHindfootAnglesRad, T1)
+                RightForefootAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightForefootAnglesRad, T1)
+                RightHalluxAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightHalluxAnglesRad, T1)
+                RightHindfootAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(RightHindfootAnglesRelHFProgressionRad, T2)
+                RightForefootAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(RightForefootAnglesRelHFProgressionRad, T2)
+                RightHalluxAnglesRelHFProgressionDeg = math.ConvertAnglesToDegrees_Batch(RightHalluxAnglesRelHFProgressionRad, T2)
+                RightAnkleComplexAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightAnkleComplexAnglesRad, T2)
+                RightMidfootAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightMidfootAnglesRad, T2)
+                RightToesAnglesDeg = math.ConvertAnglesToDegrees_Batch(RightToesAnglesRad, T2)
+
+            # =============================================================================
+            #             Compute Muscle Lengths
+            # =============================================================================
+
+            if 'MuscleLengths' in OutputGroups:
+                # Knee Joint Centers and Patella movement w.r.t. leg from 3rd order polynomials of knee flexion
+                LKF = LeftKneeAnglesProximalDeg[:,1]
+                RKF = RightKneeAnglesProximalDeg[:,1]
+
+                LeftDelpKJC_Polynomial  = np.column_stack((KneeX0 + KneeX1*LKF + KneeX2*LKF*LKF + KneeX3*LKF*LKF*LKF, np.zeros(NumberOfFrames), KneeZ0 + KneeZ1*LKF + KneeZ2*LKF*LKF + KneeZ3*LKF*LKF*LKF))
+                RightDelpKJC_Polynomial = np.column_stack((KneeX0 + KneeX1*RKF + KneeX2*RKF*RKF + KneeX3*RKF*RKF*RKF, np.zeros(NumberOfFrames), KneeZ0 + KneeZ1*RKF + KneeZ2*RKF*RKF + KneeZ3*RKF*RKF*RKF))
+                LeftPatellaDelp  = np.column_stack((PatX0 + PatX1*LKF + PatX2*LKF*LKF + PatX3*LKF*LKF*LKF, np.full(NumberOfFrames, -PatY), PatZ0 + PatZ1*LKF + PatZ2*LKF*LKF + PatZ3*LKF*LKF*LKF))
+                RightPatellaDelp = np.column_stack((PatX0 + PatX1*RKF + PatX2*RKF*RKF + PatX3*RKF*RKF*RKF, np.full(NumberOfFrames, PatY), PatZ0 + PatZ1*RKF + PatZ2*RKF*RKF + PatZ3*RKF*RKF*RKF))
+                LeftPatR  = PatR0 + PatR1*LKF + PatR2*LKF*LKF + PatR3*LKF*LKF*LKF
+                RightPatR = PatR0 + PatR1*RKF + PatR2*RKF*RKF + PatR3*RKF*RKF*RKF
+
+                # Compute Delp Muscle Model Coordinate Systems
+                [EPelvisAnatDelp, MidASISLab] = gait.AnatCS_Pelvis_Delp_Batch(LeftASISMarker, RightASISMarker, SacralMarker, PelvicTiltOffset)
+                LeftEShankAnatDelp = LeftEShankProximalAnat
+                RightEShankAnatDelp = RightEShankProximalAnat
+                # Rotate Patella CS by PatR around Y axis
+                LeftEPatellaAnatDelp = math.RotateCSaroundYaxis_Batch(LeftEShankAnatDelp, LeftPatR[:,np.newaxis])
+                RightEPatellaAnatDelp = math.RotateCSaroundYaxis_Batch(RightEShankAnatDelp, RightPatR[:,np.newaxis])
+
+                PelvisOriginDelp = np.column_stack((MidASISLab[:,0], MidASISLab[:,1]+1000., np.full(NumberOfFrames, 949.)))
+                LeftThighOriginDelp = math.TransformPointIntoLabCoors_Batch(DelpLeftHJC, EPelvisAnatDelp, PelvisOriginDelp)
+                RightThighOriginDelp = math.TransformPointIntoLabCoors_Batch(DelpRightHJC, EPelvisAnatDelp, PelvisOriginDelp)
+                LeftShankOriginDelp = math.TransformPointIntoLabCoors_Batch(LeftDelpKJC_Polynomial, LeftEThighAnat, LeftThighOriginDelp)
+                RightShankOriginDelp = math.TransformPointIntoLabCoors_Batch(RightDelpKJC_Polynomial, RightEThighAnat, RightThighOriginDelp)
+                LeftPatellaOriginDelp  = math.TransformPointIntoLabCoors_Batch(LeftPatellaDelp, LeftEShankAnatDelp, LeftShankOriginDelp)
+                RightPatellaOriginDelp = math.TransformPointIntoLabCoors_Batch(RightPatellaDelp, RightEShankAnatDelp, RightShankOriginDelp)
+                LeftCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors_Batch(DelpAJC, LeftEShankAnatDelp, LeftShankOriginDelp)
+                RightCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors_Batch(DelpAJC, RightEShankAnatDelp, RightShankOriginDelp)
+                LeftCalcaneusOriginDelp = math.TransformPointIntoLabCoors_Batch(LCalC, LeftEFootAnat, LeftCalcaneusOriginDelp_AJC)
+                RightCalcaneusOriginDelp = math.TransformPointIntoLabCoors_Batch(RCalC, RightEFootAnat, RightCalcaneusOriginDelp_AJC)
+
+                # Store Delp Muscle Model poses, segments in the order of DelpSegmentNames
+                Frames = slice(StartFrame-1, EndFrame)
+                DelpSegmentCS[0,Frames] = np.stack((EPelvisAnatDelp, LeftEThighAnat, LeftEShankAnatDelp, LeftEPatellaAnatDelp, LeftEFootAnat), axis=1)
+                DelpSegmentCS[1,Frames] = np.stack((EPelvisAnatDelp, RightEThighAnat, RightEShankAnatDelp, RightEPatellaAnatDelp, RightEFootAnat), axis=1)
+                DelpSegmentOrigins[0,Frames] = np.stack((PelvisOriginDelp, LeftThighOriginDelp, LeftShankOriginDelp, LeftPatellaOriginDelp, LeftCalcaneusOriginDelp), axis=1)
+                DelpSegmentOrigins[1,Frames] = np.stack((PelvisOriginDelp, RightThighOriginDelp, RightShankOriginDelp, RightPatellaOriginDelp, RightCalcaneusOriginDelp), axis=1)
+                DelpKneeFlexion[0,Frames] = LKF
+                DelpKneeFlexion[1,Frames] = RKF
+
+            # Compute locations of segmental centers of mass
+            if TrunkFlag == 1:
+                HATCenterOfMass = math.MassCenter_Batch(ShouldersCenterLab, PelvisCenterLab, 0.374)
+            else:
+                HATCenterOfMass = np.zeros((NumberOfFrames,3))
+            LeftThighCenterOfMass = math.MassCenter_Batch(LeftHipCenterLab, LeftKneeCenterLab, 0.567)
+            LeftShankCenterOfMass = math.MassCenter_Batch(LeftKneeCenterLab, LeftAnkleCenterLab, 0.567)
+            LeftFootCenterOfMass  = math.MassCenter_Batch(LeftAnkleCenterLab, LeftToeMarker, 0.5)
+            RightThighCenterOfMass= math.MassCenter_Batch(RightHipCenterLab, RightKneeCenterLab, 0.567)
+            RightShankCenterOfMass= math.MassCenter_Batch(RightKneeCenterLab, RightAnkleCenterLab, 0.567)
+            RightFootCenterOfMass = math.MassCenter_Batch(RightAnkleCenterLab, RightToeMarker, 0.5)
+
+            # Fill Arrays to write Joint Centers, ASI, KNE, ANK, UpperPCAL and Pelvis Origin to C3D File
+            StoreArrayBatch(arrayLeftHipCenter, LeftHipCenterLab, Direction)
+            StoreArrayBatch(arrayRightHipCenter, RightHipCenterLab, Direction)
+            StoreArrayBatch(arrayLeftKneeCenter, LeftKneeCenterLab, Direction)
+            StoreArrayBatch(arrayRightKneeCenter, RightKneeCenterLab, Direction)
+            StoreArrayBatch(arrayLeftAnkleCenter, LeftAnkleCenterLab, Direction)
+            StoreArrayBatch(arrayRightAnkleCenter, RightAnkleCenterLab, Direction)
+            StoreArrayBatch(arrayLeftASIS, LeftASISMarker, Direction)
+            StoreArrayBatch(arrayRightASIS, RightASISMarker, Direction)
+            StoreArrayBatch(arrayLeftKNE, LeftLateralKneeMarker, Direction)
+            StoreArrayBatch(arrayRightKNE, RightLateralKneeMarker, Direction)
+            StoreArrayBatch(arrayLeftANK, LeftLateralAnkleMarker, Direction)
+            StoreArrayBatch(arrayRightANK, RightLateralAnkleMarker, Direction)
+            if self.valueLeftFootModelCheck == '1':
+                StoreArrayBatch(arrayLeftUpperPCAL, LeftUpperPosteriorCalcaneusMarker, Direction)
+            if self.valueRightFootModelCheck == '1':
+                StoreArrayBatch(arrayRightUpperPCAL, RightUpperPosteriorCalcaneusMarker, Direction)
+            StoreArrayBatch(arrayPelvisOrigin, (LeftHipCenterLab + RightHipCenterLab)/2, Direction)
+
+            # Fill Arrays to write Segment Angles to C3D File
+            StoreArrayBatch(arrayLeftTrunkAngles, LeftTrunkAnglesDeg)
+            StoreArrayBatch(arrayLeftTrunkAnglesTOR, LeftTrunkAnglesTORDeg)
+            StoreArrayBatch(arrayLeftTrunkAnglesROT, LeftTrunkAnglesROTDeg)
+            StoreArrayBatch(arrayLeftPelvisAngles, LeftPelvisAnglesDeg)
+            StoreArrayBatch(arrayLeftPelvisAnglesTOR, LeftPelvisAnglesTORDeg)
+            StoreArrayBatch(arrayLeftPelvisAnglesROT, LeftPelvisAnglesROTDeg)
+            StoreArrayBatch(arrayLeftThighAngles, LeftThighAnglesDeg)
+            StoreArrayBatch(arrayLeftShankAngles, LeftShankAnglesDeg)
+            StoreArrayBatch(arrayLeftFootAngles, LeftFootAnglesDeg)
+            if self.valueLeftFootModelCheck == '1':
+                # Sagittal and coronal inclinations relative to HF progression, rotation relative to lab
+                StoreArrayBatch(arrayLeftHindfootAngles, np.column_stack((LeftHindfootAnglesRelHFProgressionDeg[:,0:2], LeftHindfootAnglesDeg[:,2])))
+                StoreArrayBatch(arrayLeftForefootAngles, np.column_stack((LeftForefootAnglesRelHFProgressionDeg[:,0:2], LeftForefootAnglesDeg[:,2])))
+                StoreArrayBatch(arrayLeftHalluxAngles, np.column_stack((LeftHalluxAnglesRelHFProgressionDeg[:,0:2], LeftHalluxAnglesDeg[:,2])))
+            StoreArrayBatch(arrayRightTrunkAngles, RightTrunkAnglesDeg)
+            StoreArrayBatch(arrayRightTrunkAnglesTOR, RightTrunkAnglesTORDeg)
+            StoreArrayBatch(arrayRightTrunkAnglesROT, RightTrunkAnglesROTDeg)
+            StoreArrayBatch(arrayRightPelvisAngles, RightPelvisAnglesDeg)
+            StoreArrayBatch(arrayRightPelvisAnglesTOR, RightPelvisAnglesTORDeg)
+            StoreArrayBatch(arrayRightPelvisAnglesROT, RightPelvisAnglesROTDeg)
+            StoreArrayBatch(arrayRightThighAngles, RightThighAnglesDeg)
+            StoreArrayBatch(arrayRightShankAngles, RightShankAnglesDeg)
+            StoreArrayBatch(arrayRightFootAngles, RightFootAnglesDeg)
+            if self.valueRightFootModelCheck == '1':
+                StoreArrayBatch(arrayRightHindfootAngles, np.column_stack((RightHindfootAnglesRelHFProgressionDeg[:,0:2], RightHindfootAnglesDeg[:,2])))
+                StoreArrayBatch(arrayRightForefootAngles, np.column_stack((RightForefootAnglesRelHFProgressionDeg[:,0:2], RightForefootAnglesDeg[:,2])))
+                StoreArrayBatch(arrayRightHalluxAngles, np.column_stack((RightHalluxAnglesRelHFProgressionDeg[:,0:2], RightHalluxAnglesDeg[:,2])))
+
+            # Segment Angles in Radians, without changing sign based on side and plotting convention
+            StoreArrayBatch(arrayLeftTrunkAnglesRad, TrunkAnglesRad)
+            StoreArrayBatch(arrayLeftPelvisAnglesRad, PelvisAnglesRad)
+            StoreArrayBatch(arrayLeftThighAnglesRad, LeftThighAnglesRad)
+            StoreArrayBatch(arrayLeftShankAnglesRad, LeftShankAnglesRad)
+            StoreArrayBatch(arrayLeftFootAnglesRad, LeftFootAnglesRad)
+            if self.valueLeftFootModelCheck == '1':
+                StoreArrayBatch(arrayLeftHindfootAnglesRad, LeftHindfootAnglesRad)
+                StoreArrayBatch(arrayLeftForefootAnglesRad, LeftForefootAnglesRad)
+                StoreArrayBatch(arrayLeftHalluxAnglesRad, LeftHalluxAnglesRad)
+            StoreArrayBatch(arrayRightTrunkAnglesRad, TrunkAnglesRad)
+            StoreArrayBatch(arrayRightPelvisAnglesRad, PelvisAnglesRad)
+            StoreArrayBatch(arrayRightThighAnglesRad, RightThighAnglesRad)
+            StoreArrayBatch(arrayRightShankAnglesRad, RightShankAnglesRad)
+            StoreArrayBatch(arrayRightFootAnglesRad, RightFootAnglesRad)
+            if self.valueRightFootModelCheck == '1':
+                StoreArrayBatch(arrayRightHindfootAnglesRad, RightHindfootAnglesRad)
+                StoreArrayBatch(arrayRightForefootAnglesRad, RightForefootAnglesRad)
+                StoreArrayBatch(arrayRightHalluxAnglesRad, RightHalluxAnglesRad)
+
+            # Fill Arrays to write Joint Angles to C3D File
+            StoreArrayBatch(arrayLeftHipAngles, LeftHipAnglesDeg)
+            StoreArrayBatch(arrayLeftKneeAngles, LeftKneeAnglesDeg)
+            StoreArrayBatch(arrayLeftKneeAnglesProximal, LeftKneeAnglesProximalDeg)
+            StoreArrayBatch(arrayLeftKneeAnglesDistal, LeftKneeAnglesDistalDeg)
+            StoreArrayBatch(arrayLeftAnkleAngles, LeftAnkleAnglesDeg)
+            StoreArrayBatch(arrayLeftHipAnglesRad, LeftHipAnglesRad)
+            StoreArrayBatch(arrayLeftKneeAnglesRad, LeftKneeAnglesRad)
+            StoreArrayBatch(arrayLeftAnkleAnglesRad, LeftAnkleAnglesRad)
+            if self.valueLeftFootModelCheck == '1':
+                StoreArrayBatch(arrayLeftAnkleComplexAngles, LeftAnkleComplexAnglesDeg)
+                StoreArrayBatch(arrayLeftMidfootAngles, LeftMidfootAnglesDeg)
+                StoreArrayBatch(arrayLeftToesAngles, LeftToesAnglesDeg)
+                StoreArrayBatch(arrayLeftAnkleComplexAnglesRad, LeftAnkleComplexAnglesRad)
+                StoreArrayBatch(arrayLeftMidfootAnglesRad, LeftMidfootAnglesRad)
+                StoreArrayBatch(arrayLeftToesAnglesRad, LeftToesAnglesRad)
+                arraySupination[0][StartFrame-1:EndFrame] = np.cos(45*np.pi/180) * (LeftMidfootAnglesDeg[:,2] + LeftAnkleComplexAnglesDeg[:,0])
+                arraySkew[0][StartFrame-1:EndFrame]       = np.cos(45*np.pi/180) * (LeftMidfootAnglesDeg[:,2] - LeftAnkleComplexAnglesDeg[:,0])
+            StoreArrayBatch(arrayRightHipAngles, RightHipAnglesDeg)
+            StoreArrayBatch(arrayRightKneeAngles, RightKneeAnglesDeg)
+            StoreArrayBatch(arrayRightKneeAnglesProximal, RightKneeAnglesProximalDeg)
+            StoreArrayBatch(arrayRightKneeAnglesDistal, RightKneeAnglesDistalDeg)
+            StoreArrayBatch(arrayRightAnkleAngles, RightAnkleAnglesDeg)
+            StoreArrayBatch(arrayRightHipAnglesRad, RightHipAnglesRad)
+            StoreArrayBatch(arrayRightKneeAnglesRad, RightKneeAnglesRad)
+            StoreArrayBatch(arrayRightAnkleAnglesRad, RightAnkleAnglesRad)
+            if self.valueRightFootModelCheck == '1':
+                StoreArrayBatch(arrayRightAnkleComplexAngles, RightAnkleComplexAnglesDeg)
+                StoreArrayBatch(arrayRightMidfootAngles, RightMidfootAnglesDeg)
+                StoreArrayBatch(arrayRightToesAngles, RightToesAnglesDeg)
+                StoreArrayBatch(arrayRightAnkleComplexAnglesRad, RightAnkleComplexAnglesRad)
+                StoreArrayBatch(arrayRightMidfootAnglesRad, RightMidfootAnglesRad)
+                StoreArrayBatch(arrayRightToesAnglesRad, RightToesAnglesRad)
+                arraySupination[1][StartFrame-1:EndFrame] = np.cos(45*np.pi/180) * (RightMidfootAnglesDeg[:,2] + RightAnkleComplexAnglesDeg[:,0])
+                arraySkew[1][StartFrame-1:EndFrame]       = np.cos(45*np.pi/180) * (RightMidfootAnglesDeg[:,2] - RightAnkleComplexAnglesDeg[:,0])
+
+            # Store Center of Mass in 3D Array
+            StoreArrayBatch(arrayHATCenterOfMass, HATCenterOfMass, Direction)
+            StoreArrayBatch(arrayLeftThighCenterOfMass, LeftThighCenterOfMass, Direction)
+            StoreArrayBatch(arrayLeftShankCenterOfMass, LeftShankCenterOfMass, Direction)
+            StoreArrayBatch(arrayLeftFootCenterOfMass, LeftFootCenterOfMass, Direction)
+            StoreArrayBatch(arrayRightThighCenterOfMass, RightThighCenterOfMass, Direction)
+            StoreArrayBatch(arrayRightShankCenterOfMass, RightShankCenterOfMass, Direction)
+            StoreArrayBatch(arrayRightFootCenterOfMass, RightFootCenterOfMass, Direction)
+
+            # =============================================================================
+            #      Exists masks: frames where all markers of a segment (and of the segments it depends on) exist
+            # =============================================================================
+            # Function to extract the exists flags of the processed frames into a boolean array
+            def MarkerExistsBatch(*MarkerExists):
+                Mask = np.ones(NumberOfFrames, dtype=bool)
+                for Exists in MarkerExists:
+                    Mask = Mask & np.asarray(Exists[StartFrame-1:EndFrame], dtype=bool)
+                return Mask
+
+            PelvisExists = MarkerExistsBatch(LeftASISMarkerExists, RightASISMarkerExists, SacralMarkerExists)
+            if TrunkFlag == 1:
+                TrunkExists = PelvisExists & MarkerExistsBatch(C7MarkerExists, LeftClavicleMarkerExists, RightClavicleMarkerExists)
+            else:
+                TrunkExists = np.zeros(NumberOfFrames, dtype=bool)
+            LeftThighExists = PelvisExists & MarkerExistsBatch(LeftThighMarkerExists, LeftLateralKneeMarkerExists)
+            RightThighExists = PelvisExists & MarkerExistsBatch(RightThighMarkerExists, RightLateralKneeMarkerExists)
+            if LeftTibialTriadCheck is True:
+                LeftShankExists = LeftThighExists & MarkerExistsBatch(LeftTibialMarkerExists, LeftTibialUpperMarkerExists, LeftTibialLowerMarkerExists)
+            else:
+                LeftShankExists = LeftThighExists & MarkerExistsBatch(LeftTibialMarkerExists, LeftLateralAnkleMarkerExists)
+            if RightTibialTriadCheck is True:
+                RightShankExists = RightThighExists & MarkerExistsBatch(RightTibialMarkerExists, RightTibialUpperMarkerExists, RightTibialLowerMarkerExists)
+            else:
+                RightShankExists = RightThighExists & MarkerExistsBatch(RightTibialMarkerExists, RightLateralAnkleMarkerExists)
+            if LeftMedialAnkleMarkerDropOff == 0:
+                LeftShankExists = LeftShankExists & MarkerExistsBatch(LeftLateralAnkleMarkerExists, LeftMedialAnkleMarkerExists)
+            if RightMedialAnkleMarkerDropOff == 0:
+                RightShankExists = RightShankExists & MarkerExistsBatch(RightLateralAnkleMarkerExists, RightMedialAnkleMarkerExists)
+            LeftFootExists = LeftShankExists & MarkerExistsBatch(LeftToeMarkerExists)
+            RightFootExists = RightShankExists & MarkerExistsBatch(RightToeMarkerExists)
+            LegsExists = LeftFootExists & RightFootExists
+
+            # Function to set the exists flags of outputs from a mask of the processed frames
+            def SetOutputExists(Mask, *OutputNames):
+                OutputExistsList = [False]*framecount
+                OutputExistsList[StartFrame-1:EndFrame] = Mask.tolist()
+                for OutputName in OutputNames:
+                    OutputExists[OutputName] = OutputExistsList
+
+            SetOutputExists(PelvisExists, 'LASI', 'RASI', 'PELO', 'LPelvisAngles', 'LPelvisAnglesTOR', 'LPelvisAnglesROT', 'RPelvisAngles', 'RPelvisAnglesTOR', 'RPelvisAnglesROT')
+            SetOutputExists(TrunkExists, 'LTrunkAngles', 'LTrunkAnglesTOR', 'LTrunkAnglesROT', 'RTrunkAngles', 'RTrunkAnglesTOR', 'RTrunkAnglesROT', 'LThoraxAngles', 'RThoraxAngles')
+            SetOutputExists(LeftThighExists, 'LHJC', 'LKJC', 'LKNE', 'LThighAngles', 'LHipAngles')
+            SetOutputExists(RightThighExists, 'RHJC', 'RKJC', 'RKNE', 'RThighAngles', 'RHipAngles')
+            SetOutputExists(LeftShankExists, 'LAJC', 'LANK', 'LShankAngles', 'LKneeAngles', 'LKneeAnglesProximal', 'LKneeAnglesDistal')
+            SetOutputExists(RightShankExists, 'RAJC', 'RANK', 'RShankAngles', 'RKneeAngles', 'RKneeAnglesProximal', 'RKneeAnglesDistal')
+            SetOutputExists(LeftFootExists, 'LFootProgressAngles', 'LAnkleAngles')
+            SetOutputExists(RightFootExists, 'RFootProgressAngles', 'RAnkleAngles')
+            # Kinetics are computed from the foot up to the hip, from the kinematics smoothed (21 frames) then differentiated
+            # (7 frames): frames whose windows include a frame with missing markers do not exist
+            LeftKineticsExists = math.ErodeExists(math.ErodeExists(LeftFootExists, 21), 7)
+            RightKineticsExists = math.ErodeExists(math.ErodeExists(RightFootExists, 21), 7)
+            SetOutputExists(LeftKineticsExists, 'LHipMoment', 'LKneeMoment', 'LAnkleMoment', 'LHipPower', 'LKneePower', 'LAnklePower',
+                            'LHipPowerComponents', 'LKneePowerComponents', 'LAnklePowerComponents', 'LAnkleForce', 'LKneeForce', 'LHipForce', 'LMomentPowerSum')
+            SetOutputExists(RightKineticsExists, 'RHipMoment', 'RKneeMoment', 'RAnkleMoment', 'RHipPower', 'RKneePower', 'RAnklePower',
+                            'RHipPowerComponents', 'RKneePowerComponents', 'RAnklePowerComponents', 'RAnkleForce', 'RKneeForce', 'RHipForce', 'RMomentPowerSum')
+            # Muscle lengths of both legs are in the same outputs, the velocities are differentiated over 7 frames
+            MuscleNames = ['GluteusMax', 'IlioPsoas', 'RectFem', 'MedHamstring', 'LatHamstring', 'Gastroc', 'Soleus', 'TibPost', 'Peroneal', 'VastusLat']
+            SetOutputExists(LegsExists, *[MuscleName + 'Length' for MuscleName in MuscleNames])
+            SetOutputExists(math.ErodeExists(LegsExists, 7), *[MuscleName + 'Velocity' for MuscleName in MuscleNames])
+            if self.valueLeftFootModelCheck == '1':
+                LeftHindfootExists = MarkerExistsBatch(LeftLateralCalcaneusMarkerExists, LeftMedialCalcaneusMarkerExists, LeftPosteriorCalcaneusMarkerExists)
+                LeftForefootExists = MarkerExistsBatch(LeftFirstMetarsalBaseMarkerExists, LeftFirstMetarsalHeadMarkerExists, LeftFifthMetarsalHeadMarkerExists)
+                LeftHalluxExists = LeftForefootExists & MarkerExistsBatch(LeftHalluxMarkerExists, LeftToeMarkerExists)
+                SetOutputExists(LeftHindfootExists, 'Left_Superior_Calcaneus', 'LHFGA')
+                SetOutputExists(LeftForefootExists, 'LFFGA')
+                SetOutputExists(LeftHalluxExists, 'LHXGA', 'LHLXA')
+                SetOutputExists(LeftHindfootExists & LeftShankExists, 'LANKA')
+                SetOutputExists(LeftHindfootExists & LeftForefootExists, 'LMDFA')
+            if self.valueRightFootModelCheck == '1':
+                RightHindfootExists = MarkerExistsBatch(RightLateralCalcaneusMarkerExists, RightMedialCalcaneusMarkerExists, RightPosteriorCalcaneusMarkerExists)
+                RightForefootExists = MarkerExistsBatch(RightFirstMetarsalBaseMarkerExists, RightFirstMetarsalHeadMarkerExists, RightFifthMetarsalHeadMarkerExists)
+                RightHalluxExists = RightForefootExists & MarkerExistsBatch(RightHalluxMarkerExists, RightToeMarkerExists)
+                SetOutputExists(RightHindfootExists, 'Right_Superior_Calcaneus', 'RHFGA')
+                SetOutputExists(RightForefootExists, 'RFFGA')
+                SetOutputExists(RightHalluxExists, 'RHXGA', 'RHLXA')
+                SetOutputExists(RightHindfootExists & RightShankExists, 'RANKA')
+                SetOutputExists(RightHindfootExists & RightForefootExists, 'RMDFA')
+
+        # Frame by frame computation, skipped when the whole trial was processed above
+        if ProcessingMode == 'Vectorized':
+            KinematicsFrameRange = range(0)
+        else:
+            KinematicsFrameRange = range(StartFrame-1,EndFrame)
+
         #for FrameNumber in xrange(framecount):
-        for FrameNumber in range(StartFrame-1,EndFrame):
+        for FrameNumber in KinematicsFrameRange:
                  
             #Transform marker data if necessary based on direction that the patient is walking
             C7Marker  = np.array([Direction * C7MarkerX[FrameNumber], Direction * C7MarkerY[FrameNumber], C7MarkerZ[FrameNumber]])
@@ -1137,289 +1795,63 @@ class Dynamic_Main():
             #             Compute Muscle Lengths
             # =============================================================================
             
-            # Knee Joint Centers based on knee flexion angle
-            # Find KJC w.r.t. HJC from 3rd order polynomial and knee flexion
-            LKF = LeftKneeAnglesProximalDeg[1]
-            RKF = RightKneeAnglesProximalDeg[1]
-            
-            LeftKneeX  = KneeX0 + KneeX1*LKF + KneeX2*LKF*LKF + KneeX3*LKF*LKF*LKF
-            RightKneeX = KneeX0 + KneeX1*RKF + KneeX2*RKF*RKF + KneeX3*RKF*RKF*RKF
-            LeftKneeZ  = KneeZ0 + KneeZ1*LKF + KneeZ2*LKF*LKF + KneeZ3*LKF*LKF*LKF
-            RightKneeZ = KneeZ0 + KneeZ1*RKF + KneeZ2*RKF*RKF + KneeZ3*RKF*RKF*RKF
-            LeftDelpKJC_Polynomial  = [LeftKneeX,  0, LeftKneeZ]
-            RightDelpKJC_Polynomial = [RightKneeX, 0, RightKneeZ]
-            
-            # Patella movement (x and y translation and flexion) with 
-            # respect to leg defined by third order polynomials. 	
-            LeftPatX  = PatX0 + PatX1*LKF + PatX2*LKF*LKF + PatX3*LKF*LKF*LKF
-            RightPatX = PatX0 + PatX1*RKF + PatX2*RKF*RKF + PatX3*RKF*RKF*RKF
-            LeftPatZ  = PatZ0 + PatZ1*LKF + PatZ2*LKF*LKF + PatZ3*LKF*LKF*LKF
-            RightPatZ = PatZ0 + PatZ1*RKF + PatZ2*RKF*RKF + PatZ3*RKF*RKF*RKF
-            LeftPatR  = PatR0 + PatR1*LKF + PatR2*LKF*LKF + PatR3*LKF*LKF*LKF
-            RightPatR = PatR0 + PatR1*RKF + PatR2*RKF*RKF + PatR3*RKF*RKF*RKF
-            
-            # Compute Delp Muscle Model Coordinate Systems
-            [EPelvisAnatDelp, MidASISLab] = gait.AnatCS_Pelvis_Delp(LeftASISMarker, RightASISMarker, SacralMarker,PelvicTiltOffset)
-            LeftEThighAnatDelp = LeftEThighAnat
-            RightEThighAnatDelp = RightEThighAnat
-            LeftEShankAnatDelp = LeftEShankProximalAnat#LeftEShankDistalAnat
-            RightEShankAnatDelp = RightEShankProximalAnat#RightEShankDistalAnat
-            LeftEPatellaAnatDelp = LeftEShankAnatDelp
-            RightEPatellaAnatDelp = RightEShankAnatDelp
-            # Rotate Patella CS by PatR around Y axis
-            LeftEPatellaAnatDelp = math.RotateCSaroundYaxis(LeftEPatellaAnatDelp,LeftPatR)
-            RightEPatellaAnatDelp = math.RotateCSaroundYaxis(RightEPatellaAnatDelp,RightPatR)
-            LeftECalcaneusAnatDelp = LeftEFootAnat
-            RightECalcaneusAnatDelp = RightEFootAnat
-            
-            PelvisOriginDelp = np.array([MidASISLab[0],MidASISLab[1]+1000.,949.])
-            LeftThighOriginDelp = math.TransformPointIntoLabCoors(DelpLeftHJC,EPelvisAnatDelp,PelvisOriginDelp)
-            RightThighOriginDelp = math.TransformPointIntoLabCoors(DelpRightHJC,EPelvisAnatDelp,PelvisOriginDelp)
-            LeftShankOriginDelp = math.TransformPointIntoLabCoors(LeftDelpKJC_Polynomial,LeftEThighAnatDelp,LeftThighOriginDelp)
-            RightShankOriginDelp = math.TransformPointIntoLabCoors(RightDelpKJC_Polynomial,RightEThighAnatDelp,RightThighOriginDelp)
-            LeftPatellaOriginDelp  = math.TransformPointIntoLabCoors([LeftPatX, -PatY,LeftPatZ], LeftEShankAnatDelp, LeftShankOriginDelp)
-            RightPatellaOriginDelp = math.TransformPointIntoLabCoors([RightPatX, PatY,RightPatZ],RightEShankAnatDelp,RightShankOriginDelp)
-            LeftCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors(DelpAJC,LeftEShankAnatDelp,LeftShankOriginDelp)
-            RightCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors(DelpAJC,RightEShankAnatDelp,RightShankOriginDelp)
-            LeftCalcaneusOriginDelp = math.TransformPointIntoLabCoors(LCalC,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp_AJC)
-            RightCalcaneusOriginDelp = math.TransformPointIntoLabCoors(RCalC,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp_AJC)
-            
-            # Compute Zero Positions to compute Normalizing Muscle Length
-            ELabDelp = np.eye(3)
-            EPelvisAnatDelp0 = ELabDelp
-            LeftEThighAnatDelp0 = ELabDelp
-            RightEThighAnatDelp0 = ELabDelp
-            LeftEShankAnatDelp0 = ELabDelp
-            RightEShankAnatDelp0 = ELabDelp
-            LeftECalcaneusAnatDelp0 = ELabDelp
-            RightECalcaneusAnatDelp0 = ELabDelp
-            LeftEPatellaAnatDelp0 = ELabDelp
-            RightEPatellaAnatDelp0 = ELabDelp
-            # Rotate Calcaneus to account for normal tibial torsion
-            LeftECalcaneusAnatDelp0 = math.RotateCSaroundZaxis(ELabDelp,15.0)
-            RightECalcaneusAnatDelp0 = math.RotateCSaroundZaxis(ELabDelp,-15.0)
-            # Flex patellae by constant at zero knee flexion
-            LeftEPatellaAnatDelp0 = math.RotateCSaroundYaxis(ELabDelp,PatR0)
-            RightEPatellaAnatDelp0 = math.RotateCSaroundYaxis(ELabDelp,PatR0)
-            
-            PelvisOriginDelp0 = PelvisOriginDelp
-            LeftThighOriginDelp0 = PelvisOriginDelp + DelpLeftHJC
-            RightThighOriginDelp0 = PelvisOriginDelp + DelpRightHJC
-            LeftShankOriginDelp0 = PelvisOriginDelp + DelpLeftHJC + DelpKJC0
-            RightShankOriginDelp0 = PelvisOriginDelp + DelpRightHJC + DelpKJC0
-            LeftPatellaOriginDelp0 = PelvisOriginDelp + DelpLeftHJC + DelpKJC0 + DelpLPat0
-            RightPatellaOriginDelp0 = PelvisOriginDelp + DelpRightHJC + DelpKJC0 + DelpRPat0
-            LeftCalcaneusOriginDelp0 = PelvisOriginDelp + DelpLeftHJC + DelpKJC0 + DelpAJC + LCalC
-            RightCalcaneusOriginDelp0 = PelvisOriginDelp + DelpRightHJC + DelpKJC0 + DelpAJC + RCalC
-            
-            
-            # Compute Muscle lengths
-            [LeftGMaS,LeftGMaSMusclePoints] = math.ComputeMuscleLength('Left',GMaS,GMaS_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightGMaS,RightGMaSMusclePoints] = math.ComputeMuscleLength('Right',GMaS,GMaS_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftGMaS0,LeftGMaSMusclePoints0] = math.ComputeMuscleLength('Left',GMaS,GMaS_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightGMaS0,RightGMaSMusclePoints0]= math.ComputeMuscleLength('Right',GMaS,GMaS_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftGMaM,LeftGMaMMusclePoints] = math.ComputeMuscleLength('Left',GMaM,GMaM_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightGMaM,RightGMaMMusclePoints] = math.ComputeMuscleLength('Right',GMaM,GMaM_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftGMaM0,LeftGMaMMusclePoints0] = math.ComputeMuscleLength('Left',GMaM,GMaM_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightGMaM0,RightGMaMMusclePoints0]= math.ComputeMuscleLength('Right',GMaM,GMaM_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftGMaI,LeftGMaIMusclePoints] = math.ComputeMuscleLength('Left',GMaI,GMaI_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightGMaI,RightGMaIMusclePoints] = math.ComputeMuscleLength('Right',GMaI,GMaI_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftGMaI0,LeftGMaIMusclePoints0] = math.ComputeMuscleLength('Left',GMaI,GMaI_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightGMaI0,RightGMaIMusclePoints0]= math.ComputeMuscleLength('Right',GMaI,GMaI_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftIlia,LeftIliaMusclePoints] = math.ComputeMuscleLength('Left',Ilia,Ilia_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightIlia,RightIliaMusclePoints] = math.ComputeMuscleLength('Right',Ilia,Ilia_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftIlia0,LeftIliaMusclePoints0] = math.ComputeMuscleLength('Left',Ilia,Ilia_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightIlia0,RightIliaMusclePoints0]= math.ComputeMuscleLength('Right',Ilia,Ilia_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftPsoa,LeftPsoaMusclePoints] = math.ComputeMuscleLength('Left',Psoa,Psoa_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightPsoa,RightPsoaMusclePoints] = math.ComputeMuscleLength('Right',Psoa,Psoa_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftPsoa0,LeftPsoaMusclePoints0] = math.ComputeMuscleLength('Left',Psoa,Psoa_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightPsoa0,RightPsoaMusclePoints0]= math.ComputeMuscleLength('Right',Psoa,Psoa_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftSeMe,LeftSeMeMusclePoints] = math.ComputeMuscleLength('Left',SeMe,SeMe_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightSeMe,RightSeMeMusclePoints] = math.ComputeMuscleLength('Right',SeMe,SeMe_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftSeMe0,LeftSeMeMusclePoints0] = math.ComputeMuscleLength('Left',SeMe,SeMe_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightSeMe0,RightSeMeMusclePoints0]= math.ComputeMuscleLength('Right',SeMe,SeMe_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftSeTe,LeftSeTeMusclePoints] = math.ComputeMuscleLength('Left',SeTe,SeTe_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightSeTe,RightSeTeMusclePoints] = math.ComputeMuscleLength('Right',SeTe,SeTe_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftSeTe0,LeftSeTeMusclePoints0] = math.ComputeMuscleLength('Left',SeTe,SeTe_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightSeTe0,RightSeTeMusclePoints0]= math.ComputeMuscleLength('Right',SeTe,SeTe_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftBiFL,LeftBiFLMusclePoints] = math.ComputeMuscleLength('Left',BiFL,BiFL_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightBiFL,RightBiFLMusclePoints] = math.ComputeMuscleLength('Right',BiFL,BiFL_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftBiFL0,LeftBiFLMusclePoints0] = math.ComputeMuscleLength('Left',BiFL,BiFL_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightBiFL0,RightBiFLMusclePoints0]= math.ComputeMuscleLength('Right',BiFL,BiFL_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftBiFS,LeftBiFSMusclePoints] = math.ComputeMuscleLength('Left',BiFS,BiFS_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightBiFS,RightBiFSMusclePoints] = math.ComputeMuscleLength('Right',BiFS,BiFS_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftBiFS0,LeftBiFSMusclePoints0] = math.ComputeMuscleLength('Left',BiFS,BiFS_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightBiFS0,RightBiFSMusclePoints0]= math.ComputeMuscleLength('Right',BiFS,BiFS_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftSole,LeftSoleMusclePoints] = math.ComputeMuscleLength('Left',Sole,Sole_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightSole,RightSoleMusclePoints] = math.ComputeMuscleLength('Right',Sole,Sole_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftSole0,LeftSoleMusclePoints0] = math.ComputeMuscleLength('Left',Sole,Sole_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightSole0,RightSoleMusclePoints0]= math.ComputeMuscleLength('Right',Sole,Sole_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftTiPo,LeftTiPoMusclePoints] = math.ComputeMuscleLength('Left',TiPo,TiPo_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightTiPo,RightTiPoMusclePoints] = math.ComputeMuscleLength('Right',TiPo,TiPo_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftTiPo0,LeftTiPoMusclePoints0] = math.ComputeMuscleLength('Left',TiPo,TiPo_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightTiPo0,RightTiPoMusclePoints0]= math.ComputeMuscleLength('Right',TiPo,TiPo_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftPeBr,LeftPeBrMusclePoints] = math.ComputeMuscleLength('Left',PeBr,PeBr_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightPeBr,RightPeBrMusclePoints] = math.ComputeMuscleLength('Right',PeBr,PeBr_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftPeBr0,LeftPeBrMusclePoints0] = math.ComputeMuscleLength('Left',PeBr,PeBr_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightPeBr0,RightPeBrMusclePoints0]= math.ComputeMuscleLength('Right',PeBr,PeBr_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            [LeftPeLn,LeftPeLnMusclePoints] = math.ComputeMuscleLength('Left',PeLn,PeLn_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightPeLn,RightPeLnMusclePoints] = math.ComputeMuscleLength('Right',PeLn,PeLn_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftPeLn0,LeftPeLnMusclePoints0] = math.ComputeMuscleLength('Left',PeLn,PeLn_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightPeLn0,RightPeLnMusclePoints0]= math.ComputeMuscleLength('Right',PeLn,PeLn_Seg,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            # Remove Second Point if Knee Flexion < 83 deg
-            Left_ReFe = []
-            if LKF < 83:
-                Left_ReFe.append(ReFe[0])
-                Left_ReFe.append(ReFe[2])
-                Left_ReFe_Seg = ['Pelvis','Patella']
-            else:
-                Left_ReFe = ReFe
-                Left_ReFe_Seg = ReFe_Seg
-            Right_ReFe = []
-            if RKF < 83:
-                Right_ReFe.append(ReFe[0])
-                Right_ReFe.append(ReFe[2])
-                Right_ReFe_Seg = ['Pelvis','Patella']
-            else:
-                Right_ReFe = ReFe
-                Right_ReFe_Seg = ReFe_Seg
-            
-            Left_ReFe0 = []
-            Left_ReFe0.append(ReFe[0])
-            Left_ReFe0.append(ReFe[2])
-            Left_ReFe_Seg0 = ['Pelvis','Patella']
-            Right_ReFe0 = []
-            Right_ReFe0.append(ReFe[0])
-            Right_ReFe0.append(ReFe[2])
-            Right_ReFe_Seg0 = ['Pelvis','Patella']  
-                
-            [LeftReFe,LeftReFeMusclePoints] = math.ComputeMuscleLength('Left',Left_ReFe,Left_ReFe_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightReFe,RightReFeMusclePoints] = math.ComputeMuscleLength('Right',Right_ReFe,Right_ReFe_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftReFe0,LeftReFeMusclePoints0] = math.ComputeMuscleLength('Left',Left_ReFe0,Left_ReFe_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightReFe0,RightReFeMusclePoints0]= math.ComputeMuscleLength('Right',Right_ReFe0,Right_ReFe_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            # Remove points depending on knee flexion
-            Left_VaLa = []
-            if LKF < 110:
-                if LKF < 69:
-                    Left_VaLa.append(VaLa[0])
-                    Left_VaLa.append(VaLa[1])
-                    Left_VaLa.append(VaLa[4])
-                    Left_VaLa_Seg = ['Thigh','Thigh','Patella']
-                else:
-                    Left_VaLa.append(VaLa[0])
-                    Left_VaLa.append(VaLa[1])
-                    Left_VaLa.append(VaLa[2])
-                    Left_VaLa.append(VaLa[4])
-                    Left_VaLa_Seg = ['Thigh','Thigh','Thigh','Patella']
-            else:
-                Left_VaLa = VaLa
-                Left_VaLa_Seg = VaLa_Seg
-            Right_VaLa = []
-            if RKF < 110:
-                if RKF < 69:
-                    Right_VaLa.append(VaLa[0])
-                    Right_VaLa.append(VaLa[1])
-                    Right_VaLa.append(VaLa[4])
-                    Right_VaLa_Seg = ['Thigh','Thigh','Patella']
-                else:
-                    Right_VaLa.append(VaLa[0])
-                    Right_VaLa.append(VaLa[1])
-                    Right_VaLa.append(VaLa[2])
-                    Right_VaLa.append(VaLa[4])
-                    Right_VaLa_Seg = ['Thigh','Thigh','Thigh','Patella']
-            else:
-                Right_VaLa = VaLa
-                Right_VaLa_Seg = VaLa_Seg
-            
-            Left_VaLa0 = []
-            Left_VaLa0.append(VaLa[0])
-            Left_VaLa0.append(VaLa[1])
-            Left_VaLa0.append(VaLa[4])
-            Left_VaLa_Seg0 = ['Thigh','Thigh','Patella']
-            Right_VaLa0 = []
-            Right_VaLa0.append(VaLa[0])
-            Right_VaLa0.append(VaLa[1])
-            Right_VaLa0.append(VaLa[4])
-            Right_VaLa_Seg0 = ['Thigh','Thigh','Patella']
-                    
-            [LeftVaLa,LeftVaLaMusclePoints] = math.ComputeMuscleLength('Left',Left_VaLa,Left_VaLa_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightVaLa,RightVaLaMusclePoints] = math.ComputeMuscleLength('Right',Right_VaLa,Right_VaLa_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftVaLa0,LeftVaLaMusclePoints0] = math.ComputeMuscleLength('Left',Left_VaLa0,Left_VaLa_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightVaLa0,RightVaLaMusclePoints0]= math.ComputeMuscleLength('Right',Right_VaLa0,Right_VaLa_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            # Remove points depending on knee flexion
-            Left_GaMe = []
-            if LKF > 44:
-                Left_GaMe.append(GaMe[0])
-                Left_GaMe.append(GaMe[2])
-                Left_GaMe.append(GaMe[3])
-                Left_GaMe_Seg = ['Thigh','Shank','Calcaneus']
-            else:
-                Left_GaMe = GaMe
-                Left_GaMe_Seg = GaMe_Seg
-            Right_GaMe = []
-            if RKF > 44:
-                Right_GaMe.append(GaMe[0])
-                Right_GaMe.append(GaMe[2])
-                Right_GaMe.append(GaMe[3])
-                Right_GaMe_Seg = ['Thigh','Shank','Calcaneus']
-            else:
-                Right_GaMe = GaMe
-                Right_GaMe_Seg = GaMe_Seg
-  
-            Left_GaMe0 = GaMe
-            Left_GaMe_Seg0 = GaMe_Seg
-            Right_GaMe0 = GaMe
-            Right_GaMe_Seg0 = GaMe_Seg
-                
-            [LeftGaMe,LeftGaMeMusclePoints] = math.ComputeMuscleLength('Left',Left_GaMe,Left_GaMe_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightGaMe,RightGaMeMusclePoints] = math.ComputeMuscleLength('Right',Right_GaMe,Right_GaMe_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftGaMe0,LeftGaMeMusclePoints0] = math.ComputeMuscleLength('Left',Left_GaMe0,Left_GaMe_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightGaMe0,RightGaMeMusclePoints0]= math.ComputeMuscleLength('Right',Right_GaMe0,Right_GaMe_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
-            
-            # Remove points depending on knee flexion
-            Left_GaLa = []
-            if LKF > 44:
-                Left_GaLa.append(GaLa[0])
-                Left_GaLa.append(GaLa[2])
-                Left_GaLa.append(GaLa[3])
-                Left_GaLa_Seg = ['Thigh','Shank','Calcaneus']
-            else:
-                Left_GaLa = GaLa
-                Left_GaLa_Seg = GaLa_Seg
-            Right_GaLa = []
-            if RKF > 44:
-                Right_GaLa.append(GaLa[0])
-                Right_GaLa.append(GaLa[2])
-                Right_GaLa.append(GaLa[3])
-                Right_GaLa_Seg = ['Thigh','Shank','Calcaneus']
-            else:
-                Right_GaLa = GaLa
-                Right_GaLa_Seg = GaLa_Seg
-
-            Left_GaLa0 = GaLa
-            Left_GaLa_Seg0 = GaLa_Seg
-            Right_GaLa0 = GaLa
-            Right_GaLa_Seg0 = GaLa_Seg   
-            
-            [LeftGaLa,LeftGaLaMusclePoints] = math.ComputeMuscleLength('Left',Left_GaLa,Left_GaLa_Seg,EPelvisAnatDelp,PelvisOriginDelp,LeftEThighAnatDelp,LeftThighOriginDelp,LeftEShankAnatDelp,LeftShankOriginDelp,LeftEPatellaAnatDelp,LeftPatellaOriginDelp,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp)
-            [RightGaLa,RightGaLaMusclePoints] = math.ComputeMuscleLength('Right',Right_GaLa,Right_GaLa_Seg,EPelvisAnatDelp,PelvisOriginDelp,RightEThighAnatDelp,RightThighOriginDelp,RightEShankAnatDelp,RightShankOriginDelp,RightEPatellaAnatDelp,RightPatellaOriginDelp,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp)
-            [LeftGaLa0,LeftGaLaMusclePoints0] = math.ComputeMuscleLength('Left',Left_GaLa0,Left_GaLa_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,LeftEThighAnatDelp0,LeftThighOriginDelp0,LeftEShankAnatDelp0,LeftShankOriginDelp0,LeftEPatellaAnatDelp0,LeftPatellaOriginDelp0,LeftECalcaneusAnatDelp0,LeftCalcaneusOriginDelp0)
-            [RightGaLa0,RightGaLaMusclePoints0]= math.ComputeMuscleLength('Right',Right_GaLa0,Right_GaLa_Seg0,EPelvisAnatDelp0,PelvisOriginDelp0,RightEThighAnatDelp0,RightThighOriginDelp0,RightEShankAnatDelp0,RightShankOriginDelp0,RightEPatellaAnatDelp0,RightPatellaOriginDelp0,RightECalcaneusAnatDelp0,RightCalcaneusOriginDelp0)
+            if 'MuscleLengths' in OutputGroups:
+                # Knee Joint Centers based on knee flexion angle
+                # Find KJC w.r.t. HJC from 3rd order polynomial and knee flexion
+                LKF = LeftKneeAnglesProximalDeg[1]
+                RKF = RightKneeAnglesProximalDeg[1]
+            
+                LeftKneeX  = KneeX0 + KneeX1*LKF + KneeX2*LKF*LKF + KneeX3*LKF*LKF*LKF
+                RightKneeX = KneeX0 + KneeX1*RKF + KneeX2*RKF*RKF + KneeX3*RKF*RKF*RKF
+                LeftKneeZ  = KneeZ0 + KneeZ1*LKF + KneeZ2*LKF*LKF + KneeZ3*LKF*LKF*LKF
+                RightKneeZ = KneeZ0 + KneeZ1*RKF + KneeZ2*RKF*RKF + KneeZ3*RKF*RKF*RKF
+                LeftDelpKJC_Polynomial  = [LeftKneeX,  0, LeftKneeZ]
+                RightDelpKJC_Polynomial = [RightKneeX, 0, RightKneeZ]
+            
+                # Patella movement (x and y translation and flexion) with 
+                # respect to leg defined by third order polynomials. 	
+                LeftPatX  = PatX0 + PatX1*LKF + PatX2*LKF*LKF + PatX3*LKF*LKF*LKF
+                RightPatX = PatX0 + PatX1*RKF + PatX2*RKF*RKF + PatX3*RKF*RKF*RKF
+                LeftPatZ  = PatZ0 + PatZ1*LKF + PatZ2*LKF*LKF + PatZ3*LKF*LKF*LKF
+                RightPatZ = PatZ0 + PatZ1*RKF + PatZ2*RKF*RKF + PatZ3*RKF*RKF*RKF
+                LeftPatR  = PatR0 + PatR1*LKF + PatR2*LKF*LKF + PatR3*LKF*LKF*LKF
+                RightPatR = PatR0 + PatR1*RKF + PatR2*RKF*RKF + PatR3*RKF*RKF*RKF
+            
+                # Compute Delp Muscle Model Coordinate Systems
+                [EPelvisAnatDelp, MidASISLab] = gait.AnatCS_Pelvis_Delp(LeftASISMarker, RightASISMarker, SacralMarker,PelvicTiltOffset)
+                LeftEThighAnatDelp = LeftEThighAnat
+                RightEThighAnatDelp = RightEThighAnat
+                LeftEShankAnatDelp = LeftEShankProximalAnat#LeftEShankDistalAnat
+                RightEShankAnatDelp = RightEShankProximalAnat#RightEShankDistalAnat
+                LeftEPatellaAnatDelp = LeftEShankAnatDelp
+                RightEPatellaAnatDelp = RightEShankAnatDelp
+                # Rotate Patella CS by PatR around Y axis
+                LeftEPatellaAnatDelp = math.RotateCSaroundYaxis(LeftEPatellaAnatDelp,LeftPatR)
+                RightEPatellaAnatDelp = math.RotateCSaroundYaxis(RightEPatellaAnatDelp,RightPatR)
+                LeftECalcaneusAnatDelp = LeftEFootAnat
+                RightECalcaneusAnatDelp = RightEFootAnat
+            
+                PelvisOriginDelp = np.array([MidASISLab[0],MidASISLab[1]+1000.,949.])
+                LeftThighOriginDelp = math.TransformPointIntoLabCoors(DelpLeftHJC,EPelvisAnatDelp,PelvisOriginDelp)
+                RightThighOriginDelp = math.TransformPointIntoLabCoors(DelpRightHJC,EPelvisAnatDelp,PelvisOriginDelp)
+                LeftShankOriginDelp = math.TransformPointIntoLabCoors(LeftDelpKJC_Polynomial,LeftEThighAnatDelp,LeftThighOriginDelp)
+                RightShankOriginDelp = math.TransformPointIntoLabCoors(RightDelpKJC_Polynomial,RightEThighAnatDelp,RightThighOriginDelp)
+                LeftPatellaOriginDelp  = math.TransformPointIntoLabCoors([LeftPatX, -PatY,LeftPatZ], LeftEShankAnatDelp, LeftShankOriginDelp)
+                RightPatellaOriginDelp = math.TransformPointIntoLabCoors([RightPatX, PatY,RightPatZ],RightEShankAnatDelp,RightShankOriginDelp)
+                LeftCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors(DelpAJC,LeftEShankAnatDelp,LeftShankOriginDelp)
+                RightCalcaneusOriginDelp_AJC = math.TransformPointIntoLabCoors(DelpAJC,RightEShankAnatDelp,RightShankOriginDelp)
+                LeftCalcaneusOriginDelp = math.TransformPointIntoLabCoors(LCalC,LeftECalcaneusAnatDelp,LeftCalcaneusOriginDelp_AJC)
+                RightCalcaneusOriginDelp = math.TransformPointIntoLabCoors(RCalC,RightECalcaneusAnatDelp,RightCalcaneusOriginDelp_AJC)
+            
+            
+            
+                # Store Delp Muscle Model poses, segments in the order of DelpSegmentNames
+                DelpSegmentCS[0,FrameNumber] = [EPelvisAnatDelp, LeftEThighAnatDelp, LeftEShankAnatDelp, LeftEPatellaAnatDelp, LeftECalcaneusAnatDelp]
+                DelpSegmentCS[1,FrameNumber] = [EPelvisAnatDelp, RightEThighAnatDelp, RightEShankAnatDelp, RightEPatellaAnatDelp, RightECalcaneusAnatDelp]
+                DelpSegmentOrigins[0,FrameNumber] = [PelvisOriginDelp, LeftThighOriginDelp, LeftShankOriginDelp, LeftPatellaOriginDelp, LeftCalcaneusOriginDelp]
+                DelpSegmentOrigins[1,FrameNumber] = [PelvisOriginDelp, RightThighOriginDelp, RightShankOriginDelp, RightPatellaOriginDelp, RightCalcaneusOriginDelp]
+                DelpKneeFlexion[0,FrameNumber] = LKF
+                DelpKneeFlexion[1,FrameNumber] = RKF
             
             # Fill Arrays to write Joint Centers to C3D File
             arrayLeftHipCenter[0][FrameNumber] = Direction * LeftHipCenterLab[0]
@@ -1797,36 +2229,6 @@ class Dynamic_Main():
                 arrayRightToesAnglesRad[1][FrameNumber] = RightToesAnglesRad[1]
                 arrayRightToesAnglesRad[2][FrameNumber] = RightToesAnglesRad[2]
             
-            # Fill Arrays to write Muscle Length in C3D File
-            arrayGluteusMaxLength[0][FrameNumber] = (LeftGMaS+LeftGMaM+LeftGMaI)/(LeftGMaS0+LeftGMaM0+LeftGMaI0)
-            arrayGluteusMaxLength[1][FrameNumber] = (RightGMaS+RightGMaM+RightGMaI)/(RightGMaS0+RightGMaM0+RightGMaI0)
-            
-            arrayIlioPsoasLength[0][FrameNumber] = (LeftIlia+LeftPsoa)/(LeftIlia0+LeftPsoa0)
-            arrayIlioPsoasLength[1][FrameNumber] = (RightIlia+RightPsoa)/(RightIlia0+RightPsoa0)
-            
-            arrayRectFemLength[0][FrameNumber] = LeftReFe/LeftReFe0
-            arrayRectFemLength[1][FrameNumber] = RightReFe/RightReFe0
-            
-            arrayMedHamstringLength[0][FrameNumber] = (LeftSeMe+LeftSeTe)/(LeftSeMe0+LeftSeTe0)
-            arrayMedHamstringLength[1][FrameNumber] = (RightSeMe+RightSeTe)/(RightSeMe0+RightSeTe0)
-            
-            arrayLatHamstringLength[0][FrameNumber] = (LeftBiFL+LeftBiFS)/(LeftBiFL0+LeftBiFS0)
-            arrayLatHamstringLength[1][FrameNumber] = (RightBiFL+RightBiFS)/(RightBiFL0+RightBiFS0)
-            
-            arrayGastrocLength[0][FrameNumber] = (LeftGaMe+LeftGaLa)/(LeftGaMe0+LeftGaLa0)
-            arrayGastrocLength[1][FrameNumber] = (RightGaMe+RightGaLa)/(RightGaMe0+RightGaLa0)
-            
-            arraySoleusLength[0][FrameNumber] = LeftSole/LeftSole0
-            arraySoleusLength[1][FrameNumber] = RightSole/RightSole0
-            
-            arrayTibPostLength[0][FrameNumber] = LeftTiPo/LeftTiPo0
-            arrayTibPostLength[1][FrameNumber] = RightTiPo/RightTiPo0
-            
-            arrayPeronealLength[0][FrameNumber] = (LeftPeBr+LeftPeLn)/(LeftPeBr0+LeftPeLn0)
-            arrayPeronealLength[1][FrameNumber] = (RightPeBr+RightPeLn)/(RightPeBr0+RightPeLn0)
-            
-            arrayVastusLatLength[0][FrameNumber] = LeftVaLa/LeftVaLa0
-            arrayVastusLatLength[1][FrameNumber] = RightVaLa/RightVaLa0
             
 
             
@@ -1871,6 +2273,29 @@ class Dynamic_Main():
             arrayRightFootCenterOfMass[1][FrameNumber] = Direction * RightFootCenterOfMass[1]
             arrayRightFootCenterOfMass[2][FrameNumber] = RightFootCenterOfMass[2]
         
+        # =============================================================================
+        #     Muscle Lengths of all frames from the compiled muscle model
+        # =============================================================================
+        # Muscle length outputs are normalized by the length in the zero position (zero knee flexion)
+        if 'MuscleLengths' in OutputGroups:
+            MuscleLengthOutputs = [[arrayGluteusMaxLength, ['GMaS','GMaM','GMaI']],
+                                   [arrayIlioPsoasLength, ['Ilia','Psoa']],
+                                   [arrayRectFemLength, ['ReFe']],
+                                   [arrayMedHamstringLength, ['SeMe','SeTe']],
+                                   [arrayLatHamstringLength, ['BiFL','BiFS']],
+                                   [arrayGastrocLength, ['GaMe','GaLa']],
+                                   [arraySoleusLength, ['Sole']],
+                                   [arrayTibPostLength, ['TiPo']],
+                                   [arrayPeronealLength, ['PeBr','PeLn']],
+                                   [arrayVastusLatLength, ['VaLa']]]
+            Frames = slice(StartFrame-1, EndFrame)
+            for [SideIndex, Side] in enumerate(['Left','Right']):
+                MuscleLengths = math.ComputeMuscleLengths_Batch(DelpMuscleModel, Side, DelpSegmentCS[SideIndex,Frames], DelpSegmentOrigins[SideIndex,Frames], DelpKneeFlexion[SideIndex,Frames])
+                # Fill Arrays to write Muscle Length in C3D File
+                for [OutputArray, Muscles] in MuscleLengthOutputs:
+                    MuscleIndices = [DelpMuscleNames.index(Muscle) for Muscle in Muscles]
+                    OutputArray[SideIndex][Frames] = np.sum(MuscleLengths[:,MuscleIndices], axis=1) / np.sum(DelpMuscleLengths0[SideIndex][MuscleIndices])
+        
         # =============================================================================
         #         Write Kinematics Outputs to C3D File
         # =============================================================================
@@ -1911,46 +2336,46 @@ class Dynamic_Main():
                 
         # Left Angles    
         if not 'LTrunkAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LTrunkAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LTrunkAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LTrunkAnglesTOR' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LTrunkAnglesTOR', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LTrunkAnglesTOR', 'Angles', XYZNames, AnglesTypes)
         if not 'LTrunkAnglesROT' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LTrunkAnglesROT', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LTrunkAnglesROT', 'Angles', XYZNames, AnglesTypes)
         if not 'LPelvisAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LPelvisAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LPelvisAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LPelvisAnglesTOR' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LPelvisAnglesTOR', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LPelvisAnglesTOR', 'Angles', XYZNames, AnglesTypes)
         if not 'LPelvisAnglesROT' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LPelvisAnglesROT', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LPelvisAnglesROT', 'Angles', XYZNames, AnglesTypes)
         if not 'LThighAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LThighAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LThighAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LShankAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LShankAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LShankAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LFootProgressAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LFootProgressAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LFootProgressAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LHipAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LHipAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LHipAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LKneeAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LKneeAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LKneeAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'LKneeAnglesProximal' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LKneeAnglesProximal', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LKneeAnglesProximal', 'Angles', XYZNames, AnglesTypes)
         if not 'LKneeAnglesDistal' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LKneeAnglesDistal', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LKneeAnglesDistal', 'Angles', XYZNames, AnglesTypes)
         if not 'LAnkleAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LAnkleAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LAnkleAngles', 'Angles', XYZNames, AnglesTypes)
         if self.valueLeftFootModelCheck == '1':
             if not 'LHFGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHFGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LHFGA', 'Angles', XYZNames, AnglesTypes)
             if not 'LFFGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LFFGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LFFGA', 'Angles', XYZNames, AnglesTypes)
             if not 'LHXGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHXGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LHXGA', 'Angles', XYZNames, AnglesTypes)
             if not 'LANKA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LANKA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LANKA', 'Angles', XYZNames, AnglesTypes)
             if not 'LMDFA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LMDFA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LMDFA', 'Angles', XYZNames, AnglesTypes)
             if not 'LHLXA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHLXA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LHLXA', 'Angles', XYZNames, AnglesTypes)
             # Create Modeled Marker- Upper calcaneus markers [name too long if Left_Upper_Posterior_Calcaneus]
             if self.valueLeftFootModelCheck == '1':
                 if not 'Left_Superior_Calcaneus' in ModelOutputs:
@@ -1958,46 +2383,46 @@ class Dynamic_Main():
         
         # Right Angles
         if not 'RTrunkAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RTrunkAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RTrunkAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RTrunkAnglesTOR' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RTrunkAnglesTOR', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RTrunkAnglesTOR', 'Angles', XYZNames, AnglesTypes)
         if not 'RTrunkAnglesROT' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RTrunkAnglesROT', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RTrunkAnglesROT', 'Angles', XYZNames, AnglesTypes)
         if not 'RPelvisAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RPelvisAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RPelvisAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RPelvisAnglesTOR' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RPelvisAnglesTOR', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RPelvisAnglesTOR', 'Angles', XYZNames, AnglesTypes)
         if not 'RPelvisAnglesROT' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RPelvisAnglesROT', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RPelvisAnglesROT', 'Angles', XYZNames, AnglesTypes)
         if not 'RThighAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RThighAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RThighAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RShankAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RShankAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RShankAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RFootProgressAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RFootProgressAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RFootProgressAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RHipAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RHipAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RHipAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RKneeAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RKneeAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RKneeAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RKneeAnglesProximal' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RKneeAnglesProximal', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RKneeAnglesProximal', 'Angles', XYZNames, AnglesTypes)
         if not 'RKneeAnglesDistal' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RKneeAnglesDistal', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RKneeAnglesDistal', 'Angles', XYZNames, AnglesTypes)
         if not 'RAnkleAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RAnkleAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RAnkleAngles', 'Angles', XYZNames, AnglesTypes)
         if self.valueRightFootModelCheck == '1':
             if not 'RHFGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHFGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RHFGA', 'Angles', XYZNames, AnglesTypes)
             if not 'RFFGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RFFGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RFFGA', 'Angles', XYZNames, AnglesTypes)
             if not 'RHXGA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHXGA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RHXGA', 'Angles', XYZNames, AnglesTypes)
             if not 'RANKA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RANKA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RANKA', 'Angles', XYZNames, AnglesTypes)
             if not 'RMDFA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RMDFA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RMDFA', 'Angles', XYZNames, AnglesTypes)
             if not 'RHLXA' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHLXA', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RHLXA', 'Angles', XYZNames, AnglesTypes)
             # Create Modeled Marker- Upper calcaneus markers [name too long if Right_Upper_Posterior_Calcaneus]
             if self.valueRightFootModelCheck == '1':
                 if not 'Right_Superior_Calcaneus' in ModelOutputs:
@@ -2005,58 +2430,58 @@ class Dynamic_Main():
                 
         if self.valueLeftFootModelCheck == '1' or self.valueRightFootModelCheck == '1':
             if not 'Supination' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'Supination', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'Supination', 'Angles', XYZNames, AnglesTypes)
             if not 'Skew' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'Skew', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'Skew', 'Angles', XYZNames, AnglesTypes)
         
         # Additional Trunk Angles for MAPS
         if not 'LThoraxAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'LThoraxAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LThoraxAngles', 'Angles', XYZNames, AnglesTypes)
         if not 'RThoraxAngles' in ModelOutputs:
-            vicon.CreateModelOutput( SubjectName, 'RThoraxAngles', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RThoraxAngles', 'Angles', XYZNames, AnglesTypes)
         
         
         # Muscle Lengths & Velocity
         if not 'GluteusMaxLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'GluteusMaxLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'GluteusMaxLength', 'Angles', XYZNames, AnglesTypes)
         if not 'GluteusMaxVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'GluteusMaxVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'GluteusMaxVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'IlioPsoasLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'IlioPsoasLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'IlioPsoasLength', 'Angles', XYZNames, AnglesTypes)
         if not 'IlioPsoasVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'IlioPsoasVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'IlioPsoasVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'RectFemLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'RectFemLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RectFemLength', 'Angles', XYZNames, AnglesTypes)
         if not 'RectFemVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'RectFemVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'RectFemVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'MedHamstringLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'MedHamstringLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'MedHamstringLength', 'Angles', XYZNames, AnglesTypes)
         if not 'MedHamstringVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'MedHamstringVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'MedHamstringVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'LatHamstringLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'LatHamstringLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LatHamstringLength', 'Angles', XYZNames, AnglesTypes)
         if not 'LatHamstringVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'LatHamstringVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'LatHamstringVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'GastrocLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'GastrocLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'GastrocLength', 'Angles', XYZNames, AnglesTypes)
         if not 'GastrocVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'GastrocVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'GastrocVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'SoleusLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'SoleusLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'SoleusLength', 'Angles', XYZNames, AnglesTypes)
         if not 'SoleusVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'SoleusVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'SoleusVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'TibPostLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'TibPostLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'TibPostLength', 'Angles', XYZNames, AnglesTypes)
         if not 'TibPostVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'TibPostVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'TibPostVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'PeronealLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'PeronealLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'PeronealLength', 'Angles', XYZNames, AnglesTypes)
         if not 'PeronealVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'PeronealVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'PeronealVelocity', 'Angles', XYZNames, AnglesTypes)
         if not 'VastusLatLength' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'VastusLatLength', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'VastusLatLength', 'Angles', XYZNames, AnglesTypes)
         if not 'VastusLatVelocity' in ModelOutputs:  
-            vicon.CreateModelOutput( SubjectName, 'VastusLatVelocity', 'Angles', XYZNames, AnglesTypes)
+            CreateModelOutput( SubjectName, 'VastusLatVelocity', 'Angles', XYZNames, AnglesTypes)
 
 
         
@@ -2066,12 +2491,7 @@ class Dynamic_Main():
         # 1- Ab/Adduction
         # 2- Int/Ext Rotation
         def reArrangeArray(InputArray):
-            ReArrangedArray = [[0. for m in range(framecount)] for n in range(3)]
-            for i in range(framecount):
-                ReArrangedArray[1][i] = InputArray[0][i]
-                ReArrangedArray[0][i] = InputArray[1][i]
-                ReArrangedArray[2][i] = InputArray[2][i]
-            return ReArrangedArray
+            return np.asarray(InputArray)[store.NexusComponentOrder,0:framecount]
         
         # Rearrange Angles arrays before writing to C3D        
         ReArranged_arrayLeftTrunkAngles = reArrangeArray(arrayLeftTrunkAngles)
@@ -2119,125 +2539,126 @@ class Dynamic_Main():
         
         # Write Arrays to C3D Files
         # Joint Centers
-        vicon.SetModelOutput(SubjectName, 'LHJC', arrayLeftHipCenter,   exists )
-        vicon.SetModelOutput(SubjectName, 'RHJC', arrayRightHipCenter,  exists )
-        vicon.SetModelOutput(SubjectName, 'LKJC', arrayLeftKneeCenter,  exists )
-        vicon.SetModelOutput(SubjectName, 'RKJC', arrayRightKneeCenter, exists )
-        vicon.SetModelOutput(SubjectName, 'LAJC', arrayLeftAnkleCenter, exists )
-        vicon.SetModelOutput(SubjectName, 'RAJC', arrayRightAnkleCenter,exists )
+        SetModelOutput(SubjectName, 'LHJC', arrayLeftHipCenter,   OutputExists.get('LHJC', exists) )
+        SetModelOutput(SubjectName, 'RHJC', arrayRightHipCenter,  OutputExists.get('RHJC', exists) )
+        SetModelOutput(SubjectName, 'LKJC', arrayLeftKneeCenter,  OutputExists.get('LKJC', exists) )
+        SetModelOutput(SubjectName, 'RKJC', arrayRightKneeCenter, OutputExists.get('RKJC', exists) )
+        SetModelOutput(SubjectName, 'LAJC', arrayLeftAnkleCenter, OutputExists.get('LAJC', exists) )
+        SetModelOutput(SubjectName, 'RAJC', arrayRightAnkleCenter,OutputExists.get('RAJC', exists) )
         
         # ASI markers for MAPS
-        vicon.SetModelOutput(SubjectName, 'LASI', arrayLeftASIS,   exists )
-        vicon.SetModelOutput(SubjectName, 'RASI', arrayRightASIS,   exists )
-        vicon.SetModelOutput(SubjectName, 'LKNE', arrayLeftKNE,   exists )
-        vicon.SetModelOutput(SubjectName, 'RKNE', arrayRightKNE,   exists )
-        vicon.SetModelOutput(SubjectName, 'LANK', arrayLeftANK,   exists )
-        vicon.SetModelOutput(SubjectName, 'RANK', arrayRightANK,   exists )
+        SetModelOutput(SubjectName, 'LASI', arrayLeftASIS,   OutputExists.get('LASI', exists) )
+        SetModelOutput(SubjectName, 'RASI', arrayRightASIS,   OutputExists.get('RASI', exists) )
+        SetModelOutput(SubjectName, 'LKNE', arrayLeftKNE,   OutputExists.get('LKNE', exists) )
+        SetModelOutput(SubjectName, 'RKNE', arrayRightKNE,   OutputExists.get('RKNE', exists) )
+        SetModelOutput(SubjectName, 'LANK', arrayLeftANK,   OutputExists.get('LANK', exists) )
+        SetModelOutput(SubjectName, 'RANK', arrayRightANK,   OutputExists.get('RANK', exists) )
         
         # Upper Calcaneus and Pelvis Origin [PELO]
-        vicon.SetModelOutput(SubjectName, 'PELO', arrayPelvisOrigin, exists)
+        SetModelOutput(SubjectName, 'PELO', arrayPelvisOrigin, OutputExists.get('PELO', exists))
         if self.valueLeftFootModelCheck == '1':
-            vicon.SetModelOutput(SubjectName, 'Left_Superior_Calcaneus', arrayLeftUpperPCAL, exists)
+            SetModelOutput(SubjectName, 'Left_Superior_Calcaneus', arrayLeftUpperPCAL, OutputExists.get('Left_Superior_Calcaneus', exists))
         if self.valueRightFootModelCheck == '1':
-            vicon.SetModelOutput(SubjectName, 'Right_Superior_Calcaneus', arrayRightUpperPCAL, exists)
+            SetModelOutput(SubjectName, 'Right_Superior_Calcaneus', arrayRightUpperPCAL, OutputExists.get('Right_Superior_Calcaneus', exists))
         
         # Left Angles   
-        vicon.SetModelOutput(SubjectName, 'LTrunkAngles',    ReArranged_arrayLeftTrunkAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'LTrunkAnglesTOR',    ReArranged_arrayLeftTrunkAnglesTOR,   exists)
-        vicon.SetModelOutput(SubjectName, 'LTrunkAnglesROT',    ReArranged_arrayLeftTrunkAnglesROT,   exists)
-        vicon.SetModelOutput(SubjectName, 'LPelvisAngles',   ReArranged_arrayLeftPelvisAngles,  exists)
-        vicon.SetModelOutput(SubjectName, 'LPelvisAnglesTOR',   ReArranged_arrayLeftPelvisAnglesTOR,  exists)
-        vicon.SetModelOutput(SubjectName, 'LPelvisAnglesROT',   ReArranged_arrayLeftPelvisAnglesROT,  exists)
-        vicon.SetModelOutput(SubjectName, 'LThighAngles',    ReArranged_arrayLeftThighAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'LShankAngles',    ReArranged_arrayLeftShankAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'LFootProgressAngles',     ReArranged_arrayLeftFootAngles,    exists)
-        vicon.SetModelOutput(SubjectName, 'LHipAngles',      ReArranged_arrayLeftHipAngles,     exists)
-        vicon.SetModelOutput(SubjectName, 'LKneeAngles',     ReArranged_arrayLeftKneeAngles,    exists)
-        vicon.SetModelOutput(SubjectName, 'LKneeAnglesProximal',     ReArranged_arrayLeftKneeAnglesProximal,    exists)
-        vicon.SetModelOutput(SubjectName, 'LKneeAnglesDistal',     ReArranged_arrayLeftKneeAnglesDistal,    exists)
-        vicon.SetModelOutput(SubjectName, 'LAnkleAngles',    ReArranged_arrayLeftAnkleAngles,   exists)
+        SetModelOutput(SubjectName, 'LTrunkAngles',    ReArranged_arrayLeftTrunkAngles,   OutputExists.get('LTrunkAngles', exists))
+        SetModelOutput(SubjectName, 'LTrunkAnglesTOR',    ReArranged_arrayLeftTrunkAnglesTOR,   OutputExists.get('LTrunkAnglesTOR', exists))
+        SetModelOutput(SubjectName, 'LTrunkAnglesROT',    ReArranged_arrayLeftTrunkAnglesROT,   OutputExists.get('LTrunkAnglesROT', exists))
+        SetModelOutput(SubjectName, 'LPelvisAngles',   ReArranged_arrayLeftPelvisAngles,  OutputExists.get('LPelvisAngles', exists))
+        SetModelOutput(SubjectName, 'LPelvisAnglesTOR',   ReArranged_arrayLeftPelvisAnglesTOR,  OutputExists.get('LPelvisAnglesTOR', exists))
+        SetModelOutput(SubjectName, 'LPelvisAnglesROT',   ReArranged_arrayLeftPelvisAnglesROT,  OutputExists.get('LPelvisAnglesROT', exists))
+        SetModelOutput(SubjectName, 'LThighAngles',    ReArranged_arrayLeftThighAngles,   OutputExists.get('LThighAngles', exists))
+        SetModelOutput(SubjectName, 'LShankAngles',    ReArranged_arrayLeftShankAngles,   OutputExists.get('LShankAngles', exists))
+        SetModelOutput(SubjectName, 'LFootProgressAngles',     ReArranged_arrayLeftFootAngles,    OutputExists.get('LFootProgressAngles', exists))
+        SetModelOutput(SubjectName, 'LHipAngles',      ReArranged_arrayLeftHipAngles,     OutputExists.get('LHipAngles', exists))
+        SetModelOutput(SubjectName, 'LKneeAngles',     ReArranged_arrayLeftKneeAngles,    OutputExists.get('LKneeAngles', exists))
+        SetModelOutput(SubjectName, 'LKneeAnglesProximal',     ReArranged_arrayLeftKneeAnglesProximal,    OutputExists.get('LKneeAnglesProximal', exists))
+        SetModelOutput(SubjectName, 'LKneeAnglesDistal',     ReArranged_arrayLeftKneeAnglesDistal,    OutputExists.get('LKneeAnglesDistal', exists))
+        SetModelOutput(SubjectName, 'LAnkleAngles',    ReArranged_arrayLeftAnkleAngles,   OutputExists.get('LAnkleAngles', exists))
         if self.valueLeftFootModelCheck == '1':
-            vicon.SetModelOutput(SubjectName, 'LHFGA',     ReArranged_arrayLeftHindfootAngles,    exists)
-            vicon.SetModelOutput(SubjectName, 'LFFGA',     ReArranged_arrayLeftForefootAngles,    exists)
-            vicon.SetModelOutput(SubjectName, 'LHXGA',     ReArranged_arrayLeftHalluxAngles,      exists)
-            vicon.SetModelOutput(SubjectName, 'LANKA',     ReArranged_arrayLeftAnkleComplexAngles,   exists)
-            vicon.SetModelOutput(SubjectName, 'LMDFA',     ReArranged_arrayLeftMidfootAngles,   exists)
-            vicon.SetModelOutput(SubjectName, 'LHLXA',     ReArranged_arrayLeftToesAngles,   exists)
+            SetModelOutput(SubjectName, 'LHFGA',     ReArranged_arrayLeftHindfootAngles,    OutputExists.get('LHFGA', exists))
+            SetModelOutput(SubjectName, 'LFFGA',     ReArranged_arrayLeftForefootAngles,    OutputExists.get('LFFGA', exists))
+            SetModelOutput(SubjectName, 'LHXGA',     ReArranged_arrayLeftHalluxAngles,      OutputExists.get('LHXGA', exists))
+            SetModelOutput(SubjectName, 'LANKA',     ReArranged_arrayLeftAnkleComplexAngles,   OutputExists.get('LANKA', exists))
+            SetModelOutput(SubjectName, 'LMDFA',     ReArranged_arrayLeftMidfootAngles,   OutputExists.get('LMDFA', exists))
+            SetModelOutput(SubjectName, 'LHLXA',     ReArranged_arrayLeftToesAngles,   OutputExists.get('LHLXA', exists))
 
         # Right Angles
-        vicon.SetModelOutput(SubjectName, 'RTrunkAngles',    ReArranged_arrayRightTrunkAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'RTrunkAnglesTOR',    ReArranged_arrayRightTrunkAnglesTOR,   exists)
-        vicon.SetModelOutput(SubjectName, 'RTrunkAnglesROT',    ReArranged_arrayRightTrunkAnglesROT,   exists)
-        vicon.SetModelOutput(SubjectName, 'RPelvisAngles',   ReArranged_arrayRightPelvisAngles,  exists)
-        vicon.SetModelOutput(SubjectName, 'RPelvisAnglesTOR',   ReArranged_arrayRightPelvisAnglesTOR,  exists)
-        vicon.SetModelOutput(SubjectName, 'RPelvisAnglesROT',   ReArranged_arrayRightPelvisAnglesROT,  exists)
-        vicon.SetModelOutput(SubjectName, 'RThighAngles',    ReArranged_arrayRightThighAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'RShankAngles',    ReArranged_arrayRightShankAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'RFootProgressAngles',     ReArranged_arrayRightFootAngles,    exists)
-        vicon.SetModelOutput(SubjectName, 'RHipAngles',      ReArranged_arrayRightHipAngles,     exists)
-        vicon.SetModelOutput(SubjectName, 'RKneeAngles',     ReArranged_arrayRightKneeAngles,    exists)
-        vicon.SetModelOutput(SubjectName, 'RKneeAnglesProximal',     ReArranged_arrayRightKneeAnglesProximal,    exists)
-        vicon.SetModelOutput(SubjectName, 'RKneeAnglesDistal',     ReArranged_arrayRightKneeAnglesDistal,    exists)
-        vicon.SetModelOutput(SubjectName, 'RAnkleAngles',    ReArranged_arrayRightAnkleAngles,   exists)
+        SetModelOutput(SubjectName, 'RTrunkAngles',    ReArranged_arrayRightTrunkAngles,   OutputExists.get('RTrunkAngles', exists))
+        SetModelOutput(SubjectName, 'RTrunkAnglesTOR',    ReArranged_arrayRightTrunkAnglesTOR,   OutputExists.get('RTrunkAnglesTOR', exists))
+        SetModelOutput(SubjectName, 'RTrunkAnglesROT',    ReArranged_arrayRightTrunkAnglesROT,   OutputExists.get('RTrunkAnglesROT', exists))
+        SetModelOutput(SubjectName, 'RPelvisAngles',   ReArranged_arrayRightPelvisAngles,  OutputExists.get('RPelvisAngles', exists))
+        SetModelOutput(SubjectName, 'RPelvisAnglesTOR',   ReArranged_arrayRightPelvisAnglesTOR,  OutputExists.get('RPelvisAnglesTOR', exists))
+        SetModelOutput(SubjectName, 'RPelvisAnglesROT',   ReArranged_arrayRightPelvisAnglesROT,  OutputExists.get('RPelvisAnglesROT', exists))
+        SetModelOutput(SubjectName, 'RThighAngles',    ReArranged_arrayRightThighAngles,   OutputExists.get('RThighAngles', exists))
+        SetModelOutput(SubjectName, 'RShankAngles',    ReArranged_arrayRightShankAngles,   OutputExists.get('RShankAngles', exists))
+        SetModelOutput(SubjectName, 'RFootProgressAngles',     ReArranged_arrayRightFootAngles,    OutputExists.get('RFootProgressAngles', exists))
+        SetModelOutput(SubjectName, 'RHipAngles',      ReArranged_arrayRightHipAngles,     OutputExists.get('RHipAngles', exists))
+        SetModelOutput(SubjectName, 'RKneeAngles',     ReArranged_arrayRightKneeAngles,    OutputExists.get('RKneeAngles', exists))
+        SetModelOutput(SubjectName, 'RKneeAnglesProximal',     ReArranged_arrayRightKneeAnglesProximal,    OutputExists.get('RKneeAnglesProximal', exists))
+        SetModelOutput(SubjectName, 'RKneeAnglesDistal',     ReArranged_arrayRightKneeAnglesDistal,    OutputExists.get('RKneeAnglesDistal', exists))
+        SetModelOutput(SubjectName, 'RAnkleAngles',    ReArranged_arrayRightAnkleAngles,   OutputExists.get('RAnkleAngles', exists))
         if self.valueRightFootModelCheck == '1':
-            vicon.SetModelOutput(SubjectName, 'RHFGA',     ReArranged_arrayRightHindfootAngles,    exists)
-            vicon.SetModelOutput(SubjectName, 'RFFGA',     ReArranged_arrayRightForefootAngles,    exists)
-            vicon.SetModelOutput(SubjectName, 'RHXGA',     ReArranged_arrayRightHalluxAngles,      exists)
-            vicon.SetModelOutput(SubjectName, 'RANKA',     ReArranged_arrayRightAnkleComplexAngles,   exists)
-            vicon.SetModelOutput(SubjectName, 'RMDFA',     ReArranged_arrayRightMidfootAngles,   exists)
-            vicon.SetModelOutput(SubjectName, 'RHLXA',     ReArranged_arrayRightToesAngles,   exists)
+            SetModelOutput(SubjectName, 'RHFGA',     ReArranged_arrayRightHindfootAngles,    OutputExists.get('RHFGA', exists))
+            SetModelOutput(SubjectName, 'RFFGA',     ReArranged_arrayRightForefootAngles,    OutputExists.get('RFFGA', exists))
+            SetModelOutput(SubjectName, 'RHXGA',     ReArranged_arrayRightHalluxAngles,      OutputExists.get('RHXGA', exists))
+            SetModelOutput(SubjectName, 'RANKA',     ReArranged_arrayRightAnkleComplexAngles,   OutputExists.get('RANKA', exists))
+            SetModelOutput(SubjectName, 'RMDFA',     ReArranged_arrayRightMidfootAngles,   OutputExists.get('RMDFA', exists))
+            SetModelOutput(SubjectName, 'RHLXA',     ReArranged_arrayRightToesAngles,   OutputExists.get('RHLXA', exists))
     
         if self.valueLeftFootModelCheck == '1' or self.valueRightFootModelCheck == '1':
-            vicon.SetModelOutput(SubjectName, 'Supination',     arraySupination,    exists)
-            vicon.SetModelOutput(SubjectName, 'Skew',     arraySkew,    exists)
+            SetModelOutput(SubjectName, 'Supination',     arraySupination,    OutputExists.get('Supination', exists))
+            SetModelOutput(SubjectName, 'Skew',     arraySkew,    OutputExists.get('Skew', exists))
         
         # Additional Trunk Angles for MAPS
-        vicon.SetModelOutput(SubjectName, 'LThoraxAngles',    ReArranged_arrayLeftTrunkAngles,   exists)
-        vicon.SetModelOutput(SubjectName, 'RThoraxAngles',    ReArranged_arrayRightTrunkAngles,   exists)
+        SetModelOutput(SubjectName, 'LThoraxAngles',    ReArranged_arrayLeftTrunkAngles,   OutputExists.get('LThoraxAngles', exists))
+        SetModelOutput(SubjectName, 'RThoraxAngles',    ReArranged_arrayRightTrunkAngles,   OutputExists.get('RThoraxAngles', exists))
         
         # Write Muscle Lengths and Velocity
         MarkerFrameRate = vicon.GetFrameRate()
         DeltaTime = 1.0 / MarkerFrameRate
         
-        vicon.SetModelOutput(SubjectName, 'GluteusMaxLength',     arrayGluteusMaxLength,    exists) 
-        [arrayGluteusMaxVelocity,arrayGluteusMaxAcceleration] = math.Differentiate(arrayGluteusMaxLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'GluteusMaxVelocity',     arrayGluteusMaxVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'IlioPsoasLength',     arrayIlioPsoasLength,    exists) 
-        [arrayIlioPsoasVelocity,arrayIlioPsoasAcceleration] = math.Differentiate(arrayIlioPsoasLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'IlioPsoasVelocity',     arrayIlioPsoasVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'RectFemLength',     arrayRectFemLength,    exists) 
-        [arrayRectFemVelocity,arrayRectFemAcceleration] = math.Differentiate(arrayRectFemLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'RectFemVelocity',     arrayRectFemVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'MedHamstringLength',     arrayMedHamstringLength,    exists) 
-        [arrayMedHamstringVelocity,arrayMedHamstringAcceleration] = math.Differentiate(arrayMedHamstringLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'MedHamstringVelocity',     arrayMedHamstringVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'LatHamstringLength',     arrayLatHamstringLength,    exists) 
-        [arrayLatHamstringVelocity,arrayLatHamstringAcceleration] = math.Differentiate(arrayLatHamstringLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'LatHamstringVelocity',     arrayLatHamstringVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'GastrocLength',     arrayGastrocLength,    exists) 
-        [arrayGastrocVelocity,arrayGastrocAcceleration] = math.Differentiate(arrayGastrocLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'GastrocVelocity',     arrayGastrocVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'SoleusLength',     arraySoleusLength,    exists) 
-        [arraySoleusVelocity,arraySoleusAcceleration] = math.Differentiate(arraySoleusLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'SoleusVelocity',     arraySoleusVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'TibPostLength',     arrayTibPostLength,    exists) 
-        [arrayTibPostVelocity,arrayTibPostAcceleration] = math.Differentiate(arrayTibPostLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'TibPostVelocity',     arrayTibPostVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'PeronealLength',     arrayPeronealLength,    exists) 
-        [arrayPeronealVelocity,arrayPeronealAcceleration] = math.Differentiate(arrayPeronealLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'PeronealVelocity',     arrayPeronealVelocity,    exists)
-        
-        vicon.SetModelOutput(SubjectName, 'VastusLatLength',     arrayVastusLatLength,    exists) 
-        [arrayVastusLatVelocity,arrayVastusLatAcceleration] = math.Differentiate(arrayVastusLatLength, StartFrame, EndFrame, framecount, DeltaTime)
-        vicon.SetModelOutput(SubjectName, 'VastusLatVelocity',     arrayVastusLatVelocity,    exists)
+        if 'MuscleLengths' in OutputGroups:
+            SetModelOutput(SubjectName, 'GluteusMaxLength',     arrayGluteusMaxLength,    OutputExists.get('GluteusMaxLength', exists)) 
+            [arrayGluteusMaxVelocity[:],arrayGluteusMaxAcceleration] = math.DifferentiateArray(arrayGluteusMaxLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'GluteusMaxVelocity',     arrayGluteusMaxVelocity,    OutputExists.get('GluteusMaxVelocity', exists))
+
+            SetModelOutput(SubjectName, 'IlioPsoasLength',     arrayIlioPsoasLength,    OutputExists.get('IlioPsoasLength', exists)) 
+            [arrayIlioPsoasVelocity[:],arrayIlioPsoasAcceleration] = math.DifferentiateArray(arrayIlioPsoasLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'IlioPsoasVelocity',     arrayIlioPsoasVelocity,    OutputExists.get('IlioPsoasVelocity', exists))
+
+            SetModelOutput(SubjectName, 'RectFemLength',     arrayRectFemLength,    OutputExists.get('RectFemLength', exists)) 
+            [arrayRectFemVelocity[:],arrayRectFemAcceleration] = math.DifferentiateArray(arrayRectFemLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'RectFemVelocity',     arrayRectFemVelocity,    OutputExists.get('RectFemVelocity', exists))
+
+            SetModelOutput(SubjectName, 'MedHamstringLength',     arrayMedHamstringLength,    OutputExists.get('MedHamstringLength', exists)) 
+            [arrayMedHamstringVelocity[:],arrayMedHamstringAcceleration] = math.DifferentiateArray(arrayMedHamstringLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'MedHamstringVelocity',     arrayMedHamstringVelocity,    OutputExists.get('MedHamstringVelocity', exists))
+
+            SetModelOutput(SubjectName, 'LatHamstringLength',     arrayLatHamstringLength,    OutputExists.get('LatHamstringLength', exists)) 
+            [arrayLatHamstringVelocity[:],arrayLatHamstringAcceleration] = math.DifferentiateArray(arrayLatHamstringLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'LatHamstringVelocity',     arrayLatHamstringVelocity,    OutputExists.get('LatHamstringVelocity', exists))
+
+            SetModelOutput(SubjectName, 'GastrocLength',     arrayGastrocLength,    OutputExists.get('GastrocLength', exists)) 
+            [arrayGastrocVelocity[:],arrayGastrocAcceleration] = math.DifferentiateArray(arrayGastrocLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'GastrocVelocity',     arrayGastrocVelocity,    OutputExists.get('GastrocVelocity', exists))
+
+            SetModelOutput(SubjectName, 'SoleusLength',     arraySoleusLength,    OutputExists.get('SoleusLength', exists)) 
+            [arraySoleusVelocity[:],arraySoleusAcceleration] = math.DifferentiateArray(arraySoleusLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'SoleusVelocity',     arraySoleusVelocity,    OutputExists.get('SoleusVelocity', exists))
+
+            SetModelOutput(SubjectName, 'TibPostLength',     arrayTibPostLength,    OutputExists.get('TibPostLength', exists)) 
+            [arrayTibPostVelocity[:],arrayTibPostAcceleration] = math.DifferentiateArray(arrayTibPostLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'TibPostVelocity',     arrayTibPostVelocity,    OutputExists.get('TibPostVelocity', exists))
+
+            SetModelOutput(SubjectName, 'PeronealLength',     arrayPeronealLength,    OutputExists.get('PeronealLength', exists)) 
+            [arrayPeronealVelocity[:],arrayPeronealAcceleration] = math.DifferentiateArray(arrayPeronealLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'PeronealVelocity',     arrayPeronealVelocity,    OutputExists.get('PeronealVelocity', exists))
+
+            SetModelOutput(SubjectName, 'VastusLatLength',     arrayVastusLatLength,    OutputExists.get('VastusLatLength', exists)) 
+            [arrayVastusLatVelocity[:],arrayVastusLatAcceleration] = math.DifferentiateArray(arrayVastusLatLength, StartFrame, EndFrame, DeltaTime)
+            SetModelOutput(SubjectName, 'VastusLatVelocity',     arrayVastusLatVelocity,    OutputExists.get('VastusLatVelocity', exists))
 
         
         # =============================================================================
@@ -2247,19 +2668,20 @@ class Dynamic_Main():
         # Check for Force Plate Hits
         LeftForcePlate_DeviceID = 0 #Default Value if Force Plate Hit is not Found
         RightForcePlate_DeviceID = 0 #Default Value if Force Plate Hit is not Found
-                
-        DeviceIDs = vicon.GetDeviceIDs()
-        for DeviceID in DeviceIDs:
-            [name, type, rate, deviceOutputIDs, forceplate, eyetracker] = vicon.GetDeviceDetails(DeviceID)
-            #print forceplate.Context
-            if forceplate.Context == 'Left':
-                LeftForcePlate_DeviceID = DeviceID
-                Left_forceplate = forceplate
-                #print('Left',string.split(DeviceNames[i])[0])
-            if forceplate.Context == 'Right':
-                RightForcePlate_DeviceID = DeviceID
-                Right_forceplate = forceplate
-                #print('Right',string.split(DeviceNames[i])[0])
+        # Kinetics are only computed when the output profile uses them
+        if 'Kinetics' in OutputGroups:
+            DeviceIDs = vicon.GetDeviceIDs()
+            for DeviceID in DeviceIDs:
+                [name, type, rate, deviceOutputIDs, forceplate, eyetracker] = vicon.GetDeviceDetails(DeviceID)
+                #print forceplate.Context
+                if forceplate.Context == 'Left':
+                    LeftForcePlate_DeviceID = DeviceID
+                    Left_forceplate = forceplate
+                    #print('Left',string.split(DeviceNames[i])[0])
+                if forceplate.Context == 'Right':
+                    RightForcePlate_DeviceID = DeviceID
+                    Right_forceplate = forceplate
+                    #print('Right',string.split(DeviceNames[i])[0])
         
         #print LeftForcePlate_DeviceID, RightForcePlate_DeviceID
         
@@ -2273,26 +2695,20 @@ class Dynamic_Main():
         Order = 3
         WindowWidth = 21 # Use Odd Number 
         
+        KineticsSides = [] # Sides with a force plate hit
+        KineticsInputs = []
         if not LeftForcePlate_DeviceID == 0:
             #==================== Smooth Data before Differentiating ======================
-            # Center of Mass
-            arrayHATCenterOfMass = math.Smooth3DArray(arrayHATCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftThighCenterOfMass = math.Smooth3DArray(arrayLeftThighCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftShankCenterOfMass = math.Smooth3DArray(arrayLeftShankCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftFootCenterOfMass = math.Smooth3DArray(arrayLeftFootCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            # Joint Centers
-            arrayLeftHipCenter = math.Smooth3DArray(arrayLeftHipCenter, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftKneeCenter = math.Smooth3DArray(arrayLeftKneeCenter, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftAnkleCenter = math.Smooth3DArray(arrayLeftAnkleCenter, StartFrame, EndFrame, Order, WindowWidth)
-            # Left Angles
-            arrayLeftTrunkAngles = math.Smooth3DArray(arrayLeftTrunkAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftPelvisAngles = math.Smooth3DArray(arrayLeftPelvisAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftThighAngles = math.Smooth3DArray(arrayLeftThighAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftShankAngles = math.Smooth3DArray(arrayLeftShankAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftFootAngles = math.Smooth3DArray(arrayLeftFootAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftHipAngles = math.Smooth3DArray(arrayLeftHipAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftKneeAngles = math.Smooth3DArray(arrayLeftKneeAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayLeftAnkleAngles = math.Smooth3DArray(arrayLeftAnkleAngles, StartFrame, EndFrame, Order, WindowWidth)
+            # Center of Mass, Joint Centers and Left Angles are stacked and smoothed in one pass
+            arraySmoothed = math.SmoothArray([arrayHATCenterOfMass, arrayLeftThighCenterOfMass, arrayLeftShankCenterOfMass, arrayLeftFootCenterOfMass,
+                                              arrayLeftHipCenter, arrayLeftKneeCenter, arrayLeftAnkleCenter,
+                                              arrayLeftTrunkAngles, arrayLeftPelvisAngles, arrayLeftThighAngles, arrayLeftShankAngles,
+                                              arrayLeftFootAngles, arrayLeftHipAngles, arrayLeftKneeAngles, arrayLeftAnkleAngles],
+                                             StartFrame, EndFrame, Order, WindowWidth)
+            [arrayHATCenterOfMass, arrayLeftThighCenterOfMass, arrayLeftShankCenterOfMass, arrayLeftFootCenterOfMass,
+             arrayLeftHipCenter, arrayLeftKneeCenter, arrayLeftAnkleCenter,
+             arrayLeftTrunkAngles, arrayLeftPelvisAngles, arrayLeftThighAngles, arrayLeftShankAngles,
+             arrayLeftFootAngles, arrayLeftHipAngles, arrayLeftKneeAngles, arrayLeftAnkleAngles] = arraySmoothed
             
             # ======================== Translation Variables Differentiatition ===============================
             # Center of Mass
@@ -2347,396 +2763,118 @@ class Dynamic_Main():
             [arrayCOPy, Ready, FP_FrameRate] = vicon.GetDeviceChannelGlobal(DeviceID, 3, 2)
             [arrayCOPz, Ready, FP_FrameRate] = vicon.GetDeviceChannelGlobal(DeviceID, 3, 3)
             
-            GRF = np.array([0.,0.,0.]) # Ground Reaction Force
-            GRT = np.array([0.,0.,0.]) # Ground Reaction Torque
-            COP = np.array([0.,0.,0.]) # Center of Pressure
-            COP_Pelvis = np.array([0.,0.,0.]) # Center of Pressure w.r.t. Pelvis
-            
-            LeftAnkleForceLab = np.array([0.,0.,0.])
-            LeftKneeForceLab = np.array([0.,0.,0.])
-            LeftHipForceLab = np.array([0.,0.,0.])
-            LeftAnkleMoment_Foot = np.array([0.,0.,0.])
-            LeftKneeMoment_Shank = np.array([0.,0.,0.])
-            LeftHipMoment_Thigh = np.array([0.,0.,0.])
-            LeftAnklePower = np.array([0.,0.,0.])
-            LeftKneePower = np.array([0.,0.,0.])
-            LeftHipPower = np.array([0.,0.,0.])
-            for FrameNumber in range(StartFrame -1, EndFrame):
-                Sign = -1 # Left Side
-                
-                #Transform marker data if necessary based on direction that the patient is walking
-                
-                SacralMarker  = np.array([Direction * SacralMarkerX[FrameNumber], Direction * SacralMarkerY[FrameNumber], SacralMarkerZ[FrameNumber]])
-                LeftASISMarker  = np.array([Direction * LeftASISMarkerX[FrameNumber], Direction * LeftASISMarkerY[FrameNumber], LeftASISMarkerZ[FrameNumber]])
-                RightASISMarker  = np.array([Direction * RightASISMarkerX[FrameNumber], Direction * RightASISMarkerY[FrameNumber], RightASISMarkerZ[FrameNumber]])
+            Sign = -1 # Left Side
+            NumberOfFrames = EndFrame - StartFrame + 1
             
-                
-                LeftThighMarker  = np.array([Direction * LeftThighMarkerX[FrameNumber], Direction * LeftThighMarkerY[FrameNumber], LeftThighMarkerZ[FrameNumber]])
-                LeftLateralKneeMarker  = np.array([Direction * LeftLateralKneeMarkerX[FrameNumber], Direction * LeftLateralKneeMarkerY[FrameNumber], LeftLateralKneeMarkerZ[FrameNumber]])
-                LeftTibialMarker  = np.array([Direction * LeftTibialMarkerX[FrameNumber], Direction * LeftTibialMarkerY[FrameNumber], LeftTibialMarkerZ[FrameNumber]])
-                LeftLateralAnkleMarker  = np.array([Direction * LeftLateralAnkleMarkerX[FrameNumber], Direction * LeftLateralAnkleMarkerY[FrameNumber], LeftLateralAnkleMarkerZ[FrameNumber]])
-                LeftToeMarker  = np.array([Direction * LeftToeMarkerX[FrameNumber], Direction * LeftToeMarkerY[FrameNumber], LeftToeMarkerZ[FrameNumber]])
-                LeftMedialAnkleMarker  = np.array([Direction * LeftMedialAnkleMarkerX[FrameNumber], Direction * LeftMedialAnkleMarkerY[FrameNumber], LeftMedialAnkleMarkerZ[FrameNumber]])
-                LeftHeelMarker  = np.array([Direction * LeftHeelMarkerX[FrameNumber], Direction * LeftHeelMarkerY[FrameNumber], LeftHeelMarkerZ[FrameNumber]])
-                if LeftTibialTriadCheck is True:
-                    LeftTibialUpperMarker  = np.array([Direction * LeftTibialUpperMarkerX[FrameNumber], Direction * LeftTibialUpperMarkerY[FrameNumber], LeftTibialUpperMarkerZ[FrameNumber]])
-                    LeftTibialLowerMarker  = np.array([Direction * LeftTibialLowerMarkerX[FrameNumber], Direction * LeftTibialLowerMarkerY[FrameNumber], LeftTibialLowerMarkerZ[FrameNumber]])
-                #Transform joint center data if necessary based on direction that the patient is walking
-                LeftHipCenterLab = np.array([Direction * arrayLeftHipCenter[0][FrameNumber], Direction * arrayLeftHipCenter[1][FrameNumber], arrayLeftHipCenter[2][FrameNumber]])
-                LeftKneeCenterLab = np.array([Direction * arrayLeftKneeCenter[0][FrameNumber], Direction * arrayLeftKneeCenter[1][FrameNumber], arrayLeftKneeCenter[2][FrameNumber]])
-                LeftAnkleCenterLab = np.array([Direction * arrayLeftAnkleCenter[0][FrameNumber], Direction * arrayLeftAnkleCenter[1][FrameNumber], arrayLeftAnkleCenter[2][FrameNumber]])
-                #Transform center of mass data if necessary based on direction that the patient is walking
-                LeftThighCenterOfMass = np.array([Direction * arrayLeftThighCenterOfMass[0][FrameNumber], Direction * arrayLeftThighCenterOfMass[1][FrameNumber], arrayLeftThighCenterOfMass[2][FrameNumber]])
-                LeftShankCenterOfMass = np.array([Direction * arrayLeftShankCenterOfMass[0][FrameNumber], Direction * arrayLeftShankCenterOfMass[1][FrameNumber], arrayLeftShankCenterOfMass[2][FrameNumber]])
-                LeftFootCenterOfMass = np.array([Direction * arrayLeftFootCenterOfMass[0][FrameNumber], Direction * arrayLeftFootCenterOfMass[1][FrameNumber], arrayLeftFootCenterOfMass[2][FrameNumber]])
-                
-                # Compute centroidal radii of gyration (Convert from mm to meters)
-                LeftThighRadiusOfGyration = math.RadiusOfGyration(LeftHipCenterLab, LeftKneeCenterLab, 0.323, 0.323, 0.187) /1e3
-                LeftShankRadiusOfGyration = math.RadiusOfGyration(LeftKneeCenterLab, LeftAnkleCenterLab, 0.302, 0.302, 0.087) /1e3
-                LeftFootRadiusOfGyration = math.RadiusOfGyration(LeftAnkleCenterLab, LeftToeMarker, 0.148, 0.475, 0.475) /1e3
-                
-                # Compute segmental mass moment of inertia
-                LeftThighMassMomentOfInertia = ThighMass * np.square(LeftThighRadiusOfGyration)
-                LeftShankMassMomentOfInertia = ShankMass * np.square(LeftShankRadiusOfGyration)
-                LeftFootMassMomentOfInertia = FootMass * np.square(LeftFootRadiusOfGyration)
-                 
-                
-                FP_FrameNumber = int(FrameNumber * FP_FrameRate / MarkerFrameRate)
-                
-                # Compute Vertical Torque (Mz is dependent on COP location)
-                Tz = arrayMz[FP_FrameNumber] + arrayFx[FP_FrameNumber] * (arrayCOPy[FP_FrameNumber] - FP_Center[1] + FP_Origin[1]) - arrayFy[FP_FrameNumber] * (arrayCOPx[FP_FrameNumber] -FP_Center[0] + FP_Origin[0])
-                
-                # Account for Walking Direction
-                # Compute Reaction force as opposite of force plate output
-                GRF[0] = -Direction * arrayFx[FP_FrameNumber]
-                GRF[1] = -Direction * arrayFy[FP_FrameNumber]
-                GRF[2] = -arrayFz[FP_FrameNumber]
-                GRT[2] = -Tz / 1e3 # Convert from mm to meters
-
-                # Center of Pressure is already in lab/global coordinate system
-                COP[0] = Direction * arrayCOPx[FP_FrameNumber]
-                COP[1] = Direction * arrayCOPy[FP_FrameNumber]
-                COP[2] = 0
-                
-                ############ Compute Anatomical Coordinate Systems ###################
-                [EPelvisTech, MidASISLab] = gait.TechCS_Pelvis_Newington(LeftASISMarker, RightASISMarker, SacralMarker)
-                EPelvisAnat = math.TransformAnatCoorSysFromTechCoors(self.valueEPelvisAnatRelTech, EPelvisTech)
-                LeftEThighTech = gait.TechCS_Thigh_Newington('Left', LeftHipCenterLab, LeftThighMarker, LeftLateralKneeMarker)
-                LeftEThighAnat = math.TransformAnatCoorSysFromTechCoors(self.valueLeftEThighAnatRelTech,LeftEThighTech)
-                if LeftTibialTriadCheck is True:
-                    LeftEShankTech = gait.TechCS_Shank_Newington('Left', LeftTibialUpperMarker, LeftTibialLowerMarker, LeftTibialMarker)
-                else:
-                    LeftEShankTech = gait.TechCS_Shank_Newington('Left', LeftKneeCenterLab, LeftTibialMarker, LeftLateralAnkleMarker)
-                LeftEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors(self.valueLeftEShankProximalAnatRelTech, LeftEShankTech)
-                LeftEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors(self.valueLeftEShankDistalAnatRelTech, LeftEShankTech)
-                # If Medial ankle is available,then recompute Shank Proximal/Distal Anatomical Coordinate System
-                if LeftMedialAnkleMarkerDropOff == 0:
-                    LeftEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington('Left', LeftKneeCenterLab, LeftLateralKneeMarker, LeftAnkleCenterLab)
-                    LeftEShankDistalAnat= gait.AnatCS_Shank_Distal_VCM('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftLateralAnkleMarker)
-                LeftEFootTech = gait.TechCS_Foot_Newington('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftToeMarker)
-                LeftEFootAnat = math.TransformAnatCoorSysFromTechCoors(self.valueLeftEFootAnatRelTech, LeftEFootTech)
-                try:
-                    LeftEFootTibAnat = math.TransformAnatCoorSysFromTechCoors(self.valueLeftEFootAnat2RelTech, LeftEFootTech)
-                except:
-                    LeftEFootTibAnat = np.matrix([[0. for m in range(3)] for n in range(3)])
-                ####################################################################################################### 
-                
-                
-                # ============================== Ankle ====================================
-                # All Distances are in mm. Account for conversion to meters
-                LeftAnkleForceLab[0] = FootMass * Direction * arrayLeftFootLinearAccelerationLab[0][FrameNumber] /1e3 - GRF[0]
-                LeftAnkleForceLab[1] = FootMass * Direction * arrayLeftFootLinearAccelerationLab[1][FrameNumber] /1e3 - GRF[1]
-                LeftAnkleForceLab[2] = FootMass * arrayLeftFootLinearAccelerationLab[2][FrameNumber] /1e3 - GRF[2] + FootMass * 9.81
-            
-                    
-                # vector from center of mass to proximal point of load application
-                ProximalVector = LeftAnkleCenterLab - LeftFootCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = COP - LeftFootCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,LeftAnkleForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,GRF) / 1e3 # Convert from mm to meters
-                
-                # Transform to Foot Coordinate System
-                MomentFromProximalForce_Foot = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, LeftEFootAnat)
-                MomentfromDistalForce_Foot = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, LeftEFootAnat)
-                GRT_Foot = math.TransformVectorIntoMovingCoors(GRT, LeftEFootAnat)
-                LeftFootAnglesVelocityLab = np.array([arrayLeftFootAnglesVelocityLab[0][FrameNumber],arrayLeftFootAnglesVelocityLab[1][FrameNumber],arrayLeftFootAnglesVelocityLab[2][FrameNumber]])
-                LeftFootAnglesAccelerationLab = np.array([arrayLeftFootAnglesAccelerationLab[0][FrameNumber],arrayLeftFootAnglesAccelerationLab[1][FrameNumber],arrayLeftFootAnglesAccelerationLab[2][FrameNumber]])
-                LeftAnkleAnglesVelocityShank = np.array([arrayLeftAnkleAnglesVelocityShank[0][FrameNumber],arrayLeftAnkleAnglesVelocityShank[1][FrameNumber],arrayLeftAnkleAnglesVelocityShank[2][FrameNumber]])
-                LeftFootAnglesVelocity_Foot = math.TransformVectorIntoMovingCoors(LeftFootAnglesVelocityLab, LeftEFootAnat) 
-                LeftFootAnglesAcceleration_Foot = math.TransformVectorIntoMovingCoors(LeftFootAnglesAccelerationLab, LeftEFootAnat) 
-                # Joint velocity is in proximal segment CS. Transform to Distal
-                if self.ShankCoordinateSystem == 'Distal':
-                    LeftAnkleAnglesVelocityLab = math.TransformVectorIntoLabCoors(LeftAnkleAnglesVelocityShank, LeftEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    LeftAnkleAnglesVelocityLab = math.TransformVectorIntoLabCoors(LeftAnkleAnglesVelocityShank, LeftEShankProximalAnat)
-                LeftAnkleAnglesVelocity_Foot = math.TransformVectorIntoMovingCoors(LeftAnkleAnglesVelocityLab, LeftEFootAnat)
-                
-                LeftAnkleMoment_Foot[0] = LeftFootMassMomentOfInertia[0] * LeftFootAnglesAcceleration_Foot[0] + \
-                                        (LeftFootMassMomentOfInertia[2] - LeftFootMassMomentOfInertia[1]) * LeftFootAnglesVelocity_Foot[1] * LeftFootAnglesVelocity_Foot[2] \
-                                            - MomentFromProximalForce_Foot[0] - MomentfromDistalForce_Foot[0] - GRT_Foot[0]
-                LeftAnkleMoment_Foot[1] = LeftFootMassMomentOfInertia[1] * LeftFootAnglesAcceleration_Foot[1] + \
-                                        (LeftFootMassMomentOfInertia[0] - LeftFootMassMomentOfInertia[2]) * LeftFootAnglesVelocity_Foot[2] * LeftFootAnglesVelocity_Foot[0] \
-                                            - MomentFromProximalForce_Foot[1] - MomentfromDistalForce_Foot[1] - GRT_Foot[1]
-                LeftAnkleMoment_Foot[2] = LeftFootMassMomentOfInertia[2] * LeftFootAnglesAcceleration_Foot[2] + \
-                                        (LeftFootMassMomentOfInertia[1] - LeftFootMassMomentOfInertia[0]) * LeftFootAnglesVelocity_Foot[0] * LeftFootAnglesVelocity_Foot[1] \
-                                            - MomentFromProximalForce_Foot[2] - MomentfromDistalForce_Foot[2] - GRT_Foot[2]
-                
-                # Transform Ankle Moment to Lab coordinate system
-                LeftAnkleMomentLab = math.TransformVectorIntoLabCoors(LeftAnkleMoment_Foot,LeftEFootAnat)
-                
-                LeftAnklePower[0] = LeftAnkleMoment_Foot[0] * LeftAnkleAnglesVelocity_Foot[0]
-                LeftAnklePower[1] = LeftAnkleMoment_Foot[1] * LeftAnkleAnglesVelocity_Foot[1]
-                LeftAnklePower[2] = LeftAnkleMoment_Foot[2] * LeftAnkleAnglesVelocity_Foot[2]
-                
-                LeftAnklePowerTotal = np.dot(LeftAnkleMoment_Foot, LeftAnkleAnglesVelocity_Foot)
-                
-                # Normalize and Store in array
-                # Apply sign convention based on right versus left side & plotting convention
-                # Internal Moments that are Extensor, Abductor, External Rotator are positive
-                arrayLeftAnkleMoment[0][FrameNumber] =  -Sign * LeftAnkleMoment_Foot[0] /float(self.valueBodyMass) 
-                arrayLeftAnkleMoment[1][FrameNumber] =  LeftAnkleMoment_Foot[1] /float(self.valueBodyMass)
-                arrayLeftAnkleMoment[2][FrameNumber] =  -Sign * LeftAnkleMoment_Foot[2] /float(self.valueBodyMass)
-                
-                arrayLeftAnklePower[0][FrameNumber] =  LeftAnklePower[0] /float(self.valueBodyMass)
-                arrayLeftAnklePower[1][FrameNumber] =  LeftAnklePower[1] /float(self.valueBodyMass)
-                arrayLeftAnklePower[2][FrameNumber] =  LeftAnklePower[2] /float(self.valueBodyMass)
-                
-                arrayLeftAnklePowerTotal[0][FrameNumber] =  0
-                arrayLeftAnklePowerTotal[1][FrameNumber] =  0
-                arrayLeftAnklePowerTotal[2][FrameNumber] =  LeftAnklePowerTotal /float(self.valueBodyMass)
-                
-                # Transform Ankle Force into Foot CS: X=AP, Y=ML, Z=SI (Do Not Re-arrange these)
-                LeftAnkleForceFoot = math.TransformVectorIntoMovingCoors(LeftAnkleForceLab, LeftEFootTibAnat)
-                arrayLeftAnkleJRF[0][FrameNumber] = LeftAnkleForceFoot[0] / float(self.valueBodyMass)
-                arrayLeftAnkleJRF[1][FrameNumber] = Sign * LeftAnkleForceFoot[1] / float(self.valueBodyMass)
-                arrayLeftAnkleJRF[2][FrameNumber] = LeftAnkleForceFoot[2] / float(self.valueBodyMass)
-                
-                # ============================== Knee ====================================
-                # Reverse sign of force and moment from Distal Segment
-                LeftAnkleForceLab = - LeftAnkleForceLab
-                LeftAnkleMomentLab = - LeftAnkleMomentLab
-                
-                # All Distances are in mm. Account for conversion to meters
-                LeftKneeForceLab[0] = ShankMass * Direction * arrayLeftShankLinearAccelerationLab[0][FrameNumber] /1e3 - LeftAnkleForceLab[0]
-                LeftKneeForceLab[1] = ShankMass * Direction * arrayLeftShankLinearAccelerationLab[1][FrameNumber] /1e3 - LeftAnkleForceLab[1]
-                LeftKneeForceLab[2] = ShankMass * arrayLeftShankLinearAccelerationLab[2][FrameNumber] /1e3 - LeftAnkleForceLab[2] + FootMass * 9.81
-                
-
-                # vector from center of mass to proximal point of load application
-                ProximalVector = LeftKneeCenterLab - LeftShankCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = LeftAnkleCenterLab - LeftShankCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,LeftKneeForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,LeftAnkleForceLab) / 1e3 # Convert from mm to meters
-                
-                # Tranform to Shank Coordinate System
-                if self.ShankCoordinateSystem == 'Distal':
-                    MomentFromProximalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, LeftEShankDistalAnat)
-                    MomentfromDistalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, LeftEShankDistalAnat)
-                    LeftAnkleMoment_Shank = math.TransformVectorIntoMovingCoors(LeftAnkleMomentLab, LeftEShankDistalAnat)
-                    LeftShankAnglesVelocityLab = np.array([arrayLeftShankAnglesVelocityLab[0][FrameNumber],arrayLeftShankAnglesVelocityLab[1][FrameNumber],arrayLeftShankAnglesVelocityLab[2][FrameNumber]])
-                    LeftShankAnglesAccelerationLab = np.array([arrayLeftShankAnglesAccelerationLab[0][FrameNumber],arrayLeftShankAnglesAccelerationLab[1][FrameNumber],arrayLeftShankAnglesAccelerationLab[2][FrameNumber]])
-                    LeftKneeAnglesVelocityThigh = np.array([arrayLeftKneeAnglesVelocityThigh[0][FrameNumber],arrayLeftKneeAnglesVelocityThigh[1][FrameNumber],arrayLeftKneeAnglesVelocityThigh[2][FrameNumber]])
-                    LeftShankAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(LeftShankAnglesVelocityLab, LeftEShankDistalAnat) 
-                    LeftShankAnglesAcceleration_Shank = math.TransformVectorIntoMovingCoors(LeftShankAnglesAccelerationLab, LeftEShankDistalAnat) 
-                    # Joint velocity is in proximal segment CS. Transform to Distal
-                    LeftKneeAnglesVelocityLab = math.TransformVectorIntoLabCoors(LeftKneeAnglesVelocityThigh, LeftEThighAnat)
-                    LeftKneeAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(LeftKneeAnglesVelocityLab, LeftEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    MomentFromProximalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, LeftEShankProximalAnat)
-                    MomentfromDistalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, LeftEShankProximalAnat)
-                    LeftAnkleMoment_Shank = math.TransformVectorIntoMovingCoors(LeftAnkleMomentLab, LeftEShankProximalAnat)
-                    LeftShankAnglesVelocityLab = np.array([arrayLeftShankAnglesVelocityLab[0][FrameNumber],arrayLeftShankAnglesVelocityLab[1][FrameNumber],arrayLeftShankAnglesVelocityLab[2][FrameNumber]])
-                    LeftShankAnglesAccelerationLab = np.array([arrayLeftShankAnglesAccelerationLab[0][FrameNumber],arrayLeftShankAnglesAccelerationLab[1][FrameNumber],arrayLeftShankAnglesAccelerationLab[2][FrameNumber]])
-                    LeftKneeAnglesVelocityThigh = np.array([arrayLeftKneeAnglesVelocityThigh[0][FrameNumber],arrayLeftKneeAnglesVelocityThigh[1][FrameNumber],arrayLeftKneeAnglesVelocityThigh[2][FrameNumber]])
-                    LeftShankAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(LeftShankAnglesVelocityLab, LeftEShankProximalAnat) 
-                    LeftShankAnglesAcceleration_Shank = math.TransformVectorIntoMovingCoors(LeftShankAnglesAccelerationLab, LeftEShankProximalAnat) 
-                    # Joint velocity is in proximal segment CS. Transform to Distal
-                    LeftKneeAnglesVelocityLab = math.TransformVectorIntoLabCoors(LeftKneeAnglesVelocityThigh, LeftEThighAnat)
-                    LeftKneeAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(LeftKneeAnglesVelocityLab, LeftEShankProximalAnat)
-                
-               
-                LeftKneeMoment_Shank[0] = LeftShankMassMomentOfInertia[0] * LeftShankAnglesAcceleration_Shank[0] + \
-                                        (LeftShankMassMomentOfInertia[2] - LeftShankMassMomentOfInertia[1]) * LeftShankAnglesVelocity_Shank[1] * LeftShankAnglesVelocity_Shank[2] \
-                                            - MomentFromProximalForce_Shank[0] - MomentfromDistalForce_Shank[0] - LeftAnkleMoment_Shank[0]
-                LeftKneeMoment_Shank[1] = LeftShankMassMomentOfInertia[1] * LeftShankAnglesAcceleration_Shank[1] + \
-                                        (LeftShankMassMomentOfInertia[0] - LeftShankMassMomentOfInertia[2]) * LeftShankAnglesVelocity_Shank[2] * LeftShankAnglesVelocity_Shank[0] \
-                                            - MomentFromProximalForce_Shank[1] - MomentfromDistalForce_Shank[1] - LeftAnkleMoment_Shank[1]
-                LeftKneeMoment_Shank[2] = LeftShankMassMomentOfInertia[2] * LeftShankAnglesAcceleration_Shank[2] + \
-                                        (LeftShankMassMomentOfInertia[1] - LeftShankMassMomentOfInertia[0]) * LeftShankAnglesVelocity_Shank[0] * LeftShankAnglesVelocity_Shank[1] \
-                                            - MomentFromProximalForce_Shank[2] - MomentfromDistalForce_Shank[2] - LeftAnkleMoment_Shank[2]
-
-                # Transform Knee Moment to Lab coordinate system
-                if self.ShankCoordinateSystem == 'Distal':
-                    LeftKneeMomentLab = math.TransformVectorIntoLabCoors(LeftKneeMoment_Shank,LeftEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    LeftKneeMomentLab = math.TransformVectorIntoLabCoors(LeftKneeMoment_Shank,LeftEShankProximalAnat)
-                    
-                LeftKneePower[0] = LeftKneeMoment_Shank[0] * LeftKneeAnglesVelocity_Shank[0]
-                LeftKneePower[1] = LeftKneeMoment_Shank[1] * LeftKneeAnglesVelocity_Shank[1]
-                LeftKneePower[2] = LeftKneeMoment_Shank[2] * LeftKneeAnglesVelocity_Shank[2]
-                
-                LeftKneePowerTotal = np.dot(LeftKneeMoment_Shank, LeftKneeAnglesVelocity_Shank)
-                
-                # Normalize and Store in array
-                arrayLeftKneeMoment[0][FrameNumber] =  -Sign * LeftKneeMoment_Shank[0] /float(self.valueBodyMass)
-                arrayLeftKneeMoment[1][FrameNumber] =  -LeftKneeMoment_Shank[1] /float(self.valueBodyMass)
-                arrayLeftKneeMoment[2][FrameNumber] =  -Sign * LeftKneeMoment_Shank[2] /float(self.valueBodyMass)
-                
-                arrayLeftKneePower[0][FrameNumber] =  LeftKneePower[0] /float(self.valueBodyMass)
-                arrayLeftKneePower[1][FrameNumber] =  LeftKneePower[1] /float(self.valueBodyMass)
-                arrayLeftKneePower[2][FrameNumber] =  LeftKneePower[2] /float(self.valueBodyMass)
-                
-                arrayLeftKneePowerTotal[0][FrameNumber] =  0
-                arrayLeftKneePowerTotal[1][FrameNumber] =  0
-                arrayLeftKneePowerTotal[2][FrameNumber] =  LeftKneePowerTotal /float(self.valueBodyMass)
-                
-                # Transform Knee Force into Proximal Tibia CS
-                LeftKneeForceTib = math.TransformVectorIntoMovingCoors(LeftKneeForceLab, LeftEShankProximalAnat)
-                arrayLeftKneeJRF[0][FrameNumber] = LeftKneeForceTib[0] / float(self.valueBodyMass)
-                arrayLeftKneeJRF[1][FrameNumber] = Sign * LeftKneeForceTib[1] / float(self.valueBodyMass)
-                arrayLeftKneeJRF[2][FrameNumber] = LeftKneeForceTib[2] / float(self.valueBodyMass)
-
-                
-                # ============================== Hip ====================================
-                # Reverse sign of force and moment from Distal Segment
-                LeftKneeForceLab = - LeftKneeForceLab
-                LeftKneeMomentLab = - LeftKneeMomentLab
-                
-                # All Distances are in mm. Account for conversion to meters
-                LeftHipForceLab[0] = ThighMass * Direction * arrayLeftThighLinearAccelerationLab[0][FrameNumber] /1e3 - LeftKneeForceLab[0]
-                LeftHipForceLab[1] = ThighMass * Direction * arrayLeftThighLinearAccelerationLab[1][FrameNumber] /1e3 - LeftKneeForceLab[1]
-                LeftHipForceLab[2] = ThighMass * arrayLeftThighLinearAccelerationLab[2][FrameNumber] /1e3 - LeftKneeForceLab[2] + FootMass * 9.81
-                
-
-                # vector from center of mass to proximal point of load application
-                ProximalVector = LeftHipCenterLab - LeftThighCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = LeftKneeCenterLab - LeftThighCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,LeftHipForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,LeftKneeForceLab) / 1e3 # Convert from mm to meters
-                
-                # Transform to Thigh Coordinate System
-                MomentFromProximalForce_Thigh = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, LeftEThighAnat)
-                MomentfromDistalForce_Thigh = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, LeftEThighAnat)
-                LeftKneeMoment_Thigh = math.TransformVectorIntoMovingCoors(LeftKneeMomentLab, LeftEThighAnat)
-                LeftThighAnglesVelocityLab = np.array([arrayLeftThighAnglesVelocityLab[0][FrameNumber],arrayLeftThighAnglesVelocityLab[1][FrameNumber],arrayLeftThighAnglesVelocityLab[2][FrameNumber]])
-                LeftThighAnglesAccelerationLab = np.array([arrayLeftThighAnglesAccelerationLab[0][FrameNumber],arrayLeftThighAnglesAccelerationLab[1][FrameNumber],arrayLeftThighAnglesAccelerationLab[2][FrameNumber]])
-                LeftHipAnglesVelocityPelvis = np.array([arrayLeftHipAnglesVelocityPelvis[0][FrameNumber],arrayLeftHipAnglesVelocityPelvis[1][FrameNumber],arrayLeftHipAnglesVelocityPelvis[2][FrameNumber]])
-                LeftThighAnglesVelocity_Thigh = math.TransformVectorIntoMovingCoors(LeftThighAnglesVelocityLab, LeftEThighAnat) 
-                LeftThighAnglesAcceleration_Thigh = math.TransformVectorIntoMovingCoors(LeftThighAnglesAccelerationLab, LeftEThighAnat) 
-                # Joint velocity is in proximal segment CS. Transform to Distal
-                LeftHipAnglesVelocityLab = math.TransformVectorIntoLabCoors(LeftHipAnglesVelocityPelvis, EPelvisAnat)
-                LeftHipAnglesVelocity_Thigh = math.TransformVectorIntoMovingCoors(LeftHipAnglesVelocityLab, LeftEThighAnat)
-                
-                
-                
-                LeftHipMoment_Thigh[0] = LeftThighMassMomentOfInertia[0] * LeftThighAnglesAcceleration_Thigh[0] + \
-                                        (LeftThighMassMomentOfInertia[2] - LeftThighMassMomentOfInertia[1]) * LeftThighAnglesVelocity_Thigh[1] * LeftThighAnglesVelocity_Thigh[2] \
-                                            - MomentFromProximalForce_Thigh[0] - MomentfromDistalForce_Thigh[0] - LeftKneeMoment_Thigh[0]
-                LeftHipMoment_Thigh[1] = LeftThighMassMomentOfInertia[1] * LeftThighAnglesAcceleration_Thigh[1] + \
-                                        (LeftThighMassMomentOfInertia[0] - LeftThighMassMomentOfInertia[2]) * LeftThighAnglesVelocity_Thigh[2] * LeftThighAnglesVelocity_Thigh[0] \
-                                            - MomentFromProximalForce_Thigh[1] - MomentfromDistalForce_Thigh[1] - LeftKneeMoment_Thigh[1]
-                LeftHipMoment_Thigh[2] = LeftThighMassMomentOfInertia[2] * LeftThighAnglesAcceleration_Thigh[2] + \
-                                        (LeftThighMassMomentOfInertia[1] - LeftThighMassMomentOfInertia[0]) * LeftThighAnglesVelocity_Thigh[0] * LeftThighAnglesVelocity_Thigh[1] \
-                                            - MomentFromProximalForce_Thigh[2] - MomentfromDistalForce_Thigh[2] - LeftKneeMoment_Thigh[2]
-
-                # Transform Hip Moment to Lab coordinate system
-                LeftHipMomentLab = math.TransformVectorIntoLabCoors(LeftHipMoment_Thigh,LeftEThighAnat)
-                
-                LeftHipPower[0] = LeftHipMoment_Thigh[0] * LeftHipAnglesVelocity_Thigh[0]
-                LeftHipPower[1] = LeftHipMoment_Thigh[1] * LeftHipAnglesVelocity_Thigh[1]
-                LeftHipPower[2] = LeftHipMoment_Thigh[2] * LeftHipAnglesVelocity_Thigh[2]
-                
-                LeftHipPowerTotal = np.dot(LeftHipMoment_Thigh, LeftHipAnglesVelocity_Thigh)
-                
-                # Normalize and Store in array
-                arrayLeftHipMoment[0][FrameNumber] =  -Sign * LeftHipMoment_Thigh[0] /float(self.valueBodyMass)
-                arrayLeftHipMoment[1][FrameNumber] =  LeftHipMoment_Thigh[1] /float(self.valueBodyMass)
-                arrayLeftHipMoment[2][FrameNumber] =  -Sign * LeftHipMoment_Thigh[2] /float(self.valueBodyMass)
-                
-                arrayLeftHipPower[0][FrameNumber] =  LeftHipPower[0] /float(self.valueBodyMass)
-                arrayLeftHipPower[1][FrameNumber] =  LeftHipPower[1] /float(self.valueBodyMass)
-                arrayLeftHipPower[2][FrameNumber] =  LeftHipPower[2] /float(self.valueBodyMass)
-                
-                arrayLeftHipPowerTotal[0][FrameNumber] =  0
-                arrayLeftHipPowerTotal[1][FrameNumber] =  0
-                arrayLeftHipPowerTotal[2][FrameNumber] =  LeftHipPowerTotal /float(self.valueBodyMass)
-                
-                # Transform Hip Force into Thigh CS
-                LeftHipForceThigh = math.TransformVectorIntoMovingCoors(LeftHipForceLab, LeftEThighAnat)
-                arrayLeftHipJRF[0][FrameNumber] = LeftHipForceThigh[0] / float(self.valueBodyMass)
-                arrayLeftHipJRF[1][FrameNumber] = Sign * LeftHipForceThigh[1] / float(self.valueBodyMass)
-                arrayLeftHipJRF[2][FrameNumber] = LeftHipForceThigh[2] / float(self.valueBodyMass)
-                # Correct for Lab CS
-                GRF = math.TransformVectorIntoMovingCoors(GRF, ELab)
-                # Write back to GRM, account for side for ML, and scale to BW
-                arrayLeftGRF[0][FrameNumber] = GRF[0] / float(self.valueBodyMass)
-                arrayLeftGRF[1][FrameNumber] = Sign * GRF[1] / float(self.valueBodyMass)
-                arrayLeftGRF[2][FrameNumber] = GRF[2] / float(self.valueBodyMass)
-                
-                arrayLeftGRM[0][FrameNumber] = arrayCOPx[FP_FrameNumber] - arrayPelvisOrigin[0][FrameNumber]
-                arrayLeftGRM[1][FrameNumber] = arrayCOPy[FP_FrameNumber] - arrayPelvisOrigin[1][FrameNumber]
-                arrayLeftGRM[2][FrameNumber] = Sign * GRT[2] / float(self.valueBodyMass)
-                
-                # Store in array of one frame
-                COP_Pelvis = np.array([arrayLeftGRM[0][FrameNumber], arrayLeftGRM[1][FrameNumber], arrayLeftGRM[2][FrameNumber]])
-                # Correct for Lab CS
-                COP_Pelvis = math.TransformVectorIntoMovingCoors(COP_Pelvis, ELab)
-                # Write back to GRM, account for walk direction and side for ML, and scale to % leg length
-                arrayLeftGRM[0][FrameNumber] = 100 * Direction * COP_Pelvis[0] / self.valueLeftLegLength
-                arrayLeftGRM[1][FrameNumber] = 100 * Direction * Sign * COP_Pelvis[1] / self.valueLeftLegLength
-
-                # Add Moment and Power Sums
-                # Index 0 is sum of sagittal plane moment, Index 1 is sum of sagittal power, Index3 is sum of total power
-                arrayLeftMPSum[0][FrameNumber] = arrayLeftHipMoment[0][FrameNumber] + \
-                                                 arrayLeftKneeMoment[0][FrameNumber] + \
-                                                 arrayLeftAnkleMoment[0][FrameNumber]
-                arrayLeftMPSum[1][FrameNumber] = arrayLeftHipPower[0][FrameNumber] + \
-                                                 arrayLeftKneePower[0][FrameNumber] + \
-                                                 arrayLeftAnklePower[0][FrameNumber]
-                arrayLeftMPSum[2][FrameNumber] = arrayLeftHipPowerTotal[2][FrameNumber] + \
-                                                 arrayLeftKneePowerTotal[2][FrameNumber] + \
-                                                 arrayLeftAnklePowerTotal[2][FrameNumber]
-                
-                # Add Foot CoP, compute components first and foot length
-                AnkleCOP = COP - LeftAnkleCenterLab
-                AnkleCOP[2] = 0
-                AnkleCOP_Foot = math.TransformVectorIntoMovingCoors(AnkleCOP, LeftEFootAnat)
-                FL = np.linalg.norm(LeftToeMarker - LeftAnkleCenterLab)
-                # Normalize
-                AnkleCOP_Foot_Normalized = 100 * AnkleCOP_Foot / FL
-                # Account for foot progression angle and account for walk direction and M/L
-                arrayLeftFootCoP[0][FrameNumber] = AnkleCOP_Foot_Normalized[0]
-                arrayLeftFootCoP[1][FrameNumber] = AnkleCOP_Foot_Normalized[1]
-                arrayLeftFootCoP[2][FrameNumber] = 0
+            # Force Plate samples of the processed frames
+            FP_FrameNumbers = (np.arange(StartFrame-1, EndFrame) * FP_FrameRate / MarkerFrameRate).astype(int)
+            [Fx, Fy, Fz, Mz, COPx, COPy] = [np.asarray(Channel, dtype=float)[FP_FrameNumbers] for Channel in [arrayFx, arrayFy, arrayFz, arrayMz, arrayCOPx, arrayCOPy]]
             
+            # Compute Vertical Torque (Mz is dependent on COP location)
+            Tz = Mz + Fx * (COPy - FP_Center[1] + FP_Origin[1]) - Fy * (COPx - FP_Center[0] + FP_Origin[0])
             
+            # Account for Walking Direction
+            # Compute Reaction force as opposite of force plate output
+            LeftGRF = np.column_stack((-Direction * Fx, -Direction * Fy, -Fz)) # Ground Reaction Force
+            LeftGRT = np.zeros((NumberOfFrames,3)) # Ground Reaction Torque
+            LeftGRT[:,2] = -Tz / 1e3 # Convert from mm to meters
+            # Center of Pressure is already in lab/global coordinate system
+            LeftCOP = np.column_stack((Direction * COPx, Direction * COPy, np.zeros(NumberOfFrames))) # Center of Pressure
+            # Center of Pressure w.r.t. Pelvis origin
+            LeftCOP_PelvisOrigin = np.column_stack((COPx, COPy)) - np.asarray(arrayPelvisOrigin)[0:2,StartFrame-1:EndFrame].T
             
+            #Transform marker data if necessary based on direction that the patient is walking
+            SacralMarker = MarkerArrayBatch(SacralMarkerX, SacralMarkerY, SacralMarkerZ, Direction)
+            LeftASISMarker = MarkerArrayBatch(LeftASISMarkerX, LeftASISMarkerY, LeftASISMarkerZ, Direction)
+            RightASISMarker = MarkerArrayBatch(RightASISMarkerX, RightASISMarkerY, RightASISMarkerZ, Direction)
+            LeftThighMarker = MarkerArrayBatch(LeftThighMarkerX, LeftThighMarkerY, LeftThighMarkerZ, Direction)
+            LeftLateralKneeMarker = MarkerArrayBatch(LeftLateralKneeMarkerX, LeftLateralKneeMarkerY, LeftLateralKneeMarkerZ, Direction)
+            LeftTibialMarker = MarkerArrayBatch(LeftTibialMarkerX, LeftTibialMarkerY, LeftTibialMarkerZ, Direction)
+            LeftLateralAnkleMarker = MarkerArrayBatch(LeftLateralAnkleMarkerX, LeftLateralAnkleMarkerY, LeftLateralAnkleMarkerZ, Direction)
+            LeftToeMarker = MarkerArrayBatch(LeftToeMarkerX, LeftToeMarkerY, LeftToeMarkerZ, Direction)
+            if LeftTibialTriadCheck is True:
+                LeftTibialUpperMarker = MarkerArrayBatch(LeftTibialUpperMarkerX, LeftTibialUpperMarkerY, LeftTibialUpperMarkerZ, Direction)
+                LeftTibialLowerMarker = MarkerArrayBatch(LeftTibialLowerMarkerX, LeftTibialLowerMarkerY, LeftTibialLowerMarkerZ, Direction)
+            #Transform joint center data if necessary based on direction that the patient is walking
+            LeftHipCenterLab = MarkerArrayBatch(arrayLeftHipCenter[0], arrayLeftHipCenter[1], arrayLeftHipCenter[2], Direction)
+            LeftKneeCenterLab = MarkerArrayBatch(arrayLeftKneeCenter[0], arrayLeftKneeCenter[1], arrayLeftKneeCenter[2], Direction)
+            LeftAnkleCenterLab = MarkerArrayBatch(arrayLeftAnkleCenter[0], arrayLeftAnkleCenter[1], arrayLeftAnkleCenter[2], Direction)
+            #Transform center of mass data if necessary based on direction that the patient is walking
+            LeftThighCenterOfMass = MarkerArrayBatch(arrayLeftThighCenterOfMass[0], arrayLeftThighCenterOfMass[1], arrayLeftThighCenterOfMass[2], Direction)
+            LeftShankCenterOfMass = MarkerArrayBatch(arrayLeftShankCenterOfMass[0], arrayLeftShankCenterOfMass[1], arrayLeftShankCenterOfMass[2], Direction)
+            LeftFootCenterOfMass = MarkerArrayBatch(arrayLeftFootCenterOfMass[0], arrayLeftFootCenterOfMass[1], arrayLeftFootCenterOfMass[2], Direction)
+            LeftThighLinearAccelerationLab = MarkerArrayBatch(arrayLeftThighLinearAccelerationLab[0], arrayLeftThighLinearAccelerationLab[1], arrayLeftThighLinearAccelerationLab[2], Direction)
+            LeftShankLinearAccelerationLab = MarkerArrayBatch(arrayLeftShankLinearAccelerationLab[0], arrayLeftShankLinearAccelerationLab[1], arrayLeftShankLinearAccelerationLab[2], Direction)
+            LeftFootLinearAccelerationLab = MarkerArrayBatch(arrayLeftFootLinearAccelerationLab[0], arrayLeftFootLinearAccelerationLab[1], arrayLeftFootLinearAccelerationLab[2], Direction)
+            
+            # Segment angular velocities/accelerations in Lab CS, joint angular velocities in proximal segment CS
+            LeftThighAnglesVelocityLab = MarkerArrayBatch(*arrayLeftThighAnglesVelocityLab)
+            LeftThighAnglesAccelerationLab = MarkerArrayBatch(*arrayLeftThighAnglesAccelerationLab)
+            LeftShankAnglesVelocityLab = MarkerArrayBatch(*arrayLeftShankAnglesVelocityLab)
+            LeftShankAnglesAccelerationLab = MarkerArrayBatch(*arrayLeftShankAnglesAccelerationLab)
+            LeftFootAnglesVelocityLab = MarkerArrayBatch(*arrayLeftFootAnglesVelocityLab)
+            LeftFootAnglesAccelerationLab = MarkerArrayBatch(*arrayLeftFootAnglesAccelerationLab)
+            LeftHipAnglesVelocityPelvis = MarkerArrayBatch(*arrayLeftHipAnglesVelocityPelvis)
+            LeftKneeAnglesVelocityThigh = MarkerArrayBatch(*arrayLeftKneeAnglesVelocityThigh)
+            LeftAnkleAnglesVelocityShank = MarkerArrayBatch(*arrayLeftAnkleAnglesVelocityShank)
+            
+            # Compute centroidal radii of gyration (Convert from mm to meters) and segmental mass moment of inertia
+            LeftThighMassMomentOfInertia = ThighMass * np.square(math.RadiusOfGyration_Batch(LeftHipCenterLab, LeftKneeCenterLab, 0.323, 0.323, 0.187) /1e3)
+            LeftShankMassMomentOfInertia = ShankMass * np.square(math.RadiusOfGyration_Batch(LeftKneeCenterLab, LeftAnkleCenterLab, 0.302, 0.302, 0.087) /1e3)
+            LeftFootMassMomentOfInertia = FootMass * np.square(math.RadiusOfGyration_Batch(LeftAnkleCenterLab, LeftToeMarker, 0.148, 0.475, 0.475) /1e3)
+            
+            ############ Compute Anatomical Coordinate Systems ###################
+            [EPelvisTech, MidASISLab] = gait.TechCS_Pelvis_Newington_Batch(LeftASISMarker, RightASISMarker, SacralMarker)
+            EPelvisAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueEPelvisAnatRelTech, EPelvisTech)
+            LeftEThighTech = gait.TechCS_Thigh_Newington_Batch('Left', LeftHipCenterLab, LeftThighMarker, LeftLateralKneeMarker)
+            LeftEThighAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEThighAnatRelTech, LeftEThighTech)
+            if LeftTibialTriadCheck is True:
+                LeftEShankTech = gait.TechCS_Shank_Newington_Batch('Left', LeftTibialUpperMarker, LeftTibialLowerMarker, LeftTibialMarker)
+            else:
+                LeftEShankTech = gait.TechCS_Shank_Newington_Batch('Left', LeftKneeCenterLab, LeftTibialMarker, LeftLateralAnkleMarker)
+            LeftEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEShankProximalAnatRelTech, LeftEShankTech)
+            LeftEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEShankDistalAnatRelTech, LeftEShankTech)
+            # If Medial ankle is available,then recompute Shank Proximal/Distal Anatomical Coordinate System
+            if LeftMedialAnkleMarkerDropOff == 0:
+                LeftEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington_Batch('Left', LeftKneeCenterLab, LeftLateralKneeMarker, LeftAnkleCenterLab)
+                LeftEShankDistalAnat = gait.AnatCS_Shank_Distal_VCM_Batch('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftLateralAnkleMarker)
+            if self.ShankCoordinateSystem == 'Distal':
+                LeftEShankAnat = LeftEShankDistalAnat
+            if self.ShankCoordinateSystem == 'Proximal':
+                LeftEShankAnat = LeftEShankProximalAnat
+            LeftEFootTech = gait.TechCS_Foot_Newington_Batch('Left', LeftKneeCenterLab, LeftAnkleCenterLab, LeftToeMarker)
+            LeftEFootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEFootAnatRelTech, LeftEFootTech)
+            try:
+                LeftEFootTibAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueLeftEFootAnat2RelTech, LeftEFootTech)
+            except:
+                LeftEFootTibAnat = np.zeros((NumberOfFrames,3,3))
+            ####################################################################################################### 
+            
+            # Inputs of the inverse dynamics, segments and joints ordered distal to proximal
+            KineticsSides.append('Left')
+            KineticsInputs.append([LeftGRF, LeftGRT, LeftCOP,
+                                   LeftFootMassMomentOfInertia, LeftShankMassMomentOfInertia, LeftThighMassMomentOfInertia,
+                                   LeftFootCenterOfMass, LeftShankCenterOfMass, LeftThighCenterOfMass,
+                                   LeftFootLinearAccelerationLab, LeftShankLinearAccelerationLab, LeftThighLinearAccelerationLab,
+                                   LeftAnkleCenterLab, LeftKneeCenterLab, LeftHipCenterLab,
+                                   LeftEFootAnat, LeftEShankAnat, LeftEThighAnat,
+                                   LeftFootAnglesVelocityLab, LeftShankAnglesVelocityLab, LeftThighAnglesVelocityLab,
+                                   LeftFootAnglesAccelerationLab, LeftShankAnglesAccelerationLab, LeftThighAnglesAccelerationLab,
+                                   LeftAnkleAnglesVelocityShank, LeftKneeAnglesVelocityThigh, LeftHipAnglesVelocityPelvis,
+                                   LeftEShankAnat, LeftEThighAnat, EPelvisAnat])
+
         if not RightForcePlate_DeviceID == 0:
             #==================== Smooth Data before Differentiating ======================
-            # Center of Mass
-            arrayHATCenterOfMass = math.Smooth3DArray(arrayHATCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightThighCenterOfMass = math.Smooth3DArray(arrayRightThighCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightShankCenterOfMass = math.Smooth3DArray(arrayRightShankCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightFootCenterOfMass = math.Smooth3DArray(arrayRightFootCenterOfMass, StartFrame, EndFrame, Order, WindowWidth)
-            # Joint Centers
-            arrayRightHipCenter = math.Smooth3DArray(arrayRightHipCenter, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightKneeCenter = math.Smooth3DArray(arrayRightKneeCenter, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightAnkleCenter = math.Smooth3DArray(arrayRightAnkleCenter, StartFrame, EndFrame, Order, WindowWidth)
-            # Right Angles
-            arrayRightTrunkAngles = math.Smooth3DArray(arrayRightTrunkAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightPelvisAngles = math.Smooth3DArray(arrayRightPelvisAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightThighAngles = math.Smooth3DArray(arrayRightThighAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightShankAngles = math.Smooth3DArray(arrayRightShankAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightFootAngles = math.Smooth3DArray(arrayRightFootAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightHipAngles = math.Smooth3DArray(arrayRightHipAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightKneeAngles = math.Smooth3DArray(arrayRightKneeAngles, StartFrame, EndFrame, Order, WindowWidth)
-            arrayRightAnkleAngles = math.Smooth3DArray(arrayRightAnkleAngles, StartFrame, EndFrame, Order, WindowWidth)
+            # Center of Mass, Joint Centers and Right Angles are stacked and smoothed in one pass
+            arraySmoothed = math.SmoothArray([arrayHATCenterOfMass, arrayRightThighCenterOfMass, arrayRightShankCenterOfMass, arrayRightFootCenterOfMass,
+                                              arrayRightHipCenter, arrayRightKneeCenter, arrayRightAnkleCenter,
+                                              arrayRightTrunkAngles, arrayRightPelvisAngles, arrayRightThighAngles, arrayRightShankAngles,
+                                              arrayRightFootAngles, arrayRightHipAngles, arrayRightKneeAngles, arrayRightAnkleAngles],
+                                             StartFrame, EndFrame, Order, WindowWidth)
+            [arrayHATCenterOfMass, arrayRightThighCenterOfMass, arrayRightShankCenterOfMass, arrayRightFootCenterOfMass,
+             arrayRightHipCenter, arrayRightKneeCenter, arrayRightAnkleCenter,
+             arrayRightTrunkAngles, arrayRightPelvisAngles, arrayRightThighAngles, arrayRightShankAngles,
+             arrayRightFootAngles, arrayRightHipAngles, arrayRightKneeAngles, arrayRightAnkleAngles] = arraySmoothed
             
             # ======================== Translation Variables Differentiatition ===============================
             # Center of Mass
@@ -2791,364 +2929,247 @@ class Dynamic_Main():
             [arrayCOPy, Ready, FP_FrameRate] = vicon.GetDeviceChannelGlobal(DeviceID, 3, 2)
             [arrayCOPz, Ready, FP_FrameRate] = vicon.GetDeviceChannelGlobal(DeviceID, 3, 3)
             
-            GRF = np.array([0.,0.,0.]) # Ground Reaction Force
-            GRT = np.array([0.,0.,0.]) # Ground Reaction Torque
-            COP = np.array([0.,0.,0.]) # Center of Pressure
-            RightAnkleForceLab = np.array([0.,0.,0.])
-            RightKneeForceLab = np.array([0.,0.,0.])
-            RightHipForceLab = np.array([0.,0.,0.])
-            RightAnkleMoment_Foot = np.array([0.,0.,0.])
-            RightKneeMoment_Shank = np.array([0.,0.,0.])
-            RightHipMoment_Thigh = np.array([0.,0.,0.])
-            RightAnklePower = np.array([0.,0.,0.])
-            RightKneePower = np.array([0.,0.,0.])
-            RightHipPower = np.array([0.,0.,0.])
-            for FrameNumber in range(StartFrame -1, EndFrame):
-                Sign = 1 # Right Side
-                
-                #Transform marker data if necessary based on direction that the patient is walking
-                RightThighMarker  = np.array([Direction * RightThighMarkerX[FrameNumber], Direction * RightThighMarkerY[FrameNumber], RightThighMarkerZ[FrameNumber]])
-                RightLateralKneeMarker  = np.array([Direction * RightLateralKneeMarkerX[FrameNumber], Direction * RightLateralKneeMarkerY[FrameNumber], RightLateralKneeMarkerZ[FrameNumber]])
-                RightTibialMarker  = np.array([Direction * RightTibialMarkerX[FrameNumber], Direction * RightTibialMarkerY[FrameNumber], RightTibialMarkerZ[FrameNumber]])
-                RightLateralAnkleMarker  = np.array([Direction * RightLateralAnkleMarkerX[FrameNumber], Direction * RightLateralAnkleMarkerY[FrameNumber], RightLateralAnkleMarkerZ[FrameNumber]])
-                RightToeMarker  = np.array([Direction * RightToeMarkerX[FrameNumber], Direction * RightToeMarkerY[FrameNumber], RightToeMarkerZ[FrameNumber]])
-                RightMedialAnkleMarker  = np.array([Direction * RightMedialAnkleMarkerX[FrameNumber], Direction * RightMedialAnkleMarkerY[FrameNumber], RightMedialAnkleMarkerZ[FrameNumber]])
-                RightHeelMarker  = np.array([Direction * RightHeelMarkerX[FrameNumber], Direction * RightHeelMarkerY[FrameNumber], RightHeelMarkerZ[FrameNumber]])
-                if RightTibialTriadCheck is True:
-                    RightTibialUpperMarker  = np.array([Direction * RightTibialUpperMarkerX[FrameNumber], Direction * RightTibialUpperMarkerY[FrameNumber], RightTibialUpperMarkerZ[FrameNumber]])
-                    RightTibialLowerMarker  = np.array([Direction * RightTibialLowerMarkerX[FrameNumber], Direction * RightTibialLowerMarkerY[FrameNumber], RightTibialLowerMarkerZ[FrameNumber]])
-                #Transform joint center data if necessary based on direction that the patient is walking
-                RightHipCenterLab = np.array([Direction * arrayRightHipCenter[0][FrameNumber], Direction * arrayRightHipCenter[1][FrameNumber], arrayRightHipCenter[2][FrameNumber]])
-                RightKneeCenterLab = np.array([Direction * arrayRightKneeCenter[0][FrameNumber], Direction * arrayRightKneeCenter[1][FrameNumber], arrayRightKneeCenter[2][FrameNumber]])
-                RightAnkleCenterLab = np.array([Direction * arrayRightAnkleCenter[0][FrameNumber], Direction * arrayRightAnkleCenter[1][FrameNumber], arrayRightAnkleCenter[2][FrameNumber]])
-                #Transform center of mass data if necessary based on direction that the patient is walking
-                RightThighCenterOfMass = np.array([Direction * arrayRightThighCenterOfMass[0][FrameNumber], Direction * arrayRightThighCenterOfMass[1][FrameNumber], arrayRightThighCenterOfMass[2][FrameNumber]])
-                RightShankCenterOfMass = np.array([Direction * arrayRightShankCenterOfMass[0][FrameNumber], Direction * arrayRightShankCenterOfMass[1][FrameNumber], arrayRightShankCenterOfMass[2][FrameNumber]])
-                RightFootCenterOfMass = np.array([Direction * arrayRightFootCenterOfMass[0][FrameNumber], Direction * arrayRightFootCenterOfMass[1][FrameNumber], arrayRightFootCenterOfMass[2][FrameNumber]])
-                
-                # Compute centroidal radii of gyration (Convert from mm to meters)
-                RightThighRadiusOfGyration = math.RadiusOfGyration(RightHipCenterLab, RightKneeCenterLab, 0.323, 0.323, 0.187) /1e3
-                RightShankRadiusOfGyration = math.RadiusOfGyration(RightKneeCenterLab, RightAnkleCenterLab, 0.302, 0.302, 0.087) /1e3
-                RightFootRadiusOfGyration = math.RadiusOfGyration(RightAnkleCenterLab, RightToeMarker, 0.148, 0.475, 0.475) /1e3
-                
-                # Compute segmental mass moment of inertia
-                RightThighMassMomentOfInertia = ThighMass * np.square(RightThighRadiusOfGyration)
-                RightShankMassMomentOfInertia = ShankMass * np.square(RightShankRadiusOfGyration)
-                RightFootMassMomentOfInertia = FootMass * np.square(RightFootRadiusOfGyration)
-                 
-                
-                FP_FrameNumber = int(FrameNumber * FP_FrameRate / MarkerFrameRate)
-                
-                # Compute Vertical Torque (Mz is dependent on COP location)
-                Tz = arrayMz[FP_FrameNumber] + arrayFx[FP_FrameNumber] * (arrayCOPy[FP_FrameNumber] - FP_Center[1] + FP_Origin[1]) - arrayFy[FP_FrameNumber] * (arrayCOPx[FP_FrameNumber] -FP_Center[0] + FP_Origin[0])
-                
-                # Account for Walking Direction
-                # Compute Reaction force as opposite of force plate output
-                GRF[0] = -Direction * arrayFx[FP_FrameNumber]
-                GRF[1] = -Direction * arrayFy[FP_FrameNumber]
-                GRF[2] = -arrayFz[FP_FrameNumber]
-                GRT[2] = -Tz / 1e3 # Convert from mm to meters
-                
-                # Center of Pressure is already in lab/global coordinate system
-                COP[0] = Direction * arrayCOPx[FP_FrameNumber]
-                COP[1] = Direction * arrayCOPy[FP_FrameNumber]
-                COP[2] = 0
-                
-                
-                ############ Compute Anatomilcal Coordinate Systems ###################
-                [EPelvisTech, MidASISLab] = gait.TechCS_Pelvis_Newington(LeftASISMarker, RightASISMarker, SacralMarker)
-                EPelvisAnat = math.TransformAnatCoorSysFromTechCoors(self.valueEPelvisAnatRelTech, EPelvisTech)
-                RightEThighTech = gait.TechCS_Thigh_Newington('Right', RightHipCenterLab, RightThighMarker, RightLateralKneeMarker)
-                RightEThighAnat = math.TransformAnatCoorSysFromTechCoors(self.valueRightEThighAnatRelTech,RightEThighTech)
-                if RightTibialTriadCheck is True:
-                    RightEShankTech = gait.TechCS_Shank_Newington('Right', RightTibialUpperMarker, RightTibialLowerMarker, RightTibialMarker)
-                else:
-                    RightEShankTech = gait.TechCS_Shank_Newington('Right', RightKneeCenterLab, RightTibialMarker, RightLateralAnkleMarker)
-                RightEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors(self.valueRightEShankProximalAnatRelTech, RightEShankTech)
-                RightEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors(self.valueRightEShankDistalAnatRelTech, RightEShankTech)
-                # If Medial ankle is available,then recompute Shank Proximal/Distal Anatomical Coordinate System
-                if RightMedialAnkleMarkerDropOff == 0:
-                    RightEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington('Right', RightKneeCenterLab, RightLateralKneeMarker, RightAnkleCenterLab)
-                    RightEShankDistalAnat= gait.AnatCS_Shank_Distal_VCM('Right', RightKneeCenterLab, RightAnkleCenterLab, RightLateralAnkleMarker)
-                RightEFootTech = gait.TechCS_Foot_Newington('Right', RightKneeCenterLab, RightAnkleCenterLab, RightToeMarker)
-                RightEFootAnat = math.TransformAnatCoorSysFromTechCoors(self.valueRightEFootAnatRelTech, RightEFootTech)
-                try:
-                    RightEFootTibAnat = math.TransformAnatCoorSysFromTechCoors(self.valueRightEFootAnat2RelTech, RightEFootTech)
-                except:
-                    RightEFootTibAnat = np.matrix([[0. for m in range(3)] for n in range(3)])
-                ####################################################################################################### 
-                
-                
-                # ============================== Ankle ====================================
-                # All Distances are in mm. Account for conversion to meters
-                RightAnkleForceLab[0] = FootMass * Direction * arrayRightFootLinearAccelerationLab[0][FrameNumber] /1e3 - GRF[0]
-                RightAnkleForceLab[1] = FootMass * Direction * arrayRightFootLinearAccelerationLab[1][FrameNumber] /1e3 - GRF[1]
-                RightAnkleForceLab[2] = FootMass * arrayRightFootLinearAccelerationLab[2][FrameNumber] /1e3 - GRF[2] + FootMass * 9.81
+            Sign = 1 # Right Side
+            NumberOfFrames = EndFrame - StartFrame + 1
             
-                    
-                # vector from center of mass to proximal point of load application
-                ProximalVector = RightAnkleCenterLab - RightFootCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = COP - RightFootCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,RightAnkleForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,GRF) / 1e3 # Convert from mm to meters
-                
-                # Tranform to Foot Coordinate System
-                MomentFromProximalForce_Foot = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, RightEFootAnat)
-                MomentfromDistalForce_Foot = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, RightEFootAnat)
-                GRT_Foot = math.TransformVectorIntoMovingCoors(GRT, RightEFootAnat)
-                RightFootAnglesVelocityLab = np.array([arrayRightFootAnglesVelocityLab[0][FrameNumber],arrayRightFootAnglesVelocityLab[1][FrameNumber],arrayRightFootAnglesVelocityLab[2][FrameNumber]])
-                RightFootAnglesAccelerationLab = np.array([arrayRightFootAnglesAccelerationLab[0][FrameNumber],arrayRightFootAnglesAccelerationLab[1][FrameNumber],arrayRightFootAnglesAccelerationLab[2][FrameNumber]])
-                RightAnkleAnglesVelocityShank = np.array([arrayRightAnkleAnglesVelocityShank[0][FrameNumber],arrayRightAnkleAnglesVelocityShank[1][FrameNumber],arrayRightAnkleAnglesVelocityShank[2][FrameNumber]])
-                RightFootAnglesVelocity_Foot = math.TransformVectorIntoMovingCoors(RightFootAnglesVelocityLab, RightEFootAnat) 
-                RightFootAnglesAcceleration_Foot = math.TransformVectorIntoMovingCoors(RightFootAnglesAccelerationLab, RightEFootAnat) 
-                # Joint velocity is in proximal segment CS. Transform to Distal
-                if self.ShankCoordinateSystem == 'Distal':
-                    RightAnkleAnglesVelocityLab = math.TransformVectorIntoLabCoors(RightAnkleAnglesVelocityShank, RightEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    RightAnkleAnglesVelocityLab = math.TransformVectorIntoLabCoors(RightAnkleAnglesVelocityShank, RightEShankProximalAnat)
-                RightAnkleAnglesVelocity_Foot = math.TransformVectorIntoMovingCoors(RightAnkleAnglesVelocityLab, RightEFootAnat)
+            # Force Plate samples of the processed frames
+            FP_FrameNumbers = (np.arange(StartFrame-1, EndFrame) * FP_FrameRate / MarkerFrameRate).astype(int)
+            [Fx, Fy, Fz, Mz, COPx, COPy] = [np.asarray(Channel, dtype=float)[FP_FrameNumbers] for Channel in [arrayFx, arrayFy, arrayFz, arrayMz, arrayCOPx, arrayCOPy]]
+            
+            # Compute Vertical Torque (Mz is dependent on COP location)
+            Tz = Mz + Fx * (COPy - FP_Center[1] + FP_Origin[1]) - Fy * (COPx - FP_Center[0] + FP_Origin[0])
+            
+            # Account for Walking Direction
+            # Compute Reaction force as opposite of force plate output
+            RightGRF = np.column_stack((-Direction * Fx, -Direction * Fy, -Fz)) # Ground Reaction Force
+            RightGRT = np.zeros((NumberOfFrames,3)) # Ground Reaction Torque
+            RightGRT[:,2] = -Tz / 1e3 # Convert from mm to meters
+            # Center of Pressure is already in lab/global coordinate system
+            RightCOP = np.column_stack((Direction * COPx, Direction * COPy, np.zeros(NumberOfFrames))) # Center of Pressure
+            # Center of Pressure w.r.t. Pelvis origin
+            RightCOP_PelvisOrigin = np.column_stack((COPx, COPy)) - np.asarray(arrayPelvisOrigin)[0:2,StartFrame-1:EndFrame].T
+            
+            #Transform marker data if necessary based on direction that the patient is walking
+            SacralMarker = MarkerArrayBatch(SacralMarkerX, SacralMarkerY, SacralMarkerZ, Direction)
+            LeftASISMarker = MarkerArrayBatch(LeftASISMarkerX, LeftASISMarkerY, LeftASISMarkerZ, Direction)
+            RightASISMarker = MarkerArrayBatch(RightASISMarkerX, RightASISMarkerY, RightASISMarkerZ, Direction)
+            RightThighMarker = MarkerArrayBatch(RightThighMarkerX, RightThighMarkerY, RightThighMarkerZ, Direction)
+            RightLateralKneeMarker = MarkerArrayBatch(RightLateralKneeMarkerX, RightLateralKneeMarkerY, RightLateralKneeMarkerZ, Direction)
+            RightTibialMarker = MarkerArrayBatch(RightTibialMarkerX, RightTibialMarkerY, RightTibialMarkerZ, Direction)
+            RightLateralAnkleMarker = MarkerArrayBatch(RightLateralAnkleMarkerX, RightLateralAnkleMarkerY, RightLateralAnkleMarkerZ, Direction)
+            RightToeMarker = MarkerArrayBatch(RightToeMarkerX, RightToeMarkerY, RightToeMarkerZ, Direction)
+            if RightTibialTriadCheck is True:
+                RightTibialUpperMarker = MarkerArrayBatch(RightTibialUpperMarkerX, RightTibialUpperMarkerY, RightTibialUpperMarkerZ, Direction)
+                RightTibialLowerMarker = MarkerArrayBatch(RightTibialLowerMarkerX, RightTibialLowerMarkerY, RightTibialLowerMarkerZ, Direction)
+            #Transform joint center data if necessary based on direction that the patient is walking
+            RightHipCenterLab = MarkerArrayBatch(arrayRightHipCenter[0], arrayRightHipCenter[1], arrayRightHipCenter[2], Direction)
+            RightKneeCenterLab = MarkerArrayBatch(arrayRightKneeCenter[0], arrayRightKneeCenter[1], arrayRightKneeCenter[2], Direction)
+            RightAnkleCenterLab = MarkerArrayBatch(arrayRightAnkleCenter[0], arrayRightAnkleCenter[1], arrayRightAnkleCenter[2], Direction)
+            #Transform center of mass data if necessary based on direction that the patient is walking
+            RightThighCenterOfMass = MarkerArrayBatch(arrayRightThighCenterOfMass[0], arrayRightThighCenterOfMass[1], arrayRightThighCenterOfMass[2], Direction)
+            RightShankCenterOfMass = MarkerArrayBatch(arrayRightShankCenterOfMass[0], arrayRightShankCenterOfMass[1], arrayRightShankCenterOfMass[2], Direction)
+            RightFootCenterOfMass = MarkerArrayBatch(arrayRightFootCenterOfMass[0], arrayRightFootCenterOfMass[1], arrayRightFootCenterOfMass[2], Direction)
+            RightThighLinearAccelerationLab = MarkerArrayBatch(arrayRightThighLinearAccelerationLab[0], arrayRightThighLinearAccelerationLab[1], arrayRightThighLinearAccelerationLab[2], Direction)
+            RightShankLinearAccelerationLab = MarkerArrayBatch(arrayRightShankLinearAccelerationLab[0], arrayRightShankLinearAccelerationLab[1], arrayRightShankLinearAccelerationLab[2], Direction)
+            RightFootLinearAccelerationLab = MarkerArrayBatch(arrayRightFootLinearAccelerationLab[0], arrayRightFootLinearAccelerationLab[1], arrayRightFootLinearAccelerationLab[2], Direction)
+            
+            # Segment angular velocities/accelerations in Lab CS, joint angular velocities in proximal segment CS
+            RightThighAnglesVelocityLab = MarkerArrayBatch(*arrayRightThighAnglesVelocityLab)
+            RightThighAnglesAccelerationLab = MarkerArrayBatch(*arrayRightThighAnglesAccelerationLab)
+            RightShankAnglesVelocityLab = MarkerArrayBatch(*arrayRightShankAnglesVelocityLab)
+            RightShankAnglesAccelerationLab = MarkerArrayBatch(*arrayRightShankAnglesAccelerationLab)
+            RightFootAnglesVelocityLab = MarkerArrayBatch(*arrayRightFootAnglesVelocityLab)
+            RightFootAnglesAccelerationLab = MarkerArrayBatch(*arrayRightFootAnglesAccelerationLab)
+            RightHipAnglesVelocityPelvis = MarkerArrayBatch(*arrayRightHipAnglesVelocityPelvis)
+            RightKneeAnglesVelocityThigh = MarkerArrayBatch(*arrayRightKneeAnglesVelocityThigh)
+            RightAnkleAnglesVelocityShank = MarkerArrayBatch(*arrayRightAnkleAnglesVelocityShank)
+            
+            # Compute centroidal radii of gyration (Convert from mm to meters) and segmental mass moment of inertia
+            RightThighMassMomentOfInertia = ThighMass * np.square(math.RadiusOfGyration_Batch(RightHipCenterLab, RightKneeCenterLab, 0.323, 0.323, 0.187) /1e3)
+            RightShankMassMomentOfInertia = ShankMass * np.square(math.RadiusOfGyration_Batch(RightKneeCenterLab, RightAnkleCenterLab, 0.302, 0.302, 0.087) /1e3)
+            RightFootMassMomentOfInertia = FootMass * np.square(math.RadiusOfGyration_Batch(RightAnkleCenterLab, RightToeMarker, 0.148, 0.475, 0.475) /1e3)
+            
+            ############ Compute Anatomical Coordinate Systems ###################
+            [EPelvisTech, MidASISLab] = gait.TechCS_Pelvis_Newington_Batch(LeftASISMarker, RightASISMarker, SacralMarker)
+            EPelvisAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueEPelvisAnatRelTech, EPelvisTech)
+            RightEThighTech = gait.TechCS_Thigh_Newington_Batch('Right', RightHipCenterLab, RightThighMarker, RightLateralKneeMarker)
+            RightEThighAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEThighAnatRelTech, RightEThighTech)
+            if RightTibialTriadCheck is True:
+                RightEShankTech = gait.TechCS_Shank_Newington_Batch('Right', RightTibialUpperMarker, RightTibialLowerMarker, RightTibialMarker)
+            else:
+                RightEShankTech = gait.TechCS_Shank_Newington_Batch('Right', RightKneeCenterLab, RightTibialMarker, RightLateralAnkleMarker)
+            RightEShankProximalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEShankProximalAnatRelTech, RightEShankTech)
+            RightEShankDistalAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEShankDistalAnatRelTech, RightEShankTech)
+            # If Medial ankle is available,then recompute Shank Proximal/Distal Anatomical Coordinate System
+            if RightMedialAnkleMarkerDropOff == 0:
+                RightEShankProximalAnat = gait.AnatCS_Shank_Proximal_Newington_Batch('Right', RightKneeCenterLab, RightLateralKneeMarker, RightAnkleCenterLab)
+                RightEShankDistalAnat = gait.AnatCS_Shank_Distal_VCM_Batch('Right', RightKneeCenterLab, RightAnkleCenterLab, RightLateralAnkleMarker)
+            if self.ShankCoordinateSystem == 'Distal':
+                RightEShankAnat = RightEShankDistalAnat
+            if self.ShankCoordinateSystem == 'Proximal':
+                RightEShankAnat = RightEShankProximalAnat
+            RightEFootTech = gait.TechCS_Foot_Newington_Batch('Right', RightKneeCenterLab, RightAnkleCenterLab, RightToeMarker)
+            RightEFootAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEFootAnatRelTech, RightEFootTech)
+            try:
+                RightEFootTibAnat = math.TransformAnatCoorSysFromTechCoors_Batch(self.valueRightEFootAnat2RelTech, RightEFootTech)
+            except:
+                RightEFootTibAnat = np.zeros((NumberOfFrames,3,3))
+            ####################################################################################################### 
+            
+            # Inputs of the inverse dynamics, segments and joints ordered distal to proximal
+            KineticsSides.append('Right')
+            KineticsInputs.append([RightGRF, RightGRT, RightCOP,
+                                   RightFootMassMomentOfInertia, RightShankMassMomentOfInertia, RightThighMassMomentOfInertia,
+                                   RightFootCenterOfMass, RightShankCenterOfMass, RightThighCenterOfMass,
+                                   RightFootLinearAccelerationLab, RightShankLinearAccelerationLab, RightThighLinearAccelerationLab,
+                                   RightAnkleCenterLab, RightKneeCenterLab, RightHipCenterLab,
+                                   RightEFootAnat, RightEShankAnat, RightEThighAnat,
+                                   RightFootAnglesVelocityLab, RightShankAnglesVelocityLab, RightThighAnglesVelocityLab,
+                                   RightFootAnglesAccelerationLab, RightShankAnglesAccelerationLab, RightThighAnglesAccelerationLab,
+                                   RightAnkleAnglesVelocityShank, RightKneeAnglesVelocityThigh, RightHipAnglesVelocityPelvis,
+                                   RightEShankAnat, RightEThighAnat, EPelvisAnat])
 
-                
-                RightAnkleMoment_Foot[0] = RightFootMassMomentOfInertia[0] * RightFootAnglesAcceleration_Foot[0] + \
-                                        (RightFootMassMomentOfInertia[2] - RightFootMassMomentOfInertia[1]) * RightFootAnglesVelocity_Foot[1] * RightFootAnglesVelocity_Foot[2] \
-                                            - MomentFromProximalForce_Foot[0] - MomentfromDistalForce_Foot[0] - GRT_Foot[0]
-                RightAnkleMoment_Foot[1] = RightFootMassMomentOfInertia[1] * RightFootAnglesAcceleration_Foot[1] + \
-                                        (RightFootMassMomentOfInertia[0] - RightFootMassMomentOfInertia[2]) * RightFootAnglesVelocity_Foot[2] * RightFootAnglesVelocity_Foot[0] \
-                                            - MomentFromProximalForce_Foot[1] - MomentfromDistalForce_Foot[1] - GRT_Foot[1]
-                RightAnkleMoment_Foot[2] = RightFootMassMomentOfInertia[2] * RightFootAnglesAcceleration_Foot[2] + \
-                                        (RightFootMassMomentOfInertia[1] - RightFootMassMomentOfInertia[0]) * RightFootAnglesVelocity_Foot[0] * RightFootAnglesVelocity_Foot[1] \
-                                            - MomentFromProximalForce_Foot[2] - MomentfromDistalForce_Foot[2] - GRT_Foot[2]
-                
-                # Transform Ankle Moment to Lab coordinate system
-                RightAnkleMomentLab = math.TransformVectorIntoLabCoors(RightAnkleMoment_Foot,RightEFootAnat)
-                
-                RightAnklePower[0] = RightAnkleMoment_Foot[0] * RightAnkleAnglesVelocity_Foot[0]
-                RightAnklePower[1] = RightAnkleMoment_Foot[1] * RightAnkleAnglesVelocity_Foot[1]
-                RightAnklePower[2] = RightAnkleMoment_Foot[2] * RightAnkleAnglesVelocity_Foot[2]
-                
-                RightAnklePowerTotal = np.dot(RightAnkleMoment_Foot, RightAnkleAnglesVelocity_Foot)
-                
-                # Normalize and Store in array
-                # Apply sign convention based on right versus Right side & plotting convention
-                # Internal Moments that are Extensor, Abductor, External Rotator are positive
-                arrayRightAnkleMoment[0][FrameNumber] =  -Sign * RightAnkleMoment_Foot[0] /float(self.valueBodyMass) 
-                arrayRightAnkleMoment[1][FrameNumber] =  RightAnkleMoment_Foot[1] /float(self.valueBodyMass)
-                arrayRightAnkleMoment[2][FrameNumber] =  -Sign * RightAnkleMoment_Foot[2] /float(self.valueBodyMass)
-                
-                arrayRightAnklePower[0][FrameNumber] =  RightAnklePower[0] /float(self.valueBodyMass)
-                arrayRightAnklePower[1][FrameNumber] =  RightAnklePower[1] /float(self.valueBodyMass)
-                arrayRightAnklePower[2][FrameNumber] =  RightAnklePower[2] /float(self.valueBodyMass)
-                
-                arrayRightAnklePowerTotal[0][FrameNumber] =  0 
-                arrayRightAnklePowerTotal[1][FrameNumber] =  0 
-                arrayRightAnklePowerTotal[2][FrameNumber] =  RightAnklePowerTotal /float(self.valueBodyMass)
-                
-                # Transform Ankle Force into Foot CS
-                RightAnkleForceFoot = math.TransformVectorIntoMovingCoors(RightAnkleForceLab, RightEFootTibAnat)
-                arrayRightAnkleJRF[0][FrameNumber] = RightAnkleForceFoot[0] / float(self.valueBodyMass)
-                arrayRightAnkleJRF[1][FrameNumber] = Sign * RightAnkleForceFoot[1] / float(self.valueBodyMass)
-                arrayRightAnkleJRF[2][FrameNumber] = RightAnkleForceFoot[2] / float(self.valueBodyMass)
-                
-                # ============================== Knee ====================================
-                # Reverse sign of force and moment from Distal Segment
-                RightAnkleForceLab = - RightAnkleForceLab
-                RightAnkleMomentLab = - RightAnkleMomentLab
-                
-                # All Distances are in mm. Account for conversion to meters
-                RightKneeForceLab[0] = ShankMass * Direction * arrayRightShankLinearAccelerationLab[0][FrameNumber] /1e3 - RightAnkleForceLab[0]
-                RightKneeForceLab[1] = ShankMass * Direction * arrayRightShankLinearAccelerationLab[1][FrameNumber] /1e3 - RightAnkleForceLab[1]
-                RightKneeForceLab[2] = ShankMass * arrayRightShankLinearAccelerationLab[2][FrameNumber] /1e3 - RightAnkleForceLab[2] + FootMass * 9.81
-                
+        # =============================================================================
+        #         Inverse Dynamics: all frames of both sides in one call
+        # =============================================================================
+        if len(KineticsSides) > 0:
+            # Stack the inputs of the sides on a leading axis: (Sides, Frames, 3)
+            KineticsInputs = [np.stack(SideInputs) for SideInputs in zip(*KineticsInputs)]
+            # As in the frame by frame equations, the weight of the foot is applied to every segment
+            SegmentWeights = [FootMass * 9.81, FootMass * 9.81, FootMass * 9.81]
+            [JointForcesLab, JointMoments, JointPowers, JointPowersTotal] = math.InverseDynamics_Batch(KineticsInputs[0], KineticsInputs[1], KineticsInputs[2],
+                                                                                                        [FootMass, ShankMass, ThighMass], SegmentWeights,
+                                                                                                        KineticsInputs[3:6], KineticsInputs[6:9], KineticsInputs[9:12],
+                                                                                                        KineticsInputs[12:15], KineticsInputs[15:18], KineticsInputs[18:21],
+                                                                                                        KineticsInputs[21:24], KineticsInputs[24:27], KineticsInputs[27:30])
+        
 
-                # vector from center of mass to proximal point of load application
-                ProximalVector = RightKneeCenterLab - RightShankCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = RightAnkleCenterLab - RightShankCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,RightKneeForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,RightAnkleForceLab) / 1e3 # Convert from mm to meters
-                
-                # Tranform to Shank Coordinate System
-                if self.ShankCoordinateSystem == 'Distal':
-                    MomentFromProximalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, RightEShankDistalAnat)
-                    MomentfromDistalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, RightEShankDistalAnat)
-                    RightAnkleMoment_Shank = math.TransformVectorIntoMovingCoors(RightAnkleMomentLab, RightEShankDistalAnat)
-                    RightShankAnglesVelocityLab = np.array([arrayRightShankAnglesVelocityLab[0][FrameNumber],arrayRightShankAnglesVelocityLab[1][FrameNumber],arrayRightShankAnglesVelocityLab[2][FrameNumber]])
-                    RightShankAnglesAccelerationLab = np.array([arrayRightShankAnglesAccelerationLab[0][FrameNumber],arrayRightShankAnglesAccelerationLab[1][FrameNumber],arrayRightShankAnglesAccelerationLab[2][FrameNumber]])
-                    RightKneeAnglesVelocityThigh = np.array([arrayRightKneeAnglesVelocityThigh[0][FrameNumber],arrayRightKneeAnglesVelocityThigh[1][FrameNumber],arrayRightKneeAnglesVelocityThigh[2][FrameNumber]])
-                    RightShankAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(RightShankAnglesVelocityLab, RightEShankDistalAnat) 
-                    RightShankAnglesAcceleration_Shank = math.TransformVectorIntoMovingCoors(RightShankAnglesAccelerationLab, RightEShankDistalAnat) 
-                    # Joint velocity is in proximal segment CS. Transform to Distal
-                    RightKneeAnglesVelocityLab = math.TransformVectorIntoLabCoors(RightKneeAnglesVelocityThigh, RightEThighAnat)
-                    RightKneeAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(RightKneeAnglesVelocityLab, RightEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    MomentFromProximalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, RightEShankProximalAnat)
-                    MomentfromDistalForce_Shank = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, RightEShankProximalAnat)
-                    RightAnkleMoment_Shank = math.TransformVectorIntoMovingCoors(RightAnkleMomentLab, RightEShankProximalAnat)
-                    RightShankAnglesVelocityLab = np.array([arrayRightShankAnglesVelocityLab[0][FrameNumber],arrayRightShankAnglesVelocityLab[1][FrameNumber],arrayRightShankAnglesVelocityLab[2][FrameNumber]])
-                    RightShankAnglesAccelerationLab = np.array([arrayRightShankAnglesAccelerationLab[0][FrameNumber],arrayRightShankAnglesAccelerationLab[1][FrameNumber],arrayRightShankAnglesAccelerationLab[2][FrameNumber]])
-                    RightKneeAnglesVelocityThigh = np.array([arrayRightKneeAnglesVelocityThigh[0][FrameNumber],arrayRightKneeAnglesVelocityThigh[1][FrameNumber],arrayRightKneeAnglesVelocityThigh[2][FrameNumber]])
-                    RightShankAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(RightShankAnglesVelocityLab, RightEShankProximalAnat) 
-                    RightShankAnglesAcceleration_Shank = math.TransformVectorIntoMovingCoors(RightShankAnglesAccelerationLab, RightEShankProximalAnat) 
-                    # Joint velocity is in proximal segment CS. Transform to Distal
-                    RightKneeAnglesVelocityLab = math.TransformVectorIntoLabCoors(RightKneeAnglesVelocityThigh, RightEThighAnat)
-                    RightKneeAnglesVelocity_Shank = math.TransformVectorIntoMovingCoors(RightKneeAnglesVelocityLab, RightEShankProximalAnat)
-                
-                RightKneeMoment_Shank[0] = RightShankMassMomentOfInertia[0] * RightShankAnglesAcceleration_Shank[0] + \
-                                        (RightShankMassMomentOfInertia[2] - RightShankMassMomentOfInertia[1]) * RightShankAnglesVelocity_Shank[1] * RightShankAnglesVelocity_Shank[2] \
-                                            - MomentFromProximalForce_Shank[0] - MomentfromDistalForce_Shank[0] - RightAnkleMoment_Shank[0]
-                RightKneeMoment_Shank[1] = RightShankMassMomentOfInertia[1] * RightShankAnglesAcceleration_Shank[1] + \
-                                        (RightShankMassMomentOfInertia[0] - RightShankMassMomentOfInertia[2]) * RightShankAnglesVelocity_Shank[2] * RightShankAnglesVelocity_Shank[0] \
-                                            - MomentFromProximalForce_Shank[1] - MomentfromDistalForce_Shank[1] - RightAnkleMoment_Shank[1]
-                RightKneeMoment_Shank[2] = RightShankMassMomentOfInertia[2] * RightShankAnglesAcceleration_Shank[2] + \
-                                        (RightShankMassMomentOfInertia[1] - RightShankMassMomentOfInertia[0]) * RightShankAnglesVelocity_Shank[0] * RightShankAnglesVelocity_Shank[1] \
-                                            - MomentFromProximalForce_Shank[2] - MomentfromDistalForce_Shank[2] - RightAnkleMoment_Shank[2]
-
-                # Transform Knee Moment to Lab coordinate system
-                if self.ShankCoordinateSystem == 'Distal':
-                    RightKneeMomentLab = math.TransformVectorIntoLabCoors(RightKneeMoment_Shank,RightEShankDistalAnat)
-                if self.ShankCoordinateSystem == 'Proximal':
-                    RightKneeMomentLab = math.TransformVectorIntoLabCoors(RightKneeMoment_Shank,RightEShankProximalAnat)
-                    
-                RightKneePower[0] = RightKneeMoment_Shank[0] * RightKneeAnglesVelocity_Shank[0]
-                RightKneePower[1] = RightKneeMoment_Shank[1] * RightKneeAnglesVelocity_Shank[1]
-                RightKneePower[2] = RightKneeMoment_Shank[2] * RightKneeAnglesVelocity_Shank[2]
-                
-                RightKneePowerTotal = np.dot(RightKneeMoment_Shank, RightKneeAnglesVelocity_Shank)
-                
-                # Normalize and Store in array
-                arrayRightKneeMoment[0][FrameNumber] =  -Sign * RightKneeMoment_Shank[0] /float(self.valueBodyMass)
-                arrayRightKneeMoment[1][FrameNumber] =  -RightKneeMoment_Shank[1] /float(self.valueBodyMass)
-                arrayRightKneeMoment[2][FrameNumber] =  -Sign * RightKneeMoment_Shank[2] /float(self.valueBodyMass)
-                
-                arrayRightKneePower[0][FrameNumber] =  RightKneePower[0] /float(self.valueBodyMass)
-                arrayRightKneePower[1][FrameNumber] =  RightKneePower[1] /float(self.valueBodyMass)
-                arrayRightKneePower[2][FrameNumber] =  RightKneePower[2] /float(self.valueBodyMass)
-                
-                arrayRightKneePowerTotal[0][FrameNumber] =  0 
-                arrayRightKneePowerTotal[1][FrameNumber] =  0 
-                arrayRightKneePowerTotal[2][FrameNumber] =  RightKneePowerTotal /float(self.valueBodyMass)
-                
-                # Transform Knee Force into Proximal Tibia CS
-                RightKneeForceTib = math.TransformVectorIntoMovingCoors(RightKneeForceLab, RightEShankProximalAnat)
-                arrayRightKneeJRF[0][FrameNumber] = RightKneeForceTib[0] / float(self.valueBodyMass)
-                arrayRightKneeJRF[1][FrameNumber] = Sign * RightKneeForceTib[1] / float(self.valueBodyMass)
-                arrayRightKneeJRF[2][FrameNumber] = RightKneeForceTib[2] / float(self.valueBodyMass)
-
-                # ============================== Hip ====================================
-                # Reverse sign of force and moment from Distal Segment
-                RightKneeForceLab = - RightKneeForceLab
-                RightKneeMomentLab = - RightKneeMomentLab
-                
-                # All Distances are in mm. Account for conversion to meters
-                RightHipForceLab[0] = ThighMass * Direction * arrayRightThighLinearAccelerationLab[0][FrameNumber] /1e3 - RightKneeForceLab[0]
-                RightHipForceLab[1] = ThighMass * Direction * arrayRightThighLinearAccelerationLab[1][FrameNumber] /1e3 - RightKneeForceLab[1]
-                RightHipForceLab[2] = ThighMass * arrayRightThighLinearAccelerationLab[2][FrameNumber] /1e3 - RightKneeForceLab[2] + FootMass * 9.81
-                
+        if not LeftForcePlate_DeviceID == 0:
+            Sign = -1 # Left Side
+            BodyMass = float(self.valueBodyMass)
+            SideIndex = KineticsSides.index('Left')
+            [LeftAnkleForceLab, LeftKneeForceLab, LeftHipForceLab] = [JointForceLab[SideIndex] for JointForceLab in JointForcesLab]
+            [LeftAnkleMoment_Foot, LeftKneeMoment_Shank, LeftHipMoment_Thigh] = [JointMoment[SideIndex] for JointMoment in JointMoments]
+            [LeftAnklePower, LeftKneePower, LeftHipPower] = [JointPower[SideIndex] for JointPower in JointPowers]
+            [LeftAnklePowerTotal, LeftKneePowerTotal, LeftHipPowerTotal] = [JointPowerTotal[SideIndex] for JointPowerTotal in JointPowersTotal]
+            
+            # Normalize and Store in array
+            # Apply sign convention based on right versus left side & plotting convention
+            # Internal Moments that are Extensor, Abductor, External Rotator are positive
+            LeftAnkleMomentNormalized = np.array([-Sign, 1, -Sign]) * LeftAnkleMoment_Foot / BodyMass
+            LeftKneeMomentNormalized = np.array([-Sign, -1, -Sign]) * LeftKneeMoment_Shank / BodyMass
+            LeftHipMomentNormalized = np.array([-Sign, 1, -Sign]) * LeftHipMoment_Thigh / BodyMass
+            StoreArrayBatch(arrayLeftAnkleMoment, LeftAnkleMomentNormalized)
+            StoreArrayBatch(arrayLeftKneeMoment, LeftKneeMomentNormalized)
+            StoreArrayBatch(arrayLeftHipMoment, LeftHipMomentNormalized)
+            StoreArrayBatch(arrayLeftAnklePower, LeftAnklePower / BodyMass)
+            StoreArrayBatch(arrayLeftKneePower, LeftKneePower / BodyMass)
+            StoreArrayBatch(arrayLeftHipPower, LeftHipPower / BodyMass)
+            StoreArrayBatch(arrayLeftAnklePowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), LeftAnklePowerTotal / BodyMass)))
+            StoreArrayBatch(arrayLeftKneePowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), LeftKneePowerTotal / BodyMass)))
+            StoreArrayBatch(arrayLeftHipPowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), LeftHipPowerTotal / BodyMass)))
+            
+            # Transform Ankle Force into Foot CS: X=AP, Y=ML, Z=SI (Do Not Re-arrange these)
+            LeftAnkleForceFoot = math.TransformVectorIntoMovingCoors_Batch(LeftAnkleForceLab, LeftEFootTibAnat)
+            StoreArrayBatch(arrayLeftAnkleJRF, np.array([1, Sign, 1]) * LeftAnkleForceFoot / BodyMass)
+            # Transform Knee Force into Proximal Tibia CS
+            LeftKneeForceTib = math.TransformVectorIntoMovingCoors_Batch(LeftKneeForceLab, LeftEShankProximalAnat)
+            StoreArrayBatch(arrayLeftKneeJRF, np.array([1, Sign, 1]) * LeftKneeForceTib / BodyMass)
+            # Transform Hip Force into Thigh CS
+            LeftHipForceThigh = math.TransformVectorIntoMovingCoors_Batch(LeftHipForceLab, LeftEThighAnat)
+            StoreArrayBatch(arrayLeftHipJRF, np.array([1, Sign, 1]) * LeftHipForceThigh / BodyMass)
+            
+            # Correct for Lab CS, account for side for ML, and scale to BW
+            StoreArrayBatch(arrayLeftGRF, np.array([1, Sign, 1]) * math.TransformVectorIntoMovingCoors_Batch(LeftGRF, ELab) / BodyMass)
+            
+            # Center of Pressure w.r.t. Pelvis, corrected for Lab CS
+            LeftGRM = np.column_stack((LeftCOP_PelvisOrigin, Sign * LeftGRT[:,2] / BodyMass))
+            COP_Pelvis = math.TransformVectorIntoMovingCoors_Batch(LeftGRM, ELab)
+            # Write back to GRM, account for walk direction and side for ML, and scale to % leg length
+            LeftGRM[:,0] = 100 * Direction * COP_Pelvis[:,0] / self.valueLeftLegLength
+            LeftGRM[:,1] = 100 * Direction * Sign * COP_Pelvis[:,1] / self.valueLeftLegLength
+            StoreArrayBatch(arrayLeftGRM, LeftGRM)
+            
+            # Add Moment and Power Sums
+            # Index 0 is sum of sagittal plane moment, Index 1 is sum of sagittal power, Index3 is sum of total power
+            StoreArrayBatch(arrayLeftMPSum, np.column_stack((LeftHipMomentNormalized[:,0] + LeftKneeMomentNormalized[:,0] + LeftAnkleMomentNormalized[:,0],
+                                                             (LeftHipPower[:,0] + LeftKneePower[:,0] + LeftAnklePower[:,0]) / BodyMass,
+                                                             (LeftHipPowerTotal + LeftKneePowerTotal + LeftAnklePowerTotal) / BodyMass)))
+            
+            # Add Foot CoP, compute components first and foot length
+            AnkleCOP = LeftCOP - LeftAnkleCenterLab
+            AnkleCOP[:,2] = 0
+            AnkleCOP_Foot = math.TransformVectorIntoMovingCoors_Batch(AnkleCOP, LeftEFootAnat)
+            FL = np.linalg.norm(LeftToeMarker - LeftAnkleCenterLab, axis=1)
+            # Normalize
+            AnkleCOP_Foot_Normalized = 100 * AnkleCOP_Foot / FL[:,np.newaxis]
+            # Account for foot progression angle and account for walk direction and M/L
+            StoreArrayBatch(arrayLeftFootCoP, np.array([1, 1, 0]) * AnkleCOP_Foot_Normalized)
+        
 
-                # vector from center of mass to proximal point of load application
-                ProximalVector = RightHipCenterLab - RightThighCenterOfMass
-                # vector from center of mass to distal point of load application
-                DistalVector = RightKneeCenterLab - RightThighCenterOfMass 
-                
-                MomentFromProximalForce = np.cross(ProximalVector,RightHipForceLab) / 1e3 # Convert from mm to meters
-                MomentFromDistalForce = np.cross(DistalVector,RightKneeForceLab) / 1e3 # Convert from mm to meters
-                
-                # Transform to Thigh Coordinate System
-                MomentFromProximalForce_Thigh = math.TransformVectorIntoMovingCoors(MomentFromProximalForce, RightEThighAnat)
-                MomentfromDistalForce_Thigh = math.TransformVectorIntoMovingCoors(MomentFromDistalForce, RightEThighAnat)
-                RightKneeMoment_Thigh = math.TransformVectorIntoMovingCoors(RightKneeMomentLab, RightEThighAnat)
-                RightThighAnglesVelocityLab = np.array([arrayRightThighAnglesVelocityLab[0][FrameNumber],arrayRightThighAnglesVelocityLab[1][FrameNumber],arrayRightThighAnglesVelocityLab[2][FrameNumber]])
-                RightThighAnglesAccelerationLab = np.array([arrayRightThighAnglesAccelerationLab[0][FrameNumber],arrayRightThighAnglesAccelerationLab[1][FrameNumber],arrayRightThighAnglesAccelerationLab[2][FrameNumber]])
-                RightHipAnglesVelocityPelvis = np.array([arrayRightHipAnglesVelocityPelvis[0][FrameNumber],arrayRightHipAnglesVelocityPelvis[1][FrameNumber],arrayRightHipAnglesVelocityPelvis[2][FrameNumber]])
-                RightThighAnglesVelocity_Thigh = math.TransformVectorIntoMovingCoors(RightThighAnglesVelocityLab, RightEThighAnat) 
-                RightThighAnglesAcceleration_Thigh = math.TransformVectorIntoMovingCoors(RightThighAnglesAccelerationLab, RightEThighAnat) 
-                # Joint velocity is in proximal segment CS. Transform to Distal
-                RightHipAnglesVelocityLab = math.TransformVectorIntoLabCoors(RightHipAnglesVelocityPelvis, EPelvisAnat)
-                RightHipAnglesVelocity_Thigh = math.TransformVectorIntoMovingCoors(RightHipAnglesVelocityLab, RightEThighAnat)
-                
-                RightHipMoment_Thigh[0] = RightThighMassMomentOfInertia[0] * RightThighAnglesAcceleration_Thigh[0] + \
-                                        (RightThighMassMomentOfInertia[2] - RightThighMassMomentOfInertia[1]) * RightThighAnglesVelocity_Thigh[1] * RightThighAnglesVelocity_Thigh[2] \
-                                            - MomentFromProximalForce_Thigh[0] - MomentfromDistalForce_Thigh[0] - RightKneeMoment_Thigh[0]
-                RightHipMoment_Thigh[1] = RightThighMassMomentOfInertia[1] * RightThighAnglesAcceleration_Thigh[1] + \
-                                        (RightThighMassMomentOfInertia[0] - RightThighMassMomentOfInertia[2]) * RightThighAnglesVelocity_Thigh[2] * RightThighAnglesVelocity_Thigh[0] \
-                                            - MomentFromProximalForce_Thigh[1] - MomentfromDistalForce_Thigh[1] - RightKneeMoment_Thigh[1]
-                RightHipMoment_Thigh[2] = RightThighMassMomentOfInertia[2] * RightThighAnglesAcceleration_Thigh[2] + \
-                                        (RightThighMassMomentOfInertia[1] - RightThighMassMomentOfInertia[0]) * RightThighAnglesVelocity_Thigh[0] * RightThighAnglesVelocity_Thigh[1] \
-                                            - MomentFromProximalForce_Thigh[2] - MomentfromDistalForce_Thigh[2] - RightKneeMoment_Thigh[2]
-
-                # Transform Hip Moment to Lab coordinate system
-                RightHipMomentLab = math.TransformVectorIntoLabCoors(RightHipMoment_Thigh,RightEThighAnat)
-                
-                RightHipPower[0] = RightHipMoment_Thigh[0] * RightHipAnglesVelocity_Thigh[0]
-                RightHipPower[1] = RightHipMoment_Thigh[1] * RightHipAnglesVelocity_Thigh[1]
-                RightHipPower[2] = RightHipMoment_Thigh[2] * RightHipAnglesVelocity_Thigh[2]
-                
-                RightHipPowerTotal = np.dot(RightHipMoment_Thigh, RightHipAnglesVelocity_Thigh)
-                
-                # Normalize and Store in array
-                arrayRightHipMoment[0][FrameNumber] =  -Sign * RightHipMoment_Thigh[0] /float(self.valueBodyMass)
-                arrayRightHipMoment[1][FrameNumber] =  RightHipMoment_Thigh[1] /float(self.valueBodyMass)
-                arrayRightHipMoment[2][FrameNumber] =  -Sign * RightHipMoment_Thigh[2] /float(self.valueBodyMass)
-                
-                arrayRightHipPower[0][FrameNumber] =  RightHipPower[0] /float(self.valueBodyMass)
-                arrayRightHipPower[1][FrameNumber] =  RightHipPower[1] /float(self.valueBodyMass)
-                arrayRightHipPower[2][FrameNumber] =  RightHipPower[2] /float(self.valueBodyMass)
-                
-                arrayRightHipPowerTotal[0][FrameNumber] =  0 
-                arrayRightHipPowerTotal[1][FrameNumber] =  0 
-                arrayRightHipPowerTotal[2][FrameNumber] =  RightHipPowerTotal /float(self.valueBodyMass)
-                
-                # Transform Hip Force into Thigh CS
-                RightHipForceThigh = math.TransformVectorIntoMovingCoors(RightHipForceLab, RightEThighAnat)
-                arrayRightHipJRF[0][FrameNumber] = RightHipForceThigh[0] / float(self.valueBodyMass)
-                arrayRightHipJRF[1][FrameNumber] = Sign * RightHipForceThigh[1] / float(self.valueBodyMass)
-                arrayRightHipJRF[2][FrameNumber] = RightHipForceThigh[2] / float(self.valueBodyMass)
-                
-                # Add Ground Reaction Forces and Moments: Flip X and Y if walking in -X
-                # Correct for Lab CS
-                GRF = math.TransformVectorIntoMovingCoors(GRF, ELab)
-                # Account for side for ML and scale to BW
-                arrayRightGRF[0][FrameNumber] = GRF[0] / float(self.valueBodyMass)
-                arrayRightGRF[1][FrameNumber] = Sign * GRF[1] / float(self.valueBodyMass)
-                arrayRightGRF[2][FrameNumber] = GRF[2] / float(self.valueBodyMass)
-				
-                # Add Center of Pressure w.r.t. PELO
-                arrayRightGRM[0][FrameNumber] = arrayCOPx[FP_FrameNumber] - arrayPelvisOrigin[0][FrameNumber]
-                arrayRightGRM[1][FrameNumber] = arrayCOPy[FP_FrameNumber] - arrayPelvisOrigin[1][FrameNumber]
-                arrayRightGRM[2][FrameNumber] = Sign * GRT[2] / float(self.valueBodyMass)
-                
-                # Store in array of one frame
-                COP_Pelvis = np.array([arrayRightGRM[0][FrameNumber], arrayRightGRM[1][FrameNumber], arrayRightGRM[2][FrameNumber]])
-                # Correct for Lab CS
-                COP_Pelvis = math.TransformVectorIntoMovingCoors(COP_Pelvis, ELab)
-                # Write back to GRM, account for direction and side for ML, and scale to % leg length
-                arrayRightGRM[0][FrameNumber] = 100 * Direction * COP_Pelvis[0] / self.valueRightLegLength
-                arrayRightGRM[1][FrameNumber] = 100 * Sign * Direction * COP_Pelvis[1] / self.valueRightLegLength
-
-
-                # Index 0 is sum of sagittal plane moment, Index 1 is sum of sagittal power, Index3 is sum of total power
-                arrayRightMPSum[0][FrameNumber] = arrayRightHipMoment[0][FrameNumber] + arrayRightKneeMoment[0][FrameNumber]  + \
-                                                 arrayRightAnkleMoment[0][FrameNumber]
-                arrayRightMPSum[1][FrameNumber] = arrayRightHipPower[0][FrameNumber] + arrayRightKneePower[0][FrameNumber] + \
-                                                 arrayRightAnklePower[0][FrameNumber]
-                arrayRightMPSum[2][FrameNumber] = arrayRightHipPowerTotal[2][FrameNumber] + arrayRightKneePowerTotal[2][FrameNumber] + \
-                                                 arrayRightAnklePowerTotal[2][FrameNumber]
-                
-                # Add Foot CoP, compute components first and foot length
-                AnkleCOP = COP - RightAnkleCenterLab
-                AnkleCOP[2] = 0
-                # Account for foot progression angle and account for walk direction and M/L
-                AnkleCOP_Foot = math.TransformVectorIntoMovingCoors(AnkleCOP, RightEFootAnat)
-                FL = np.linalg.norm(RightToeMarker - RightAnkleCenterLab)
-                # Normalize
-                AnkleCOP_Foot_Normalized = 100 * AnkleCOP_Foot / FL
-                arrayRightFootCoP[0][FrameNumber] = AnkleCOP_Foot_Normalized[0]
-                arrayRightFootCoP[1][FrameNumber] = -AnkleCOP_Foot_Normalized[1]
-                arrayRightFootCoP[2][FrameNumber] = 0
+        if not RightForcePlate_DeviceID == 0:
+            Sign = 1 # Right Side
+            BodyMass = float(self.valueBodyMass)
+            SideIndex = KineticsSides.index('Right')
+            [RightAnkleForceLab, RightKneeForceLab, RightHipForceLab] = [JointForceLab[SideIndex] for JointForceLab in JointForcesLab]
+            [RightAnkleMoment_Foot, RightKneeMoment_Shank, RightHipMoment_Thigh] = [JointMoment[SideIndex] for JointMoment in JointMoments]
+            [RightAnklePower, RightKneePower, RightHipPower] = [JointPower[SideIndex] for JointPower in JointPowers]
+            [RightAnklePowerTotal, RightKneePowerTotal, RightHipPowerTotal] = [JointPowerTotal[SideIndex] for JointPowerTotal in JointPowersTotal]
+            
+            # Normalize and Store in array
+            # Apply sign convention based on right versus left side & plotting convention
+            # Internal Moments that are Extensor, Abductor, External Rotator are positive
+            RightAnkleMomentNormalized = np.array([-Sign, 1, -Sign]) * RightAnkleMoment_Foot / BodyMass
+            RightKneeMomentNormalized = np.array([-Sign, -1, -Sign]) * RightKneeMoment_Shank / BodyMass
+            RightHipMomentNormalized = np.array([-Sign, 1, -Sign]) * RightHipMoment_Thigh / BodyMass
+            StoreArrayBatch(arrayRightAnkleMoment, RightAnkleMomentNormalized)
+            StoreArrayBatch(arrayRightKneeMoment, RightKneeMomentNormalized)
+            StoreArrayBatch(arrayRightHipMoment, RightHipMomentNormalized)
+            StoreArrayBatch(arrayRightAnklePower, RightAnklePower / BodyMass)
+            StoreArrayBatch(arrayRightKneePower, RightKneePower / BodyMass)
+            StoreArrayBatch(arrayRightHipPower, RightHipPower / BodyMass)
+            StoreArrayBatch(arrayRightAnklePowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), RightAnklePowerTotal / BodyMass)))
+            StoreArrayBatch(arrayRightKneePowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), RightKneePowerTotal / BodyMass)))
+            StoreArrayBatch(arrayRightHipPowerTotal, np.column_stack((np.zeros((NumberOfFrames,2)), RightHipPowerTotal / BodyMass)))
+            
+            # Transform Ankle Force into Foot CS: X=AP, Y=ML, Z=SI (Do Not Re-arrange these)
+            RightAnkleForceFoot = math.TransformVectorIntoMovingCoors_Batch(RightAnkleForceLab, RightEFootTibAnat)
+            StoreArrayBatch(arrayRightAnkleJRF, np.array([1, Sign, 1]) * RightAnkleForceFoot / BodyMass)
+            # Transform Knee Force into Proximal Tibia CS
+            RightKneeForceTib = math.TransformVectorIntoMovingCoors_Batch(RightKneeForceLab, RightEShankProximalAnat)
+            StoreArrayBatch(arrayRightKneeJRF, np.array([1, Sign, 1]) * RightKneeForceTib / BodyMass)
+            # Transform Hip Force into Thigh CS
+            RightHipForceThigh = math.TransformVectorIntoMovingCoors_Batch(RightHipForceLab, RightEThighAnat)
+            StoreArrayBatch(arrayRightHipJRF, np.array([1, Sign, 1]) * RightHipForceThigh / BodyMass)
+            
+            # Correct for Lab CS, account for side for ML, and scale to BW
+            StoreArrayBatch(arrayRightGRF, np.array([1, Sign, 1]) * math.TransformVectorIntoMovingCoors_Batch(RightGRF, ELab) / BodyMass)
+            
+            # Center of Pressure w.r.t. Pelvis, corrected for Lab CS
+            RightGRM = np.column_stack((RightCOP_PelvisOrigin, Sign * RightGRT[:,2] / BodyMass))
+            COP_Pelvis = math.TransformVectorIntoMovingCoors_Batch(RightGRM, ELab)
+            # Write back to GRM, account for walk direction and side for ML, and scale to % leg length
+            RightGRM[:,0] = 100 * Direction * COP_Pelvis[:,0] / self.valueRightLegLength
+            RightGRM[:,1] = 100 * Direction * Sign * COP_Pelvis[:,1] / self.valueRightLegLength
+            StoreArrayBatch(arrayRightGRM, RightGRM)
+            
+            # Add Moment and Power Sums
+            # Index 0 is sum of sagittal plane moment, Index 1 is sum of sagittal power, Index3 is sum of total power
+            StoreArrayBatch(arrayRightMPSum, np.column_stack((RightHipMomentNormalized[:,0] + RightKneeMomentNormalized[:,0] + RightAnkleMomentNormalized[:,0],
+                                                             (RightHipPower[:,0] + RightKneePower[:,0] + RightAnklePower[:,0]) / BodyMass,
+                                                             (RightHipPowerTotal + RightKneePowerTotal + RightAnklePowerTotal) / BodyMass)))
+            
+            # Add Foot CoP, compute components first and foot length
+            AnkleCOP = RightCOP - RightAnkleCenterLab
+            AnkleCOP[:,2] = 0
+            AnkleCOP_Foot = math.TransformVectorIntoMovingCoors_Batch(AnkleCOP, RightEFootAnat)
+            FL = np.linalg.norm(RightToeMarker - RightAnkleCenterLab, axis=1)
+            # Normalize
+            AnkleCOP_Foot_Normalized = 100 * AnkleCOP_Foot / FL[:,np.newaxis]
+            # Account for foot progression angle and account for walk direction and M/L
+            StoreArrayBatch(arrayRightFootCoP, np.array([1, -1, 0]) * AnkleCOP_Foot_Normalized)
         
+
         # =============================================================================
         #         Write Kinetics Outputs to C3D File
         # =============================================================================
@@ -3162,79 +3183,79 @@ class Dynamic_Main():
         # Left Moments and Power
         if not LeftForcePlate_DeviceID == 0:
             if not 'LHipMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHipMoment',  'Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LHipMoment',  'Moments', XYZNames, MomentsNormalizedTypes)
             if not 'LKneeMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LKneeMoment', 'Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LKneeMoment', 'Moments', XYZNames, MomentsNormalizedTypes)
             if not 'LAnkleMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LAnkleMoment','Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LAnkleMoment','Moments', XYZNames, MomentsNormalizedTypes)
             if not 'LHipPower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHipPower',   'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LHipPower',   'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'LKneePower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LKneePower',  'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LKneePower',  'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'LAnklePower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LAnklePower', 'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LAnklePower', 'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'LHipPowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHipPowerComponents',   'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LHipPowerComponents',   'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'LKneePowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LKneePowerComponents',  'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LKneePowerComponents',  'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'LAnklePowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LAnklePowerComponents', 'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LAnklePowerComponents', 'Powers',  XYZNames, PowersNormalizedTypes)
             # Add JRFs
             if not 'LAnkleForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LAnkleForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LAnkleForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'LKneeForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LKneeForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LKneeForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'LHipForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LHipForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LHipForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             # Add GRFs and GRMs
             if not 'LGroundReactionForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LGroundReactionForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LGroundReactionForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'LGroundReactionMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LGroundReactionMoment', 'Moments',  XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LGroundReactionMoment', 'Moments',  XYZNames, MomentsNormalizedTypes)
             if not 'LMomentPowerSum' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LMomentPowerSum', 'Moments',  XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'LMomentPowerSum', 'Moments',  XYZNames, MomentsNormalizedTypes)
             # Add COP
             if not 'LFootCoP' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'LFootCoP', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'LFootCoP', 'Angles', XYZNames, AnglesTypes)
         
         # Right Moments and Power
         if not RightForcePlate_DeviceID == 0:
             if not 'RHipMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHipMoment',  'Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RHipMoment',  'Moments', XYZNames, MomentsNormalizedTypes)
             if not 'RKneeMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RKneeMoment', 'Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RKneeMoment', 'Moments', XYZNames, MomentsNormalizedTypes)
             if not 'RAnkleMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RAnkleMoment','Moments', XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RAnkleMoment','Moments', XYZNames, MomentsNormalizedTypes)
             if not 'RHipPower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHipPower',   'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RHipPower',   'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'RKneePower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RKneePower',  'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RKneePower',  'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'RAnklePower' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RAnklePower', 'Powers',  XYZNames, PowersNormalizedTypes)  
+                CreateModelOutput( SubjectName, 'RAnklePower', 'Powers',  XYZNames, PowersNormalizedTypes)  
             if not 'RHipPowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHipPowerComponents',   'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RHipPowerComponents',   'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'RKneePowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RKneePowerComponents',  'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RKneePowerComponents',  'Powers',  XYZNames, PowersNormalizedTypes)
             if not 'RAnklePowerComponents' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RAnklePowerComponents', 'Powers',  XYZNames, PowersNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RAnklePowerComponents', 'Powers',  XYZNames, PowersNormalizedTypes)
             
             # Add JRFs
             if not 'RAnkleForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RAnkleForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RAnkleForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'RKneeForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RKneeForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RKneeForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'RHipForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RHipForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RHipForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             # Add GRFs and GRMs
             if not 'RGroundReactionForce' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RGroundReactionForce', 'Forces',  XYZNames, ForceNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RGroundReactionForce', 'Forces',  XYZNames, ForceNormalizedTypes)
             if not 'RGroundReactionMoment' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RGroundReactionMoment', 'Moments',  XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RGroundReactionMoment', 'Moments',  XYZNames, MomentsNormalizedTypes)
             if not 'RMomentPowerSum' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RMomentPowerSum', 'Moments',  XYZNames, MomentsNormalizedTypes)
+                CreateModelOutput( SubjectName, 'RMomentPowerSum', 'Moments',  XYZNames, MomentsNormalizedTypes)
             # Add COP
             if not 'RFootCoP' in ModelOutputs:
-                vicon.CreateModelOutput( SubjectName, 'RFootCoP', 'Angles', XYZNames, AnglesTypes)
+                CreateModelOutput( SubjectName, 'RFootCoP', 'Angles', XYZNames, AnglesTypes)
 
             
         # Rearrange all arrays before writing to C3D
@@ -3261,46 +3282,52 @@ class Dynamic_Main():
         # Write Arrays to C3D Files
         # Left
         if not LeftForcePlate_DeviceID == 0:
-            vicon.SetModelOutput(SubjectName, 'LHipMoment', ReArranged_arrayLeftHipMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'LKneeMoment', ReArranged_arrayLeftKneeMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'LAnkleMoment', ReArranged_arrayLeftAnkleMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'LHipPower', ReArranged_arrayLeftHipPowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'LKneePower', ReArranged_arrayLeftKneePowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'LAnklePower', ReArranged_arrayLeftAnklePowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'LHipPowerComponents', ReArranged_arrayLeftHipPower,   exists)
-            vicon.SetModelOutput(SubjectName, 'LKneePowerComponents', ReArranged_arrayLeftKneePower,   exists)
-            vicon.SetModelOutput(SubjectName, 'LAnklePowerComponents', ReArranged_arrayLeftAnklePower,   exists)
+            SetModelOutput(SubjectName, 'LHipMoment', ReArranged_arrayLeftHipMoment,   OutputExists.get('LHipMoment', exists))
+            SetModelOutput(SubjectName, 'LKneeMoment', ReArranged_arrayLeftKneeMoment,   OutputExists.get('LKneeMoment', exists))
+            SetModelOutput(SubjectName, 'LAnkleMoment', ReArranged_arrayLeftAnkleMoment,   OutputExists.get('LAnkleMoment', exists))
+            SetModelOutput(SubjectName, 'LHipPower', ReArranged_arrayLeftHipPowerTotal,   OutputExists.get('LHipPower', exists))
+            SetModelOutput(SubjectName, 'LKneePower', ReArranged_arrayLeftKneePowerTotal,   OutputExists.get('LKneePower', exists))
+            SetModelOutput(SubjectName, 'LAnklePower', ReArranged_arrayLeftAnklePowerTotal,   OutputExists.get('LAnklePower', exists))
+            SetModelOutput(SubjectName, 'LHipPowerComponents', ReArranged_arrayLeftHipPower,   OutputExists.get('LHipPowerComponents', exists))
+            SetModelOutput(SubjectName, 'LKneePowerComponents', ReArranged_arrayLeftKneePower,   OutputExists.get('LKneePowerComponents', exists))
+            SetModelOutput(SubjectName, 'LAnklePowerComponents', ReArranged_arrayLeftAnklePower,   OutputExists.get('LAnklePowerComponents', exists))
             # Add JRFs to output (not re-arranged)
-            vicon.SetModelOutput(SubjectName, 'LAnkleForce', arrayLeftAnkleJRF,   exists)
-            vicon.SetModelOutput(SubjectName, 'LKneeForce', arrayLeftKneeJRF,   exists)
-            vicon.SetModelOutput(SubjectName, 'LHipForce', arrayLeftHipJRF, exists)
+            SetModelOutput(SubjectName, 'LAnkleForce', arrayLeftAnkleJRF,   OutputExists.get('LAnkleForce', exists))
+            SetModelOutput(SubjectName, 'LKneeForce', arrayLeftKneeJRF,   OutputExists.get('LKneeForce', exists))
+            SetModelOutput(SubjectName, 'LHipForce', arrayLeftHipJRF, OutputExists.get('LHipForce', exists))
             # Add GRFs and GRMs to output (not re-arranged)
-            vicon.SetModelOutput(SubjectName, 'LGroundReactionForce', arrayLeftGRF, exists)
-            vicon.SetModelOutput(SubjectName, 'LGroundReactionMoment', arrayLeftGRM, exists)
+            SetModelOutput(SubjectName, 'LGroundReactionForce', arrayLeftGRF, OutputExists.get('LGroundReactionForce', exists))
+            SetModelOutput(SubjectName, 'LGroundReactionMoment', arrayLeftGRM, OutputExists.get('LGroundReactionMoment', exists))
             # Add Moment and Power Sums and Foot COP
-            vicon.SetModelOutput(SubjectName, 'LMomentPowerSum', arrayLeftMPSum, exists)
-            vicon.SetModelOutput(SubjectName, 'LFootCoP', arrayLeftFootCoP, exists)
+            SetModelOutput(SubjectName, 'LMomentPowerSum', arrayLeftMPSum, OutputExists.get('LMomentPowerSum', exists))
+            SetModelOutput(SubjectName, 'LFootCoP', arrayLeftFootCoP, OutputExists.get('LFootCoP', exists))
 
         if not RightForcePlate_DeviceID == 0:
-            vicon.SetModelOutput(SubjectName, 'RHipMoment', ReArranged_arrayRightHipMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'RKneeMoment', ReArranged_arrayRightKneeMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'RAnkleMoment', ReArranged_arrayRightAnkleMoment,   exists)
-            vicon.SetModelOutput(SubjectName, 'RHipPower', ReArranged_arrayRightHipPowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'RKneePower', ReArranged_arrayRightKneePowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'RAnklePower', ReArranged_arrayRightAnklePowerTotal,   exists)
-            vicon.SetModelOutput(SubjectName, 'RHipPowerComponents', ReArranged_arrayRightHipPower,   exists)
-            vicon.SetModelOutput(SubjectName, 'RKneePowerComponents', ReArranged_arrayRightKneePower,   exists)
-            vicon.SetModelOutput(SubjectName, 'RAnklePowerComponents', ReArranged_arrayRightAnklePower,   exists)
+            SetModelOutput(SubjectName, 'RHipMoment', ReArranged_arrayRightHipMoment,   OutputExists.get('RHipMoment', exists))
+            SetModelOutput(SubjectName, 'RKneeMoment', ReArranged_arrayRightKneeMoment,   OutputExists.get('RKneeMoment', exists))
+            SetModelOutput(SubjectName, 'RAnkleMoment', ReArranged_arrayRightAnkleMoment,   OutputExists.get('RAnkleMoment', exists))
+            SetModelOutput(SubjectName, 'RHipPower', ReArranged_arrayRightHipPowerTotal,   OutputExists.get('RHipPower', exists))
+            SetModelOutput(SubjectName, 'RKneePower', ReArranged_arrayRightKneePowerTotal,   OutputExists.get('RKneePower', exists))
+            SetModelOutput(SubjectName, 'RAnklePower', ReArranged_arrayRightAnklePowerTotal,   OutputExists.get('RAnklePower', exists))
+            SetModelOutput(SubjectName, 'RHipPowerComponents', ReArranged_arrayRightHipPower,   OutputExists.get('RHipPowerComponents', exists))
+            SetModelOutput(SubjectName, 'RKneePowerComponents', ReArranged_arrayRightKneePower,   OutputExists.get('RKneePowerComponents', exists))
+            SetModelOutput(SubjectName, 'RAnklePowerComponents', ReArranged_arrayRightAnklePower,   OutputExists.get('RAnklePowerComponents', exists))
             # Add JRFs to output (not re-arranged)
-            vicon.SetModelOutput(SubjectName, 'RAnkleForce', arrayRightAnkleJRF, exists)
-            vicon.SetModelOutput(SubjectName, 'RKneeForce', arrayRightKneeJRF, exists)
-            vicon.SetModelOutput(SubjectName, 'RHipForce', arrayRightHipJRF, exists)
+            SetModelOutput(SubjectName, 'RAnkleForce', arrayRightAnkleJRF, OutputExists.get('RAnkleForce', exists))
+            SetModelOutput(SubjectName, 'RKneeForce', arrayRightKneeJRF, OutputExists.get('RKneeForce', exists))
+            SetModelOutput(SubjectName, 'RHipForce', arrayRightHipJRF, OutputExists.get('RHipForce', exists))
             # Add GRFs and GRMs to output (not re-arranged)
-            vicon.SetModelOutput(SubjectName, 'RGroundReactionForce', arrayRightGRF, exists)
-            vicon.SetModelOutput(SubjectName, 'RGroundReactionMoment', arrayRightGRM, exists)
+            SetModelOutput(SubjectName, 'RGroundReactionForce', arrayRightGRF, OutputExists.get('RGroundReactionForce', exists))
+            SetModelOutput(SubjectName, 'RGroundReactionMoment', arrayRightGRM, OutputExists.get('RGroundReactionMoment', exists))
             # Add Moment and Power Sums and Foot CoP
-            vicon.SetModelOutput(SubjectName, 'RMomentPowerSum', arrayRightMPSum, exists)
-            vicon.SetModelOutput(SubjectName, 'RFootCoP', arrayRightFootCoP, exists)
+            SetModelOutput(SubjectName, 'RMomentPowerSum', arrayRightMPSum, OutputExists.get('RMomentPowerSum', exists))
+            SetModelOutput(SubjectName, 'RFootCoP', arrayRightFootCoP, OutputExists.get('RFootCoP', exists))
+
+        # Outputs of the output groups left out that the trial already has (earlier run with another output profile) are
+        # written without existing frames, so they do not keep the values of the earlier run
+        for Name in sorted(PrunedOutputs):
+            if Name in ModelOutputs:
+                vicon.SetModelOutput(SubjectName, Name, np.zeros((3, framecount)), [False]*framecount)
 
 #Calls the main Function
 Dynamic_Main()
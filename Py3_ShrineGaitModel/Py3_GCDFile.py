@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Buffered writer of GCD files (#!DST-Python3_ShrineGaitModel format read by the report generator)
+
+CreateGCD wrote each value with its own file write after np.format_float_positional. The GCDWriter keeps the header
+text and the variables in memory, formats the values of all variables together when the file is closed, and writes the
+file at once to a temporary file that is then renamed, so a GCD file is never left half written:
+
+    GCDFile = gcdfile.GCDWriter(FilePath + FileName + '.GCD')
+    GCDFile.write('$ProgramVersion' + '\n')           (header lines, as with a text file)
+    GCDFile.WriteArray('LeftHipFlexExt', Values)       (!LeftHipFlexExt then one value per line)
+    GCDFile.WriteSingleValue('LeftCadence', Value)
+    GCDFile.close()
+
+The values are written as before, byte for byte: np.format_float_positional(Value, precision=6), and str(round(Value, 6))
+for the EMG channels.
+
+With GCDBinary of the user preferences, CreateGCD also writes a binary companion <Trial>.GCD.bin with the same variables
+as float32 arrays, the header values (mass, height, leg lengths, video rate, program version, file names) and an index
+of the variables, so that one curve is read without parsing the text file:
+
+    GCD = gcdfile.GCDReader('Walk01.GCD')              (memory-maps Walk01.GCD.bin)
+    GCD.Header['Mass'], GCD['LeftKneeFlexExt']
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import json
+import struct
+import numpy as np
+
+# Binary companion of the GCD files
+BinaryExtension = '.bin'
+BinaryMagic = b'SGMGCDB1'
+BinaryFormat = '#!DST-Python3_ShrineGaitModel'
+DataAlignment = 16
+
+# Values written by np.format_float_positional instead of '%.6f' (see FormatPositional)
+LargeValue = 1e16
+
+def FormatPositional(Values):
+    # Text of the values as np.format_float_positional(Value, precision=6): '%.6f' of the value, without the trailing
+    # zeros when the value has at most 6 decimals or was rounded up (format_float_positional keeps the zeros of the
+    # 6 decimals it truncated, and drops the zeros of a carry)
+    Values = np.asarray(Values, dtype=np.float64).ravel()
+    Texts = ['%.6f' % Value for Value in Values.tolist()]
+    with np.errstate(invalid='ignore'):
+        Trimmed = (np.abs(np.array(Texts, dtype=np.float64)) >= np.abs(Values)).tolist()
+    Texts = [Text.rstrip('0') if Trim else Text for [Text, Trim] in zip(Texts, Trimmed)]
+    # From 17 integer digits format_float_positional writes the shortest digits that identify the value, then zeros
+    for Index in np.flatnonzero(np.abs(Values) >= LargeValue).tolist():
+        Texts[Index] = np.format_float_positional(Values[Index], precision=6)
+    return Texts
+
+def FormatRounded(Values):
+    # Text of the values as str(round(Value, 6)), as written for the EMG channels
+    return [str(round(Value, 6)) for Value in np.asarray(Values, dtype=np.float64).ravel().tolist()]
+
+class GCDWriter():
+    # Parts: header text, or variables [GCDVariableName, values, rounded] formatted together by close(). With Binary the
+    # variables and the header values are also written to the binary companion <FileName>.bin (see GCDReader)
+    def __init__(self, FileName, Binary=False):
+        self.FileName = FileName
+        self.Binary = Binary
+        self.Parts = []
+
+    def write(self, Text):
+        self.Parts.append(Text)
+
+    def WriteArray(self, GCDVariableName, GCDVariable):
+        self.Parts.append([GCDVariableName, np.asarray(GCDVariable, dtype=np.float64).ravel(), False])
+
+    def WriteSingleValue(self, GCDVariableName, GCDVariable):
+        self.WriteArray(GCDVariableName, [GCDVariable])
+
+    def WriteRoundedArray(self, GCDVariableName, GCDVariable):
+        self.Parts.append([GCDVariableName, np.asarray(GCDVariable, dtype=np.float64).ravel(), True])
+
+    def Variables(self):
+        return [Part for Part in self.Parts if not isinstance(Part, str)]
+
+    def Text(self):
+        # Values of all variables formatted in one pass, then split back into their variables
+        Positional = [Values for [GCDVariableName, Values, Rounded] in self.Variables() if not Rounded]
+        Texts = FormatPositional(np.concatenate(Positional)) if len(Positional) > 0 else []
+        Lines = []
+        Start = 0
+        for Part in self.Parts:
+            if isinstance(Part, str):
+                Lines.append(Part)
+                continue
+            [GCDVariableName, Values, Rounded] = Part
+            if Rounded:
+                VariableTexts = FormatRounded(Values)
+            else:
+                VariableTexts = Texts[Start:Start + len(Values)]
+                Start = Start + len(Values)
+            Lines.append('!' + GCDVariableName + '\n' + ''.join([Text + '\n' for Text in VariableTexts]))
+        return ''.join(Lines)
+
+    def Header(self):
+        # {Name: value} of the header lines ($ProgramVersion, !Mass, ...), numbers for the ! lines
+        Lines = ''.join([Part for Part in self.Parts if isinstance(Part, str)]).splitlines()
+        Header = {}
+        for Index in range(len(Lines) - 1):
+            if Lines[Index].startswith('$'):
+                Header[Lines[Index][1:]] = Lines[Index + 1]
+            elif Lines[Index].startswith('!'):
+                try:
+                    Header[Lines[Index][1:]] = float(Lines[Index + 1])
+                except ValueError:
+                    Header[Lines[Index][1:]] = Lines[Index + 1]
+        return Header
+
+    def BinaryData(self):
+        # Companion file: magic, header length (uint64), JSON header {Format, Header, Variables {Name: [Offset, Length]}}
+        # padded to DataAlignment bytes, then the values of the variables as little-endian float32
+        Variables = {}
+        Offset = 0
+        for [GCDVariableName, Values, Rounded] in self.Variables():
+            Variables[GCDVariableName] = [Offset, len(Values)]
+            Offset = Offset + len(Values)
+        Header = json.dumps({'Format': BinaryFormat, 'Version': VersionNumber, 'Header': self.Header(), 'Variables': Variables}).encode('utf-8')
+        Header = Header + b' ' * (-(len(BinaryMagic) + 8 + len(Header)) % DataAlignment)
+        Arrays = [Values for [GCDVariableName, Values, Rounded] in self.Variables()]
+        Data = np.concatenate(Arrays).astype('<f4') if len(Arrays) > 0 else np.zeros(0, dtype='<f4')
+        return BinaryMagic + struct.pack('<Q', len(Header)) + Header + Data.tobytes()
+
+    def close(self):
+        # Written to temporary files and renamed over the GCD file (and its companion)
+        ReplaceFile(self.FileName, self.Text(), 'w')
+        if self.Binary:
+            ReplaceFile(self.FileName + BinaryExtension, self.BinaryData(), 'wb')
+
+def ReplaceFile(FileName, Contents, Mode):
+    # Contents written to <FileName>.<pid>.tmp, then renamed over the file
+    TemporaryFileName = FileName + '.' + str(os.getpid()) + '.tmp'
+    try:
+        with open(TemporaryFileName, Mode) as TemporaryFile:
+            TemporaryFile.write(Contents)
+        os.replace(TemporaryFileName, FileName)
+    finally:
+        if os.path.exists(TemporaryFileName):
+            os.remove(TemporaryFileName)
+
+class GCDReader():
+    # Binary companion of a GCD file, memory-mapped. Header {Name: value}, Names of the variables, and each variable as
+    # a float32 array read from the file when used
+    def __init__(self, FileName):
+        if not FileName.endswith(BinaryExtension):
+            FileName = FileName + BinaryExtension
+        self.FileName = FileName
+        with open(FileName, 'rb') as BinaryFile:
+            if not BinaryFile.read(len(BinaryMagic)) == BinaryMagic:
+                raise ValueError(FileName + ' is not a binary GCD file')
+            HeaderLength = struct.unpack('<Q', BinaryFile.read(8))[0]
+            Contents = json.loads(BinaryFile.read(HeaderLength).decode('utf-8'))
+        self.Header = Contents['Header']
+        self.Version = Contents['Version']
+        self.Variables = Contents['Variables']
+        self.Names = list(self.Variables)
+        DataOffset = len(BinaryMagic) + 8 + HeaderLength
+        Length = sum([self.Variables[Name][1] for Name in self.Variables])
+        # np.memmap cannot map an empty data block
+        self.Data = np.memmap(FileName, dtype='<f4', mode='r', offset=DataOffset, shape=(Length,)) if Length > 0 else np.zeros(0, dtype='<f4')
+
+    def __getitem__(self, GCDVariableName):
+        [Offset, Length] = self.Variables[GCDVariableName]
+        return self.Data[Offset:Offset + Length]
+
+    def __contains__(self, GCDVariableName):
+        return GCDVariableName in self.Variables
@@ -27,91 +27,92 @@ Last Update: 26 Aug, 2024
 ---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 """
 
-VersionNumber = 'Py3_v1.3'
+VersionNumber = 'Py3_v1.4'
 
 import numpy as np
 import Py3_MathModules as math
 
 
-def TechCS_Trunk_Newington(C7, LCLV, RCLV, LASIS, RASIS, SACR):
-                
-    # Intialize Matrix and array 
-    # If . is not placed after zero, values will be truncated to integers
-    ETrunkTech =  np.matrix([[0. for m in range(3)] for n in range(3)])
-    PelvicCenterLab = np.array([0.,0.,0.])
-    ShouldersCenterLab = np.array([0.,0.,0.])
+def TechCS_Trunk_Newington_Batch(C7, LCLV, RCLV, LASIS, RASIS, SACR):
+    # Markers are (N, 3) arrays, returns (N, 3, 3) frames and (N, 3) cluster centers
     
     # Determine Pelvic Coordinate System
-    epy = math.ComputeUnitVecFromPts(RASIS, LASIS)
-    ed3 = math.ComputeUnitVecFromPts(RASIS, SACR)
-    epz = np.cross(epy,ed3)
-    epz = epz/np.linalg.norm(epz)
+    epy = math.ComputeUnitVecFromPts_Batch(RASIS, LASIS)
+    ed3 = math.ComputeUnitVecFromPts_Batch(RASIS, SACR)
+    epz = math.NormalizeVectors_Batch(np.cross(epy,ed3))
     epx = np.cross(epy,epz)
     
     #Determine Center of the Pelvic Cluster
-    d3 = np.linalg.norm(SACR - RASIS)
-    beta = np.arccos(np.dot(ed3,epy))
+    d3 = np.linalg.norm(SACR - RASIS, axis=-1)
+    beta = np.arccos(math.DotProduct_Batch(ed3,epy))
     d2 = d3 * np.sin(beta)
     
-    PelvicCenterLab = (RASIS + LASIS)/2 - 0.5 * d2 * epx
+    PelvicCenterLab = (RASIS + LASIS)/2 - 0.5 * d2[..., np.newaxis] * epx
     
     # Compute Shoulder Coordinate System
-    esy = math.ComputeUnitVecFromPts(RCLV, LCLV)
-    ed3 = math.ComputeUnitVecFromPts(RCLV, C7)
-    esz = np.cross(esy,ed3)
-    esz = esz/np.linalg.norm(esz)
+    esy = math.ComputeUnitVecFromPts_Batch(RCLV, LCLV)
+    ed3 = math.ComputeUnitVecFromPts_Batch(RCLV, C7)
+    esz = math.NormalizeVectors_Batch(np.cross(esy,ed3))
     esx = np.cross(esy,esz)
     
     # Determine Center of Shoulder Cluster
-    d3 = np.linalg.norm(C7 - RCLV)
-    beta = np.arccos(np.dot(ed3,esy))
+    d3 = np.linalg.norm(C7 - RCLV, axis=-1)
+    beta = np.arccos(math.DotProduct_Batch(ed3,esy))
     d2 = d3 * np.sin(beta)
     
-    ShouldersCenterLab = (RCLV + LCLV)/2 - 0.5 * d2 * esx
+    ShouldersCenterLab = (RCLV + LCLV)/2 - 0.5 * d2[..., np.newaxis] * esx
     
     # Compute Trunk Coordinate System
-    etz = ShouldersCenterLab - PelvicCenterLab
-
-    etz = etz/np.linalg.norm(etz)
-    etx = np.cross(esy,etz)
-    etx = etx/np.linalg.norm(etx)
+    etz = math.NormalizeVectors_Batch(ShouldersCenterLab - PelvicCenterLab)
+    etx = math.NormalizeVectors_Batch(np.cross(esy,etz))
     ety = np.cross(etz,etx)
     
-    ETrunkTech = np.column_stack((etx,ety,etz))
+    ETrunkTech = np.stack((etx,ety,etz), axis=-1)
     
     return([ETrunkTech, PelvicCenterLab, ShouldersCenterLab])
+
+def TechCS_Trunk_Newington(C7, LCLV, RCLV, LASIS, RASIS, SACR):
     
+    return TechCS_Trunk_Newington_Batch(C7, LCLV, RCLV, LASIS, RASIS, SACR)
     
-def TechCS_Pelvis_Newington(LASIS, RASIS, SACR):
     
-    epy = math.ComputeUnitVecFromPts(RASIS, LASIS)
-    ed3 = math.ComputeUnitVecFromPts(RASIS, SACR)
-    epz = np.cross(epy,ed3)
-    epz = epz/np.linalg.norm(epz)
+def TechCS_Pelvis_Newington_Batch(LASIS, RASIS, SACR):
+    # Markers are (N, 3) arrays, returns (N, 3, 3) frames and (N, 3) MidASIS
+    epy = math.ComputeUnitVecFromPts_Batch(RASIS, LASIS)
+    ed3 = math.ComputeUnitVecFromPts_Batch(RASIS, SACR)
+    epz = math.NormalizeVectors_Batch(np.cross(epy,ed3))
     epx = np.cross(epy,epz)            
     
-    EPelvisTech = np.column_stack((epx,epy,epz))
+    EPelvisTech = np.stack((epx,epy,epz), axis=-1)
     MidASISLab = (LASIS + RASIS) /2
     
     return([EPelvisTech, MidASISLab])
 
-def AnatCS_Pelvis_Delp(LASIS, RASIS, SACR, PelvicTiltOffset):
+def TechCS_Pelvis_Newington(LASIS, RASIS, SACR):
+    
+    return TechCS_Pelvis_Newington_Batch(LASIS, RASIS, SACR)
+
+def AnatCS_Pelvis_Delp_Batch(LASIS, RASIS, SACR, PelvicTiltOffset):
     MidASISLab = (LASIS + RASIS) /2
     
-    ey = math.ComputeUnitVecFromPts(RASIS, LASIS)
-    ed3 = math.ComputeUnitVecFromPts(SACR,  MidASISLab)
-    ez = np.cross(ed3,ey)
-    ez = ez/np.linalg.norm(ez)
+    ey = math.ComputeUnitVecFromPts_Batch(RASIS, LASIS)
+    ed3 = math.ComputeUnitVecFromPts_Batch(SACR,  MidASISLab)
+    ez = math.NormalizeVectors_Batch(np.cross(ed3,ey))
     ex = np.cross(ey,ez)            
     
-    EPelvisAnat = np.column_stack((ex,ey,ez))
+    EPelvisAnat = np.stack((ex,ey,ez), axis=-1)
     
     # Rotate CS around Y axis by PelviTiltOffset
-    EPelvisAnat = math.RotateCSaroundYaxis(EPelvisAnat,PelvicTiltOffset)
+    EPelvisAnat = math.RotateCSaroundYaxis_Batch(EPelvisAnat,PelvicTiltOffset)
     
     return([EPelvisAnat, MidASISLab])
+
+def AnatCS_Pelvis_Delp(LASIS, RASIS, SACR, PelvicTiltOffset):
     
-def JointCenterModel_Hip_Newington(Side, MarkerDiameter, ASISdist, ASIStoGTdist, LeftLegLength, RightLegLength, RASIS, LASIS, EPelvisTech, MidASISLab):
+    return AnatCS_Pelvis_Delp_Batch(LASIS, RASIS, SACR, PelvicTiltOffset)
+    
+def JointCenterModel_Hip_Newington_Batch(Side, MarkerDiameter, ASISdist, ASIStoGTdist, LeftLegLength, RightLegLength, RASIS, LASIS, EPelvisTech, MidASISLab):
+    # EPelvisTech is (N, 3, 3) and MidASISLab (N, 3), hip center in pelvis is the same for all frames
     
     #Constants in degrees
     ThetaConst = 28.42
@@ -144,27 +145,32 @@ def JointCenterModel_Hip_Newington(Side, MarkerDiameter, ASISdist, ASIStoGTdist,
     HipCenterPelvis[2] = np.sin(PelvisTiltConstRadians) * HipInPelvisCoorsTemp[0] + np.cos(PelvisTiltConstRadians) * HipInPelvisCoorsTemp[2]
     
     #compute hip location relative to lab origin and expressed relative to lab coordinate system
-    HipCenterLab = math.TransformPointIntoLabCoors(HipCenterPelvis, EPelvisTech, MidASISLab)
+    HipCenterLab = math.TransformPointIntoLabCoors_Batch(HipCenterPelvis, EPelvisTech, MidASISLab)
     
     return([HipCenterPelvis, HipCenterLab])
+
+def JointCenterModel_Hip_Newington(Side, MarkerDiameter, ASISdist, ASIStoGTdist, LeftLegLength, RightLegLength, RASIS, LASIS, EPelvisTech, MidASISLab):
     
+    return JointCenterModel_Hip_Newington_Batch(Side, MarkerDiameter, ASISdist, ASIStoGTdist, LeftLegLength, RightLegLength, RASIS, LASIS, EPelvisTech, MidASISLab)
     
-def JointCenterModel_Hip_Harrington(Side, ASISdist, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+    
+def JointCenterModel_Hip_Harrington_Batch(Side, ASISdist, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+    # Markers are (N, 3) arrays, returns (N, 3) hip centers in pelvis and in lab
     
     #PelvicWidth = np.linalg.norm(LASIS-RASIS)
     PelvicWidth = ASISdist
-    PelvicDepth = np.linalg.norm((LASIS+RASIS)/2 - SACR)
+    PelvicDepth = np.linalg.norm((LASIS+RASIS)/2 - SACR, axis=-1)
     
     #define hip center relative to a pelvis coordinate syste (Origin at MidASIS)
-    HipCenterPelvis = np.array([0.,0.,0.])
+    HipCenterPelvis = np.zeros(np.shape(PelvicDepth) + (3,))
     
     # Single Linear Regression Equations
-    HipCenterPelvis[0] = -0.24 * PelvicDepth - 9.9
+    HipCenterPelvis[...,0] = -0.24 * PelvicDepth - 9.9
     if Side == 'Right':
-        HipCenterPelvis[1] =  -0.33*PelvicWidth - 7.3
+        HipCenterPelvis[...,1] =  -0.33*PelvicWidth - 7.3
     if Side == 'Left':
-        HipCenterPelvis[1] =  +0.33*PelvicWidth + 7.3
-    HipCenterPelvis[2] = -0.30*PelvicWidth -10.9
+        HipCenterPelvis[...,1] =  +0.33*PelvicWidth + 7.3
+    HipCenterPelvis[...,2] = -0.30*PelvicWidth -10.9
     
     # Two Variable Regression Equations
 #    HipCenterPelvis[0] = -0.24 * PelvicDepth - 9.9
@@ -176,19 +182,24 @@ def JointCenterModel_Hip_Harrington(Side, ASISdist, RASIS, LASIS, SACR, EPelvisT
     
     
     #compute hip location relative to lab origin and expressed relative to lab coordinate system
-    HipCenterLab = math.TransformPointIntoLabCoors(HipCenterPelvis, EPelvisTech, MidASISLab)
+    HipCenterLab = math.TransformPointIntoLabCoors_Batch(HipCenterPelvis, EPelvisTech, MidASISLab)
     
     return([HipCenterPelvis, HipCenterLab])
     
-def JointCenterModel_Hip_Harrington2(Side, ASISdist, LeftLegLength, RightLegLength, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+def JointCenterModel_Hip_Harrington(Side, ASISdist, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+    
+    return JointCenterModel_Hip_Harrington_Batch(Side, ASISdist, RASIS, LASIS, SACR, EPelvisTech, MidASISLab)
+    
+def JointCenterModel_Hip_Harrington2_Batch(Side, ASISdist, LeftLegLength, RightLegLength, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+    # Markers are (N, 3) arrays, returns (N, 3) hip centers in pelvis and in lab
     
     #PelvicWidth = np.linalg.norm(LASIS-RASIS)
     PelvicWidth = ASISdist
-    PelvicDepth = np.linalg.norm((LASIS+RASIS)/2 - SACR)
+    PelvicDepth = np.linalg.norm((LASIS+RASIS)/2 - SACR, axis=-1)
     LongerLegLength = max(LeftLegLength, RightLegLength)
     
     #define hip center relative to a pelvis coordinate syste (Origin at MidASIS)
-    HipCenterPelvis = np.array([0.,0.,0.])
+    HipCenterPelvis = np.zeros(np.shape(PelvicDepth) + (3,))
     
     # Single Linear Regression Equations
 #    HipCenterPelvis[0] = -0.24 * PelvicDepth - 9.9
@@ -199,19 +210,23 @@ def JointCenterModel_Hip_Harrington2(Side, ASISdist, LeftLegLength, RightLegLeng
 #    HipCenterPelvis[2] = -0.30*PelvicWidth -10.9
     
     # Two Variable Regression Equations
-    HipCenterPelvis[0] = -0.24 * PelvicDepth - 9.9
+    HipCenterPelvis[...,0] = -0.24 * PelvicDepth - 9.9
     if Side == 'Right':
-        HipCenterPelvis[1] =  -0.28*PelvicDepth - 0.16*PelvicWidth - 7.9
+        HipCenterPelvis[...,1] =  -0.28*PelvicDepth - 0.16*PelvicWidth - 7.9
     if Side == 'Left':
-        HipCenterPelvis[1] =  +0.28*PelvicDepth + 0.16*PelvicWidth + 7.9
-    HipCenterPelvis[2] = -0.16*PelvicWidth - 0.04*LongerLegLength - 7.1
+        HipCenterPelvis[...,1] =  +0.28*PelvicDepth + 0.16*PelvicWidth + 7.9
+    HipCenterPelvis[...,2] = -0.16*PelvicWidth - 0.04*LongerLegLength - 7.1
     
     
     #compute hip location relative to lab origin and expressed relative to lab coordinate system
-    HipCenterLab = math.TransformPointIntoLabCoors(HipCenterPelvis, EPelvisTech, MidASISLab)
+    HipCenterLab = math.TransformPointIntoLabCoors_Batch(HipCenterPelvis, EPelvisTech, MidASISLab)
     
     return([HipCenterPelvis, HipCenterLab])
     
+def JointCenterModel_Hip_Harrington2(Side, ASISdist, LeftLegLength, RightLegLength, RASIS, LASIS, SACR, EPelvisTech, MidASISLab):
+    
+    return JointCenterModel_Hip_Harrington2_Batch(Side, ASISdist, LeftLegLength, RightLegLength, RASIS, LASIS, SACR, EPelvisTech, MidASISLab)
+    
 def ComputeVirtualKneeMarker_Newington(Side, MarkerDiameter, UpperKADMarker, LateralKADMarker, LowerKADMarker):
     
     R1 = UpperKADMarker - LowerKADMarker
@@ -239,26 +254,28 @@ def ComputeVirtualKneeMarker_Newington(Side, MarkerDiameter, UpperKADMarker, Lat
         
     return VirtualKneeMarker   
 
-def TechCS_Thigh_Newington(Side, HipCenter, ThighMarker, VirtualKneeMarker):
+def TechCS_Thigh_Newington_Batch(Side, HipCenter, ThighMarker, VirtualKneeMarker):
     
-    ethz = math.ComputeUnitVecFromPts(VirtualKneeMarker, HipCenter)
+    ethz = math.ComputeUnitVecFromPts_Batch(VirtualKneeMarker, HipCenter)
     
     #Intermediate Vector from Knee to Thigh Marker
-    R1 = math.ComputeUnitVecFromPts(VirtualKneeMarker, ThighMarker)
+    R1 = math.ComputeUnitVecFromPts_Batch(VirtualKneeMarker, ThighMarker)
     
     if Side == 'Right':
-        ethx = np.cross(ethz, R1)
-        ethx = ethx /np.linalg.norm(ethx)
+        ethx = math.NormalizeVectors_Batch(np.cross(ethz, R1))
     if Side == 'Left':
-        ethx = np.cross(R1, ethz)
-        ethx = ethx /np.linalg.norm(ethx)
+        ethx = math.NormalizeVectors_Batch(np.cross(R1, ethz))
     
     ethy = np.cross(ethz, ethx)
     
-    EThighTech = np.column_stack((ethx,ethy,ethz))
+    EThighTech = np.stack((ethx,ethy,ethz), axis=-1)
     
     return EThighTech    
 
+def TechCS_Thigh_Newington(Side, HipCenter, ThighMarker, VirtualKneeMarker):
+    
+    return TechCS_Thigh_Newington_Batch(Side, HipCenter, ThighMarker, VirtualKneeMarker)
+
 def JointCenterModel_Knee_Newington(Side, MarkerDiameter, KneeWidth, VirtualKneeMarker, LateralKADMarker):
     
     E1= math.ComputeUnitVecFromPts(LateralKADMarker, VirtualKneeMarker)
@@ -266,29 +283,37 @@ def JointCenterModel_Knee_Newington(Side, MarkerDiameter, KneeWidth, VirtualKnee
     
     return KneeCenter        
 
-def TechCS_Shank_Newington(Side, KneeCenter, TibialMarker, LateralAnkle):
+def TechCS_Shank_Newington_Batch(Side, KneeCenter, TibialMarker, LateralAnkle):
     
-    esz = math.ComputeUnitVecFromPts(LateralAnkle, KneeCenter)
-    R1 = math.ComputeUnitVecFromPts(LateralAnkle, TibialMarker)
+    esz = math.ComputeUnitVecFromPts_Batch(LateralAnkle, KneeCenter)
+    R1 = math.ComputeUnitVecFromPts_Batch(LateralAnkle, TibialMarker)
     
     if Side == 'Right':
         esx = np.cross(esz, R1)
     if Side == 'Left':
         esx = np.cross(R1, esz)
-    esx = esx /np.linalg.norm(esx)
+    esx = math.NormalizeVectors_Batch(esx)
     esy = np.cross(esz, esx)
     
-    EShankTech = np.column_stack((esx,esy,esz))
+    EShankTech = np.stack((esx,esy,esz), axis=-1)
     
     return EShankTech
 
-def JointCenterModel_Ankle_Newington(Side, MarkerDiameter, AnkleWidth, LateralAnkle, MedialAnkle):
+def TechCS_Shank_Newington(Side, KneeCenter, TibialMarker, LateralAnkle):
     
-    E1 = math.ComputeUnitVecFromPts(LateralAnkle, MedialAnkle)
+    return TechCS_Shank_Newington_Batch(Side, KneeCenter, TibialMarker, LateralAnkle)
+
+def JointCenterModel_Ankle_Newington_Batch(Side, MarkerDiameter, AnkleWidth, LateralAnkle, MedialAnkle):
+    
+    E1 = math.ComputeUnitVecFromPts_Batch(LateralAnkle, MedialAnkle)
     AnkleCenterLab = LateralAnkle + (float(AnkleWidth)/2 + float(MarkerDiameter)/2) * E1
     
     return AnkleCenterLab
 
+def JointCenterModel_Ankle_Newington(Side, MarkerDiameter, AnkleWidth, LateralAnkle, MedialAnkle):
+    
+    return JointCenterModel_Ankle_Newington_Batch(Side, MarkerDiameter, AnkleWidth, LateralAnkle, MedialAnkle)
+
 def ComputeVirtualHeelMarkerLab(PlantigradeCheck, SujectShodCheck, SoleThickness ,AnkleCenterLab, ToeMarker, HeelMarker):
 
     VirtualHeelMarkerLab = np.array([0.,0.,0.])
@@ -327,172 +352,192 @@ def ComputeVirtualHeelMarkerLab(PlantigradeCheck, SujectShodCheck, SoleThickness
         
     return VirtualHeelMarkerLab
 
-def TechCS_Foot_Newington(Side, KneeCenterLab, AnkleCenterLab, ToeMarker):
+def TechCS_Foot_Newington_Batch(Side, KneeCenterLab, AnkleCenterLab, ToeMarker):
     
-    eztemp = math.ComputeUnitVecFromPts(AnkleCenterLab, KneeCenterLab)
-    ex = math.ComputeUnitVecFromPts(AnkleCenterLab, ToeMarker)
-    ey = np.cross(eztemp,ex)
-    ey = ey/ np.linalg.norm(ey)
-    ez = np.cross(ex,ey)
-    ez = ez/ np.linalg.norm(ez)
+    eztemp = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, KneeCenterLab)
+    ex = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, ToeMarker)
+    ey = math.NormalizeVectors_Batch(np.cross(eztemp,ex))
+    ez = math.NormalizeVectors_Batch(np.cross(ex,ey))
     
-    EFootTech = np.column_stack((ex,ey,ez))
+    EFootTech = np.stack((ex,ey,ez), axis=-1)
     
     return EFootTech
 
-def AnatCS_Thigh_Newington(Side, HipCenterLab, VirtualKneeMarkerLab, KneeCenterLab):
+def TechCS_Foot_Newington(Side, KneeCenterLab, AnkleCenterLab, ToeMarker):
     
-    ez = math.ComputeUnitVecFromPts(KneeCenterLab, HipCenterLab)
-    R1 = math.ComputeUnitVecFromPts(KneeCenterLab, VirtualKneeMarkerLab)
+    return TechCS_Foot_Newington_Batch(Side, KneeCenterLab, AnkleCenterLab, ToeMarker)
+
+def AnatCS_Thigh_Newington_Batch(Side, HipCenterLab, VirtualKneeMarkerLab, KneeCenterLab):
+    
+    ez = math.ComputeUnitVecFromPts_Batch(KneeCenterLab, HipCenterLab)
+    R1 = math.ComputeUnitVecFromPts_Batch(KneeCenterLab, VirtualKneeMarkerLab)
     
     if Side == 'Left':
         ex = np.cross(R1, ez)
     if Side == 'Right':
         ex = np.cross(ez, R1)
     
-    ex = ex/ np.linalg.norm(ex)
+    ex = math.NormalizeVectors_Batch(ex)
     ey = np.cross(ez, ex)
     
-    EThighAnat = np.column_stack((ex,ey,ez))
+    EThighAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EThighAnat
 
-def AnatCS_Thigh_Delp(Side, HipCenterLab, KneeMarkerLab, KneeCenterLab, ThighRotation):
+def AnatCS_Thigh_Newington(Side, HipCenterLab, VirtualKneeMarkerLab, KneeCenterLab):
     
-    etz = math.ComputeUnitVecFromPts(KneeCenterLab, HipCenterLab)
-    R1 = math.ComputeUnitVecFromPts(KneeCenterLab, KneeMarkerLab)
+    return AnatCS_Thigh_Newington_Batch(Side, HipCenterLab, VirtualKneeMarkerLab, KneeCenterLab)
+
+def SegmentRotationAngle(Side, SegmentRotation):
+    # Converts rotation string such as '5 Ext' or '5 Int' to signed angle in degrees for the side
+    SegmentRotationValue = float(SegmentRotation.split(' ')[0])
+    if SegmentRotation.split(' ')[1] == 'Ext':
+        SegmentRotationDirection = +1
+    else:
+        SegmentRotationDirection = -1
     
     if Side == 'Left':
-        etx = np.cross(R1, etz)
+        angle = -SegmentRotationDirection * SegmentRotationValue
     if Side == 'Right':
-        etx = np.cross(etz, R1)
+        angle =  SegmentRotationDirection * SegmentRotationValue
     
-    etx = etx/ np.linalg.norm(etx)
-    ety = np.cross(etz, etx)
+    return angle
+
+def AnatCS_Thigh_Delp_Batch(Side, HipCenterLab, KneeMarkerLab, KneeCenterLab, ThighRotation):
     
-    # Rotate CS around Z axis by ThighRotation
-    ThighRotationValue = float(ThighRotation.split(' ')[0])
-    if ThighRotation.split(' ')[1] == 'Ext':
-        ThighRotationDirection = +1
-    else:
-        ThighRotationDirection = -1
+    etz = math.ComputeUnitVecFromPts_Batch(KneeCenterLab, HipCenterLab)
+    R1 = math.ComputeUnitVecFromPts_Batch(KneeCenterLab, KneeMarkerLab)
     
     if Side == 'Left':
-        angle = -ThighRotationDirection * ThighRotationValue
+        etx = np.cross(R1, etz)
     if Side == 'Right':
-        angle =  ThighRotationDirection * ThighRotationValue
+        etx = np.cross(etz, R1)
     
+    etx = math.NormalizeVectors_Batch(etx)
+    ety = np.cross(etz, etx)
+    
+    # Rotate CS around Z axis by ThighRotation
+    angle = SegmentRotationAngle(Side, ThighRotation)
     
     ex = etx * np.cos(angle*np.pi/180) + ety * -np.sin(angle*np.pi/180)
     ey = etx * np.sin(angle*np.pi/180) + ety *  np.cos(angle*np.pi/180)
     ez = etz 
     ############################################
     
-    EThighAnat = np.column_stack((ex,ey,ez))
+    EThighAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EThighAnat
 
-def AnatCS_Shank_Proximal_Newington(Side, KneeCenterLab, VirtualKneeMarkerLab, AnkleCenterLab):
+def AnatCS_Thigh_Delp(Side, HipCenterLab, KneeMarkerLab, KneeCenterLab, ThighRotation):
     
-    ez = math.ComputeUnitVecFromPts(AnkleCenterLab,KneeCenterLab)
-    R1 = math.ComputeUnitVecFromPts(KneeCenterLab, VirtualKneeMarkerLab)
+    return AnatCS_Thigh_Delp_Batch(Side, HipCenterLab, KneeMarkerLab, KneeCenterLab, ThighRotation)
+
+def AnatCS_Shank_Proximal_Newington_Batch(Side, KneeCenterLab, VirtualKneeMarkerLab, AnkleCenterLab):
+    
+    ez = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab,KneeCenterLab)
+    R1 = math.ComputeUnitVecFromPts_Batch(KneeCenterLab, VirtualKneeMarkerLab)
     
     if Side == 'Left':
         ex = np.cross(R1, ez)
     if Side == 'Right':
         ex = np.cross(ez, R1)
     
-    ex = ex/ np.linalg.norm(ex)
+    ex = math.NormalizeVectors_Batch(ex)
     ey = np.cross(ez,ex) 
     
-    EShankProximalAnat = np.column_stack((ex,ey,ez))
+    EShankProximalAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EShankProximalAnat
 
-def AnatCS_Shank_Distal_VCM(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker):
+def AnatCS_Shank_Proximal_Newington(Side, KneeCenterLab, VirtualKneeMarkerLab, AnkleCenterLab):
+    
+    return AnatCS_Shank_Proximal_Newington_Batch(Side, KneeCenterLab, VirtualKneeMarkerLab, AnkleCenterLab)
+
+def AnatCS_Shank_Distal_VCM_Batch(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker):
     
-    ez = math.ComputeUnitVecFromPts(AnkleCenterLab,KneeCenterLab)
+    ez = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab,KneeCenterLab)
     
     if Side == 'Left':
-        R1 = math.ComputeUnitVecFromPts(AnkleCenterLab, LateralAnkleMarker)
+        R1 = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, LateralAnkleMarker)
     if Side == 'Right':
-        R1 = math.ComputeUnitVecFromPts(LateralAnkleMarker, AnkleCenterLab)
+        R1 = math.ComputeUnitVecFromPts_Batch(LateralAnkleMarker, AnkleCenterLab)
     
-    ex = np.cross(R1, ez)
-    ex = ex/ np.linalg.norm(ex)
+    ex = math.NormalizeVectors_Batch(np.cross(R1, ez))
     ey = np.cross(ez,ex) 
     
-    EShankDistalAnat = np.column_stack((ex,ey,ez))
+    EShankDistalAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EShankDistalAnat
 
-def AnatCS_Shank_Delp(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker,ShankRotation):
+def AnatCS_Shank_Distal_VCM(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker):
     
-    esz = math.ComputeUnitVecFromPts(AnkleCenterLab,KneeCenterLab)
+    return AnatCS_Shank_Distal_VCM_Batch(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker)
+
+def AnatCS_Shank_Delp_Batch(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker,ShankRotation):
+    
+    esz = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab,KneeCenterLab)
     
     if Side == 'Left':
-        R1 = math.ComputeUnitVecFromPts(AnkleCenterLab, LateralAnkleMarker)
+        R1 = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, LateralAnkleMarker)
     if Side == 'Right':
-        R1 = math.ComputeUnitVecFromPts(LateralAnkleMarker, AnkleCenterLab)
+        R1 = math.ComputeUnitVecFromPts_Batch(LateralAnkleMarker, AnkleCenterLab)
     
-    esx = np.cross(R1, esz)
-    esx = esx/ np.linalg.norm(esx)
+    esx = math.NormalizeVectors_Batch(np.cross(R1, esz))
     esy = np.cross(esz,esx) 
     
     # Rotate CS around Z axis by ShankRotation
-    ShankRotationValue = float(ShankRotation.split(' ')[0])
-    if ShankRotation.split(' ')[1] == 'Ext':
-        ShankRotationDirection = +1
-    else:
-        ShankRotationDirection = -1
-    
-    if Side == 'Left':
-        angle = -ShankRotationDirection * ShankRotationValue
-    if Side == 'Right':
-        angle =  ShankRotationDirection * ShankRotationValue
-    
+    angle = SegmentRotationAngle(Side, ShankRotation)
     
     ex = esx * np.cos(angle*np.pi/180) + esy * -np.sin(angle*np.pi/180)
     ey = esx * np.sin(angle*np.pi/180) + esy *  np.cos(angle*np.pi/180)
     ez = esz 
     ############################################
     
-    EShankDistalAnat = np.column_stack((ex,ey,ez))
+    EShankDistalAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EShankDistalAnat
+
+def AnatCS_Shank_Delp(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker,ShankRotation):
+    
+    return AnatCS_Shank_Delp_Batch(Side, KneeCenterLab, AnkleCenterLab, LateralAnkleMarker,ShankRotation)
  
-def AnatCS_Foot_Newington(Side, LateralAnkleMarker, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
+def AnatCS_Foot_Newington_Batch(Side, LateralAnkleMarker, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
     
-    ex = math.ComputeUnitVecFromPts(VirtualHeelMarkerLab, ToeMarker)
+    ex = math.ComputeUnitVecFromPts_Batch(VirtualHeelMarkerLab, ToeMarker)
     
     if Side == 'Left':
-        R1= math.ComputeUnitVecFromPts(AnkleCenterLab, LateralAnkleMarker)
+        R1= math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, LateralAnkleMarker)
     if Side == 'Right':
-        R1= math.ComputeUnitVecFromPts(LateralAnkleMarker, AnkleCenterLab)
+        R1= math.ComputeUnitVecFromPts_Batch(LateralAnkleMarker, AnkleCenterLab)
     
-    ez = np.cross(ex, R1)
-    ez = ez/ np.linalg.norm(ez)
+    ez = math.NormalizeVectors_Batch(np.cross(ex, R1))
     ey = np.cross(ez,ex)
     
-    EFootAnat = np.column_stack((ex,ey,ez))
+    EFootAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EFootAnat
 
-def AnatCS_Foot_ShrineGaitModel(Side, KneeCenterLab, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
+def AnatCS_Foot_Newington(Side, LateralAnkleMarker, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
     
-    ex = math.ComputeUnitVecFromPts(VirtualHeelMarkerLab, ToeMarker)
+    return AnatCS_Foot_Newington_Batch(Side, LateralAnkleMarker, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab)
+
+def AnatCS_Foot_ShrineGaitModel_Batch(Side, KneeCenterLab, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
     
-    eztemp = math.ComputeUnitVecFromPts(AnkleCenterLab, KneeCenterLab)
+    ex = math.ComputeUnitVecFromPts_Batch(VirtualHeelMarkerLab, ToeMarker)
     
-    ey = np.cross(eztemp,ex)
-    ey = ey/ np.linalg.norm(ey)
-    ez = np.cross(ex,ey)
-    ez = ez/ np.linalg.norm(ez)
+    eztemp = math.ComputeUnitVecFromPts_Batch(AnkleCenterLab, KneeCenterLab)
     
-    EFootAnat = np.column_stack((ex,ey,ez))
+    ey = math.NormalizeVectors_Batch(np.cross(eztemp,ex))
+    ez = math.NormalizeVectors_Batch(np.cross(ex,ey))
+    
+    EFootAnat = np.stack((ex,ey,ez), axis=-1)
     
     return EFootAnat
 
+def AnatCS_Foot_ShrineGaitModel(Side, KneeCenterLab, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab):
+    
+    return AnatCS_Foot_ShrineGaitModel_Batch(Side, KneeCenterLab, AnkleCenterLab, ToeMarker, VirtualHeelMarkerLab)
+
 def Compute_TibialTorsion(Side, EShankProximalAnat, LateralAnkleMarker, MedialAnkleMarker): 
     
     if Side == 'Left':
@@ -537,56 +582,65 @@ def Compute_ThighRotation(Side, EPelvisAnat, LateralKneeeMarker, KneeCenter):
     
     return ThighRotation
 
-def TechCS_Hindfoot_mSHCG(Side, LateralCalcaneusMarker, MedialCalcaneusMarker, HeelMarker):
+def TechCS_Hindfoot_mSHCG_Batch(Side, LateralCalcaneusMarker, MedialCalcaneusMarker, HeelMarker):
     
     CCAL = (LateralCalcaneusMarker + MedialCalcaneusMarker) /2 
-    ex = math.ComputeUnitVecFromPts(HeelMarker, CCAL)
+    ex = math.ComputeUnitVecFromPts_Batch(HeelMarker, CCAL)
     
     if Side == 'Left':
-        R1 = math.ComputeUnitVecFromPts(MedialCalcaneusMarker, LateralCalcaneusMarker)
+        R1 = math.ComputeUnitVecFromPts_Batch(MedialCalcaneusMarker, LateralCalcaneusMarker)
     if Side == 'Right':
-        R1 = math.ComputeUnitVecFromPts(LateralCalcaneusMarker, MedialCalcaneusMarker)
+        R1 = math.ComputeUnitVecFromPts_Batch(LateralCalcaneusMarker, MedialCalcaneusMarker)
     
-    ez = np.cross(ex,R1)
-    ez = ez/ np.linalg.norm(ez)
+    ez = math.NormalizeVectors_Batch(np.cross(ex,R1))
     ey = np.cross(ez,ex)
     
-    EHindfootTech = np.column_stack((ex,ey,ez))
+    EHindfootTech = np.stack((ex,ey,ez), axis=-1)
     
     return EHindfootTech
 
-def TechCS_Forefoot_mSHCG(Side, MT1B, MT1H, MT5H):
+def TechCS_Hindfoot_mSHCG(Side, LateralCalcaneusMarker, MedialCalcaneusMarker, HeelMarker):
     
-    ex = math.ComputeUnitVecFromPts(MT1B, MT1H)
+    return TechCS_Hindfoot_mSHCG_Batch(Side, LateralCalcaneusMarker, MedialCalcaneusMarker, HeelMarker)
+
+def TechCS_Forefoot_mSHCG_Batch(Side, MT1B, MT1H, MT5H):
+    
+    ex = math.ComputeUnitVecFromPts_Batch(MT1B, MT1H)
     
     if Side == 'Left':
-        R1 = math.ComputeUnitVecFromPts(MT1H, MT5H)
+        R1 = math.ComputeUnitVecFromPts_Batch(MT1H, MT5H)
     if Side == 'Right':
-        R1 = math.ComputeUnitVecFromPts(MT5H, MT1H)
+        R1 = math.ComputeUnitVecFromPts_Batch(MT5H, MT1H)
     
-    ez = np.cross(ex,R1)
-    ez = ez/ np.linalg.norm(ez)
+    ez = math.NormalizeVectors_Batch(np.cross(ex,R1))
     ey = np.cross(ez,ex)
     
-    EForefootTech = np.column_stack((ex,ey,ez))
+    EForefootTech = np.stack((ex,ey,ez), axis=-1)
     return EForefootTech
 
-def TechCS_Hallux_mSHCG(Side, HLX, MTP1, TOE):
+def TechCS_Forefoot_mSHCG(Side, MT1B, MT1H, MT5H):
+    
+    return TechCS_Forefoot_mSHCG_Batch(Side, MT1B, MT1H, MT5H)
+
+def TechCS_Hallux_mSHCG_Batch(Side, HLX, MTP1, TOE):
     
-    ex = math.ComputeUnitVecFromPts(MTP1, HLX)
+    ex = math.ComputeUnitVecFromPts_Batch(MTP1, HLX)
     
     if Side == 'Left':
-        R1 = math.ComputeUnitVecFromPts(MTP1, TOE)
+        R1 = math.ComputeUnitVecFromPts_Batch(MTP1, TOE)
     if Side =='Right':
-        R1 = math.ComputeUnitVecFromPts(TOE, MTP1)
+        R1 = math.ComputeUnitVecFromPts_Batch(TOE, MTP1)
     
-    ez = np.cross(ex,R1)
-    ez = ez/ np.linalg.norm(ez)
+    ez = math.NormalizeVectors_Batch(np.cross(ex,R1))
     ey = np.cross(ez,ex)
     
-    EHalluxTech = np.column_stack((ex,ey,ez))
+    EHalluxTech = np.stack((ex,ey,ez), axis=-1)
     
     return EHalluxTech        
+
+def TechCS_Hallux_mSHCG(Side, HLX, MTP1, TOE):
+    
+    return TechCS_Hallux_mSHCG_Batch(Side, HLX, MTP1, TOE)
     
 def AnatCS_Hindfoot_mSHCG(Side, LCAL, MCAL, HEEL, CALPT, 
                           HindfootVarus, CalcanealPitch, HindfootProgression, HindFootValgusIsNegative):
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Command line entry point to run the Shrine Gait Model programs on C3D files, without Vicon Nexus
+
+    python Py3_Headless.py dynamic Walk01.c3d --condition BF --mode Vectorized
+    python Py3_Headless.py gcd Walk01.c3d --condition BF
+    python Py3_Headless.py process Walk01.c3d          (dynamic then gcd, sharing the loaded trial)
+    python Py3_Headless.py dynamic Walk01.c3d --output Walk01.Model.c3d
+    python Py3_Headless.py static Static01.c3d --preferences Py3_UserPreferences.py
+    python Py3_Headless.py process Walk01.c3d --outputs Standard   (model outputs of a profile, see Py3_OutputStore)
+    python Py3_Headless.py gcd Walk01.c3d --all-cycles   (also <Trial>.AllCycles.GCD with every cycle, mean and SD)
+    python Py3_Headless.py process Walk01.c3d --cache D:/ModelCache   (reuse the results of unchanged trials)
+    python Py3_Headless.py process Walk01.c3d --profile       (calls to the trial source and their time)
+
+The static calibration file Static_<Condition>_<Subject>.py is looked up next to the C3D file, as in Nexus.
+Dynamic model outputs are saved next to the C3D file (<Trial>.Outputs.npz) for a later gcd step, or with --output
+written with the trial to a new C3D file (gcd can then be run on that file).
+Static calibration is the interactive calibration review and still needs a display.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import runpy
+import argparse
+
+import Py3_TrialSource
+import Py3_ResultCache
+import Py3_Calibration
+
+ProgramDirectory = os.path.dirname(os.path.abspath(__file__))
+Programs = {'static': 'Py3_StaticMain.py', 'dynamic': 'Py3_DynamicMain.py', 'gcd': 'Py3_CreateGCD.py'}
+Steps = {'static': ['static'], 'dynamic': ['dynamic'], 'gcd': ['gcd'], 'process': ['dynamic', 'gcd']}
+
+def RunProgram(Step, Arguments):
+    # Run a program as Nexus does, the script arguments follow the Nexus pipeline arguments
+    ProgramFileName = os.path.join(ProgramDirectory, Programs[Step])
+    if Step == 'static':
+        sys.argv = [ProgramFileName, Arguments.condition] + ([Arguments.preferences] if Arguments.preferences else [])
+    elif Step == 'dynamic':
+        sys.argv = [ProgramFileName, Arguments.condition, Arguments.mode] + ([Arguments.outputs] if getattr(Arguments, 'outputs', None) else [])
+    else:
+        sys.argv = [ProgramFileName, Arguments.condition] + (['AllCycles'] if getattr(Arguments, 'all_cycles', False) else [])
+    Globals = runpy.run_path(ProgramFileName, run_name='__main__')
+    if getattr(Arguments, 'profile', False):
+        print(Step + ' ' + Globals['vicon'].Report())
+
+def RunStep(Source, Step, Arguments, Cache=None):
+    # Run a step on the trial and save its results. With a result cache the dynamic outputs or GCD file of an earlier
+    # run on the same inputs are reused.
+    Key = None
+    Found = False
+    GCDFiles = {'GCD': Source.FilePath + Source.TrialName + '.GCD'}
+    if getattr(Arguments, 'all_cycles', False):
+        GCDFiles['AllCycles.GCD'] = Source.FilePath + Source.TrialName + '.AllCycles.GCD'
+    # With --output the model outputs of the dynamic step go to that C3D file and not to <Trial>.Outputs.npz, which the
+    # GCD key hashes, so the GCD file is not cached
+    if Cache is not None and (Step == 'dynamic' or (Step == 'gcd' and not getattr(Arguments, 'output', None))):
+        StaticDataFileName = Source.FilePath + 'Static_' + Arguments.condition + '_' + Source.SubjectName + '.py'
+        if Step == 'dynamic':
+            Options = [Arguments.outputs] if getattr(Arguments, 'outputs', None) else []
+            Key = Cache.Key(Step, Source.C3D.FileName, StaticDataFileName, Arguments.condition, Arguments.mode, *Options)
+            Found = Cache.Get(Key, {'Outputs.npz': Source.LoadOutputs})
+        else:
+            Options = (['AllCycles'] if getattr(Arguments, 'all_cycles', False) else []) + ([Arguments.outputs] if getattr(Arguments, 'outputs', None) else [])
+            if Py3_Calibration.LoadCalibration(StaticDataFileName).get('GCDBinary', False):
+                GCDFiles.update({Name + '.bin': GCDFiles[Name] + '.bin' for Name in list(GCDFiles)})
+            # The model outputs come from <Trial>.Outputs.npz, or from the C3D file when there is none, and were computed
+            # with the mode of the dynamic step, not the --mode of this run
+            Key = Cache.Key(Step, Source.C3D.FileName, StaticDataFileName, Arguments.condition, '', *Options, InputFileNames=[Source.OutputsFileName()])
+            Found = Cache.Get(Key, GCDFiles)
+    if not Found:
+        RunProgram(Step, Arguments)
+
+    if Step == 'dynamic' and Arguments.output:
+        Source.SaveC3D(Arguments.output)
+    elif Step == 'dynamic':
+        Source.SaveOutputs()
+    if Key is not None and not Found:
+        if Step == 'dynamic':
+            Cache.Put(Key, {'Outputs.npz': Source.SaveOutputs})
+        else:
+            Cache.Put(Key, GCDFiles)
+
+def main():
+    Parser = argparse.ArgumentParser(description='Run the Shrine Gait Model on a C3D file without Vicon Nexus')
+    Parser.add_argument('step', choices=sorted(Steps), help='program to run, process runs dynamic and gcd')
+    Parser.add_argument('trial', help='C3D file of the trial')
+    Parser.add_argument('--condition', default='BF', help='testing condition of the static calibration file (default BF)')
+    Parser.add_argument('--mode', default='FrameByFrame', choices=['FrameByFrame', 'Vectorized'], help='Dynamic_Main processing mode')
+    Parser.add_argument('--outputs', default=None, help='model output profile or groups joined by +, instead of OutputProfile of the static calibration')
+    Parser.add_argument('--all-cycles', action='store_true', help='gcd also writes every complete gait cycle with mean and SD to <Trial>.AllCycles.GCD')
+    Parser.add_argument('--subject', default=None, help='subject name, when the C3D file has none')
+    Parser.add_argument('--preferences', default=None, help='user preferences file for a new static calibration')
+    Parser.add_argument('--output', default=None, help='C3D file to write the trial with the dynamic model outputs')
+    Parser.add_argument('--cache', default=None, help='result cache folder, unchanged trials are not processed again')
+    Parser.add_argument('--profile', action='store_true', help='print the calls to the trial source of each program and their time')
+    Parser.add_argument('--cache-size', type=float, default=Py3_ResultCache.DefaultCacheSize, help='maximum size of the result cache in MB')
+    Arguments = Parser.parse_args()
+
+    Source = Py3_TrialSource.C3DTrialSource(Arguments.trial, Arguments.subject)
+    Py3_TrialSource.SetTrialSource(Source)
+    Cache = None
+    if Arguments.cache:
+        Cache = Py3_ResultCache.ResultCache(Arguments.cache, Arguments.cache_size)
+    for Step in Steps[Arguments.step]:
+        RunStep(Source, Step, Arguments, Cache)
+    if Cache is not None:
+        print(Cache.Report())
+
+if __name__ == '__main__':
+    main()
@@ -27,10 +27,13 @@ Last Update: 26 Aug, 2024
 ---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 """
 
-VersionNumber = 'Py3_v1.3'
+VersionNumber = 'Py3_v1.4'
 
 import numpy as np
 import math
+import functools
+import scipy.signal as signal
+import scipy.interpolate as interpolate
 
 def ComputeUnitVecFromPts(Tail, Tip):
     if np.linalg.norm(Tip-Tail) == 0.0 or math.isnan(np.linalg.norm(Tip-Tail)) is True:
@@ -40,6 +43,21 @@ def ComputeUnitVecFromPts(Tail, Tip):
         UnitVector = (Tip-Tail)/np.linalg.norm(Tip-Tail)
     return UnitVector
 
+def NormalizeVectors_Batch(Vectors):
+    # Unit vectors along the last axis of (N, 3) or (3,) data
+    # Zero length or NaN vectors are masked and returned as zeros, as in ComputeUnitVecFromPts
+    Vectors = np.asarray(Vectors, dtype=float)
+    Norm = np.linalg.norm(Vectors, axis=-1, keepdims=True)
+    Valid = (Norm > 0.0) & ~np.isnan(Norm)
+    return np.divide(Vectors, Norm, out=np.zeros(Vectors.shape), where=Valid)
+
+def ComputeUnitVecFromPts_Batch(Tail, Tip):
+    return NormalizeVectors_Batch(np.asarray(Tip, dtype=float) - np.asarray(Tail, dtype=float))
+
+def DotProduct_Batch(Vector1, Vector2):
+    # Row-wise dot product of (N, 3) arrays
+    return np.einsum('...i,...i->...', Vector1, Vector2)
+
 def Compute3DAngle(Point1, Point2, Point3):
     UnitVector1 = ComputeUnitVecFromPts(Point2, Point1)
     UnitVector2 = ComputeUnitVecFromPts(Point2, Point3)
@@ -54,12 +72,25 @@ def TransformVectorIntoLabCoors(Vector, TransformationMatrix):
     
     return TransformedVector
 
+def TransformVectorIntoLabCoors_Batch(Vector, TransformationMatrix):
+    # Vector is (..., 3), TransformationMatrix is (..., 3, 3)
+    TransformedVector = np.einsum('...ij,...j->...i', TransformationMatrix, Vector)
+    
+    return TransformedVector
+
 def TransformPointIntoLabCoors(Point, TransformationMatrix, CoordinateSystemOrigin):
     TransformedVector = TransformVectorIntoLabCoors(Point, TransformationMatrix)
     TransformedPoint = TransformedVector + CoordinateSystemOrigin    
 
     return TransformedPoint
 
+def TransformPointIntoLabCoors_Batch(Point, TransformationMatrix, CoordinateSystemOrigin):
+    # Point is (3,) or (N, 3), TransformationMatrix is (N, 3, 3) or (3, 3), CoordinateSystemOrigin is (N, 3) or (3,)
+    TransformedVector = np.einsum('...ij,...j->...i', TransformationMatrix, Point)
+    TransformedPoint = TransformedVector + CoordinateSystemOrigin
+
+    return TransformedPoint
+
 def TransformVectorIntoMovingCoors(Vector, TransformationMatrix):
     TransformedVector = np.array([0.,0.,0.])
     for i in range(3):
@@ -68,6 +99,12 @@ def TransformVectorIntoMovingCoors(Vector, TransformationMatrix):
     return TransformedVector
 
 
+def TransformVectorIntoMovingCoors_Batch(Vector, TransformationMatrix):
+    # Vector is (..., 3), TransformationMatrix is (..., 3, 3)
+    TransformedVector = np.einsum('...ji,...j->...i', TransformationMatrix, Vector)
+    
+    return TransformedVector
+
 def TransformPointIntoMovingCoors(Point, TransformationMatrix, Origin):
     
     TranslatedPoint = Point - Origin
@@ -105,6 +142,10 @@ def TransformAnatCoorSysFromTechCoors(EAnatRelTech, ETech):
         
     return EAnat
 
+def TransformAnatCoorSysFromTechCoors_Batch(EAnatRelTech, ETech):
+    # Batch version of TransformAnatCoorSysFromTechCoors, ETech is (N, 3, 3) and EAnatRelTech (3, 3)
+    return np.matmul(ETech, EAnatRelTech)
+
 def EulerAngles_YXZ(EMoving, ERef):
     
     # em- Vectors of Moving Coordinate System
@@ -187,37 +228,94 @@ def EulerAngles_ZYX(EMoving, ERef):
     
     return AnglesRad
 
+def DirectionCosines_Batch(EMoving, ERef):
+    # Dot products of moving and reference axes for stacks of coordinate systems
+    # EMoving and ERef are (N, 3, 3) with axes in columns, a single (3, 3) ERef is broadcast to all frames
+    # Returns (N, 3, 3) where element [n, i, k] = em_i . er_k at frame n
+    return np.einsum('...ji,...jk->...ik', EMoving, ERef)
+
+def EulerAngles_YXZ_Batch(EMoving, ERef):
+    # Batch version of EulerAngles_YXZ, returns (N, 3) angles in radians
+    D = DirectionCosines_Batch(EMoving, ERef)
+    AnglesRad = np.empty(D.shape[:-1])
+    # Obiliquity or Ab/Adduction
+    AnglesRad[..., 0] = np.arcsin(-D[..., 2, 1])
+    # Tilt or Flexion/Extension
+    AnglesRad[..., 1] = np.arctan2(D[..., 2, 0], D[..., 2, 2])
+    # Int/Ext Rotation
+    AnglesRad[..., 2] = np.arctan2(D[..., 0, 1], D[..., 1, 1])
+    
+    return AnglesRad
+
+def EulerAngles_ZXY_Batch(EMoving, ERef):
+    # Batch version of EulerAngles_ZXY, returns (N, 3) angles in radians
+    D = DirectionCosines_Batch(EMoving, ERef)
+    AnglesRad = np.empty(D.shape[:-1])
+    # Obiliquity or Ab/Adduction
+    AnglesRad[..., 0] = np.arcsin(D[..., 1, 2])
+    # Tilt or Flexion/Extension
+    AnglesRad[..., 1] = np.arctan2(-D[..., 0, 2], D[..., 2, 2])
+    # Int/Ext Rotation
+    AnglesRad[..., 2] = np.arctan2(-D[..., 1, 0], D[..., 1, 1])
+    
+    return AnglesRad
+
+def EulerAngles_ZYX_Batch(EMoving, ERef):
+    # Batch version of EulerAngles_ZYX, returns (N, 3) angles in radians
+    D = DirectionCosines_Batch(EMoving, ERef)
+    AnglesRad = np.empty(D.shape[:-1])
+    # Obiliquity or Ab/Adduction
+    AnglesRad[..., 0] = np.arctan2(D[..., 1, 2], D[..., 2, 2])
+    # Tilt or Flexion/Extension
+    AnglesRad[..., 1] = np.arcsin(-D[..., 0, 2])
+    # Int/Ext Rotation
+    AnglesRad[..., 2] = np.arctan2(D[..., 0, 1], D[..., 0, 0])
+    
+    return AnglesRad
+
+def AngleConventionMatrices(Sign):
+    # Sign and plotting convention matrices used for angle outputs. Sign = -1 for Left, 1 for Right
+    # T1- Segment angles, T2- Hip/Ankle/Foot joint angles, T3- Knee angles
+    T1 = np.diag([-Sign, 1., Sign])
+    T2 = np.diag([ Sign,-1., Sign])
+    T3 = np.diag([ Sign, 1., Sign])
+    return ([T1, T2, T3])
+
+def ConvertAnglesToDegrees_Batch(AnglesRad, T):
+    # Applies convention matrix T and converts radians to degrees in one broadcasted operation
+    # AnglesRad is (N, 3) or stacked (K, N, 3); T is (3, 3) or stacked (K, 3, 3)
+    return np.einsum('...ij,...nj->...ni', T, AnglesRad) * 180 / np.pi
+
+def AngVelAcc_Euler_YXZ_Batch(Angles, Velocity, Acceleration):
+    # Angular velocity and acceleration from YXZ Euler angle derivatives
+    # Inputs are (3, ...) arrays with the angle components along the first axis
+    AngVel = np.zeros(np.shape(Angles))
+    AngAcc = np.zeros(np.shape(Angles))
+    CosA, SinA = np.cos(Angles[0]), np.sin(Angles[0])
+    CosB, SinB = np.cos(Angles[1]), np.sin(Angles[1])
+    
+    AngVel[0] =  Velocity[0] * CosB + Velocity[2] * CosA * SinB
+    AngVel[1] =  Velocity[1] - Velocity[2] * SinA
+    AngVel[2] = -Velocity[0] * SinB + Velocity[2] * CosA * CosB
+    
+    AngAcc[0] =  Acceleration[0] * CosB - Velocity[0] * Velocity[1] * SinB + Acceleration[2] * CosA * SinB \
+                -Velocity[2] * Velocity[0] * SinA * SinB + Velocity[2] * Velocity[1] * CosA * CosB
+    AngAcc[1] =  Acceleration[1] - Acceleration[2] * SinA - Velocity[2] * Velocity[0] * CosA
+    AngAcc[2] = -Acceleration[0] * SinB - Velocity[0] * Velocity[1] * CosB + Acceleration[2] * CosA * CosB \
+                -Velocity[2] * Velocity[0] * SinA * CosB - Velocity[2] * Velocity[1] * CosA * SinB
+    
+    return ([AngVel, AngAcc])
+
 def AngVelAcc_Euler_YXZ(Angles, Velocity, Acceleration, FirstFrame, LastFrame, framecount):
-    AngVel = [[0. for m in range(framecount)] for n in range(3)]
-    AngAcc = [[0. for m in range(framecount)] for n in range(3)]    
+    AngVel = np.zeros((3, framecount))
+    AngAcc = np.zeros((3, framecount))
     
-    for FrameNumber in range(FirstFrame-1, LastFrame):
-        AngVel[0][FrameNumber] =  Velocity[0][FrameNumber] * np.cos(Angles[1][FrameNumber]) + \
-                                  Velocity[2][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.sin(Angles[1][FrameNumber])
-        
-        AngVel[1][FrameNumber] =  Velocity[1][FrameNumber] + \
-                                 -Velocity[2][FrameNumber] * np.sin(Angles[0][FrameNumber])
+    Frames = slice(FirstFrame-1, LastFrame)
+    [AngVel[:,Frames], AngAcc[:,Frames]] = AngVelAcc_Euler_YXZ_Batch(np.asarray(Angles, dtype=float)[:,Frames],
+                                                                     np.asarray(Velocity, dtype=float)[:,Frames],
+                                                                     np.asarray(Acceleration, dtype=float)[:,Frames])
         
-        AngVel[2][FrameNumber] = -Velocity[0][FrameNumber] * np.sin(Angles[1][FrameNumber]) + \
-                                  Velocity[2][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.cos(Angles[1][FrameNumber])
-                                  
-        AngAcc[0][FrameNumber] =  Acceleration[0][FrameNumber] * np.cos(Angles[1][FrameNumber]) +\
-                                 -Velocity[0][FrameNumber] * Velocity[1][FrameNumber] * np.sin(Angles[1][FrameNumber]) +\
-                                  Acceleration[2][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.sin(Angles[1][FrameNumber]) +\
-                                 -Velocity[2][FrameNumber] * Velocity[0][FrameNumber] * np.sin(Angles[0][FrameNumber]) * np.sin(Angles[1][FrameNumber]) +\
-                                  Velocity[2][FrameNumber] * Velocity[1][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.cos(Angles[1][FrameNumber])
-                                  
-        AngAcc[1][FrameNumber] =  Acceleration[1][FrameNumber] + \
-                                 -Acceleration[2][FrameNumber] * np.sin(Angles[0][FrameNumber])  + \
-                                 -Velocity[2][FrameNumber] * Velocity[0][FrameNumber] * np.cos(Angles[0][FrameNumber])
-        
-        AngAcc[2][FrameNumber] = -Acceleration[0][FrameNumber] * np.sin(Angles[1][FrameNumber]) + \
-                                 -Velocity[0][FrameNumber] * Velocity[1][FrameNumber] * np.cos(Angles[1][FrameNumber]) + \
-                                  Acceleration[2][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.cos(Angles[1][FrameNumber]) + \
-                                 -Velocity[2][FrameNumber] * Velocity[0][FrameNumber] * np.sin(Angles[0][FrameNumber]) * np.cos(Angles[1][FrameNumber]) + \
-                                 -Velocity[2][FrameNumber] * Velocity[1][FrameNumber] * np.cos(Angles[0][FrameNumber]) * np.sin(Angles[1][FrameNumber])
-        
-    return ([AngVel, AngAcc])
+    return ([AngVel.tolist(), AngAcc.tolist()])
 
 def MassCenter(ProximalPoint, DistalPoint, DistalPercentage):
     
@@ -229,6 +327,14 @@ def MassCenter(ProximalPoint, DistalPoint, DistalPercentage):
     
     return COM
 
+def MassCenter_Batch(ProximalPoint, DistalPoint, DistalPercentage):
+    # Batch version of MassCenter for (N, 3) end points
+    LongAxisVector = ProximalPoint - DistalPoint
+    
+    COM = DistalPoint + DistalPercentage * LongAxisVector
+    
+    return COM
+
 def RadiusOfGyration(ProximalPoint, DistalPoint, Percentage1, Percentage2, Percentage3):
 
     LongAxisVector = ProximalPoint - DistalPoint
@@ -241,112 +347,281 @@ def RadiusOfGyration(ProximalPoint, DistalPoint, Percentage1, Percentage2, Perce
     
     return RadGyr
 
-def Differentiate(YData, FirstFrame, LastFrame, framecount, DeltaTime):
-    # Inputs is vector-based data set. 
-    # Converts into three single dimensional arrays for differentiation
-    # Returns the first and second derivative arrays into vector-based variables
-    FirstDerivativeData = [[0. for m in range(framecount)] for n in range(3)]
-    SecondDerivativeData = [[0. for m in range(framecount)] for n in range(3)]
+def RadiusOfGyration_Batch(ProximalPoint, DistalPoint, Percentage1, Percentage2, Percentage3):
+    # Batch version of RadiusOfGyration for (..., 3) end points
+    SegmentLength = np.linalg.norm(ProximalPoint - DistalPoint, axis=-1)
     
-    for i in range(3):
-        for FrameNumber in range(FirstFrame -1 + 3 , LastFrame - 3):
-            # Fit Quadratic polynomial in 7 point window
-            x = [0, 1*DeltaTime, 2*DeltaTime, 3*DeltaTime, 4*DeltaTime, 5*DeltaTime, 6*DeltaTime]
-            y = [ YData[i][FrameNumber-3],YData[i][FrameNumber-2], YData[i][FrameNumber-1], YData[i][FrameNumber], YData[i][FrameNumber+1], YData[i][FrameNumber+2], YData[i][FrameNumber+3] ] 
-            
-            # Fit fourth order polynomial to the 7 point data window
-            coeffs = np.polyfit(x, y, 3)
-            ffit_Polynomial = np.poly1d(coeffs)
-            FirstDeriv_Polynomial = ffit_Polynomial.deriv()
-            SecondDeriv_Polynomial = FirstDeriv_Polynomial.deriv()
-            
-            # Compute values at midpoint of 7-point window
-            FirstDerivativeData[i][FrameNumber] = FirstDeriv_Polynomial(3*DeltaTime)
-            SecondDerivativeData[i][FrameNumber] = SecondDeriv_Polynomial(3*DeltaTime)
-            
-            # Account for Beginning and End Points
-            if FrameNumber == FirstFrame -1 + 3:
-                FirstDerivativeData[i][FrameNumber-3] = FirstDeriv_Polynomial(0*DeltaTime)
-                SecondDerivativeData[i][FrameNumber-3] = SecondDeriv_Polynomial(0*DeltaTime)
-                FirstDerivativeData[i][FrameNumber-2] = FirstDeriv_Polynomial(1*DeltaTime)
-                SecondDerivativeData[i][FrameNumber-2] = SecondDeriv_Polynomial(1*DeltaTime)
-                FirstDerivativeData[i][FrameNumber-1] = FirstDeriv_Polynomial(2*DeltaTime)
-                SecondDerivativeData[i][FrameNumber-1] = SecondDeriv_Polynomial(2*DeltaTime)
-                #print(x)
-                #print(y)
-                #print(FirstDeriv_Polynomial(3*DeltaTime))
-                #print(SecondDerivativeData[i][FrameNumber])
-                
-                
-            if FrameNumber == LastFrame - 3 - 1:
-                FirstDerivativeData[i][FrameNumber+1] = FirstDeriv_Polynomial(4*DeltaTime)
-                SecondDerivativeData[i][FrameNumber+1] = SecondDeriv_Polynomial(4*DeltaTime)
-                FirstDerivativeData[i][FrameNumber+2] = FirstDeriv_Polynomial(5*DeltaTime)
-                SecondDerivativeData[i][FrameNumber+2] = SecondDeriv_Polynomial(5*DeltaTime)
-                FirstDerivativeData[i][FrameNumber+3] = FirstDeriv_Polynomial(6*DeltaTime)
-                SecondDerivativeData[i][FrameNumber+3] = SecondDeriv_Polynomial(6*DeltaTime)
-            
+    RadGyr = np.stack((Percentage1 * SegmentLength, Percentage2 * SegmentLength, Percentage3 * SegmentLength), axis=-1)
+    
+    return RadGyr
+
+def NewtonEuler_Batch(SegmentMass, SegmentWeight, MassMomentOfInertia, CenterOfMass, LinearAccelerationLab, ProximalPoint,
+                      DistalPoint, DistalForceLab, DistalMomentLab, ESegment, AngularVelocityLab, AngularAccelerationLab):
+    # Newton-Euler equations of one segment for all frames. Inputs are (..., 3) vectors and (..., 3, 3) coordinate systems,
+    # leading axes (e.g. side and frame) broadcast. Positions in mm, accelerations in mm/s^2, masses in kg.
+    # Distal force and moment act on the segment at DistalPoint; returns the proximal joint force (lab) and
+    # moment (segment CS and lab) acting on the segment
+    ProximalForceLab = SegmentMass * LinearAccelerationLab / 1e3 - DistalForceLab
+    ProximalForceLab[...,2] = ProximalForceLab[...,2] + SegmentWeight
+    
+    # Moments of the joint forces about the center of mass. Convert from mm to meters
+    MomentFromProximalForce = np.cross(ProximalPoint - CenterOfMass, ProximalForceLab) / 1e3
+    MomentFromDistalForce = np.cross(DistalPoint - CenterOfMass, DistalForceLab) / 1e3
+    
+    # Transform to Segment Coordinate System
+    MomentFromProximalForce_Segment = TransformVectorIntoMovingCoors_Batch(MomentFromProximalForce, ESegment)
+    MomentFromDistalForce_Segment = TransformVectorIntoMovingCoors_Batch(MomentFromDistalForce, ESegment)
+    DistalMoment_Segment = TransformVectorIntoMovingCoors_Batch(DistalMomentLab, ESegment)
+    AngularVelocity_Segment = TransformVectorIntoMovingCoors_Batch(AngularVelocityLab, ESegment)
+    AngularAcceleration_Segment = TransformVectorIntoMovingCoors_Batch(AngularAccelerationLab, ESegment)
+    
+    # Euler equations about the principal axes: I*alpha + (Ik - Ij)*wj*wk
+    I = MassMomentOfInertia
+    W = AngularVelocity_Segment
+    ProximalMoment_Segment = I * AngularAcceleration_Segment + \
+                             (I[...,[2,0,1]] - I[...,[1,2,0]]) * W[...,[1,2,0]] * W[...,[2,0,1]] \
+                             - MomentFromProximalForce_Segment - MomentFromDistalForce_Segment - DistalMoment_Segment
+    
+    # Transform Moment to Lab coordinate system
+    ProximalMomentLab = TransformVectorIntoLabCoors_Batch(ProximalMoment_Segment, ESegment)
+    
+    return ([ProximalForceLab, ProximalMoment_Segment, ProximalMomentLab])
+
+def InverseDynamics_Batch(GRF, GRT, COP, SegmentMasses, SegmentWeights, MassMomentsOfInertia, CentersOfMass, LinearAccelerationsLab,
+                          JointCenters, ESegments, AngularVelocitiesLab, AngularAccelerationsLab, JointAngularVelocities, EJointReferences):
+    # Inverse dynamics of a segment chain, distal to proximal, for all frames at once.
+    # Segment lists are ordered [Foot, Shank, Thigh]; joint lists [Ankle, Knee, Hip] with JointCenters holding the
+    # proximal end of each segment. JointAngularVelocities are expressed in EJointReferences (the proximal segment CS).
+    # GRF, GRT (N.m) and COP act on the most distal segment. Arrays may carry leading axes, e.g. (Sides, N, 3).
+    # Returns lists [Ankle, Knee, Hip] of joint forces (lab), joint moments (distal segment CS), power components and total power
+    JointForcesLab = []
+    JointMoments = []
+    JointPowers = []
+    JointPowersTotal = []
+    DistalPoint = COP
+    DistalForceLab = GRF
+    DistalMomentLab = GRT
+    for i in range(len(ESegments)):
+        [ForceLab, Moment_Segment, MomentLab] = NewtonEuler_Batch(SegmentMasses[i], SegmentWeights[i], MassMomentsOfInertia[i], CentersOfMass[i],
+                                                                  LinearAccelerationsLab[i], JointCenters[i], DistalPoint, DistalForceLab,
+                                                                  DistalMomentLab, ESegments[i], AngularVelocitiesLab[i], AngularAccelerationsLab[i])
+        # Joint velocity is in proximal segment CS. Transform to Distal
+        JointAngularVelocityLab = TransformVectorIntoLabCoors_Batch(JointAngularVelocities[i], EJointReferences[i])
+        JointAngularVelocity_Segment = TransformVectorIntoMovingCoors_Batch(JointAngularVelocityLab, ESegments[i])
+        JointPower = Moment_Segment * JointAngularVelocity_Segment
+        
+        JointForcesLab.append(ForceLab)
+        JointMoments.append(Moment_Segment)
+        JointPowers.append(JointPower)
+        JointPowersTotal.append(np.sum(JointPower, axis=-1))
+        
+        # Reverse sign of force and moment for the next proximal segment
+        DistalPoint = JointCenters[i]
+        DistalForceLab = -ForceLab
+        DistalMomentLab = -MomentLab
+    
+    return ([JointForcesLab, JointMoments, JointPowers, JointPowersTotal])
+
+def PolynomialFilterKernels(WindowWidth, Order, DerivativeOrder):
+    # Savitzky-Golay style kernels for a least squares polynomial of given Order fitted to
+    # WindowWidth equally spaced points (x = 0, 1, ... WindowWidth-1).
+    # Row p of the returned matrix holds the weights that evaluate the DerivativeOrder-th
+    # derivative of the fitted polynomial at window position p, i.e. the centre point and the
+    # asymmetric edge points of the window are all available from one fit.
+    # Rows cover positions 0 ... 2*int(WindowWidth/2), one more than the window for even widths.
+    # Kernels only depend on the window geometry, so they are cached and returned read-only
+    return _PolynomialFilterKernels(int(WindowWidth), int(Order), int(DerivativeOrder))
+
+@functools.lru_cache(maxsize=64)
+def _PolynomialFilterKernels(WindowWidth, Order, DerivativeOrder):
+    x = np.arange(WindowWidth, dtype=float)
+    Positions = np.arange(2*int(WindowWidth/2) + 1, dtype=float)
+    # Vandermonde matrix, column j is x**j. Coefficients of the fit are pinv(V) @ y
+    Vandermonde = np.vander(x, Order + 1, increasing=True)
+    FitMatrix = np.linalg.pinv(Vandermonde)
+    # Derivative of x**j evaluated at every window position
+    DerivativeMatrix = np.zeros((len(Positions), Order + 1))
+    for j in range(DerivativeOrder, Order + 1):
+        DerivativeMatrix[:, j] = math.factorial(j) / math.factorial(j - DerivativeOrder) * Positions**(j - DerivativeOrder)
+    Kernels = DerivativeMatrix @ FitMatrix
+    Kernels.flags.writeable = False
+    return Kernels
+
+def DifferentiationKernels(DeltaTime, WindowWidth = 7, Order = 3):
+    # First and second derivative kernels scaled for the sampling interval DeltaTime
+    return _DifferentiationKernels(float(DeltaTime), int(WindowWidth), int(Order))
+
+@functools.lru_cache(maxsize=64)
+def _DifferentiationKernels(DeltaTime, WindowWidth, Order):
+    FirstKernels = PolynomialFilterKernels(WindowWidth, Order, 1) / DeltaTime
+    SecondKernels = PolynomialFilterKernels(WindowWidth, Order, 2) / DeltaTime**2
+    FirstKernels.flags.writeable = False
+    SecondKernels.flags.writeable = False
+    return ([FirstKernels, SecondKernels])
+
+def DifferentiateArray(YData, FirstFrame, LastFrame, DeltaTime, WindowWidth = 7, Order = 3):
+    # Vectorized version of Differentiate for ndarray inputs. Frames are along the last axis,
+    # so (3, N) vector data or stacked (K, 3, N) data are differentiated in a single pass.
+    # Centre frames use the symmetric kernel; the first and last half windows are evaluated
+    # from the first and last fitted windows, as in the per-frame polynomial fit.
+    YData = np.asarray(YData, dtype=float)
+    FirstDerivativeData = np.zeros(YData.shape)
+    SecondDerivativeData = np.zeros(YData.shape)
+    HalfWidth = int(WindowWidth/2)
+    
+    # Nothing to fit if the frame range is shorter than a window
+    if LastFrame - FirstFrame + 1 < WindowWidth:
+        return ([FirstDerivativeData, SecondDerivativeData])
+    
+    [FirstKernels, SecondKernels] = DifferentiationKernels(DeltaTime, WindowWidth, Order)
+    # Windows along the frame axis: shape (..., NumberOfWindows, WindowWidth)
+    Windows = np.lib.stride_tricks.sliding_window_view(YData[..., FirstFrame-1:LastFrame], WindowWidth, axis=-1)
+    CenterFrames = slice(FirstFrame - 1 + HalfWidth, LastFrame - HalfWidth)
+    FirstDerivativeData[..., CenterFrames] = Windows @ FirstKernels[HalfWidth]
+    SecondDerivativeData[..., CenterFrames] = Windows @ SecondKernels[HalfWidth]
+    
+    # Account for Beginning and End Points
+    FirstDerivativeData[..., FirstFrame-1:FirstFrame-1+HalfWidth] = Windows[..., 0, :] @ FirstKernels[:HalfWidth].T
+    SecondDerivativeData[..., FirstFrame-1:FirstFrame-1+HalfWidth] = Windows[..., 0, :] @ SecondKernels[:HalfWidth].T
+    FirstDerivativeData[..., LastFrame-HalfWidth:LastFrame] = Windows[..., -1, :] @ FirstKernels[WindowWidth-HalfWidth:].T
+    SecondDerivativeData[..., LastFrame-HalfWidth:LastFrame] = Windows[..., -1, :] @ SecondKernels[WindowWidth-HalfWidth:].T
     
     return ([FirstDerivativeData, SecondDerivativeData])
 
-def Smooth1DArray(DataArray,StartFrame,EndFrame,Order,WindowWidth):
-    #print DataArray
-    DataArraySmoothed = [0. for m in range(len(DataArray))]
+def Differentiate(YData, FirstFrame, LastFrame, framecount, DeltaTime):
+    # Inputs is vector-based data set. 
+    # Fits cubic polynomial in 7 point window (Savitzky-Golay kernels) and evaluates first and
+    # second derivative at midpoint of the window. Beginning and end points use the first and last window.
+    # Returns the first and second derivative arrays into vector-based variables
+    [FirstDerivativeData, SecondDerivativeData] = DifferentiateArray(YData, FirstFrame, LastFrame, DeltaTime)
+    
+    return ([FirstDerivativeData.tolist(), SecondDerivativeData.tolist()])
+
+def ErodeExists(Exists, WindowWidth):
+    # Exists flags of the frames of a WindowWidth polynomial fit (SmoothArray, DifferentiateArray): a frame exists when
+    # all frames of its window exist. The first and last half windows are computed from the first and last windows.
+    # No frame exists when there are fewer frames than a window
+    Exists = np.asarray(Exists, dtype=bool)
+    NumberOfFrames = len(Exists)
+    if NumberOfFrames < WindowWidth:
+        return np.zeros(NumberOfFrames, dtype=bool)
+    WindowExists = np.lib.stride_tricks.sliding_window_view(Exists, WindowWidth).all(-1)
+    WindowStarts = np.clip(np.arange(NumberOfFrames) - int(WindowWidth/2), 0, NumberOfFrames - WindowWidth)
+    return WindowExists[WindowStarts]
+
+def SmoothArray(DataArray, StartFrame, EndFrame, Order, WindowWidth):
+    # Vectorized polynomial smoothing for ndarray inputs. Frames are along the last axis,
+    # so (N,), (3, N) or stacked (K, 3, N) data are smoothed in a single pass.
+    # Fits polynomial of given Order to WindowWidth frames and evaluates it at the window centre.
+    # The first and last half windows are extrapolated from the first and last fitted windows.
+    DataArray = np.asarray(DataArray, dtype=float)
+    DataArraySmoothed = np.zeros(DataArray.shape)
     # If WindowWidth is larger than data array size
     if EndFrame - StartFrame + 1 < WindowWidth:
         WindowWidth = EndFrame - StartFrame + 1
+    HalfWidth = int(WindowWidth/2)
     
-    # Fit fourth order polynomial to WindowWidth Data
-    XWindow = [0. for m in range(WindowWidth)]
-    YWindow = [0. for m in range(WindowWidth)]
-    for FrameNumber in range(StartFrame - 1 + int(WindowWidth/2), EndFrame - int(WindowWidth/2)):
-        for i in range(WindowWidth):
-            XWindow[i] = i
-            YWindow[i] = DataArray[FrameNumber - int(WindowWidth/2) + i]
-        coeffs = np.polyfit(XWindow, YWindow, 3)
-        ffit_polynomial = np.poly1d(coeffs)
-        DataArraySmoothed[FrameNumber] = ffit_polynomial(int(WindowWidth/2))
-        
-        # For Beginning of Data Array
-        if FrameNumber == StartFrame - 1 + int(WindowWidth/2):
-            #print FrameNumber
-            #print XWindow
-            #print YWindow
-            for j in range(int(WindowWidth/2)):
-                #print(int(WindowWidth/2) - j - 1, FrameNumber - j - 1)
-                DataArraySmoothed[FrameNumber - j - 1] = ffit_polynomial(int(WindowWidth/2) - j - 1)
-    
-        # For End of Data Array
-        if FrameNumber == EndFrame - int(WindowWidth/2) - 1:
-            #print FrameNumber
-            for j in range(int(WindowWidth/2)):
-                #print(int(WindowWidth/2) + j + 1, FrameNumber + j + 1)
-                DataArraySmoothed[FrameNumber + j + 1] = ffit_polynomial(int(WindowWidth/2) + j + 1)
-
-    return DataArraySmoothed
-
-def Smooth3DArray(Data3DArray,StartFrame,EndFrame,Order,WindowWidth):
-    
-    Data3DArraySmoothed = [[0. for m in range(len(Data3DArray[0]))] for n in range(3)]
-    Data1DArrayX = [0. for m in range(len(Data3DArray[0]))]
-    Data1DArrayY = [0. for m in range(len(Data3DArray[0]))]
-    Data1DArrayZ = [0. for m in range(len(Data3DArray[0]))]
+    FirstCenter = StartFrame - 1 + HalfWidth
+    LastCenter = EndFrame - HalfWidth - 1
+    # Odd window widths fit every window, even widths stop one window short (as the centre is rounded down)
+    NumberOfCenters = LastCenter - FirstCenter + 1
+    if NumberOfCenters < 1:
+        return DataArraySmoothed
     
-    # Create 3 1D Arrays
-    for i in range(len(Data3DArray[0])):
-        Data1DArrayX[i] = Data3DArray[0][i]
-        Data1DArrayY[i] = Data3DArray[1][i]
-        Data1DArrayZ[i] = Data3DArray[2][i]
-    Data1DArrayXSmoothed = Smooth1DArray(Data1DArrayX, StartFrame, EndFrame, Order, WindowWidth)
-    Data1DArrayYSmoothed = Smooth1DArray(Data1DArrayY, StartFrame, EndFrame, Order, WindowWidth)
-    Data1DArrayZSmoothed = Smooth1DArray(Data1DArrayZ, StartFrame, EndFrame, Order, WindowWidth)
+    Kernels = PolynomialFilterKernels(WindowWidth, Order, 0)
+    # Windows along the frame axis: shape (..., NumberOfWindows, WindowWidth)
+    Windows = np.lib.stride_tricks.sliding_window_view(DataArray[..., StartFrame-1:EndFrame], WindowWidth, axis=-1)
+    DataArraySmoothed[..., FirstCenter:LastCenter+1] = Windows[..., :NumberOfCenters, :] @ Kernels[HalfWidth]
     
-    for i in range(len(Data3DArray[0])):
-        Data3DArraySmoothed[0][i] = Data1DArrayXSmoothed[i]
-        Data3DArraySmoothed[1][i] = Data1DArrayYSmoothed[i]
-        Data3DArraySmoothed[2][i] = Data1DArrayZSmoothed[i]
+    # For Beginning and End of Data Array
+    DataArraySmoothed[..., FirstCenter-HalfWidth:FirstCenter] = Windows[..., 0, :] @ Kernels[:HalfWidth].T
+    DataArraySmoothed[..., LastCenter+1:LastCenter+1+HalfWidth] = Windows[..., NumberOfCenters-1, :] @ Kernels[HalfWidth+1:].T
     
-    return Data3DArraySmoothed
+    return DataArraySmoothed
+
+def Smooth1DArray(DataArray,StartFrame,EndFrame,Order,WindowWidth):
+    # Fits polynomial to WindowWidth Data and evaluates at centre of the window
+    return SmoothArray(DataArray, StartFrame, EndFrame, Order, WindowWidth).tolist()
+
+def Smooth3DArray(Data3DArray,StartFrame,EndFrame,Order,WindowWidth):
+    # Smooths X, Y and Z components together. Returns ndarray input as ndarray, list input as list
+    Data3DArraySmoothed = SmoothArray(Data3DArray, StartFrame, EndFrame, Order, WindowWidth)
+    if isinstance(Data3DArray, np.ndarray):
+        return Data3DArraySmoothed
+    return Data3DArraySmoothed.tolist()
+
+def TimeNormalize_Batch(Data, Cycles, NumPoints = 101, Method = 'Linear'):
+    # Resamples the frames Strike1 ... Strike2 (1-based, inclusive) of each cycle [Strike1, Strike2] to NumPoints points.
+    # Frames are along the last axis, so all variables (..., frames) are normalized together. Returns (cycles, ..., NumPoints)
+    # 'Linear' gives the values of np.interp of each cycle, 'Cubic' a not-a-knot cubic spline through the frames of the cycle
+    Data = np.asarray(Data, dtype=float)
+    GCD_Time = np.linspace(0, NumPoints-1, NumPoints)
+    if Method == 'Cubic':
+        Normalized = np.zeros((len(Cycles),) + Data.shape[:-1] + (NumPoints,))
+        for [CycleIndex, [Strike1, Strike2]] in enumerate(Cycles):
+            C3D_Time = np.linspace(0, NumPoints-1, Strike2-Strike1+1)
+            if len(C3D_Time) < 2:
+                Normalized[CycleIndex] = Data[..., Strike1-1:Strike2]
+            else:
+                Normalized[CycleIndex] = interpolate.CubicSpline(C3D_Time, Data[..., Strike1-1:Strike2], axis=-1)(GCD_Time)
+        return Normalized
+    
+    # Interval (frame) and position in the interval of every point of every cycle, then all cycles in one pass
+    Frames = np.zeros((len(Cycles), NumPoints), dtype=int)
+    NextFrames = np.zeros((len(Cycles), NumPoints), dtype=int)
+    Offsets = np.zeros((len(Cycles), NumPoints))
+    Steps = np.ones((len(Cycles), NumPoints))
+    for [CycleIndex, [Strike1, Strike2]] in enumerate(Cycles):
+        C3D_Time = np.linspace(0, NumPoints-1, Strike2-Strike1+1)
+        if len(C3D_Time) < 2:
+            Frames[CycleIndex] = Strike1-1
+            NextFrames[CycleIndex] = Strike1-1
+            continue
+        Intervals = np.clip(np.searchsorted(C3D_Time, GCD_Time, side='right') - 1, 0, len(C3D_Time) - 2)
+        Frames[CycleIndex] = Strike1 - 1 + Intervals
+        NextFrames[CycleIndex] = Frames[CycleIndex] + 1
+        Offsets[CycleIndex] = GCD_Time - C3D_Time[Intervals]
+        Steps[CycleIndex] = C3D_Time[Intervals+1] - C3D_Time[Intervals]
+        # Points at or after the last frame take its value
+        Last = GCD_Time >= C3D_Time[-1]
+        Frames[CycleIndex, Last] = Strike2 - 1
+        NextFrames[CycleIndex, Last] = Strike2 - 1
+        Offsets[CycleIndex, Last] = 0.
+    Values = Data[..., Frames]
+    Normalized = (Data[..., NextFrames] - Values) / Steps * Offsets + Values
+    # (..., cycles, NumPoints) to (cycles, ..., NumPoints)
+    return np.moveaxis(Normalized, -2, 0)
+
+@functools.lru_cache(maxsize=16)
+def HighPassFilter(FilterOrder, CutOffFrequency, SignalFrequency):
+    # Butterworth high-pass filter as second-order sections, designed once per order, cut-off and signal frequency
+    return signal.butter(FilterOrder, CutOffFrequency/(SignalFrequency/2.0), btype='high', output='sos')
+
+def MovingAverage_Batch(Signals, WindowSize):
+    # Moving average of WindowSize samples along the last axis of Signals (channels, samples), from cumulative sums.
+    # Sample i averages [i-WindowSize/2, i+WindowSize/2). The first half window averages [i, WindowSize-i) and the
+    # last half window the last WindowSize samples
+    Signals = np.asarray(Signals, dtype=float)
+    NumSamples = Signals.shape[-1]
+    HalfWidth = int(WindowSize/2)
+    Samples = np.arange(NumSamples)
+    First = Samples < WindowSize/2
+    Last = ~First & (Samples > NumSamples - WindowSize/2)
+    Starts = np.where(First, Samples, Samples - HalfWidth)
+    Ends = np.where(First, WindowSize - Samples, Samples + HalfWidth)
+    Starts[Last] = NumSamples - WindowSize
+    Ends[Last] = NumSamples
+    # Window bounds as slices, a negative start counts from the end of the signal
+    Starts = np.clip(np.where(Starts < 0, Starts + NumSamples, Starts), 0, NumSamples)
+    Ends = np.clip(Ends, 0, NumSamples)
+    CumulativeSums = np.concatenate((np.zeros(Signals.shape[:-1] + (1,)), np.cumsum(Signals, axis=-1)), axis=-1)
+    return (CumulativeSums[..., Ends] - CumulativeSums[..., Starts]) / np.maximum(Ends - Starts, 1)
+
+def EMGEnvelope_Batch(Signals, SignalFrequency, AveragingWindowSizeInMiliseconds, FilterOrder = 5, CutOffFrequency = 10):
+    # Envelope of raw EMG signals (channels, samples): zero-lag high-pass filter, rectification and moving average
+    Filtered = signal.sosfiltfilt(HighPassFilter(FilterOrder, CutOffFrequency, SignalFrequency), Signals, axis=-1)
+    WindowSize = int(AveragingWindowSizeInMiliseconds*(1000/SignalFrequency))
+    return MovingAverage_Batch(np.abs(Filtered), WindowSize)
 
 def Trim3DList(List,StartFrame,EndFrame):
     trimmedList = [[0. for m in range(EndFrame-StartFrame+1)] for n in range(len(List))]
@@ -401,6 +676,69 @@ def ComputeMuscleLength(Side,MusclePoints,MuscleSegments,EPelvisAnatDelp,PelvisO
   
     return [MuscleLength,MusclePointsLab]
 
+def CompileMuscleModel(Muscles, SegmentNames):
+    # Compile muscle attachment tables once into index and offset arrays for ComputeMuscleLengths_Batch
+    # Muscles is a list of [MusclePoints, MuscleSegments, KneeFlexionRanges]. KneeFlexionRanges holds for every
+    # point the [Min, Max] knee flexion (deg) in which the via point is part of the muscle path, or None if the
+    # point is always part of it. Use None instead of the list for muscles without knee flexion dependent points.
+    PointOffsets = []
+    PointSegments = []
+    PointKneeFlexionMin = []
+    PointKneeFlexionMax = []
+    PairStart = []
+    PairEnd = []
+    MusclePairStart = []
+    for [MusclePoints, MuscleSegments, KneeFlexionRanges] in Muscles:
+        FirstPoint = len(PointOffsets)
+        if KneeFlexionRanges is None:
+            KneeFlexionRanges = [None] * len(MusclePoints)
+        for i in range(len(MusclePoints)):
+            PointOffsets.append(MusclePoints[i])
+            PointSegments.append(SegmentNames.index(MuscleSegments[i]))
+            if KneeFlexionRanges[i] is None:
+                PointKneeFlexionMin.append(-np.inf)
+                PointKneeFlexionMax.append(np.inf)
+            else:
+                PointKneeFlexionMin.append(KneeFlexionRanges[i][0])
+                PointKneeFlexionMax.append(KneeFlexionRanges[i][1])
+        
+        # Pairs of points that can be consecutive on the path: all points in between are knee flexion dependent
+        MusclePairStart.append(len(PairStart))
+        for i in range(len(MusclePoints)-1):
+            for j in range(i+1, len(MusclePoints)):
+                PairStart.append(FirstPoint + i)
+                PairEnd.append(FirstPoint + j)
+                if KneeFlexionRanges[j] is None:
+                    break
+    
+    return ([np.array(PointOffsets, dtype=float), np.array(PointSegments), np.array(PointKneeFlexionMin, dtype=float),
+             np.array(PointKneeFlexionMax, dtype=float), np.array(PairStart), np.array(PairEnd), np.array(MusclePairStart)])
+
+def ComputeMuscleLengths_Batch(MuscleModel, Side, ESegments, SegmentOrigins, KneeFlexion):
+    # Path length of every muscle of a compiled muscle model (CompileMuscleModel) for all frames
+    # ESegments are (..., Segments, 3, 3) and SegmentOrigins (..., Segments, 3) in the order of the model's SegmentNames,
+    # KneeFlexion (...) in deg. Returns (..., Muscles) muscle lengths
+    [PointOffsets, PointSegments, PointKneeFlexionMin, PointKneeFlexionMax, PairStart, PairEnd, MusclePairStart] = MuscleModel
+    if Side == 'Right':
+        PointOffsets = PointOffsets * np.array([1., -1., 1.])
+    
+    # All muscle points in lab
+    ESegments = np.asarray(ESegments, dtype=float)
+    SegmentOrigins = np.asarray(SegmentOrigins, dtype=float)
+    MusclePointsLab = np.einsum('...pij,pj->...pi', ESegments[...,PointSegments,:,:], PointOffsets) + SegmentOrigins[...,PointSegments,:]
+    
+    # Points of the muscle paths at the current knee flexion
+    KneeFlexion = np.asarray(KneeFlexion, dtype=float)[...,np.newaxis]
+    PointActive = ~((KneeFlexion < PointKneeFlexionMin) | (KneeFlexion > PointKneeFlexionMax))
+    ActivePointCount = np.cumsum(PointActive, axis=-1)
+    PairActive = PointActive[...,PairStart] & PointActive[...,PairEnd] & (ActivePointCount[...,PairEnd-1] == ActivePointCount[...,PairStart])
+    
+    # Compute Distance
+    PairLength = np.linalg.norm(MusclePointsLab[...,PairEnd,:] - MusclePointsLab[...,PairStart,:], axis=-1)
+    MuscleLengths = np.add.reduceat(np.where(PairActive, PairLength, 0.), MusclePairStart, axis=-1)
+    
+    return MuscleLengths
+
 def RotateCSaroundXaxis(InputCS,Angle):
     OutputCS = np.eye(3)
     epx = np.array([InputCS[0][0],InputCS[1][0],InputCS[2][0]])
@@ -444,4 +782,30 @@ def RotateCSaroundZaxis(InputCS,Angle):
     
     OutputCS = np.column_stack((ex,ey,ez))
 
-    return OutputCS
\ No newline at end of file
+    return OutputCS
+
+def RotateCSaroundYaxis_Batch(InputCS,Angle):
+    # Batch version of RotateCSaroundYaxis for (N, 3, 3) coordinate systems
+    epx = InputCS[..., 0]
+    epy = InputCS[..., 1]
+    epz = InputCS[..., 2]
+    
+    # Rotate CS around Y axis by Angle
+    ex = epx * np.cos(-Angle*np.pi/180) + epz * np.sin(-Angle*np.pi/180)
+    ey = epy
+    ez = epx *-np.sin(-Angle*np.pi/180) + epz * np.cos(-Angle*np.pi/180)
+    
+    return np.stack((ex,ey,ez), axis=-1)
+
+def RotateCSaroundZaxis_Batch(InputCS,Angle):
+    # Batch version of RotateCSaroundZaxis for (N, 3, 3) coordinate systems
+    epx = InputCS[..., 0]
+    epy = InputCS[..., 1]
+    epz = InputCS[..., 2]
+    
+    # Rotate CS around Z axis by Angle
+    ex = epx * np.cos(-Angle*np.pi/180) + epy *-np.sin(-Angle*np.pi/180)
+    ey = epx * np.sin(-Angle*np.pi/180) + epy * np.cos(-Angle*np.pi/180)
+    ez = epz
+    
+    return np.stack((ex,ey,ez), axis=-1)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Store of the model outputs of a trial (joint centres, angles, kinetics, muscle lengths) in one array
+
+Dynamic_Main kept each model output as three Python lists of framecount floats. The OutputStore allocates all outputs
+at once as one contiguous (outputs, 3, frames) array, and each output is a (3, frames) view of it:
+
+    Outputs = store.OutputStore(['LeftHipCenter', 'LeftHipAngles'], framecount)
+    arrayLeftHipAngles = Outputs['LeftHipAngles']
+    arrayLeftHipAngles[0][FrameNumber] = 10.             (as with the lists)
+    arrayLeftHipAngles[:,StartFrame-1:EndFrame] = ...    (whole frame range)
+
+The views are written to Nexus, the C3D file or CreateGCD as they are, without copying them into lists first.
+
+The outputs are float64, or float32 with OutputDataType of the user preferences, which halves the memory of long trials.
+The values are then rounded to float32 when they are stored, as the C3D file stores them.
+
+Output profiles select the groups of model outputs a site uses (OutputProfile of the user preferences, or the third
+script argument of Dynamic_Main). The outputs of the other groups are not written, and the muscle model and the
+kinetics are not computed when their groups are not selected:
+
+    Full         all outputs (default)
+    Standard     Kinematics, Kinetics (joint moments and powers, the kinetics of the GCD file)
+    Kinematics   joint centres, MAPS markers, segment and joint angles (incl. foot model)
+
+or groups joined by '+', e.g. 'Kinematics+MuscleLengths'. The groups a group needs are added (KineticsDetails needs
+Kinetics). Outputs of the groups not selected that the trial already has, e.g. from an earlier run with another
+profile in Nexus, are written with no existing frames, so that they do not keep the values of the earlier run.
+CreateGCD writes the kinetics only when the joint moments were written.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import numpy as np
+
+# Angles, moments and powers are computed as [Ab/Adduction, Flexion, Rotation] and written as [Flexion, Ab/Adduction, Rotation]
+NexusComponentOrder = [1, 0, 2]
+
+class OutputStore():
+    # Model outputs in Data (outputs, 3, frames), Indices {Name: row}. DataType float64, or float32 to halve the memory
+    def __init__(self, Names, FrameCount, DataType=np.float64):
+        self.Names = list(dict.fromkeys(Names))
+        self.Indices = {Name: Index for [Index, Name] in enumerate(self.Names)}
+        self.Data = np.zeros((len(self.Names), 3, FrameCount), dtype=DataType)
+
+    def __getitem__(self, Name):
+        return self.Data[self.Indices[Name]]
+
+    def __contains__(self, Name):
+        return Name in self.Indices
+
+# Model outputs of the groups that can be left out, Kinematics are the other outputs and are always written
+OutputGroups = {'Kinematics': [],
+                'RotationSequences': [Side + Segment + 'Angles' + Sequence for Side in ['L','R'] for Segment in ['Trunk','Pelvis'] for Sequence in ['TOR','ROT']],
+                'MuscleLengths': [Muscle + Quantity for Muscle in ['GluteusMax','IlioPsoas','RectFem','MedHamstring','LatHamstring','Gastroc','Soleus','TibPost','Peroneal','VastusLat']
+                                  for Quantity in ['Length','Velocity']],
+                'Kinetics': [Side + Joint + Quantity for Side in ['L','R'] for Joint in ['Hip','Knee','Ankle'] for Quantity in ['Moment','Power','PowerComponents']],
+                'KineticsDetails': [Side + Output for Side in ['L','R'] for Output in ['AnkleForce','KneeForce','HipForce','GroundReactionForce',
+                                    'GroundReactionMoment','MomentPowerSum','FootCoP']]}
+OutputGroupDependencies = {'RotationSequences': ['Kinematics'], 'MuscleLengths': ['Kinematics'], 'Kinetics': ['Kinematics'], 'KineticsDetails': ['Kinetics']}
+OutputProfiles = {'Full': list(OutputGroups), 'Standard': ['Kinematics','Kinetics'], 'Kinematics': ['Kinematics']}
+DefaultOutputProfile = 'Full'
+
+# Data types of the model outputs (OutputDataType of the user preferences)
+OutputDataTypes = {'float64': np.float64, 'float32': np.float32}
+DefaultOutputDataType = 'float64'
+
+def OutputDataType(Name):
+    # Data type of an OutputDataType name
+    if Name not in OutputDataTypes:
+        raise ValueError('Unknown model output data type ' + str(Name) + ' (data types: ' + ', '.join(OutputDataTypes) + ')')
+    return OutputDataTypes[Name]
+
+def SelectOutputGroups(Profile):
+    # Output groups of a profile name or of group names joined by '+', with the groups they need
+    Groups = list(OutputProfiles[Profile]) if Profile in OutputProfiles else Profile.split('+')
+    Selected = []
+    while len(Groups) > 0:
+        Group = Groups.pop(0)
+        if Group not in OutputGroups:
+            raise ValueError('Unknown model output profile or group ' + Group + ' (profiles: ' + ', '.join(OutputProfiles) + '; groups: ' + ', '.join(OutputGroups) + ')')
+        if Group not in Selected:
+            Selected.append(Group)
+            Groups = Groups + OutputGroupDependencies.get(Group, [])
+    return Selected
+
+def PrunedOutputs(Groups):
+    # Model outputs of the groups not selected
+    return set([Name for Group in OutputGroups if Group not in Groups for Name in OutputGroups[Group]])
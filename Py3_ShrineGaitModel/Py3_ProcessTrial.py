@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Fused run of Dynamic_Main and CreateGCD on the current Nexus trial, in one Python process
+
+Nexus pipeline: one Python entry with this script instead of the DynamicMain and CreateGCD entries, with the
+script arguments of Dynamic_Main (testing condition and processing mode, e.g. BF Vectorized). AllCycles among the
+arguments is passed on to CreateGCD (all cycles export, e.g. BF Vectorized AllCycles).
+CreateGCD gets the model outputs of Dynamic_Main, and the trajectories and force plate channels already read, from
+memory (Py3_TrialSource.FusedTrialSource) instead of reading them back from Nexus. Py3_CreateGCD.py still runs on its
+own as before.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import runpy
+
+import Py3_TrialSource
+
+ProgramDirectory = os.path.dirname(os.path.abspath(__file__))
+
+def main():
+    # Arguments: testing condition and processing mode, as for Dynamic_Main, and the GCD export of CreateGCD
+    Arguments = [Argument for Argument in sys.argv[1:] if not Argument == 'AllCycles']
+    GCDExport = [Argument for Argument in sys.argv[1:] if Argument == 'AllCycles']
+    Source = Py3_TrialSource.OpenTrialSource().Source
+    Py3_TrialSource.SetTrialSource(Py3_TrialSource.FusedTrialSource(Source))
+    try:
+        sys.argv = [os.path.join(ProgramDirectory, 'Py3_DynamicMain.py')] + Arguments
+        runpy.run_path(sys.argv[0], run_name='__main__')
+        sys.argv = [os.path.join(ProgramDirectory, 'Py3_CreateGCD.py')] + Arguments[0:1] + GCDExport
+        runpy.run_path(sys.argv[0], run_name='__main__')
+    finally:
+        Py3_TrialSource.SetTrialSource(Source)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Disk cache of the results of the headless programs, to skip unchanged trials when an archive is reprocessed
+
+An entry is keyed by the SHA-256 of the step, the C3D file bytes, the static calibration file (which holds the marker
+names of the user preferences), the testing condition, the Dynamic_Main processing mode and the bytes of the files of the
+model modules. The GCD file holds the path of the trial, so the GCD key also includes the path. CreateGCD reads the model
+outputs of Dynamic_Main from <Trial>.Outputs.npz (or from the C3D file), so the GCD key hashes that file instead of the
+processing mode.
+Entries are folders <Cache>/<Key[0:2]>/<Key>, written to a temporary folder and renamed so that worker processes can
+share the cache. The least recently used entries are removed when the cache is larger than its maximum size.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import shutil
+import hashlib
+
+ProgramDirectory = os.path.dirname(os.path.abspath(__file__))
+ModelModules = ['Py3_DynamicMain.py', 'Py3_CreateGCD.py', 'Py3_MathModules.py', 'Py3_GaitModules.py', 'Py3_TrialSource.py', 'Py3_C3D.py', 'Py3_GCDFile.py',
+                'Py3_OutputStore.py', 'Py3_Calibration.py']
+DefaultCacheDirectory = os.path.join(os.path.expanduser('~'), '.Py3_ShrineGaitModel', 'Cache')
+DefaultCacheSize = 10000 # MB
+
+ModuleHashes = []
+
+def ModuleVersions():
+    # SHA-256 of the files of the model modules, so that any change of the code that computes the results is a new key.
+    # Read once per process
+    if len(ModuleHashes) == 0:
+        for ModuleFileName in ModelModules:
+            Hash = hashlib.sha256()
+            HashFile(Hash, os.path.join(ProgramDirectory, ModuleFileName))
+            ModuleHashes.append(ModuleFileName + '=' + Hash.hexdigest())
+    return ModuleHashes
+
+def HashFile(Hash, FileName):
+    if not os.path.exists(FileName):
+        Hash.update(b'\x00Missing')
+        return
+    with open(FileName, 'rb') as File:
+        for Chunk in iter(lambda: File.read(1 << 20), b''):
+            Hash.update(Chunk)
+
+class ResultCache():
+    # Results (files) of the headless steps of a trial, Hits and Misses count the lookups of this process
+    def __init__(self, Directory=DefaultCacheDirectory, MaxMegabytes=DefaultCacheSize):
+        self.Directory = Directory
+        self.MaxBytes = int(MaxMegabytes * 1e6)
+        self.Hits = 0
+        self.Misses = 0
+        self.Versions = ModuleVersions()
+        os.makedirs(self.Directory, exist_ok=True)
+
+    def Key(self, Step, TrialFileName, StaticDataFileName, Condition, Mode, *Options, InputFileNames=[]):
+        # Options: further arguments of the step that change its results (output profile, GCD export). InputFileNames:
+        # further files read by the step (model outputs of an earlier step), hashed when they exist
+        Hash = hashlib.sha256()
+        for Text in [Step, Condition, Mode] + list(Options) + self.Versions:
+            Hash.update(Text.encode('utf-8') + b'\x00')
+        if Step == 'gcd':
+            Hash.update(os.path.abspath(TrialFileName).encode('utf-8') + b'\x00')
+        HashFile(Hash, TrialFileName)
+        Hash.update(b'\x00Static')
+        HashFile(Hash, StaticDataFileName)
+        for InputFileName in InputFileNames:
+            Hash.update(b'\x00Input')
+            HashFile(Hash, InputFileName)
+        return Hash.hexdigest()
+
+    def EntryPath(self, Key):
+        return os.path.join(self.Directory, Key[0:2], Key)
+
+    def Get(self, Key, Files):
+        # Files {Name: destination file or function reading the cached file}, True when the entry was found
+        Path = self.EntryPath(Key)
+        if not all([os.path.exists(os.path.join(Path, Name)) for Name in Files]):
+            self.Misses = self.Misses + 1
+            return False
+        try:
+            for Name in Files:
+                if callable(Files[Name]):
+                    Files[Name](os.path.join(Path, Name))
+                else:
+                    shutil.copyfile(os.path.join(Path, Name), Files[Name])
+            os.utime(Path) # Most recently used
+        except OSError:
+            # Entry removed by another process meanwhile
+            self.Misses = self.Misses + 1
+            return False
+        self.Hits = self.Hits + 1
+        return True
+
+    def Put(self, Key, Files):
+        # Files {Name: source file or function writing the file to be cached}
+        Path = self.EntryPath(Key)
+        TemporaryPath = os.path.join(self.Directory, 'Temp-' + str(os.getpid()) + '-' + Key)
+        os.makedirs(TemporaryPath, exist_ok=True)
+        for Name in Files:
+            if callable(Files[Name]):
+                Files[Name](os.path.join(TemporaryPath, Name))
+            else:
+                shutil.copyfile(Files[Name], os.path.join(TemporaryPath, Name))
+        os.makedirs(os.path.dirname(Path), exist_ok=True)
+        try:
+            os.rename(TemporaryPath, Path)
+        except OSError:
+            # Written by another process meanwhile
+            shutil.rmtree(TemporaryPath, ignore_errors=True)
+        self.Evict()
+
+    def Evict(self):
+        # Remove the least recently used entries until the cache fits its maximum size
+        Entries = []
+        TotalBytes = 0
+        for Prefix in os.listdir(self.Directory):
+            PrefixPath = os.path.join(self.Directory, Prefix)
+            if not len(Prefix) == 2 or not os.path.isdir(PrefixPath):
+                continue
+            for Key in os.listdir(PrefixPath):
+                Path = os.path.join(PrefixPath, Key)
+                try:
+                    Bytes = sum([os.path.getsize(os.path.join(Path, Name)) for Name in os.listdir(Path)])
+                    Entries.append([os.path.getmtime(Path), Bytes, Path])
+                except OSError:
+                    continue
+                TotalBytes = TotalBytes + Bytes
+        Entries.sort()
+        for [UsedTime, Bytes, Path] in Entries:
+            if TotalBytes <= self.MaxBytes:
+                break
+            shutil.rmtree(Path, ignore_errors=True)
+            TotalBytes = TotalBytes - Bytes
+
+    def Report(self):
+        return HitRateReport(self.Hits, self.Misses)
+
+def HitRateReport(Hits, Misses):
+    Lookups = Hits + Misses
+    Rate = 100. * Hits / Lookups if Lookups > 0 else 0.
+    return 'Result cache: ' + str(Hits) + ' hits, ' + str(Misses) + ' misses (' + ('%.1f' % Rate) + '% hit rate)'
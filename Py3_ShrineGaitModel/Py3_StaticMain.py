@@ -26,7 +26,7 @@ Last Update: Aug 26, 2024
 @author: psaraswat
 ---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 """
-VersionNumber = 'Py3_v1.3'
+VersionNumber = 'Py3_v1.4'
 
 import os.path
 import sys
@@ -43,9 +43,12 @@ import reportlab.lib.colors as reportlabColors
 
 import numpy as np
 
-#import Vicon Nexus Subroutines
-from viconnexusapi import ViconNexus
-vicon = ViconNexus.ViconNexus()
+#import Trial Data Source (Vicon Nexus, or a C3D file when run from Py3_Headless)
+import Py3_TrialSource
+vicon = Py3_TrialSource.OpenTrialSource()
+
+#import Static Calibration Store
+import Py3_Calibration as calibration
 
 #import Common Vector/Matrix Operations Modules
 import Py3_MathModules as math
@@ -58,6 +61,9 @@ DefaultTestingCondition = 'BF'
 TestingCondition = DefaultTestingCondition
 if len(sys.argv) > 1:
     TestingCondition = sys.argv[1]
+# Third argument is the user preferences file, for runs away from the clinic network
+if len(sys.argv) > 2:
+    UserPreferencesFileName = sys.argv[2]
 
 #print(vicon.GetSubjectNames())
 SubjectName = vicon.GetSubjectNames()[0]
@@ -1018,6 +1024,8 @@ class QAreport_Page(tk.Frame):
 # =============================================================================
         # Extract Clinical Values
         exec(open(StaticDataFileName).read())
+        # Read all markers of the user preferences at once
+        vicon.FetchMarkers(SubjectName, [getattr(self, Name) for Name in dir(self) if Name.endswith('MarkerName')])
         #Extract Nexus first frame
         StartFrame, EndFrame = vicon.GetTrialRegionOfInterest()
 
@@ -1052,19 +1060,12 @@ class QAreport_Page(tk.Frame):
         # Function to extract markerdata into an array and check if data exists
         def MarkerArrayCheck(Subject, MarkerName):
             # Check if marker exists at all
-            if vicon.HasTrajectory(Subject,MarkerName) is True:
-                MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists = vicon.GetTrajectory(Subject, MarkerName)   
-            else:
-                framecount = vicon.GetFrameCount()
-                MarkerDataX= [0 for m in range(framecount)] 
-                MarkerDataY= [0 for m in range(framecount)] 
-                MarkerDataZ= [0 for m in range(framecount)] 
-                MarkerDataExists = [False]*framecount
+            if vicon.HasTrajectory(Subject,MarkerName) is False:
                 ErrorMessagesLabel.place(x=50,y=100, width=130,height=85)
                 ErrorMessagesText.place(x=195,y=95,width=490,height=85)
                 ErrorMessage = 'Marker ' + MarkerName + ' is not Found ' + '\n'
                 ErrorMessagesText.insert(tk.END,ErrorMessage)
-            return MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists
+            return vicon.MarkerArrayCheck(Subject, MarkerName)
 # =============================================================================
 #       If Pelvic Fix Option used then compute ASIS markers  
 # =============================================================================
@@ -2861,21 +2862,12 @@ class StaticSubjectCalibrationReport_Page(tk.Frame):
 
             #print('FileUpdate- Tmatrix')
             StaticDataFile.close()
+            # Structured calibration store read by Dynamic_Main and CreateGCD
+            calibration.ConvertStaticFile(StaticDataFileName)
             
         def saveResultsinC3D():
             # Function to extract markerdata into an array and check if data exists
-            def MarkerArrayCheck(Subject, MarkerName):
-                # Check if marker exists at all
-                if vicon.HasTrajectory(Subject,MarkerName) is True:
-                    MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists = vicon.GetTrajectory(Subject, MarkerName)   
-
-                else:
-                    framecount = vicon.GetFrameCount()
-                    MarkerDataX= [0 for m in range(framecount)] 
-                    MarkerDataY= [0 for m in range(framecount)] 
-                    MarkerDataZ= [0 for m in range(framecount)] 
-                    MarkerDataExists = [False]*framecount
-                return MarkerDataX, MarkerDataY, MarkerDataZ, MarkerDataExists
+            MarkerArrayCheck = vicon.MarkerArrayCheck
             
             exec(open(StaticDataFileName).read())
             #execfile(UserPreferencesFileName)
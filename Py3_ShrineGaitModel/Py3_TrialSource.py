@@ -0,0 +1,692 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Trial data sources for the Static, Dynamic and GCD programs: a live Vicon Nexus session or a C3D file
+
+The programs talk to the trial through the Vicon Nexus API object 'vicon'. A trial source provides the
+part of that API the programs use, with the same method names, arguments and return values:
+
+    Trial:          GetSubjectNames, GetTrialName, GetTrialRegionOfInterest, GetFrameRate, GetFrameCount, GetEvents
+    Subject:        GetSubjectParam, SetSubjectParam
+    Trajectories:   HasTrajectory, GetTrajectory, GetTrajectoryAtFrame, SetTrajectory (GetTrajectories: C3D only)
+    Model Outputs:  GetModelOutputNames, CreateModelOutput, CreateModeledMarker, SetModelOutput, GetModelOutput
+    Devices:        GetDeviceIDs, GetDeviceNames, GetDeviceIDFromName, GetDeviceDetails, GetDeviceOutputDetails,
+                    GetDeviceOutputIDFromName, GetDeviceChannelIDFromName, GetDeviceChannel, GetDeviceChannelGlobal
+
+The programs get the source through OpenTrialSource, as a TrialAccess that reads the trial metadata and markers once
+per run and counts the calls to the source.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import time
+import numpy as np
+
+import Py3_C3D as c3d
+
+ForcePlateThreshold = 10.0 # N, vertical force below which a force plate is unloaded (CoP not defined)
+ForcePlateContactTolerance = 2 # Frames between a Foot Strike event and the force plate loading onset
+
+# Model output types of the C3D POINT group, with the Nexus model output group they are read into
+ModelOutputTypes = [['ANGLES', 'Angles'], ['FORCES', 'Forces'], ['MOMENTS', 'Moments'], ['POWERS', 'Powers'],
+                    ['SCALARS', 'Scalars'], ['MODELED_MARKERS', 'Modeled Markers']]
+
+ActiveTrialSource = None
+
+def SetTrialSource(Source):
+    # Register the trial source used by the programs, e.g. a C3DTrialSource for headless runs
+    global ActiveTrialSource
+    ActiveTrialSource = Source
+
+def OpenTrialSource():
+    # Access to the trial source of the current run (the live Nexus session unless another source was registered),
+    # a new TrialAccess for each program unless a TrialAccess was registered
+    if ActiveTrialSource is None:
+        SetTrialSource(NexusTrialSource())
+    if isinstance(ActiveTrialSource, TrialAccess):
+        return ActiveTrialSource
+    return TrialAccess(ActiveTrialSource)
+
+
+class NexusTrialSource():
+    # Live Vicon Nexus session, every API call is forwarded to Nexus
+    Headless = False
+
+    def __init__(self):
+        try:
+            from viconnexusapi import ViconNexus
+        except ImportError:
+            import ViconNexus # Nexus 2.11 and earlier
+        self.vicon = ViconNexus.ViconNexus()
+
+    def __getattr__(self, Name):
+        return getattr(self.vicon, Name)
+
+
+def CopyResult(Value):
+    # Copy of the lists of a memoized result, the programs change some results (e.g. event frames) in place
+    if isinstance(Value, list):
+        return [CopyResult(Element) for Element in Value]
+    if isinstance(Value, tuple):
+        return tuple([CopyResult(Element) for Element in Value])
+    return Value
+
+
+class TrialAccess():
+    # Access layer of the programs to a trial source (Nexus or C3D), one per program run (see OpenTrialSource).
+    # Trial and device metadata are read once. The markers are fetched together (FetchMarkers) into Markers
+    # (markers, 3, frames) and MarkerExists (markers, frames), MarkerIndices {Marker: row}. Calls and Seconds count
+    # the calls to the source and their time by function, for profiling (Report).
+    MetadataFunctions = ['GetSubjectNames', 'GetTrialName', 'GetTrialRegionOfInterest', 'GetFrameRate', 'GetFrameCount',
+                         'GetEvents', 'GetMarkerNames', 'GetDeviceIDs', 'GetDeviceNames', 'GetDeviceIDFromName', 'GetDeviceDetails',
+                         'GetDeviceOutputDetails', 'GetDeviceOutputIDFromName', 'GetDeviceChannelIDFromName']
+
+    def __init__(self, Source):
+        self.Source = Source
+        self.Headless = Source.Headless
+        self.Metadata = {} # {(Function, Arguments): Result}
+        self.Trajectories = {} # {Marker: True/False}, HasTrajectory
+        self.MarkerIndices = {}
+        self.Markers = np.zeros((0, 3, 0))
+        self.MarkerExists = np.zeros((0, 0), dtype=bool)
+        self.Calls = {}
+        self.Seconds = {}
+
+    def Call(self, Function, *Arguments):
+        # Call of a function of the source, counted and timed
+        StartTime = time.perf_counter()
+        try:
+            return getattr(self.Source, Function)(*Arguments)
+        finally:
+            self.Calls[Function] = self.Calls.get(Function, 0) + 1
+            self.Seconds[Function] = self.Seconds.get(Function, 0.) + time.perf_counter() - StartTime
+
+    def ReadMetadata(self, Function, *Arguments):
+        if (Function, Arguments) not in self.Metadata:
+            self.Metadata[(Function, Arguments)] = self.Call(Function, *Arguments)
+        return CopyResult(self.Metadata[(Function, Arguments)])
+
+    def __getattr__(self, Name):
+        Attribute = getattr(self.Source, Name)
+        if not callable(Attribute):
+            return Attribute
+        if Name in self.MetadataFunctions:
+            return lambda *Arguments: self.ReadMetadata(Name, *Arguments)
+        return lambda *Arguments: self.Call(Name, *Arguments)
+
+    def Report(self):
+        # Calls and time by function of the source, most time first
+        Lines = ['Trial source: ' + str(sum(self.Calls.values())) + ' calls, ' + ('%.1f' % (1e3 * sum(self.Seconds.values()))) + ' ms']
+        for Function in sorted(self.Calls, key=lambda Function: -self.Seconds[Function]):
+            Lines.append('    ' + Function.ljust(28) + str(self.Calls[Function]).rjust(6) + ' calls ' + ('%9.1f' % (1e3 * self.Seconds[Function])) + ' ms')
+        return '\n'.join(Lines)
+
+    # ============================== Trajectories ==============================
+    def HasTrajectory(self, Subject, Marker):
+        if Marker not in self.Trajectories:
+            self.Trajectories[Marker] = self.Call('HasTrajectory', Subject, Marker)
+        return self.Trajectories[Marker]
+
+    def FetchMarkers(self, Subject, MarkerNames):
+        # Read the markers of the trial not read yet, those of a C3D file in one array operation
+        MarkerNames = [Marker for Marker in dict.fromkeys(MarkerNames) if Marker not in self.MarkerIndices and self.HasTrajectory(Subject, Marker)]
+        if len(MarkerNames) == 0:
+            return
+        if hasattr(self.Source, 'GetTrajectories'):
+            [Markers, MarkerExists] = self.Call('GetTrajectories', Subject, MarkerNames)
+        else:
+            Trajectories = [self.Call('GetTrajectory', Subject, Marker) for Marker in MarkerNames]
+            Markers = np.array([Trajectory[0:3] for Trajectory in Trajectories], dtype=float).reshape((len(MarkerNames), 3, -1))
+            MarkerExists = np.array([Trajectory[3] for Trajectory in Trajectories], dtype=bool).reshape((len(MarkerNames), -1))
+        self.AddMarkers(MarkerNames, Markers, MarkerExists)
+
+    def AddMarkers(self, MarkerNames, Markers, MarkerExists):
+        if len(self.MarkerIndices) == 0:
+            [self.Markers, self.MarkerExists] = [np.array(Markers, dtype=float), np.array(MarkerExists, dtype=bool)]
+        else:
+            self.Markers = np.concatenate((self.Markers, Markers))
+            self.MarkerExists = np.concatenate((self.MarkerExists, MarkerExists))
+        for Marker in MarkerNames:
+            self.MarkerIndices[Marker] = len(self.MarkerIndices)
+
+    def GetTrajectory(self, Subject, Marker):
+        self.FetchMarkers(Subject, [Marker])
+        if Marker not in self.MarkerIndices:
+            return self.Call('GetTrajectory', Subject, Marker) # Error of the source for a missing marker
+        Index = self.MarkerIndices[Marker]
+        return (self.Markers[Index,0].tolist(), self.Markers[Index,1].tolist(), self.Markers[Index,2].tolist(), self.MarkerExists[Index].tolist())
+
+    def GetTrajectoryAtFrame(self, Subject, Marker, Frame):
+        if Marker not in self.MarkerIndices:
+            return self.Call('GetTrajectoryAtFrame', Subject, Marker, Frame)
+        [Index, Frame] = [self.MarkerIndices[Marker], int(Frame)]
+        return (float(self.Markers[Index,0,Frame-1]), float(self.Markers[Index,1,Frame-1]), float(self.Markers[Index,2,Frame-1]), bool(self.MarkerExists[Index,Frame-1]))
+
+    def SetTrajectory(self, Subject, Marker, X, Y, Z, Exists):
+        self.Call('SetTrajectory', Subject, Marker, X, Y, Z, Exists)
+        self.Trajectories[Marker] = True
+        if Marker not in self.MarkerIndices:
+            self.AddMarkers([Marker], np.array([[X, Y, Z]], dtype=float), np.array([Exists], dtype=bool))
+        else:
+            self.Markers[self.MarkerIndices[Marker]] = [X, Y, Z]
+            self.MarkerExists[self.MarkerIndices[Marker]] = Exists
+
+    def MarkerArrayCheck(self, Subject, Marker):
+        # X, Y, Z and Exists lists of a marker, zeros and not existing when the trial has no such marker
+        if self.HasTrajectory(Subject, Marker) is True:
+            return self.GetTrajectory(Subject, Marker)
+        FrameCount = self.GetFrameCount()
+        return ([0 for m in range(FrameCount)], [0 for m in range(FrameCount)], [0 for m in range(FrameCount)], [False]*FrameCount)
+
+    # ============================== Model Outputs ==============================
+    def SetModelOutput(self, Subject, Name, Components, Exists):
+        # Outputs of the OutputStore are arrays, Nexus takes lists
+        if isinstance(Components, np.ndarray) and not self.Headless:
+            Components = Components.tolist()
+        self.Call('SetModelOutput', Subject, Name, Components, Exists)
+
+
+class FusedTrialSource(TrialAccess):
+    # Trial access of a fused Dynamic_Main and CreateGCD run (Py3_ProcessTrial), shared by both programs. Model outputs
+    # set by Dynamic_Main and device data already read are also answered from memory instead of being read back.
+    def __init__(self, Source):
+        TrialAccess.__init__(self, Source)
+        self.ModelOutputs = {} # {Name: (Components, Exists)}
+        self.DeviceChannels = {} # {(Function, Arguments): Result}
+
+    # ============================== Model Outputs ==============================
+    def SetModelOutput(self, Subject, Name, Components, Exists):
+        TrialAccess.SetModelOutput(self, Subject, Name, Components, Exists)
+        self.ModelOutputs[Name] = (np.array(Components, dtype=float), list(Exists))
+
+    def GetModelOutput(self, Subject, Name):
+        if Name not in self.ModelOutputs:
+            return self.Call('GetModelOutput', Subject, Name)
+        return self.ModelOutputs[Name]
+
+    # ============================== Devices ==============================
+    def ReadDeviceChannel(self, Function, *Arguments):
+        if (Function, Arguments) not in self.DeviceChannels:
+            self.DeviceChannels[(Function, Arguments)] = self.Call(Function, *Arguments)
+        return self.DeviceChannels[(Function, Arguments)]
+
+    def GetDeviceChannel(self, DeviceID, OutputID, ChannelID):
+        return self.ReadDeviceChannel('GetDeviceChannel', DeviceID, OutputID, ChannelID)
+
+    def GetDeviceChannelGlobal(self, DeviceID, OutputID, ChannelID):
+        return self.ReadDeviceChannel('GetDeviceChannelGlobal', DeviceID, OutputID, ChannelID)
+
+
+class DeviceForcePlate():
+    # Force plate description as returned by GetDeviceDetails, Context is 'Invalid' for devices that are not force plates
+    def __init__(self):
+        self.Context = 'Invalid'
+        self.LocalR = [1.,0.,0.,0.,1.,0.,0.,0.,1.]
+        self.LocalT = [0.,0.,0.]
+        self.WorldR = [1.,0.,0.,0.,1.,0.,0.,0.,1.]
+        self.WorldT = [0.,0.,0.]
+        self.LowerBounds = [0.,0.,0.]
+        self.UpperBounds = [0.,0.,0.]
+
+
+class C3DTrialSource():
+    # Trial read from a C3D file, for running the programs without Nexus
+    # Frames are numbered as in Nexus, frame 1 is the first frame of the capture (C3D header first frame may be later).
+    # Outputs and trajectories set by the programs are kept in memory, SaveOutputs writes them next to the C3D file
+    # and they are read back when the trial is opened again (e.g. CreateGCD after Dynamic_Main in another process).
+    # The C3D file is memory mapped, markers, model outputs and device data are read when they are first requested.
+    Headless = True
+
+    def __init__(self, FileName, SubjectName=None):
+        self.C3D = c3d.C3DFile(FileName)
+        FilePath, TrialFileName = os.path.split(os.path.abspath(FileName))
+        self.FilePath = FilePath + os.sep
+        self.TrialName = os.path.splitext(TrialFileName)[0]
+        self.FrameRate = self.C3D.PointRate
+        self.FrameCount = self.C3D.LastFrame
+        self.AnalogRatio = self.C3D.AnalogRatio
+
+        if SubjectName is None:
+            SubjectName = self.FindSubjectName()
+        self.SubjectName = SubjectName
+        self.SubjectParams = {}
+
+        # Trajectories and Model Outputs, points of Vicon files are labelled 'Subject:Name'
+        ModelOutputGroups = {}
+        for [PointType, Group] in ModelOutputTypes:
+            for Label in self.C3D.GetLabels('POINT', PointType, len(self.C3D.PointLabels)):
+                if not Label == '':
+                    ModelOutputGroups[self.StripSubject(Label)] = Group
+        self.Trajectories = {}
+        self.ModelOutputs = {}
+        self.ModelOutputDetails = {}
+        self.PointIndices = {} # Point of the C3D file of the trajectories and model outputs not read yet
+        for i in range(len(self.C3D.PointLabels)):
+            Name = self.StripSubject(self.C3D.PointLabels[i])
+            if Name in ModelOutputGroups:
+                self.ModelOutputDetails[Name] = [ModelOutputGroups[Name], ['X','Y','Z'], ['']*3]
+            if not Name == '' and Name not in self.PointIndices:
+                self.PointIndices[Name] = i
+        self.ChangedTrajectories = []
+        self.ChangedModelOutputs = []
+        self.LoadOutputs()
+
+        self.ReadEvents()
+        self.ReadDevices()
+
+    def FindSubjectName(self):
+        Names = self.C3D.GetParameter('SUBJECTS', 'NAMES')
+        if isinstance(Names, str):
+            Names = [Names]
+        if Names is not None and len(Names) > 0 and not Names[0] == '':
+            return Names[0]
+        for Label in self.C3D.PointLabels:
+            if ':' in Label:
+                return Label.split(':')[0]
+        return self.TrialName
+
+    def StripSubject(self, Label):
+        if Label.startswith(self.SubjectName + ':'):
+            return Label[len(self.SubjectName)+1:]
+        return Label
+
+    def ReadPoint(self, Name):
+        # Trajectory or model output points of the C3D file, read on first use
+        if Name not in self.PointIndices:
+            return None
+        [Points, Exists] = self.C3D.GetPoint(self.PointIndices.pop(Name))
+        Points = self.PadFrames(Points, 1)
+        Exists = self.PadFrames(Exists, 1)
+        if Name in self.ModelOutputDetails:
+            self.ModelOutputs[Name] = [Points.T, Exists]
+        else:
+            self.Trajectories[Name] = [Points, Exists]
+        return [Points, Exists]
+
+    def PadFrames(self, Data, Ratio):
+        # Data of the C3D frames to data of Nexus frames 1..FrameCount, earlier frames are zero
+        Padding = (self.C3D.FirstFrame - 1) * Ratio
+        if Padding == 0:
+            return np.array(Data)
+        return np.concatenate((np.zeros((Padding,) + Data.shape[1:], dtype=Data.dtype), Data))
+
+    def OutputsFileName(self):
+        return self.FilePath + self.TrialName + '.Outputs.npz'
+
+    def SaveOutputs(self, FileName=None):
+        # Save trajectories and model outputs set by the programs, next to the C3D file by default
+        if FileName is None:
+            FileName = self.OutputsFileName()
+        Arrays = {}
+        for Name in self.ChangedTrajectories:
+            [Points, Exists] = self.Trajectories[Name]
+            Arrays['Trajectory:' + Name] = Points
+            Arrays['TrajectoryExists:' + Name] = Exists
+        for Name in self.ChangedModelOutputs:
+            [Components, Exists] = self.ModelOutputs[Name]
+            [Group, ComponentNames, Types] = self.ModelOutputDetails[Name]
+            Arrays['ModelOutput:' + Name] = Components
+            Arrays['ModelOutputExists:' + Name] = Exists
+            Arrays['ModelOutputDetails:' + Name] = np.array([Group] + ComponentNames + Types)
+        np.savez(FileName, **Arrays)
+
+    def LoadOutputs(self, FileName=None):
+        if FileName is None:
+            FileName = self.OutputsFileName()
+        if not os.path.exists(FileName):
+            return
+        with np.load(FileName) as Arrays:
+            for Key in Arrays.files:
+                [Kind, Name] = Key.split(':', 1)
+                if Kind in ['Trajectory', 'ModelOutput']:
+                    self.PointIndices.pop(Name, None)
+                if Kind == 'Trajectory':
+                    self.Trajectories[Name] = [Arrays[Key], Arrays['TrajectoryExists:' + Name]]
+                    if Name not in self.ChangedTrajectories:
+                        self.ChangedTrajectories.append(Name)
+                if Kind == 'ModelOutput':
+                    Details = [str(Value) for Value in Arrays['ModelOutputDetails:' + Name]]
+                    NumComponents = (len(Details) - 1) // 2
+                    self.ModelOutputs[Name] = [Arrays[Key], Arrays['ModelOutputExists:' + Name]]
+                    self.ModelOutputDetails[Name] = [Details[0], Details[1:1+NumComponents], Details[1+NumComponents:]]
+                    if Name not in self.ChangedModelOutputs:
+                        self.ChangedModelOutputs.append(Name)
+
+    def SaveC3D(self, FileName):
+        # Write the trial with its trajectories and model outputs to a float C3D file in one pass. Points keep the order
+        # of the C3D file, new model outputs follow and are listed in the POINT type groups (ANGLES, FORCES, ...).
+        # Analog data and the other parameters are copied.
+        Prefix = ''
+        if any([Label.startswith(self.SubjectName + ':') for Label in self.C3D.PointLabels]):
+            Prefix = self.SubjectName + ':'
+        Names = []
+        for Label in self.C3D.PointLabels:
+            Names.append(self.StripSubject(Label))
+        Names.extend([Name for Name in list(self.ModelOutputDetails) + list(self.Trajectories) if Name not in Names])
+
+        Frames = slice(self.C3D.FirstFrame - 1, self.C3D.LastFrame)
+        Points = np.zeros((self.C3D.NumFrames, len(Names), 4), dtype=np.float32)
+        Points[:,:,3] = -1.
+        # Points that were not read or set are copied from the C3D file
+        Unchanged = [[Index, self.PointIndices[Name]] for [Index, Name] in enumerate(Names) if Name in self.PointIndices]
+        if len(Unchanged) > 0:
+            [Indices, PointIndices] = np.array(Unchanged).T
+            Points[:,Indices,0:3] = self.C3D.Points[:,PointIndices]
+            if self.C3D.IsFloat:
+                Points[:,Indices,3] = self.C3D.PointData[:,PointIndices,3]
+            else:
+                Points[:,Indices,3] = np.where(self.C3D.PointExists[:,PointIndices], 0., -1.)
+        for [Index, Name] in enumerate(Names):
+            if Name in self.Trajectories:
+                [Values, Exists] = self.Trajectories[Name]
+            elif Name in self.ModelOutputs:
+                [Values, Exists] = self.ModelOutputs[Name]
+                Values = Values[0:3].T
+            else:
+                continue
+            Exists = Exists[Frames]
+            Points[:,Index,0:Values.shape[1]] = Values[Frames]
+            Points[:,Index,3] = np.where(Exists, 0., -1.)
+            Points[~Exists,Index,0:3] = 0.
+
+        Analog = self.C3D.AnalogData
+        if self.C3D.AnalogUnsigned:
+            Analog = Analog.view(self.C3D.Endian + 'u2')
+
+        Parameters = {}
+        for Group in self.C3D.Parameters:
+            Parameters[Group] = dict(self.C3D.Parameters[Group])
+        c3d.SetLabels(Parameters, 'POINT', 'LABELS', [Prefix + Name for Name in Names])
+        Descriptions = self.C3D.GetLabels('POINT', 'DESCRIPTIONS', len(self.C3D.PointLabels))
+        c3d.SetLabels(Parameters, 'POINT', 'DESCRIPTIONS', Descriptions + ['' for Name in Names[len(Descriptions):]])
+        for [PointType, Group] in ModelOutputTypes:
+            Labels = [Prefix + Name for Name in Names if Name in self.ModelOutputDetails and self.ModelOutputDetails[Name][0] == Group]
+            c3d.SetLabels(Parameters, 'POINT', PointType, Labels)
+        c3d.WriteC3D(FileName, Parameters, Points, Analog, self.C3D.FirstFrame)
+
+    # ============================== Trial ==============================
+    def GetSubjectNames(self):
+        return [self.SubjectName]
+
+    def GetTrialName(self):
+        return (self.FilePath, self.TrialName)
+
+    def GetTrialRegionOfInterest(self):
+        return (self.C3D.FirstFrame, self.C3D.LastFrame)
+
+    def GetFrameRate(self):
+        return self.FrameRate
+
+    def GetFrameCount(self):
+        return self.FrameCount
+
+    def ReadEvents(self):
+        # EVENT group, times are in seconds from frame 1 (TIMES holds minutes and seconds)
+        self.Events = []
+        Used = self.C3D.GetCount('EVENT', 'USED', 0)
+        if Used == 0:
+            return
+        Contexts = self.C3D.GetLabels('EVENT', 'CONTEXTS', Used)
+        Labels = self.C3D.GetLabels('EVENT', 'LABELS', Used)
+        Subjects = self.C3D.GetLabels('EVENT', 'SUBJECTS', Used)
+        Times = np.asarray(self.C3D.GetParameter('EVENT', 'TIMES'), dtype=float).reshape(-1,2)
+        for i in range(Used):
+            Time = Times[i][0] * 60. + Times[i][1]
+            Frame = int(np.floor(Time * self.FrameRate + 1e-2)) + 1 # Times are float32
+            Offset = max(Time - (Frame - 1) / self.FrameRate, 0.)
+            self.Events.append([Subjects[i], Contexts[i], Labels[i], Frame, Offset])
+
+    def GetEvents(self, Subject, Context, Event):
+        Frames = []
+        Offsets = []
+        for [EventSubject, EventContext, EventLabel, Frame, Offset] in self.Events:
+            if EventSubject in ['', Subject] and EventContext.lower() == Context.lower() and EventLabel.lower() == Event.lower():
+                Frames.append(Frame)
+                Offsets.append(Offset)
+        return (Frames, Offsets)
+
+    # ============================== Subject ==============================
+    def GetSubjectParam(self, Subject, Param):
+        # Nexus writes the subject parameters into the PROCESSING group
+        if Param in self.SubjectParams:
+            return (self.SubjectParams[Param], True)
+        Value = self.C3D.GetParameter('PROCESSING', Param.upper())
+        if Value is None:
+            return (0., False)
+        return (float(np.asarray(Value).ravel()[0]), True)
+
+    def SetSubjectParam(self, Subject, Param, Value, *Args):
+        self.SubjectParams[Param] = float(Value)
+
+    # ============================== Trajectories ==============================
+    def HasTrajectory(self, Subject, Marker):
+        return Marker in self.Trajectories or (Marker in self.PointIndices and Marker not in self.ModelOutputDetails)
+
+    def TrajectoryData(self, Marker):
+        if Marker not in self.Trajectories and self.HasTrajectory(self.SubjectName, Marker):
+            self.ReadPoint(Marker)
+        if Marker not in self.Trajectories:
+            raise ValueError('Trajectory ' + Marker + ' not found in ' + self.C3D.FileName)
+        return self.Trajectories[Marker]
+
+    def GetTrajectories(self, Subject, Markers):
+        # Markers (markers, 3, frames) and exists (markers, frames) of several markers, for TrialAccess.FetchMarkers
+        Trajectories = [self.TrajectoryData(Marker) for Marker in Markers]
+        return [np.stack([Points.T for [Points, Exists] in Trajectories]), np.stack([Exists for [Points, Exists] in Trajectories])]
+
+    def GetTrajectory(self, Subject, Marker):
+        [Points, Exists] = self.TrajectoryData(Marker)
+        return (Points[:,0].tolist(), Points[:,1].tolist(), Points[:,2].tolist(), Exists.tolist())
+
+    def GetTrajectoryAtFrame(self, Subject, Marker, Frame):
+        [Points, Exists] = self.TrajectoryData(Marker)
+        Frame = int(Frame)
+        return (float(Points[Frame-1,0]), float(Points[Frame-1,1]), float(Points[Frame-1,2]), bool(Exists[Frame-1]))
+
+    def SetTrajectory(self, Subject, Marker, X, Y, Z, Exists):
+        self.PointIndices.pop(Marker, None)
+        self.Trajectories[Marker] = [np.column_stack((X, Y, Z)).astype(float), np.array(Exists, dtype=bool)]
+        if Marker not in self.ChangedTrajectories:
+            self.ChangedTrajectories.append(Marker)
+
+    # ============================== Model Outputs ==============================
+    def GetModelOutputNames(self, Subject):
+        return list(self.ModelOutputDetails.keys())
+
+    def CreateModelOutput(self, Subject, Name, Group, ComponentNames, Types):
+        self.PointIndices.pop(Name, None)
+        self.ModelOutputDetails[Name] = [Group, list(ComponentNames), list(Types)]
+        self.ModelOutputs[Name] = [np.zeros((len(ComponentNames), self.FrameCount)), np.zeros(self.FrameCount, dtype=bool)]
+
+    def CreateModeledMarker(self, Subject, Name):
+        self.CreateModelOutput(Subject, Name, 'Modeled Markers', ['X','Y','Z'], ['Length','Length','Length'])
+
+    def SetModelOutput(self, Subject, Name, Components, Exists):
+        if Name not in self.ModelOutputDetails:
+            raise ValueError('Model output ' + Name + ' has not been created')
+        self.ModelOutputs[Name] = [np.array(Components, dtype=float), np.array(Exists, dtype=bool)]
+        if Name not in self.ChangedModelOutputs:
+            self.ChangedModelOutputs.append(Name)
+
+    def GetModelOutput(self, Subject, Name):
+        if Name not in self.ModelOutputs and Name in self.ModelOutputDetails:
+            self.ReadPoint(Name)
+        if Name not in self.ModelOutputs:
+            raise ValueError('Model output ' + Name + ' not found')
+        [Components, Exists] = self.ModelOutputs[Name]
+        return (Components.tolist(), Exists.tolist())
+
+    # ============================== Devices ==============================
+    def ReadDevices(self):
+        # Force plates (FORCE_PLATFORM group) come first, then the other analog channels grouped into devices
+        # by their Vicon description 'Device - Output'. Devices are [Name, Type, Plate, Outputs] with Outputs
+        # [Name, Type, Unit, ChannelNames, AnalogChannels]. The data of a device is computed on first use.
+        self.Devices = []
+        self.DeviceData = {}
+        PlateChannels = []
+        for Plate in range(len(self.C3D.ForcePlates)):
+            PlateChannels.extend(self.C3D.ForcePlates[Plate].Channels)
+            self.Devices.append(['FP' + str(Plate+1), 'ForcePlate', Plate,
+                                 [['Force', 'Force', 'newton', ['Fx','Fy','Fz'], None],
+                                  ['Moment', 'Moment', 'newton millimeter', ['Mx','My','Mz'], None],
+                                  ['CoP', 'CoP', 'millimeter', ['Cx','Cy','Cz'], None]]])
+
+        Units = {'V': 'volt', 'mV': 'millivolt', 'uV': 'microvolt'}
+        OtherDevices = {}
+        for Channel in range(len(self.C3D.AnalogLabels)):
+            if Channel in PlateChannels:
+                continue
+            Label = self.C3D.AnalogLabels[Channel]
+            Description = self.C3D.AnalogDescriptions[Channel]
+            if ' - ' in Description:
+                [DeviceName, OutputName] = Description.rsplit(' - ', 1)
+            else:
+                [DeviceName, OutputName] = ['Analog', 'Voltage']
+            if Label.startswith(OutputName + '.'):
+                Label = Label[len(OutputName)+1:]
+            Unit = self.C3D.AnalogUnits[Channel]
+            Outputs = OtherDevices.setdefault(DeviceName, {}).setdefault(OutputName, [Units.get(Unit, Unit), [], []])
+            Outputs[1].append(Label)
+            Outputs[2].append(Channel)
+        for DeviceName in OtherDevices:
+            Outputs = []
+            for OutputName in OtherDevices[DeviceName]:
+                [Unit, ChannelNames, Channels] = OtherDevices[DeviceName][OutputName]
+                Outputs.append([OutputName, OutputName, Unit, ChannelNames, Channels])
+            self.Devices.append([DeviceName, 'Other', None, Outputs])
+
+    def ReadDevice(self, DeviceID):
+        # [ForcePlate, Output data (Samples, Channels) of each output] of a device, computed once
+        if DeviceID not in self.DeviceData:
+            [Name, Type, Plate, Outputs] = self.Devices[DeviceID-1]
+            if Plate is not None:
+                [ForcePlate, Force, Moment, CoP] = self.ReadForcePlate(Plate)
+                self.DeviceData[DeviceID] = [ForcePlate, [Force, Moment, CoP]]
+            else:
+                self.DeviceData[DeviceID] = [DeviceForcePlate(), [self.PadFrames(self.C3D.GetAnalog(Output[4]), self.AnalogRatio) for Output in Outputs]]
+        return self.DeviceData[DeviceID]
+
+    def ReadForcePlate(self, Plate):
+        # Force, moment about the plate centre and CoP of a force plate in lab coordinates
+        # C3D plate types 1 (Fx,Fy,Fz,Px,Py,Tz), 2 (Fx,Fy,Fz,Mx,My,Mz), 3 (Kistler, 8 channels) and 4 (type 2 with CAL_MATRIX)
+        Plate = self.C3D.ForcePlates[Plate]
+        PlateType = Plate.Type
+        Origin = Plate.Origin
+        [Center, R] = [Plate.Center, Plate.R] # R is Plate to Lab
+        Analog = self.C3D.GetAnalog(Plate.Channels)
+
+        # Force and moment about the centre of the plate surface in plate coordinates
+        # Origin is the vector from the sensor origin to the centre of the plate surface
+        if PlateType == 1:
+            Force = Analog[:,0:3]
+            Moment = np.column_stack((Analog[:,4] * Analog[:,2], -Analog[:,3] * Analog[:,2],
+                                      Analog[:,3] * Analog[:,1] - Analog[:,4] * Analog[:,0] + Analog[:,5]))
+        elif PlateType == 3:
+            Force = np.column_stack((Analog[:,0] + Analog[:,1], Analog[:,2] + Analog[:,3], np.sum(Analog[:,4:8], axis=1)))
+            [a, b] = np.abs(Origin[0:2])
+            MomentSensor = np.column_stack((b * (Analog[:,4] + Analog[:,5] - Analog[:,6] - Analog[:,7]),
+                                            a * (-Analog[:,4] + Analog[:,5] + Analog[:,6] - Analog[:,7]),
+                                            b * (-Analog[:,0] + Analog[:,1]) + a * (Analog[:,2] - Analog[:,3])))
+            Moment = MomentSensor - np.cross([0., 0., Origin[2]], Force)
+        elif PlateType in [2, 4]:
+            if PlateType == 4:
+                Analog = Analog.dot(Plate.CalMatrix)
+            if Origin[2] > 0: # Some writers store the vector from the surface to the sensor
+                Origin = -Origin
+            Force = Analog[:,0:3]
+            Moment = Analog[:,3:6] - np.cross(Origin, Force)
+        else:
+            raise ValueError('Force plate type ' + str(PlateType) + ' is not supported')
+
+        # Center of pressure on the plate surface, zero when the plate is unloaded
+        Loaded = np.abs(Force[:,2]) > ForcePlateThreshold
+        CoP = np.zeros(Force.shape)
+        CoP[Loaded,0] = -Moment[Loaded,1] / Force[Loaded,2]
+        CoP[Loaded,1] = Moment[Loaded,0] / Force[Loaded,2]
+        CoPLab = np.where(Loaded[:,np.newaxis], Center + CoP.dot(R.T), 0.)
+
+        ForcePlate = DeviceForcePlate()
+        ForcePlate.WorldR = R.ravel().tolist()
+        ForcePlate.WorldT = Center.tolist()
+        LocalCorners = (Plate.Corners - Center).dot(R)
+        ForcePlate.LowerBounds = np.min(LocalCorners, axis=0).tolist()
+        ForcePlate.UpperBounds = np.max(LocalCorners, axis=0).tolist()
+        ForceLab = self.PadFrames(Force.dot(R.T), self.AnalogRatio)
+        ForcePlate.Context = self.ForcePlateContext(ForceLab)
+        return [ForcePlate, ForceLab, self.PadFrames(Moment.dot(R.T), self.AnalogRatio), self.PadFrames(CoPLab, self.AnalogRatio)]
+
+    def ForcePlateContext(self, ForceLab):
+        # Nexus keeps the force plate assignment of the gait event detection in its session, not in the C3D file.
+        # A plate is assigned to the side whose Foot Strike events start all of its loading phases.
+        Loaded = np.abs(ForceLab[:,2]) > ForcePlateThreshold
+        Onsets = np.flatnonzero(Loaded[1:] & ~Loaded[:-1]) + 1
+        if Loaded[0]:
+            return 'Invalid' # Already loaded when the capture starts
+        Contexts = []
+        for Onset in Onsets:
+            Context = 'Invalid'
+            Nearest = ForcePlateContactTolerance * self.AnalogRatio + 1
+            for [Subject, EventContext, Label, Frame, Offset] in self.Events:
+                Sample = int(round((Frame - 1 + Offset * self.FrameRate) * self.AnalogRatio))
+                if Label == 'Foot Strike' and abs(Sample - Onset) < Nearest:
+                    Context = EventContext
+                    Nearest = abs(Sample - Onset)
+            Contexts.append(Context)
+        if len(Contexts) == 0 or not len(set(Contexts)) == 1:
+            return 'Invalid'
+        return Contexts[0]
+
+    def GetDeviceIDs(self):
+        return list(range(1, len(self.Devices)+1))
+
+    def GetDeviceNames(self):
+        return [Device[0] for Device in self.Devices]
+
+    def GetDeviceIDFromName(self, Name):
+        return self.GetDeviceNames().index(Name) + 1
+
+    def GetDeviceDetails(self, DeviceID):
+        [Name, Type, Plate, Outputs] = self.Devices[DeviceID-1]
+        ForcePlate = self.ReadDevice(DeviceID)[0]
+        return [Name, Type, self.C3D.AnalogRate, list(range(1, len(Outputs)+1)), ForcePlate, None]
+
+    def GetDeviceOutputDetails(self, DeviceID, OutputID):
+        [Name, Type, Unit, ChannelNames, Channels] = self.Devices[DeviceID-1][3][OutputID-1]
+        return (Name, Type, Unit, True, list(ChannelNames), list(range(1, len(ChannelNames)+1)))
+
+    def GetDeviceOutputIDFromName(self, DeviceID, Name):
+        return [Output[0] for Output in self.Devices[DeviceID-1][3]].index(Name) + 1
+
+    def GetDeviceChannelIDFromName(self, DeviceID, OutputID, Name):
+        return self.Devices[DeviceID-1][3][OutputID-1][3].index(Name) + 1
+
+    def GetDeviceChannel(self, DeviceID, OutputID, ChannelID):
+        # Force plate outputs are in lab coordinates, as from GetDeviceChannelGlobal
+        Channels = self.ReadDevice(DeviceID)[1][OutputID-1]
+        return [Channels[:,ChannelID-1].tolist(), True, self.C3D.AnalogRate]
+
+    def GetDeviceChannelGlobal(self, DeviceID, OutputID, ChannelID):
+        return self.GetDeviceChannel(DeviceID, OutputID, ChannelID)
@@ -4,6 +4,10 @@ self.HipModelName = 'Harrington2' # Options are 'Newington' or 'Harrington' or '
 self.TrunkRotationSequence = 'ROT' # Options are 'ROT' or 'TOR'
 self.PelvisRotationSequence = 'ROT' # Options are 'ROT' or 'TOR'
 self.ShankCoordinateSystem = 'Distal' # Options are 'Distal' or 'Proximal'
+self.GCDInterpolation = 'Linear' # Options are 'Linear' or 'Cubic' (time normalization of the GCD variables)
+self.GCDBinary = False # True also writes the GCD variables to the binary companion <Trial>.GCD.bin (see Py3_GCDFile)
+self.OutputProfile = 'Full' # Options are 'Full' or 'Standard' or 'Kinematics' or output groups joined by '+' (see Py3_OutputStore)
+self.OutputDataType = 'float64' # Options are 'float64' or 'float32' (model outputs kept in float32 use half the memory, see Py3_OutputStore)
 self.C7MarkerName = 'C7'
 self.LeftClavicleMarkerName = 'Left_Clavicle'
 self.RightClavicleMarkerName = 'Right_Clavicle'
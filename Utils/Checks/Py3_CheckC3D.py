@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Check of the C3D writer and reader (Py3_C3D)
+
+Writes C3D files with WriteC3D for the Intel, DEC and MIPS processor types and reads them back with C3DFile: points,
+missing points, analog channels, labels (with LABELS2), rates, frames and force plates. The trials cover the int16 and
+the float POINT:FRAMES, and a last frame beyond the 16 bit header frames. C3D files given as arguments are also
+written again for each processor type and compared with the file read:
+
+    python Utils/Checks/Py3_CheckC3D.py [Walk01.c3d ...]
+
+Prints the failed checks and returns 1 when any check failed.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'Py3_ShrineGaitModel'))
+import Py3_C3D as c3d
+
+Processors = {'Intel': c3d.ProcessorIntel, 'DEC': c3d.ProcessorDEC, 'MIPS': c3d.ProcessorMIPS}
+
+def TestTrial(NumFrames, NumPoints, AnalogRatio, AnalogChannels, FirstFrame):
+    # [Parameters, Points, Analog] of a trial with random markers, missing frames, analog channels and one force plate
+    Random = np.random.default_rng(NumFrames + NumPoints)
+    Points = np.zeros((NumFrames, NumPoints, 4), dtype=np.float32)
+    Points[:,:,0:3] = Random.normal(0., 500., (NumFrames, NumPoints, 3))
+    Points[:,:,3] = Random.uniform(0., 2., (NumFrames, NumPoints))
+    Missing = Random.uniform(0., 1., (NumFrames, NumPoints)) < 0.1
+    Points[Missing] = [0., 0., 0., -1.]
+    Analog = Random.normal(0., 100., (NumFrames, AnalogRatio, AnalogChannels)).astype(np.float32)
+    Parameters = {}
+    Parameters['POINT'] = {'RATE': np.array(120., dtype=np.float32), 'UNITS': 'mm', 'SCALE': np.array(0.1, dtype=np.float32)}
+    c3d.SetLabels(Parameters, 'POINT', 'LABELS', ['Subject:Marker' + str(Index) for Index in range(NumPoints)])
+    Parameters['ANALOG'] = {'RATE': np.array(120. * AnalogRatio, dtype=np.float32), 'GEN_SCALE': np.array(0.5, dtype=np.float32),
+                            'SCALE': np.linspace(0.25, 2., AnalogChannels).astype(np.float32),
+                            'OFFSET': np.arange(AnalogChannels).astype(np.int16) - 3}
+    c3d.SetLabels(Parameters, 'ANALOG', 'LABELS', ['Channel' + str(Index) for Index in range(AnalogChannels)])
+    if AnalogChannels >= 6:
+        Corners = np.array([[232., 254., 0.], [-232., 254., 0.], [-232., -254., 0.], [232., -254., 0.]], dtype=np.float32) + [500., 300., 0.]
+        Parameters['FORCE_PLATFORM'] = {'USED': np.array(1, dtype=np.int16), 'TYPE': np.array([2], dtype=np.int16),
+                                        'CORNERS': Corners.reshape(1, 4, 3), 'ORIGIN': np.array([[0.3, -0.2, -41.5]], dtype=np.float32),
+                                        'CHANNEL': np.arange(1, 7).astype(np.int16).reshape(1, 6)}
+    return [Parameters, Points, Analog]
+
+def CompareFile(Name, FileName, Parameters, Points, Analog, FirstFrame, Processor):
+    # Failures of the C3D file read back against the values written
+    Failures = []
+    def Check(Condition, Message):
+        if not Condition:
+            Failures.append(Name + ': ' + Message)
+    [NumFrames, NumPoints] = Points.shape[0:2]
+    [AnalogRatio, AnalogChannels] = Analog.shape[1:3]
+    C3D = c3d.C3DFile(FileName)
+    Check(C3D.ProcessorType == Processor, 'processor type ' + str(C3D.ProcessorType))
+    Check(C3D.IsFloat, 'not a float file')
+    Check([C3D.FirstFrame, C3D.LastFrame, C3D.NumFrames] == [FirstFrame, FirstFrame + NumFrames - 1, NumFrames],
+          'frames ' + str([C3D.FirstFrame, C3D.LastFrame, C3D.NumFrames]))
+    Frames = C3D.GetParameter('POINT', 'FRAMES')
+    Check(float(Frames) == NumFrames and np.asarray(Frames).dtype.kind == ('i' if NumFrames <= 32767 else 'f'),
+          'POINT:FRAMES ' + repr(Frames))
+    Check(C3D.PointRate == float(Parameters['POINT']['RATE']), 'point rate ' + str(C3D.PointRate))
+    Check(C3D.AnalogRate == float(Parameters['ANALOG']['RATE']), 'analog rate ' + str(C3D.AnalogRate))
+    Check(C3D.AnalogRatio == AnalogRatio, 'analog ratio ' + str(C3D.AnalogRatio))
+    Check(C3D.PointLabels == [Label for Index in range(1, 10) for Label in Parameters['POINT'].get('LABELS' if Index == 1 else 'LABELS' + str(Index), [])],
+          'point labels')
+    Check(C3D.AnalogLabels == list(Parameters['ANALOG'].get('LABELS', [])), 'analog labels')
+    Check(C3D.GetParameter('POINT', 'UNITS') == Parameters['POINT'].get('UNITS'), 'POINT:UNITS ' + repr(C3D.GetParameter('POINT', 'UNITS')))
+
+    Exists = Points[:,:,3] >= 0
+    Check(np.array_equal(np.asarray(C3D.PointExists), Exists), 'point exists')
+    Check(np.array_equal(np.asarray(C3D.Points), Points[:,:,0:3]), 'points')
+    for Index in range(0, NumPoints, max(1, NumPoints // 7)):
+        [PointValues, PointExists] = C3D.GetPoint(Index)
+        Check(np.array_equal(PointExists, Exists[:,Index]) and np.array_equal(PointValues, np.where(Exists[:,Index,None], Points[:,Index,0:3], 0.)),
+              'GetPoint(' + str(Index) + ')')
+    Channels = list(range(AnalogChannels))
+    Expected = ((Analog.reshape(NumFrames * AnalogRatio, AnalogChannels).astype(float) - np.asarray(Parameters['ANALOG'].get('OFFSET', np.zeros(AnalogChannels)), dtype=float)) *
+                float(Parameters['ANALOG'].get('GEN_SCALE', 1.)) * np.asarray(Parameters['ANALOG'].get('SCALE', np.ones(AnalogChannels)), dtype=float))
+    Check(np.allclose(C3D.GetAnalog(Channels), Expected, rtol=1e-6, atol=0.), 'analog')
+
+    if 'FORCE_PLATFORM' in Parameters:
+        Check(len(C3D.ForcePlates) == 1, str(len(C3D.ForcePlates)) + ' force plates')
+        if len(C3D.ForcePlates) == 1:
+            Plate = C3D.ForcePlates[0]
+            Check(Plate.Type == 2 and Plate.Channels == list(range(6)), 'force plate type and channels')
+            Check(np.array_equal(Plate.Corners, np.asarray(Parameters['FORCE_PLATFORM']['CORNERS'], dtype=float)[0]), 'force plate corners')
+            Check(np.array_equal(Plate.Origin, np.asarray(Parameters['FORCE_PLATFORM']['ORIGIN'], dtype=float)[0]), 'force plate origin')
+    return Failures
+
+def CheckTrials(Directory):
+    # [checks, failures] of the test trials written for each processor type
+    Trials = [['Trial', [300, 12, 10, 8, 17]],
+              ['ManyMarkers', [20, 300, 1, 2, 1]],
+              ['NoAnalog', [50, 5, 1, 0, 1]],
+              ['FloatFrames', [40000, 1, 1, 1, 1]],
+              ['LongTrial', [70000, 1, 1, 1, 1000]]]
+    Failures = []
+    Checks = 0
+    for [TrialName, Sizes] in Trials:
+        [NumFrames, NumPoints, AnalogRatio, AnalogChannels, FirstFrame] = Sizes
+        for ProcessorName in Processors:
+            [Parameters, Points, Analog] = TestTrial(NumFrames, NumPoints, AnalogRatio, AnalogChannels, FirstFrame)
+            FileName = os.path.join(Directory, TrialName + ProcessorName + '.c3d')
+            c3d.WriteC3D(FileName, Parameters, Points, Analog, FirstFrame, Processors[ProcessorName])
+            Checks = Checks + 1
+            Failures.extend(CompareFile(TrialName + ' ' + ProcessorName, FileName, Parameters, Points, Analog, FirstFrame, Processors[ProcessorName]))
+    return [Checks, Failures]
+
+def CheckFiles(Directory, FileNames):
+    # [checks, failures] of C3D files written again for each processor type
+    Failures = []
+    Checks = 0
+    for FileName in FileNames:
+        Source = c3d.C3DFile(FileName)
+        Points = np.zeros(Source.PointData.shape, dtype=np.float32)
+        Points[:,:,0:3] = Source.Points
+        Points[:,:,3] = np.where(Source.PointExists, np.maximum(np.asarray(Source.PointData[:,:,3], dtype=np.float32), 0.) if Source.IsFloat else 0., -1.)
+        Analog = Source.AnalogData
+        if Source.AnalogUnsigned:
+            Analog = Analog.view(Source.Endian + 'u2')
+        for ProcessorName in Processors:
+            Parameters = {}
+            for Group in Source.Parameters:
+                Parameters[Group] = dict(Source.Parameters[Group])
+            if 'ANALOG' in Parameters:
+                Parameters['ANALOG']['OFFSET'] = Source.AnalogOffsets
+                Parameters['ANALOG'].pop('FORMAT', None)
+            Parameters['POINT']['SCALE'] = abs(Source.PointScale)
+            CopyFileName = os.path.join(Directory, os.path.splitext(os.path.basename(FileName))[0] + ProcessorName + '.c3d')
+            c3d.WriteC3D(CopyFileName, Parameters, Points, np.asarray(Analog, dtype=np.float32), Source.FirstFrame, Processors[ProcessorName])
+            Copy = c3d.C3DFile(CopyFileName)
+            Name = os.path.basename(FileName) + ' ' + ProcessorName
+            Checks = Checks + 1
+            if not ([Copy.FirstFrame, Copy.LastFrame, Copy.PointLabels, Copy.AnalogLabels, Copy.PointRate, Copy.AnalogRate] ==
+                    [Source.FirstFrame, Source.LastFrame, Source.PointLabels, Source.AnalogLabels, Source.PointRate, Source.AnalogRate]):
+                Failures.append(Name + ': frames, labels or rates')
+            if not (np.array_equal(Copy.PointExists, Source.PointExists) and np.array_equal(np.asarray(Copy.Points), np.asarray(Source.Points, dtype=np.float32))):
+                Failures.append(Name + ': points')
+            Channels = list(range(len(Source.AnalogLabels)))
+            if not np.allclose(Copy.GetAnalog(Channels), Source.GetAnalog(Channels), rtol=1e-6, atol=1e-9):
+                Failures.append(Name + ': analog')
+            if not len(Copy.ForcePlates) == len(Source.ForcePlates) or not all(
+                    [np.allclose(Plate.Corners, SourcePlate.Corners) and Plate.Channels == SourcePlate.Channels for [Plate, SourcePlate] in zip(Copy.ForcePlates, Source.ForcePlates)]):
+                Failures.append(Name + ': force plates')
+            del Copy
+    return [Checks, Failures]
+
+def main():
+    with tempfile.TemporaryDirectory() as Directory:
+        [TrialChecks, Failures] = CheckTrials(Directory)
+        [FileChecks, FileFailures] = CheckFiles(Directory, sys.argv[1:])
+    Failures = Failures + FileFailures
+    for Failure in Failures[0:50]:
+        print('Failed', Failure)
+    print(str(TrialChecks) + ' test files, ' + str(FileChecks) + ' copies of C3D files, ' + str(len(Failures)) + ' failed')
+    return 1 if len(Failures) > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Check of the polynomial filter kernels (Py3_MathModules)
+
+Differentiate and Smooth1DArray fitted np.polyfit to the window of every frame. They now apply kernels computed once
+(PolynomialFilterKernels). This check keeps the per-frame np.polyfit versions and compares them with Differentiate,
+DifferentiateArray and SmoothArray on noisy gait-like curves, for several frame ranges and window widths, then times both
+on a trial:
+
+    python Utils/Checks/Py3_CheckDifferentiation.py [number of frames of the timed trial]
+
+Prints the failed checks and returns 1 when any check failed.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'Py3_ShrineGaitModel'))
+import Py3_MathModules as math
+
+def PolyfitDifferentiate(YData, FirstFrame, LastFrame, framecount, DeltaTime):
+    # Differentiate before the kernels: cubic fitted to the 7 frames around each frame, first and second derivative at
+    # the midpoint of the window, the first and last 3 frames from the first and last windows
+    FirstDerivativeData = [[0. for m in range(framecount)] for n in range(3)]
+    SecondDerivativeData = [[0. for m in range(framecount)] for n in range(3)]
+    x = [0, 1*DeltaTime, 2*DeltaTime, 3*DeltaTime, 4*DeltaTime, 5*DeltaTime, 6*DeltaTime]
+    for i in range(3):
+        for FrameNumber in range(FirstFrame -1 + 3 , LastFrame - 3):
+            y = [YData[i][FrameNumber + Offset] for Offset in range(-3, 4)]
+            FirstDeriv_Polynomial = np.poly1d(np.polyfit(x, y, 3)).deriv()
+            SecondDeriv_Polynomial = FirstDeriv_Polynomial.deriv()
+            FirstDerivativeData[i][FrameNumber] = FirstDeriv_Polynomial(3*DeltaTime)
+            SecondDerivativeData[i][FrameNumber] = SecondDeriv_Polynomial(3*DeltaTime)
+            if FrameNumber == FirstFrame -1 + 3:
+                for Position in range(3):
+                    FirstDerivativeData[i][FrameNumber-3+Position] = FirstDeriv_Polynomial(Position*DeltaTime)
+                    SecondDerivativeData[i][FrameNumber-3+Position] = SecondDeriv_Polynomial(Position*DeltaTime)
+            if FrameNumber == LastFrame - 3 - 1:
+                for Position in range(4, 7):
+                    FirstDerivativeData[i][FrameNumber-3+Position] = FirstDeriv_Polynomial(Position*DeltaTime)
+                    SecondDerivativeData[i][FrameNumber-3+Position] = SecondDeriv_Polynomial(Position*DeltaTime)
+    return ([FirstDerivativeData, SecondDerivativeData])
+
+def PolyfitSmooth1DArray(DataArray, StartFrame, EndFrame, Order, WindowWidth):
+    # Smooth1DArray before the kernels: polynomial fitted to the WindowWidth frames around each frame and evaluated at
+    # the centre of the window, the first and last half windows from the first and last windows
+    DataArraySmoothed = [0. for m in range(len(DataArray))]
+    HalfWidth = int(WindowWidth/2)
+    XWindow = list(range(WindowWidth))
+    for FrameNumber in range(StartFrame - 1 + HalfWidth, EndFrame - HalfWidth):
+        YWindow = [DataArray[FrameNumber - HalfWidth + i] for i in range(WindowWidth)]
+        ffit_polynomial = np.poly1d(np.polyfit(XWindow, YWindow, Order))
+        DataArraySmoothed[FrameNumber] = ffit_polynomial(HalfWidth)
+        if FrameNumber == StartFrame - 1 + HalfWidth:
+            for j in range(HalfWidth):
+                DataArraySmoothed[FrameNumber - j - 1] = ffit_polynomial(HalfWidth - j - 1)
+        if FrameNumber == EndFrame - HalfWidth - 1:
+            for j in range(HalfWidth):
+                DataArraySmoothed[FrameNumber + j + 1] = ffit_polynomial(HalfWidth + j + 1)
+    return DataArraySmoothed
+
+def TestCurves(NumFrames, NumCurves, Seed):
+    # (NumCurves, 3, NumFrames) gait-like curves: a few harmonics of a 1 s cycle, an offset and marker noise
+    Random = np.random.default_rng(Seed)
+    Time = np.arange(NumFrames) / 120.
+    Curves = Random.normal(0., 200., (NumCurves, 3, 1))
+    for Harmonic in range(1, 5):
+        Amplitudes = Random.normal(0., 100. / Harmonic, (NumCurves, 3, 2))
+        Curves = Curves + Amplitudes[..., 0:1] * np.sin(2. * np.pi * Harmonic * Time) + Amplitudes[..., 1:2] * np.cos(2. * np.pi * Harmonic * Time)
+    return Curves + Random.normal(0., 0.5, Curves.shape)
+
+def Difference(Values, Reference):
+    # Largest difference relative to the largest reference value
+    Reference = np.asarray(Reference, dtype=float)
+    return float(np.max(np.abs(np.asarray(Values, dtype=float) - Reference)) / max(np.max(np.abs(Reference)), 1e-300))
+
+def CheckEquivalence(Tolerance):
+    # [checks, failures] of the kernels against the per-frame fits
+    Failures = []
+    Checks = 0
+    DeltaTime = 1. / 120.
+    Curves = TestCurves(160, 4, 1)
+    framecount = Curves.shape[-1]
+    for [FirstFrame, LastFrame] in [[1, framecount], [12, framecount], [1, 140], [30, 36], [50, 90]]:
+        Name = 'frames ' + str(FirstFrame) + '-' + str(LastFrame)
+        [FirstDerivative, SecondDerivative] = math.DifferentiateArray(Curves, FirstFrame, LastFrame, DeltaTime)
+        for [Index, Curve] in enumerate(Curves):
+            [ReferenceFirst, ReferenceSecond] = PolyfitDifferentiate(Curve.tolist(), FirstFrame, LastFrame, framecount, DeltaTime)
+            [First, Second] = math.Differentiate(Curve.tolist(), FirstFrame, LastFrame, framecount, DeltaTime)
+            Checks = Checks + 4
+            for [Label, Values, Reference] in [['Differentiate first derivative', First, ReferenceFirst],
+                                               ['Differentiate second derivative', Second, ReferenceSecond],
+                                               ['DifferentiateArray first derivative', FirstDerivative[Index], ReferenceFirst],
+                                               ['DifferentiateArray second derivative', SecondDerivative[Index], ReferenceSecond]]:
+                if Difference(Values, Reference) > Tolerance:
+                    Failures.append(Label + ', ' + Name + ': relative difference ' + '%.3g' % Difference(Values, Reference))
+
+        for WindowWidth in [7, 20, 21]:
+            if LastFrame - FirstFrame + 1 < WindowWidth:
+                continue
+            Smoothed = math.SmoothArray(Curves, FirstFrame, LastFrame, 3, WindowWidth)
+            for [Index, Curve] in enumerate(Curves):
+                for Axis in range(3):
+                    Checks = Checks + 2
+                    Reference = PolyfitSmooth1DArray(Curve[Axis].tolist(), FirstFrame, LastFrame, 3, WindowWidth)
+                    if Difference(Smoothed[Index, Axis], Reference) > Tolerance:
+                        Failures.append('SmoothArray, window ' + str(WindowWidth) + ', ' + Name + ': relative difference ' + '%.3g' % Difference(Smoothed[Index, Axis], Reference))
+                    Smoothed1D = math.Smooth1DArray(Curve[Axis].tolist(), FirstFrame, LastFrame, 3, WindowWidth)
+                    if Difference(Smoothed1D, Reference) > Tolerance:
+                        Failures.append('Smooth1DArray, window ' + str(WindowWidth) + ', ' + Name + ': relative difference ' + '%.3g' % Difference(Smoothed1D, Reference))
+    return [Checks, Failures]
+
+def Benchmark(NumFrames):
+    # Time of the per-frame fits and of the kernels on one (3, NumFrames) curve and on the 15 curves smoothed by DynamicMain
+    DeltaTime = 1. / 120.
+    Curves = TestCurves(NumFrames, 15, 2)
+    Curve = Curves[0].tolist()
+    Times = []
+    for Function in [lambda: PolyfitDifferentiate(Curve, 1, NumFrames, NumFrames, DeltaTime),
+                     lambda: math.Differentiate(Curve, 1, NumFrames, NumFrames, DeltaTime),
+                     lambda: [PolyfitSmooth1DArray(Curves[Index, Axis].tolist(), 1, NumFrames, 3, 21) for Index in range(15) for Axis in range(3)],
+                     lambda: math.SmoothArray(Curves, 1, NumFrames, 3, 21)]:
+        Start = time.perf_counter()
+        Function()
+        Times.append(time.perf_counter() - Start)
+    print('Differentiate, (3, ' + str(NumFrames) + '):  polyfit per frame %.3f s, kernels %.5f s' % (Times[0], Times[1]))
+    print('Smoothing, (15, 3, ' + str(NumFrames) + '):  polyfit per frame %.3f s, kernels %.5f s' % (Times[2], Times[3]))
+
+def main():
+    NumFrames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    [Checks, Failures] = CheckEquivalence(1e-9)
+    for Failure in Failures[0:50]:
+        print('Failed', Failure)
+    print(str(Checks) + ' comparisons with the per-frame fits, ' + str(len(Failures)) + ' failed')
+    Benchmark(NumFrames)
+    return 1 if len(Failures) > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+<One of the file associated with the Program to compute lower extremity Shrine Gait Model kinematics and kinetics>
+Copyright (C) 2023  <Prabhav Saraswat>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+# Check of the GCD writer and reader (Py3_GCDFile)
+
+Compares FormatPositional and FormatRounded with the formatting CreateGCD used before (np.format_float_positional(Value,
+precision=6) and str(round(Value, 6))) on random values and on the values where they differ most easily (ties, carries,
+zeros, nan and inf), then writes a GCD file with its binary companion, reads the text back and reads the companion with
+GCDReader:
+
+    python Utils/Checks/Py3_CheckGCDFile.py [number of random values]
+
+Prints the failed checks and returns 1 when any check failed.
+
+Created on Sun Oct 18 2026
+Last Update: 18 Oct, 2026
+
+---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+VersionNumber = 'Py3_v1.4'
+
+import os
+import sys
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'Py3_ShrineGaitModel'))
+import Py3_GCDFile as gcdfile
+
+def TestValues(Count):
+    # Random values at the scales of the GCD variables, and values at the edges of the 6 decimals
+    Random = np.random.default_rng(0)
+    Values = [Random.normal(0., Scale, Count) for Scale in [1e-4, 1e-2, 1., 100., 1e4]]
+    Values.append(np.round(Random.uniform(-1000., 1000., Count), 6))
+    Values.append(np.round(Random.uniform(-1000., 1000., Count), 3))
+    Values.append(np.arange(-512, 513) / 128.)
+    Values.append(np.array([0., -0., 1., -1., 0.5, 1e-7, -1e-7, 5e-7, -5e-7, 4.9999999e-7, 1.2999996, 1.2999995, 0.9999995,
+                            -0.9999995, 9.9999996, 123456.7890125, 1e15, -1e15, 1e22, 2.**60, np.nan, np.inf, -np.inf]))
+    return np.concatenate(Values)
+
+def CheckFormats(Values):
+    # [checks, failures] of the formatters against the reference formatting
+    Failures = []
+    Positional = gcdfile.FormatPositional(Values)
+    Rounded = gcdfile.FormatRounded(Values)
+    for [Index, Value] in enumerate(Values.tolist()):
+        Expected = np.format_float_positional(Value, precision=6)
+        if not Positional[Index] == Expected:
+            Failures.append('FormatPositional(' + repr(Value) + ') = ' + Positional[Index] + ', expected ' + Expected)
+        Expected = str(round(Value, 6))
+        if not Rounded[Index] == Expected:
+            Failures.append('FormatRounded(' + repr(Value) + ') = ' + Rounded[Index] + ', expected ' + Expected)
+    return [2 * len(Values), Failures]
+
+def WriteTestFile(FileName, Values):
+    # GCD file as CreateGCD writes it: header lines, then variables, single values and EMG channels
+    GCDFile = gcdfile.GCDWriter(FileName, Binary=True)
+    GCDFile.write('#!DST-Python3_ShrineGaitModel' + '\n')
+    GCDFile.write('$ProgramVersion' + '\n' + VersionNumber + '\n')
+    GCDFile.write('!Mass' + '\n' + '32.5' + '\n')
+    GCDFile.write('!Height' + '\n' + '1410' + '\n')
+    GCDFile.write('$StaticFile' + '\n' + 'Static_BF_Subject.py' + '\n')
+    Variables = {'LeftHipFlexExt': Values[0:51], 'RightKneeFlexExt': Values[51:102], 'LeftCadence': Values[102:103],
+                 'LeftAnklePower': Values[103:104] * 0., 'RightEMG1': Values[104:205]}
+    GCDFile.WriteArray('LeftHipFlexExt', Variables['LeftHipFlexExt'])
+    GCDFile.WriteArray('RightKneeFlexExt', Variables['RightKneeFlexExt'])
+    GCDFile.WriteSingleValue('LeftCadence', Variables['LeftCadence'][0])
+    GCDFile.WriteArray('LeftAnklePower', Variables['LeftAnklePower'])
+    GCDFile.WriteRoundedArray('RightEMG1', Variables['RightEMG1'])
+    GCDFile.close()
+    return Variables
+
+def ReadText(FileName):
+    # Text before the first ! line of a GCD text file, and {Name: value texts} of the ! lines (header values and variables)
+    with open(FileName) as TextFile:
+        Text = TextFile.read()
+    Parts = Text.split('\n!')
+    Variables = {}
+    for Part in Parts[1:]:
+        Lines = Part.split('\n')
+        Variables[Lines[0]] = [Line for Line in Lines[1:] if len(Line) > 0]
+    return [Parts[0], Variables]
+
+def CheckRoundTrip(Values):
+    # [checks, failures] of a GCD file and its binary companion written and read back
+    Failures = []
+    Checks = 0
+    with tempfile.TemporaryDirectory() as Directory:
+        FileName = os.path.join(Directory, 'Walk01.GCD')
+        Variables = WriteTestFile(FileName, Values)
+        Checks = Checks + 1
+        if not sorted(os.listdir(Directory)) == ['Walk01.GCD', 'Walk01.GCD' + gcdfile.BinaryExtension]:
+            Failures.append('Files written: ' + ', '.join(sorted(os.listdir(Directory))))
+        [HeaderText, TextVariables] = ReadText(FileName)
+        Checks = Checks + 1
+        if not HeaderText == '#!DST-Python3_ShrineGaitModel\n$ProgramVersion\n' + VersionNumber:
+            Failures.append('Header text: ' + repr(HeaderText))
+        for Name in Variables:
+            Checks = Checks + 2
+            Rounded = Name.endswith('EMG1')
+            Expected = [str(round(Value, 6)) if Rounded else np.format_float_positional(Value, precision=6) for Value in Variables[Name].tolist()]
+            if not TextVariables.get(Name) == Expected:
+                Failures.append('Text of ' + Name + ' differs from the reference formatting')
+            if not np.allclose(np.array(TextVariables.get(Name, []), dtype=np.float64), Variables[Name], rtol=0., atol=1e-6):
+                Failures.append('Values of ' + Name + ' read back from the text differ')
+
+        for ReaderFileName in [FileName, FileName + gcdfile.BinaryExtension]:
+            GCD = gcdfile.GCDReader(ReaderFileName)
+            Checks = Checks + 3
+            if not GCD.Names == list(Variables):
+                Failures.append('GCDReader(' + os.path.basename(ReaderFileName) + ').Names = ' + str(GCD.Names))
+            if not GCD.Version == VersionNumber:
+                Failures.append('GCDReader version ' + str(GCD.Version))
+            Expected = {'ProgramVersion': VersionNumber, 'Mass': 32.5, 'Height': 1410., 'StaticFile': 'Static_BF_Subject.py'}
+            if not GCD.Header == Expected:
+                Failures.append('GCDReader header ' + str(GCD.Header))
+            for Name in Variables:
+                Checks = Checks + 2
+                if not Name in GCD:
+                    Failures.append(Name + ' not in GCDReader')
+                    continue
+                Read = np.asarray(GCD[Name])
+                if not (Read.dtype == np.dtype('<f4') and np.array_equal(Read, Variables[Name].astype('<f4'), equal_nan=True)):
+                    Failures.append('Binary values of ' + Name + ' differ')
+            Checks = Checks + 1
+            if 'LeftKneeFlexExt' in GCD:
+                Failures.append('GCDReader contains a variable that was not written')
+
+        # Empty file: no variables, nothing to map
+        EmptyFileName = os.path.join(Directory, 'Empty.GCD')
+        GCDFile = gcdfile.GCDWriter(EmptyFileName, Binary=True)
+        GCDFile.write('#!DST-Python3_ShrineGaitModel' + '\n')
+        GCDFile.close()
+        GCD = gcdfile.GCDReader(EmptyFileName)
+        Checks = Checks + 1
+        if not (GCD.Names == [] and len(GCD.Data) == 0):
+            Failures.append('Empty GCD file read back with variables')
+
+        Checks = Checks + 1
+        try:
+            gcdfile.GCDReader(FileName + '.txt')
+            Failures.append('GCDReader accepted a file that is not a binary GCD file')
+        except (OSError, ValueError):
+            pass
+    return [Checks, Failures]
+
+def main():
+    Count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    Values = TestValues(Count)
+    [FormatChecks, FormatFailures] = CheckFormats(Values)
+    Finite = Values[np.isfinite(Values) & (np.abs(Values) < 1e6)]
+    [RoundTripChecks, RoundTripFailures] = CheckRoundTrip(np.concatenate([Finite[-200:], Finite[0:5]]))
+    Failures = FormatFailures + RoundTripFailures
+    for Failure in Failures[0:50]:
+        print('Failed', Failure)
+    print(str(FormatChecks) + ' format checks, ' + str(RoundTripChecks) + ' round trip checks, ' + str(len(Failures)) + ' failed')
+    return 1 if len(Failures) > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())